@@ -255,7 +255,10 @@ class AssignShiftCommandHandler(CommandHandler):
 
             async with self.uow:
                 # Get shift and employee
-                shift = await self.uow.shifts.find_by_id(command.shift_id)
+                shift, employee = await self.uow.gather(
+                    self.uow.shifts.find_by_id(command.shift_id),
+                    self.uow.employees.find_by_id(command.employee_id),
+                )
                 if not shift:
                     return CommandResult(
                         success=False,
@@ -263,7 +266,6 @@ class AssignShiftCommandHandler(CommandHandler):
                         errors=[f"Shift {command.shift_id} not found"],
                     )
 
-                employee = await self.uow.employees.find_by_id(command.employee_id)
                 if not employee:
                     return CommandResult(
                         success=False,
@@ -443,11 +445,9 @@ class SwapAssignmentsCommandHandler(CommandHandler):
 
             async with self.uow:
                 # Get both assignments
-                assignment1 = await self.uow.assignments.find_by_id(
-                    command.assignment_id_1,
-                )
-                assignment2 = await self.uow.assignments.find_by_id(
-                    command.assignment_id_2,
+                assignment1, assignment2 = await self.uow.gather(
+                    self.uow.assignments.find_by_id(command.assignment_id_1),
+                    self.uow.assignments.find_by_id(command.assignment_id_2),
                 )
 
                 if not assignment1:
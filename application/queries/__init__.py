@@ -148,19 +148,19 @@ class GetScheduleQueryHandler(QueryHandler):
 
                 query_time_range = TimeRange(time_range_start, time_range_end)
 
-                # Get all shifts in date range
+                # Get all shifts and assignments in date range together
                 shift_query = ShiftQuery(
                     date_range=query_time_range, departments=query.department_ids,
                 )
-                shifts = await self.uow.shifts.find_all(shift_query)
-
-                # Get all assignments in date range
                 assignment_query = AssignmentQuery(
                     date_range=query_time_range,
                     departments=query.department_ids,
                     status="active",
                 )
-                assignments = await self.uow.assignments.find_all(assignment_query)
+                shifts, assignments = await self.uow.gather(
+                    self.uow.shifts.find_all(shift_query),
+                    self.uow.assignments.find_all(assignment_query),
+                )
 
                 # Group assignments by shift
                 assignments_by_shift = {}
@@ -458,25 +458,22 @@ class GetFairnessReportQueryHandler(QueryHandler):
 
                 fairness_scores = []
 
-                # Calculate fairness for each employee
-                for employee in employees:
-                    # Convert DateRange to TimeRange for assignment query
-                    time_range_start = datetime.combine(
-                        query.date_range.start, datetime.min.time(),
-                    )
-                    time_range_end = datetime.combine(
-                        query.date_range.end, datetime.max.time(),
-                    )
-                    from domain.value_objects import TimeRange
-
-                    query_time_range = TimeRange(time_range_start, time_range_end)
+                # Convert DateRange to TimeRange for assignment query
+                from domain.value_objects import TimeRange
 
-                    assignments = (
-                        await self.uow.assignments.find_by_employee_and_date_range(
-                            employee.id, query_time_range,
-                        )
+                query_time_range = TimeRange(
+                    datetime.combine(query.date_range.start, datetime.min.time()),
+                    datetime.combine(query.date_range.end, datetime.max.time()),
+                )
+                assignments_by_employee = (
+                    await self.uow.assignments.find_by_employees_and_date_range(
+                        [employee.id for employee in employees], query_time_range,
                     )
+                )
 
+                # Calculate fairness for each employee
+                for employee in employees:
+                    assignments = assignments_by_employee.get(employee.id, [])
                     fairness_result = (
                         self.fairness_calculator.calculate_employee_fairness(
                             employee, assignments, query.date_range,
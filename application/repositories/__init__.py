@@ -11,8 +11,10 @@ Key Design Principles:
 4. Unit of Work pattern for transaction management
 """
 
+import asyncio
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Awaitable
 from dataclasses import dataclass
 from datetime import date
 from datetime import datetime
@@ -173,6 +175,16 @@ class AssignmentRepository(ABC):
     ) -> list[Assignment]:
         """Find assignments for employee in date range."""
 
+    @abstractmethod
+    async def find_by_employees_and_date_range(
+        self, employee_ids: list[EmployeeId], date_range: TimeRange,
+    ) -> dict[EmployeeId, list[Assignment]]:
+        """Find assignments for several employees in date range, in one load.
+
+        Every requested employee is present in the result, possibly with an
+        empty list.
+        """
+
     @abstractmethod
     async def find_by_shift(self, shift_id: ShiftId) -> list[Assignment]:
         """Find all assignments for a shift."""
@@ -249,6 +261,14 @@ class UnitOfWork(ABC):
     async def rollback(self) -> None:
         """Rollback transaction."""
 
+    async def gather(self, *loads: Awaitable[Any]) -> list[Any]:
+        """Await independent repository loads together, results in call order.
+
+        Use cases should gather reads that do not depend on each other
+        instead of awaiting them one after another.
+        """
+        return list(await asyncio.gather(*loads))
+
 
 # Export all repository interfaces
 __all__ = [
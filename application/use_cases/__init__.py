@@ -11,8 +11,10 @@ Key Design Principles:
 4. Transaction Management - proper unit of work patterns
 """
 
+import heapq
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date
 from datetime import datetime
@@ -103,6 +105,78 @@ class ConflictResolution:
     estimated_impact: dict[str, float]
 
 
+class _EmployeeLoadQueue:
+    """Min-heaps of employees keyed by running fairness score, one per shift type.
+
+    An employee sits in the heap of every shift type they are available for.
+    Changing a score bumps the employee's version and pushes fresh entries;
+    outdated entries are skipped when they surface (lazy deletion), so no
+    heap is ever rebuilt.
+    """
+
+    def __init__(
+        self, employees: list["Employee"], scores: dict["EmployeeId", float],
+    ):
+        from domain.value_objects import ShiftType
+
+        self._employees = employees
+        self._scores = [scores.get(employee.id, 0.0) for employee in employees]
+        self._versions = [0] * len(employees)
+        self._index = {employee.id: i for i, employee in enumerate(employees)}
+        self._heaps: dict[ShiftType, list[tuple[float, int, int]]] = {}
+        self._types_of: list[list[ShiftType]] = [[] for _ in employees]
+        for shift_type in ShiftType:
+            heap = []
+            for i, employee in enumerate(employees):
+                if self._toggled_on(employee, shift_type):
+                    heap.append((self._scores[i], i, 0))
+                    self._types_of[i].append(shift_type)
+            heapq.heapify(heap)
+            self._heaps[shift_type] = heap
+
+    @staticmethod
+    def _toggled_on(employee: "Employee", shift_type: "ShiftType") -> bool:
+        from domain.value_objects import ShiftType
+
+        if shift_type == ShiftType.WAAKDIENST:
+            return employee.available_for_waakdienst
+        return employee.available_for_incidents
+
+    def pop_eligible(
+        self, shift_type: "ShiftType", is_eligible: Callable[["Employee"], bool],
+    ) -> Optional["Employee"]:
+        """Lowest-scored employee of ``shift_type`` passing ``is_eligible``.
+
+        Ineligible employees (leave, termination) are set aside and pushed
+        back afterwards, so they stay queued for later shifts.
+        """
+        heap = self._heaps.get(shift_type, [])
+        skipped = []
+        chosen = None
+        while heap:
+            entry = heapq.heappop(heap)
+            _score, i, version = entry
+            if version != self._versions[i]:
+                continue  # Outdated entry; a fresher one is in the heap
+            if is_eligible(self._employees[i]):
+                chosen = i
+                heapq.heappush(heap, entry)
+                break
+            skipped.append(entry)
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return None if chosen is None else self._employees[chosen]
+
+    def add_load(self, employee: "Employee", amount: float) -> float:
+        """Raise ``employee``'s score by ``amount`` and re-queue them; returns the new score."""
+        i = self._index[employee.id]
+        self._scores[i] += amount
+        self._versions[i] += 1
+        for shift_type in self._types_of[i]:
+            heapq.heappush(self._heaps[shift_type], (self._scores[i], i, self._versions[i]))
+        return self._scores[i]
+
+
 class OrchestrateScheduleUseCase:
     """
     Primary use case for orchestrating shift scheduling.
@@ -129,11 +203,12 @@ class OrchestrateScheduleUseCase:
         """Execute the complete scheduling workflow."""
         try:
             async with self.uow:
-                # Step 1: Discover shifts that need assignment
-                shifts_to_assign = await self._discover_shifts(request)
-
-                # Step 2: Get available employees
-                available_employees = await self._get_available_employees(request)
+                # Steps 1-2: Discover shifts that need assignment and get
+                # available employees (independent loads, run together)
+                shifts_to_assign, available_employees = await self.uow.gather(
+                    self._discover_shifts(request),
+                    self._get_available_employees(request),
+                )
 
                 # Step 3: Calculate current fairness scores
                 fairness_scores = await self._calculate_fairness_scores(
@@ -146,13 +221,9 @@ class OrchestrateScheduleUseCase:
                 )
 
                 # Step 5: Assign remaining shifts using optimization
+                forced_shift_ids = {getattr(a, "shift_id", None) for a in assignments}
                 remaining_shifts = [
-                    s
-                    for s in shifts_to_assign
-                    if not any(
-                        hasattr(a, "shift_id") and a.shift_id == s.id
-                        for a in assignments
-                    )
+                    s for s in shifts_to_assign if s.id not in forced_shift_ids
                 ]
 
                 (
@@ -282,20 +353,23 @@ class OrchestrateScheduleUseCase:
         self, employees: list["Employee"], date_range: "DateRange",
     ) -> dict["EmployeeId", float]:
         """Calculate current fairness scores for employees."""
-        fairness_scores = {}
-
-        for employee in employees:
-            # Convert DateRange to TimeRange for assignment query
-            time_range_start = datetime.combine(date_range.start, datetime.min.time())
-            time_range_end = datetime.combine(date_range.end, datetime.max.time())
-            from domain.value_objects import TimeRange
-
-            query_time_range = TimeRange(time_range_start, time_range_end)
+        from domain.value_objects import TimeRange
 
-            assignments = await self.uow.assignments.find_by_employee_and_date_range(
-                employee.id, query_time_range,
+        # Convert DateRange to TimeRange for assignment query
+        query_time_range = TimeRange(
+            datetime.combine(date_range.start, datetime.min.time()),
+            datetime.combine(date_range.end, datetime.max.time()),
+        )
+        # One batched load for all employees instead of a query per employee
+        assignments_by_employee = (
+            await self.uow.assignments.find_by_employees_and_date_range(
+                [employee.id for employee in employees], query_time_range,
             )
+        )
 
+        fairness_scores = {}
+        for employee in employees:
+            assignments = assignments_by_employee.get(employee.id, [])
             # Calculate fairness score using domain service
             fairness_result = self.fairness_calculator.calculate_employee_fairness(
                 employee, assignments, date_range,
@@ -314,7 +388,12 @@ class OrchestrateScheduleUseCase:
         if not request.force_assignments:
             return assignments, conflicts
 
-        for shift_id, employee_id in request.force_assignments.items():
+        forced = list(request.force_assignments.items())
+        found_employees = await self.uow.gather(
+            *(self.uow.employees.find_by_id(employee_id) for _, employee_id in forced),
+        )
+
+        for (shift_id, employee_id), employee in zip(forced, found_employees, strict=True):
             # Find the shift and employee
             shift = next((s for s in shifts if s.id == shift_id), None)
             if not shift:
@@ -327,7 +406,6 @@ class OrchestrateScheduleUseCase:
                 )
                 continue
 
-            employee = await self.uow.employees.find_by_id(employee_id)
             if not employee:
                 conflicts.append(
                     {
@@ -356,18 +434,26 @@ class OrchestrateScheduleUseCase:
         fairness_scores: dict["EmployeeId", float],
         request: SchedulingRequest,
     ) -> tuple[list["Assignment"], list[dict[str, Any]]]:
-        """Optimize shift assignments using fairness and availability."""
+        """Optimize shift assignments using fairness and availability.
+
+        Each shift goes to the eligible employee with the lowest running
+        fairness score (earliest in ``employees`` on ties). Scores live in an
+        ``_EmployeeLoadQueue``, so a shift costs O(log employees) instead of a
+        scan over everyone.
+        """
         assignments = []
         conflicts = []
+        queue = _EmployeeLoadQueue(employees, fairness_scores)
 
         for shift in shifts:
-            # Find eligible employees for this shift
-            eligible_employees = []
-            for employee in employees:
-                if employee.can_work_shift(shift):
-                    eligible_employees.append(employee)
+            best_employee = queue.pop_eligible(
+                shift.shift_type,
+                lambda employee, shift=shift: employee.is_available_for_shift(
+                    shift.shift_type, shift.time_range,
+                ),
+            )
 
-            if not eligible_employees:
+            if best_employee is None:
                 conflicts.append(
                     {
                         "type": "no_eligible_employees",
@@ -377,49 +463,21 @@ class OrchestrateScheduleUseCase:
                 )
                 continue
 
-            # Select best employee based on fairness
-            best_employee = self._select_best_employee(
-                eligible_employees, shift, fairness_scores,
+            assignment = Assignment.create_new(
+                employee_id=best_employee.id,
+                shift=shift,
+                assigned_at=datetime.now(),
+                status="tentative",
             )
+            assignments.append(assignment)
 
-            if best_employee:
-                assignment = Assignment.create_new(
-                    employee_id=best_employee.id,
-                    shift=shift,
-                    assigned_at=datetime.now(),
-                    status="tentative",
-                )
-                assignments.append(assignment)
-
-                # Update fairness scores for next iteration
-                fairness_scores[best_employee.id] += 1.0  # Simplified update
+            # Update fairness scores for next iteration
+            fairness_scores[best_employee.id] = queue.add_load(
+                best_employee, 1.0,
+            )  # Simplified update
 
         return assignments, conflicts
 
-    def _select_best_employee(
-        self,
-        eligible_employees: list["Employee"],
-        shift: "Shift",
-        fairness_scores: dict["EmployeeId", float],
-    ) -> Optional["Employee"]:
-        """Select the best employee for a shift based on fairness."""
-        if not eligible_employees:
-            return None
-
-        # Score each employee
-        scored_employees = []
-        for employee in eligible_employees:
-            # Base fairness score (lower is better for assignment)
-            fairness_score = fairness_scores.get(employee.id, 0.0)
-
-            # Simple scoring: prefer employees with lower fairness scores
-            total_score = -fairness_score
-
-            scored_employees.append((employee, total_score))
-
-        # Return employee with highest total score (lowest fairness score)
-        return max(scored_employees, key=lambda x: x[1])[0]
-
     async def _validate_coverage(
         self, assignments: list["Assignment"], date_range: "DateRange",
     ) -> dict[str, Any]:
@@ -473,9 +531,13 @@ class OrchestrateScheduleUseCase:
             employee_assignments[assignment.employee_id].append(assignment)
 
         # Calculate scores
+        employees = await self.uow.gather(
+            *(self.uow.employees.find_by_id(employee_id) for employee_id in employee_assignments),
+        )
         fairness_scores = {}
-        for employee_id, employee_assignments_list in employee_assignments.items():
-            employee = await self.uow.employees.find_by_id(employee_id)
+        for employee, (employee_id, employee_assignments_list) in zip(
+            employees, employee_assignments.items(), strict=True,
+        ):
             if employee:
                 fairness_result = self.fairness_calculator.calculate_employee_fairness(
                     employee, employee_assignments_list, date_range,
@@ -534,20 +596,21 @@ class ResolveConflictsUseCase:
     ) -> list[dict[str, Any]]:
         """Analyze conflicts for given assignments."""
         async with self.uow:
-            assignments = []
-            employees = {}
-
-            for assignment_id in assignment_ids:
-                assignment = await self.uow.assignments.find_by_id(assignment_id)
-                if assignment:
-                    assignments.append(assignment)
-                    # Get employee for conflict detection
-                    if assignment.employee_id not in employees:
-                        employee = await self.uow.employees.find_by_id(
-                            assignment.employee_id,
-                        )
-                        if employee:
-                            employees[assignment.employee_id] = employee
+            found = await self.uow.gather(
+                *(self.uow.assignments.find_by_id(aid) for aid in assignment_ids),
+            )
+            assignments = [assignment for assignment in found if assignment]
+
+            # Get employees for conflict detection, one lookup per employee
+            employee_ids = list(dict.fromkeys(a.employee_id for a in assignments))
+            found_employees = await self.uow.gather(
+                *(self.uow.employees.find_by_id(eid) for eid in employee_ids),
+            )
+            employees = {
+                eid: employee
+                for eid, employee in zip(employee_ids, found_employees, strict=True)
+                if employee
+            }
 
             conflicts = []
             for assignment in assignments:
@@ -16,6 +16,7 @@ from team_planner.users.api import auth_views
 from team_planner.users.api import rbac_views
 from team_planner.users.api import registration_views
 from team_planner.notifications.api_views import NotificationViewSet, NotificationPreferenceViewSet
+from team_planner.notifications.api_views import CalendarFeedTokenViewSet, calendar_feed_view
 from team_planner.reports import api as reports_api
 from team_planner.shifts import api as shifts_api
 from team_planner.leaves import api as leaves_api
@@ -41,6 +42,7 @@ router.register(
 # Notifications
 router.register("notifications", NotificationViewSet, basename="notification")
 router.register("notification-preferences", NotificationPreferenceViewSet, basename="notification-preference")
+router.register("calendar-feeds", CalendarFeedTokenViewSet, basename="calendar-feed-token")
 
 app_name = "api"
 urlpatterns = router.urls + [
@@ -91,6 +93,13 @@ urlpatterns = router.urls + [
         api_v2.orchestrator_metrics_v2,
         name="orchestrator_metrics_v2",
     ),
+    path(
+        "orchestrator-status/runs/",
+        api_v2.orchestrator_run_telemetry_v2,
+        name="orchestrator_run_telemetry_v2",
+    ),
+    # Subscribable iCalendar feeds (token in URL is the credential)
+    path("calendar/<str:token>.ics", calendar_feed_view, name="calendar-feed"),
     # MFA endpoints
     path("mfa/setup/", mfa_views.setup_mfa, name="mfa-setup"),
     path("mfa/verify/", mfa_views.verify_mfa, name="mfa-verify"),
@@ -119,6 +128,8 @@ urlpatterns = router.urls + [
     path("reports/swap-history/", reports_api.swap_history_report, name="report-swap-history"),
     path("reports/employee-hours/", reports_api.employee_hours_report, name="report-employee-hours"),
     path("reports/weekend-holiday/", reports_api.weekend_holiday_distribution_report, name="report-weekend-holiday"),
+    # Dashboard (team roster + personal section in one payload)
+    path("dashboard/", shifts_api.dashboard_overview_api, name="dashboard"),
     # Recurring Shift Pattern endpoints
     path("patterns/", shifts_api.recurring_pattern_list_create, name="patterns-list"),
     path("patterns/<int:pk>/", shifts_api.recurring_pattern_detail, name="patterns-detail"),
@@ -377,3 +377,48 @@ SPECTACULAR_SETTINGS = {
 }
 # Your stuff...
 # ------------------------------------------------------------------------------
+
+# Notifications outbox
+# ------------------------------------------------------------------------------
+# Emails are queued on notifications.OutboundEmail and delivered by the
+# notifications.drain_email_outbox task over one pooled SMTP connection per batch.
+NOTIFICATIONS_OUTBOX_BATCH_SIZE = env.int("NOTIFICATIONS_OUTBOX_BATCH_SIZE", default=50)
+NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS = env.int("NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS", default=6)
+NOTIFICATIONS_OUTBOX_BACKOFF_BASE_SECONDS = 60
+NOTIFICATIONS_OUTBOX_BACKOFF_MAX_SECONDS = 60 * 60
+NOTIFICATIONS_OUTBOX_KICK_WORKER = True
+# Shift notifications buffered by NotificationService.coalesce_shift_notifications()
+# are flushed as one digest per recipient at least this often.
+NOTIFICATIONS_DIGEST_WINDOW_SECONDS = env.int("NOTIFICATIONS_DIGEST_WINDOW_SECONDS", default=300)
+# Rolling window and body cache lifetime for subscribable .ics feeds
+CALENDAR_FEED_PAST_DAYS = 30
+CALENDAR_FEED_FUTURE_DAYS = 180
+CALENDAR_FEED_CACHE_SECONDS = 24 * 60 * 60
+# Short-lived per-user / per-team cache for the dashboard payload
+DASHBOARD_CACHE_SECONDS = 30
+# Cache lifetime of swap approval statistics for closed periods with no pending
+# requests left (see SwapApprovalService.get_approval_statistics)
+SWAP_APPROVAL_STATS_CACHE_SECONDS = 24 * 60 * 60
+# Progress events of background orchestration runs (see orchestrators/progress.py):
+# "redis" publishes over REDIS_URL pub/sub, "cache" polls the Django cache.
+ORCHESTRATOR_PROGRESS_BROKER = env("ORCHESTRATOR_PROGRESS_BROKER", default="redis")
+ORCHESTRATOR_PROGRESS_TTL_SECONDS = 24 * 60 * 60
+ORCHESTRATOR_PROGRESS_STREAM_SECONDS = 300
+# Previews are cached under a hash of their inputs and a version stamp of the
+# team's planning data (see orchestrators/preview_cache.py); 0 disables.
+ORCHESTRATOR_PREVIEW_CACHE_SECONDS = env.int("ORCHESTRATOR_PREVIEW_CACHE_SECONDS", default=15 * 60)
+# Lifetime of the orchestrator metrics snapshot (see orchestrators/metrics.py);
+# the beat task below recomputes it on the same period.
+ORCHESTRATOR_METRICS_SNAPSHOT_SECONDS = 60
+# Rows per transaction when the assignment history reset task purges history
+ORCHESTRATOR_HISTORY_PURGE_BATCH_SIZE = 500
+CELERY_BEAT_SCHEDULE = {
+    "notifications-drain-email-outbox": {
+        "task": "notifications.drain_email_outbox",
+        "schedule": 30.0,
+    },
+    "orchestrators-refresh-metrics-snapshot": {
+        "task": "orchestrators.refresh_metrics_snapshot",
+        "schedule": float(ORCHESTRATOR_METRICS_SNAPSHOT_SECONDS),
+    },
+}
@@ -76,3 +76,9 @@ LOGGING = {
 
 # Your stuff...
 # ------------------------------------------------------------------------------
+# Tests drain the outbox explicitly instead of dispatching to a broker
+NOTIFICATIONS_OUTBOX_KICK_WORKER = False
+# No Redis in tests: progress events go through the locmem cache
+ORCHESTRATOR_PROGRESS_BROKER = "cache"
+# Metrics are recomputed on every request so each test sees its own data
+ORCHESTRATOR_METRICS_SNAPSHOT_SECONDS = 0
@@ -426,6 +426,33 @@ class Assignment:
 
         return AssignmentId(random.randint(1, 1000000))
 
+    @classmethod
+    def create_new(
+        cls,
+        employee_id: EmployeeId,
+        shift: Shift,
+        assigned_at: datetime,
+        status: AssignmentStatus | str = AssignmentStatus.PENDING,
+    ) -> "Assignment":
+        """Create an automatic assignment proposal for a shift.
+
+        A "tentative" status is a proposal that still needs confirming, i.e.
+        ``AssignmentStatus.PENDING``.
+        """
+        if status == "tentative":
+            status = AssignmentStatus.PENDING
+        return cls(
+            id=cls.generate(),
+            employee_id=employee_id,
+            shift_id=shift.id,
+            assigned_at=assigned_at,
+            assigned_by=UserId.system(),
+            auto_assigned=True,
+            status=AssignmentStatus(status),
+            conflicts=[],
+            shift=shift,
+        )
+
     def validate(self) -> "ValidationResult":
         """Validate assignment against all constraints."""
         violations = []
@@ -156,7 +156,7 @@ const AssignmentHistoryReset: React.FC = () => {
       const data = await response.json();
 
       if (response.ok) {
-        setSuccess(`Successfully reset assignment history: ${data.summary.shifts_deleted} shifts deleted`);
+        setSuccess(`Assignment history reset started: ${data.summary.shifts_to_delete} shifts will be deleted`);
         setPreviewData(null);
         setConfirmDialogOpen(false);
         setDialogOpen(false);
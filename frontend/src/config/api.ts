@@ -24,6 +24,7 @@ export const API_CONFIG = {
     USER_DETAIL: '/api/users/{id}/',
     
     // Dashboard
+    DASHBOARD: '/api/dashboard/',
     SHIFTS_DASHBOARD: '/shifts/api/dashboard/',
     USERS_DASHBOARD: '/api/users/me/dashboard/',
     
@@ -80,30 +80,10 @@ const Dashboard: React.FC = () => {
     const fetchDashboardData = async () => {
       try {
         setLoading(true);
-        // Load general dashboard data (required)
-        const generalData = await dashboardService.getDashboardData();
-        setDashboardData(generalData);
-        
-        // Try to load user-specific dashboard data (optional)
-        try {
-          const userData = await userService.getUserDashboardData();
-          setUserDashboardData(userData);
-        } catch (userDataError) {
-          console.warn('User dashboard data not available:', userDataError);
-          // Set default empty user data
-          setUserDashboardData({
-            upcoming_shifts: [],
-            incoming_swap_requests: [],
-            outgoing_swap_requests: [],
-            recent_activities: [],
-            shift_stats: {
-              total_shifts_this_month: 0,
-              completed_shifts: 0,
-              upcoming_shifts: 0,
-              swap_requests_pending: 0,
-            },
-          });
-        }
+        // Team roster and personal data come from a single request
+        const { team, user } = await dashboardService.getCombinedDashboardData();
+        setDashboardData(team);
+        setUserDashboardData(user);
         
         setError(null);
       } catch (err) {
@@ -19,7 +19,16 @@ export interface Engineer {
   username: string;
 }
 
+export interface CombinedDashboardData {
+  team: DashboardData;
+  user: UserDashboardData;
+}
+
 export const dashboardService = {
+  getCombinedDashboardData: async (): Promise<CombinedDashboardData> => {
+    return apiClient.get(API_CONFIG.ENDPOINTS.DASHBOARD);
+  },
+
   getDashboardData: async (): Promise<DashboardData> => {
     return apiClient.get(API_CONFIG.ENDPOINTS.SHIFTS_DASHBOARD);
   },
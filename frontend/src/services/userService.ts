@@ -89,6 +89,10 @@ export interface UserDashboardData {
     upcoming_shifts: number;
     swap_requests_pending: number;
   };
+  leave_stats?: {
+    pending: number;
+    upcoming_approved: number;
+  };
 }
 
 export interface Activity {
@@ -10,6 +10,8 @@ Key Design Principles:
 3. Provides transaction management through Django ORM
 4. Optimizes queries to prevent N+1 problems
 5. Maintains domain model purity (no Django dependencies in domain)
+6. Uses Django's native async ORM API (aget, async iteration, abulk_create)
+   instead of wrapping sync calls, so independent loads can be gathered
 """
 
 import asyncio
@@ -24,6 +26,7 @@ from typing import Set
 from asgiref.sync import sync_to_async
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import QuerySet
 from django.utils import timezone
 
 from application.repositories import AssignmentQuery
@@ -66,6 +69,47 @@ from team_planner.teams.models import TeamMembership
 
 User = get_user_model()
 
+ACTIVE_SHIFT_STATUSES = [
+    Shift.Status.SCHEDULED,
+    Shift.Status.CONFIRMED,
+    Shift.Status.IN_PROGRESS,
+]
+
+
+async def _alist(queryset: QuerySet) -> list[Any]:
+    """Evaluate a queryset with async iteration (prefetches included)."""
+    return [obj async for obj in queryset]
+
+
+async def _previous_assignees(shift_ids: list[int]) -> list[int]:
+    """Current holders of ``shift_ids``, read before a bulk write reassigns them."""
+    if not shift_ids:
+        return []
+    return await _alist(
+        Shift.objects.filter(id__in=shift_ids).values_list("assigned_employee_id", flat=True),
+    )
+
+
+def _refresh_employee_caches(employee_ids) -> None:
+    """Bulk writes skip Shift signals, so refresh the feeds and dashboards they would have."""
+    from team_planner.notifications.calendar_feed import bump_feed_version
+    from team_planner.shifts.services.dashboard import DashboardService
+
+    ids = {pk for pk in employee_ids if pk}
+
+    def refresh():
+        bump_feed_version(ids)
+        for user_id in ids:
+            DashboardService.invalidate_user(user_id)
+
+    transaction.on_commit(refresh)
+
+
+def _timezone_name(value: datetime) -> str:
+    """IANA name of an aware datetime's zone (pytz ``zone`` or zoneinfo ``key``)."""
+    tzinfo = value.tzinfo
+    return getattr(tzinfo, "zone", None) or getattr(tzinfo, "key", None) or "UTC"
+
 
 class DjangoEmployeeRepository(EmployeeRepository):
     """Django ORM implementation of EmployeeRepository."""
@@ -73,9 +117,11 @@ class DjangoEmployeeRepository(EmployeeRepository):
     async def find_by_id(self, employee_id: EmployeeId) -> Employee | None:
         """Find employee by ID."""
         try:
-            user = await sync_to_async(
-                User.objects.select_related("employee_profile").get,
-            )(id=employee_id.value)
+            user = await (
+                User.objects.select_related("employee_profile")
+                .prefetch_related("teams")
+                .aget(id=employee_id.value)
+            )
             return self._map_to_domain_employee(user)
         except User.DoesNotExist:
             return None
@@ -106,7 +152,7 @@ class DjangoEmployeeRepository(EmployeeRepository):
                     employee_profile__skills__name__in=query.has_skills,
                 ).distinct()
 
-        users = await sync_to_async(list)(queryset)
+        users = await _alist(queryset)
         return [self._map_to_domain_employee(user) for user in users]
 
     async def find_available_for_shift(
@@ -118,7 +164,7 @@ class DjangoEmployeeRepository(EmployeeRepository):
         """Find employees available for a specific shift."""
         queryset = (
             User.objects.select_related("employee_profile")
-            .prefetch_related("employee_profile__skills")
+            .prefetch_related("employee_profile__skills", "teams")
             .filter(employee_profile__status=EmployeeProfile.Status.ACTIVE)
         )
 
@@ -140,30 +186,25 @@ class DjangoEmployeeRepository(EmployeeRepository):
         # - Recurring leave patterns
         # - Employee availability preferences
 
-        users = await sync_to_async(list)(queryset)
+        users = await _alist(queryset)
         return [self._map_to_domain_employee(user) for user in users]
 
     async def get_employee_assignments_count(
         self, employee_id: EmployeeId, date_range: TimeRange,
     ) -> int:
         """Get count of assignments for employee in date range."""
-        return await sync_to_async(
-            Shift.objects.filter(
-                assigned_employee_id=employee_id.value,
-                start_datetime__gte=date_range.start,
-                end_datetime__lte=date_range.end,
-                status__in=[
-                    Shift.Status.SCHEDULED,
-                    Shift.Status.CONFIRMED,
-                    Shift.Status.IN_PROGRESS,
-                ],
-            ).count,
-        )()
+        return await Shift.objects.filter(
+            assigned_employee_id=employee_id.value,
+            start_datetime__gte=date_range.start,
+            end_datetime__lte=date_range.end,
+            status__in=ACTIVE_SHIFT_STATUSES,
+        ).acount()
 
     async def get_employees_by_department(self, department_id: str) -> list[Employee]:
         """Get all employees in a department."""
-        users = await sync_to_async(list)(
+        users = await _alist(
             User.objects.select_related("employee_profile")
+            .prefetch_related("teams")
             .filter(
                 teams__department__id=department_id,
                 employee_profile__status=EmployeeProfile.Status.ACTIVE,
@@ -181,8 +222,8 @@ class DjangoEmployeeRepository(EmployeeRepository):
     async def delete(self, employee_id: EmployeeId) -> None:
         """Delete employee."""
         # In a full implementation, this would deactivate rather than delete
-        await sync_to_async(User.objects.filter(id=employee_id.value).update)(
-            employee_profile__status=EmployeeProfile.Status.INACTIVE,
+        await EmployeeProfile.objects.filter(user_id=employee_id.value).aupdate(
+            status=EmployeeProfile.Status.INACTIVE,
         )
 
     def _map_to_domain_employee(self, user: Any) -> Employee:
@@ -255,16 +296,16 @@ class DjangoShiftRepository(ShiftRepository):
     async def find_by_id(self, shift_id: ShiftId) -> DomainShift | None:
         """Find shift by ID."""
         try:
-            django_shift = await sync_to_async(
-                Shift.objects.select_related("template", "assigned_employee").get,
-            )(id=shift_id.value)
+            django_shift = await Shift.objects.select_related("template").aget(
+                id=shift_id.value,
+            )
             return self._map_to_domain_shift(django_shift)
         except Shift.DoesNotExist:
             return None
 
     async def find_all(self, query: ShiftQuery | None = None) -> list[DomainShift]:
         """Find shifts matching query criteria."""
-        queryset = Shift.objects.select_related("template", "assigned_employee")
+        queryset = Shift.objects.select_related("template")
 
         if query:
             if query.date_range:
@@ -291,14 +332,14 @@ class DjangoShiftRepository(ShiftRepository):
                 employee_ids = [emp_id.value for emp_id in query.assigned_to]
                 queryset = queryset.filter(assigned_employee__id__in=employee_ids)
 
-        shifts = await sync_to_async(list)(queryset)
+        shifts = await _alist(queryset)
         return [self._map_to_domain_shift(shift) for shift in shifts]
 
     async def find_unassigned_in_range(
         self, date_range: TimeRange,
     ) -> list[DomainShift]:
         """Find unassigned shifts in date range."""
-        shifts = await sync_to_async(list)(
+        shifts = await _alist(
             Shift.objects.select_related("template").filter(
                 start_datetime__gte=date_range.start,
                 end_datetime__lte=date_range.end,
@@ -312,16 +353,12 @@ class DjangoShiftRepository(ShiftRepository):
         self, employee_id: EmployeeId, time_range: TimeRange,
     ) -> list[DomainShift]:
         """Find shifts that would conflict with employee assignment."""
-        shifts = await sync_to_async(list)(
+        shifts = await _alist(
             Shift.objects.select_related("template").filter(
                 assigned_employee_id=employee_id.value,
                 start_datetime__lt=time_range.end,
                 end_datetime__gt=time_range.start,
-                status__in=[
-                    Shift.Status.SCHEDULED,
-                    Shift.Status.CONFIRMED,
-                    Shift.Status.IN_PROGRESS,
-                ],
+                status__in=ACTIVE_SHIFT_STATUSES,
             ),
         )
         return [self._map_to_domain_shift(shift) for shift in shifts]
@@ -339,8 +376,8 @@ class DjangoShiftRepository(ShiftRepository):
             datetime.combine(target_date, datetime.max.time()),
         )
 
-        shifts = await sync_to_async(list)(
-            Shift.objects.select_related("template", "assigned_employee").filter(
+        shifts = await _alist(
+            Shift.objects.select_related("template").filter(
                 start_datetime__gte=start_datetime, start_datetime__lt=end_datetime,
             ),
         )
@@ -360,54 +397,74 @@ class DjangoShiftRepository(ShiftRepository):
 
     async def save(self, shift: DomainShift) -> None:
         """Save or update shift."""
-        # Create or update Django Shift object
-        django_shift_data = {
-            "start_datetime": shift.time_range.start,
-            "end_datetime": shift.time_range.end,
-            "status": shift.assignment_status.value
-            if hasattr(shift.assignment_status, "value")
-            else str(shift.assignment_status),
-            "auto_assigned": getattr(shift, "auto_assigned", True),
-            "assignment_reason": getattr(shift, "notes", ""),
-        }
-
-        # Get or create template
         template = await self._get_or_create_template(shift.shift_type)
-        django_shift_data["template"] = template
-
-        if shift.assigned_employee:
-            django_shift_data["assigned_employee_id"] = shift.assigned_employee.value
+        django_shift_data = self._django_shift_data(shift, template)
 
         if shift.id:
             # Update existing
-            await sync_to_async(Shift.objects.filter(id=shift.id.value).update)(
-                **django_shift_data,
-            )
+            await Shift.objects.filter(id=shift.id.value).aupdate(**django_shift_data)
         else:
             # Create new
-            django_shift = await sync_to_async(Shift.objects.create)(
-                **django_shift_data,
-            )
+            django_shift = await Shift.objects.acreate(**django_shift_data)
             # Update domain shift with new ID
             object.__setattr__(shift, "id", ShiftId(django_shift.pk))
 
     async def save_batch(self, shifts: list[DomainShift]) -> None:
-        """Save multiple shifts in batch."""
+        """Save multiple shifts: one template lookup per type, new shifts in one INSERT."""
+        templates = {}
+        for shift in shifts:
+            if shift.shift_type not in templates:
+                templates[shift.shift_type] = await self._get_or_create_template(
+                    shift.shift_type,
+                )
+
+        new_shifts = [shift for shift in shifts if not shift.id]
+        affected = await _previous_assignees([shift.id.value for shift in shifts if shift.id])
         for shift in shifts:
-            await self.save(shift)
+            if shift.id:
+                await Shift.objects.filter(id=shift.id.value).aupdate(
+                    **self._django_shift_data(shift, templates[shift.shift_type]),
+                )
+
+        created = await Shift.objects.abulk_create(
+            [
+                Shift(**self._django_shift_data(shift, templates[shift.shift_type]))
+                for shift in new_shifts
+            ],
+        )
+        for shift, django_shift in zip(new_shifts, created, strict=True):
+            object.__setattr__(shift, "id", ShiftId(django_shift.pk))
+
+        affected += [shift.assigned_employee.value for shift in shifts if shift.assigned_employee]
+        # On the ORM's thread, so it joins an open unit of work's transaction
+        await sync_to_async(_refresh_employee_caches)(affected)
 
     async def delete(self, shift_id: ShiftId) -> None:
         """Delete shift."""
-        await sync_to_async(Shift.objects.filter(id=shift_id.value).delete)()
+        await Shift.objects.filter(id=shift_id.value).adelete()
+
+    def _django_shift_data(self, shift: DomainShift, template: ShiftTemplate) -> dict[str, Any]:
+        """Django Shift field values for a domain shift."""
+        django_shift_data = {
+            "start_datetime": shift.time_range.start,
+            "end_datetime": shift.time_range.end,
+            "status": shift.assignment_status.value
+            if hasattr(shift.assignment_status, "value")
+            else str(shift.assignment_status),
+            "auto_assigned": getattr(shift, "auto_assigned", True),
+            "assignment_reason": getattr(shift, "notes", ""),
+            "template": template,
+        }
+        if shift.assigned_employee:
+            django_shift_data["assigned_employee_id"] = shift.assigned_employee.value
+        return django_shift_data
 
     def _map_to_domain_shift(self, django_shift: Any) -> DomainShift:
         """Map Django Shift to domain Shift."""
         time_range = TimeRange(
             start=django_shift.start_datetime,
             end=django_shift.end_datetime,
-            timezone=django_shift.start_datetime.tzinfo.zone
-            if django_shift.start_datetime.tzinfo
-            else "UTC",
+            timezone=_timezone_name(django_shift.start_datetime),
         )
 
         shift_type = self._map_to_domain_shift_type(django_shift.template.shift_type)
@@ -422,8 +479,8 @@ class DjangoShiftRepository(ShiftRepository):
             shift_type=shift_type,
             time_range=time_range,
             team_id=team_id,
-            assigned_employee=EmployeeId(django_shift.assigned_employee.pk)
-            if django_shift.assigned_employee
+            assigned_employee=EmployeeId(django_shift.assigned_employee_id)
+            if django_shift.assigned_employee_id
             else None,
             assignment_status=self._map_to_domain_assignment_status(
                 django_shift.status,
@@ -479,7 +536,7 @@ class DjangoShiftRepository(ShiftRepository):
         """Get or create shift template for shift type."""
         django_shift_type = self._map_to_django_shift_type(shift_type)
 
-        template, created = await sync_to_async(ShiftTemplate.objects.get_or_create)(
+        template, _created = await ShiftTemplate.objects.aget_or_create(
             shift_type=django_shift_type,
             name=f"Default {shift_type.value}",
             defaults={
@@ -499,9 +556,9 @@ class DjangoAssignmentRepository(AssignmentRepository):
         """Find assignment by ID."""
         try:
             # Assignments are represented by Shift objects in Django
-            django_shift = await sync_to_async(
-                Shift.objects.select_related("template", "assigned_employee").get,
-            )(id=assignment_id)
+            django_shift = await Shift.objects.select_related("template").aget(
+                id=assignment_id,
+            )
             return self._map_to_domain_assignment(django_shift)
         except Shift.DoesNotExist:
             return None
@@ -510,9 +567,9 @@ class DjangoAssignmentRepository(AssignmentRepository):
         self, query: AssignmentQuery | None = None,
     ) -> list[Assignment]:
         """Find assignments matching query criteria."""
-        queryset = Shift.objects.select_related(
-            "template", "assigned_employee",
-        ).exclude(assigned_employee__isnull=True)
+        queryset = Shift.objects.select_related("template").exclude(
+            assigned_employee__isnull=True,
+        )
 
         if query:
             if query.employee_id:
@@ -529,24 +586,18 @@ class DjangoAssignmentRepository(AssignmentRepository):
 
             if query.status:
                 if query.status == "active":
-                    queryset = queryset.filter(
-                        status__in=[
-                            Shift.Status.SCHEDULED,
-                            Shift.Status.CONFIRMED,
-                            Shift.Status.IN_PROGRESS,
-                        ],
-                    )
+                    queryset = queryset.filter(status__in=ACTIVE_SHIFT_STATUSES)
                 elif query.status == "cancelled":
                     queryset = queryset.filter(status=Shift.Status.CANCELLED)
 
-        shifts = await sync_to_async(list)(queryset)
+        shifts = await _alist(queryset)
         return [self._map_to_domain_assignment(shift) for shift in shifts]
 
     async def find_by_employee_and_date_range(
         self, employee_id: EmployeeId, date_range: TimeRange,
     ) -> list[Assignment]:
         """Find assignments for employee in date range."""
-        shifts = await sync_to_async(list)(
+        shifts = await _alist(
             Shift.objects.select_related("template")
             .filter(
                 assigned_employee_id=employee_id.value,
@@ -557,13 +608,36 @@ class DjangoAssignmentRepository(AssignmentRepository):
         )
         return [self._map_to_domain_assignment(shift) for shift in shifts]
 
+    async def find_by_employees_and_date_range(
+        self, employee_ids: list[EmployeeId], date_range: TimeRange,
+    ) -> dict[EmployeeId, list[Assignment]]:
+        """Find assignments for several employees in date range with one query."""
+        by_employee: dict[EmployeeId, list[Assignment]] = {
+            employee_id: [] for employee_id in employee_ids
+        }
+        if not by_employee:
+            return by_employee
+        shifts = await _alist(
+            Shift.objects.select_related("template")
+            .filter(
+                assigned_employee_id__in=[e.value for e in by_employee],
+                start_datetime__gte=date_range.start,
+                end_datetime__lte=date_range.end,
+            )
+            .order_by("start_datetime", "pk"),
+        )
+        for shift in shifts:
+            assignment = self._map_to_domain_assignment(shift)
+            by_employee[assignment.employee_id].append(assignment)
+        return by_employee
+
     async def find_by_shift(self, shift_id: ShiftId) -> list[Assignment]:
         """Find all assignments for a shift."""
         try:
-            shift = await sync_to_async(
-                Shift.objects.select_related("template", "assigned_employee").get,
-            )(id=shift_id.value)
-            if shift.assigned_employee:
+            shift = await Shift.objects.select_related("template").aget(
+                id=shift_id.value,
+            )
+            if shift.assigned_employee_id:
                 return [self._map_to_domain_assignment(shift)]
             return []
         except Shift.DoesNotExist:
@@ -573,16 +647,12 @@ class DjangoAssignmentRepository(AssignmentRepository):
         self, employee_id: EmployeeId, time_range: TimeRange,
     ) -> list[Assignment]:
         """Find assignments that would conflict with new assignment."""
-        shifts = await sync_to_async(list)(
+        shifts = await _alist(
             Shift.objects.select_related("template").filter(
                 assigned_employee_id=employee_id.value,
                 start_datetime__lt=time_range.end,
                 end_datetime__gt=time_range.start,
-                status__in=[
-                    Shift.Status.SCHEDULED,
-                    Shift.Status.CONFIRMED,
-                    Shift.Status.IN_PROGRESS,
-                ],
+                status__in=ACTIVE_SHIFT_STATUSES,
             ),
         )
         return [self._map_to_domain_assignment(shift) for shift in shifts]
@@ -591,7 +661,7 @@ class DjangoAssignmentRepository(AssignmentRepository):
         self, employee_id: EmployeeId, date_range: TimeRange,
     ) -> dict[str, Any]:
         """Get assignment statistics for employee in date range."""
-        shifts = await sync_to_async(list)(
+        shifts = await _alist(
             Shift.objects.select_related("template").filter(
                 assigned_employee_id=employee_id.value,
                 start_datetime__gte=date_range.start,
@@ -627,39 +697,53 @@ class DjangoAssignmentRepository(AssignmentRepository):
         # Assignments are saved as part of shift updates
         # This would update the assigned_employee field on the Shift
         if hasattr(assignment, "shift_id") and assignment.shift_id:
-            await sync_to_async(
-                Shift.objects.filter(id=assignment.shift_id.value).update,
-            )(
+            await Shift.objects.filter(id=assignment.shift_id.value).aupdate(
                 assigned_employee_id=assignment.employee_id.value,
-                status=assignment.status.value
-                if hasattr(assignment.status, "value")
-                else assignment.status,
+                status=self._status_value(assignment),
             )
 
     async def save_batch(self, assignments: list[Assignment]) -> None:
-        """Save multiple assignments in batch."""
-        for assignment in assignments:
-            await self.save(assignment)
+        """Save multiple assignments with one bulk UPDATE."""
+        updates = [
+            Shift(
+                pk=assignment.shift_id.value,
+                assigned_employee_id=assignment.employee_id.value,
+                status=self._status_value(assignment),
+            )
+            for assignment in assignments
+            if getattr(assignment, "shift_id", None)
+        ]
+        affected = await _previous_assignees([shift.pk for shift in updates])
+        await Shift.objects.abulk_update(updates, ["assigned_employee", "status"])
+
+        affected += [shift.assigned_employee_id for shift in updates]
+        await sync_to_async(_refresh_employee_caches)(affected)
 
     async def delete(self, assignment_id: str) -> None:
         """Delete assignment."""
         # This would unassign the employee from the shift
-        await sync_to_async(Shift.objects.filter(id=assignment_id).update)(
+        await Shift.objects.filter(id=assignment_id).aupdate(
             assigned_employee=None, status=Shift.Status.SCHEDULED,
         )
 
+    @staticmethod
+    def _status_value(assignment: Assignment) -> str:
+        return (
+            assignment.status.value
+            if hasattr(assignment.status, "value")
+            else assignment.status
+        )
+
     def _map_to_domain_assignment(self, django_shift: Any) -> Assignment:
         """Map Django Shift to domain Assignment."""
-        if not django_shift.assigned_employee:
+        if not django_shift.assigned_employee_id:
             msg = "Cannot create assignment from unassigned shift"
             raise ValueError(msg)
 
         time_range = TimeRange(
             start=django_shift.start_datetime,
             end=django_shift.end_datetime,
-            timezone=django_shift.start_datetime.tzinfo.zone
-            if django_shift.start_datetime.tzinfo
-            else "UTC",
+            timezone=_timezone_name(django_shift.start_datetime),
         )
 
         # Create shift entity for the assignment
@@ -669,7 +753,7 @@ class DjangoAssignmentRepository(AssignmentRepository):
             shift_type=self._map_to_domain_shift_type(django_shift.template.shift_type),
             time_range=time_range,
             team_id=team_id,
-            assigned_employee=EmployeeId(django_shift.assigned_employee.pk),
+            assigned_employee=EmployeeId(django_shift.assigned_employee_id),
             assignment_status=AssignmentStatus.CONFIRMED,  # Simplified mapping
             auto_assigned=getattr(django_shift, "auto_assigned", False),
         )
@@ -679,7 +763,7 @@ class DjangoAssignmentRepository(AssignmentRepository):
 
         return Assignment(
             id=AssignmentId(django_shift.pk),  # Use proper AssignmentId
-            employee_id=EmployeeId(django_shift.assigned_employee.pk),
+            employee_id=EmployeeId(django_shift.assigned_employee_id),
             shift_id=ShiftId(django_shift.pk),
             assigned_at=getattr(django_shift, "created_at", datetime.utcnow()),
             assigned_by=UserId.system(),  # System user for auto assignments
@@ -708,12 +792,14 @@ class DjangoLeaveRequestRepository(LeaveRequestRepository):
         self, employee_id: EmployeeId, date_range: TimeRange,
     ) -> list[dict[str, Any]]:
         """Find leave requests for employee in date range."""
-        leave_requests = await sync_to_async(list)(
+        leave_requests = await _alist(
             LeaveRequest.objects.filter(
                 employee_id=employee_id.value,
                 start_date__lte=date_range.end.date(),
                 end_date__gte=date_range.start.date(),
-            ).order_by("start_date"),
+            )
+            .select_related("leave_type")
+            .order_by("start_date"),
         )
 
         return [
@@ -733,7 +819,7 @@ class DjangoLeaveRequestRepository(LeaveRequestRepository):
         self, date_range: TimeRange,
     ) -> list[dict[str, Any]]:
         """Find all approved leave requests in date range."""
-        leave_requests = await sync_to_async(list)(
+        leave_requests = await _alist(
             LeaveRequest.objects.filter(
                 start_date__lte=date_range.end.date(),
                 end_date__gte=date_range.start.date(),
@@ -760,16 +846,12 @@ class DjangoLeaveRequestRepository(LeaveRequestRepository):
         self, employee_id: EmployeeId, time_range: TimeRange,
     ) -> bool:
         """Check if employee has approved leave during time range."""
-        count = await sync_to_async(
-            LeaveRequest.objects.filter(
-                employee_id=employee_id.value,
-                start_date__lte=time_range.end.date(),
-                end_date__gte=time_range.start.date(),
-                status="approved",
-            ).count,
-        )()
-
-        return count > 0
+        return await LeaveRequest.objects.filter(
+            employee_id=employee_id.value,
+            start_date__lte=time_range.end.date(),
+            end_date__gte=time_range.start.date(),
+            status="approved",
+        ).aexists()
 
 
 class DjangoUnitOfWork(UnitOfWork):
@@ -809,9 +891,9 @@ class DjangoUnitOfWork(UnitOfWork):
 
     async def rollback(self) -> None:
         """Rollback transaction."""
-        # Force transaction rollback
+        # Mark the atomic block for rollback; it is rolled back on exit
         if self._transaction:
-            await sync_to_async(self._transaction.rollback)()
+            await sync_to_async(transaction.set_rollback)(True)
 
 
 # Factory function for creating UnitOfWork instances
@@ -14,6 +14,7 @@ from team_planner.rbac.decorators import require_permission
 from team_planner.notifications.mailer import build_ics_for_leave
 from team_planner.notifications.mailer import notify_leave_approved
 from team_planner.notifications.services import NotificationService
+from team_planner.utils.pagination import KeysetPaginationMixin
 
 from .models import LeaveRequest
 from .models import LeaveType
@@ -23,8 +24,11 @@ from .serializers import LeaveTypeSerializer
 User = get_user_model()
 
 
-class LeaveRequestViewSet(viewsets.ModelViewSet):
-    """ViewSet for managing leave requests."""
+class LeaveRequestViewSet(KeysetPaginationMixin, viewsets.ModelViewSet):
+    """ViewSet for managing leave requests.
+
+    ``?pagination=cursor`` pages by (created, id) instead of page numbers.
+    """
 
     queryset = LeaveRequest.objects.all()
     serializer_class = LeaveRequestSerializer
@@ -164,7 +168,9 @@ class LeaveRequestViewSet(viewsets.ModelViewSet):
         try:
             ics = build_ics_for_leave(leave_request)
             email = getattr(leave_request.employee, "email", None)
-            notify_leave_approved(email, ics)
+            notify_leave_approved(
+                email, ics, idempotency_key=f"leave-approved-ics:{leave_request.pk}",
+            )
         except Exception:
             pass
 
@@ -80,6 +80,20 @@ class LeaveType(TimeStampedModel):
     def get_absolute_url(self):
         return reverse("leaves:leavetype_detail", kwargs={"pk": self.pk})
 
+    @staticmethod
+    def blocks_shift_type(conflict_handling: str, shift_type: str) -> bool:
+        """Whether approved leave with ``conflict_handling`` keeps someone from ``shift_type``.
+
+        Daytime-only leave leaves the employee available for waakdienst.
+        """
+        from team_planner.shifts.models import ShiftType
+
+        if conflict_handling == LeaveType.ConflictHandling.FULL_UNAVAILABLE:
+            return True
+        if conflict_handling == LeaveType.ConflictHandling.DAYTIME_ONLY:
+            return shift_type != ShiftType.WAAKDIENST
+        return False
+
 
 class LeaveRequest(TimeStampedModel):
     """Employee leave request."""
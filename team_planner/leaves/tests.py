@@ -149,6 +149,14 @@ class LeaveRequestTestCase(TestCase):
         # Should not be approvable due to shift conflicts
         assert not leave_request.can_be_approved()
 
+    def test_conflict_handling_decides_blocked_shift_types(self):
+        handling = LeaveType.ConflictHandling
+        for shift_type in ("incidents", "incidents_standby", "changes", "projects"):
+            assert LeaveType.blocks_shift_type(handling.DAYTIME_ONLY, shift_type)
+        assert not LeaveType.blocks_shift_type(handling.DAYTIME_ONLY, "waakdienst")
+        assert LeaveType.blocks_shift_type(handling.FULL_UNAVAILABLE, "waakdienst")
+        assert not LeaveType.blocks_shift_type(handling.NO_CONFLICT, "incidents")
+
 
 class LeaveRequestIntegrationTestCase(TestCase):
     def setUp(self):
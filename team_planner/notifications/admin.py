@@ -1,8 +1,9 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
-from .models import Notification, NotificationPreference, EmailLog
+from .models import Notification, NotificationPreference, EmailLog, OutboundEmail, CalendarFeedToken
 
 
 @admin.register(Notification)
@@ -143,3 +144,31 @@ class EmailLogAdmin(admin.ModelAdmin):
             return format_html('<span style="color: green; font-size: 16px;">✓</span>')
         return format_html('<span style="color: red; font-size: 16px;">✗</span>')
     success_icon.short_description = _('Status')
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'recipient', 'notification_type', 'status', 'attempts', 'next_attempt_at', 'sent_at']
+    list_filter = ['status', 'notification_type', 'created']
+    search_fields = ['subject', 'idempotency_key', 'recipient__username']
+    readonly_fields = ['idempotency_key', 'created', 'sent_at', 'locked_at', 'last_error', 'attempts']
+    date_hierarchy = 'created'
+    
+    actions = ['retry_now']
+    
+    def retry_now(self, request, queryset):
+        count = queryset.exclude(status=OutboundEmail.Status.SENT).update(
+            status=OutboundEmail.Status.PENDING,
+            next_attempt_at=timezone.now(),
+            locked_at=None,
+        )
+        self.message_user(request, f"{count} email(s) rescheduled for delivery.")
+    retry_now.short_description = _("Retry selected now")
+
+
+@admin.register(CalendarFeedToken)
+class CalendarFeedTokenAdmin(admin.ModelAdmin):
+    list_display = ['user', 'team', 'is_active', 'created']
+    list_filter = ['is_active', 'created']
+    search_fields = ['user__username', 'team__name']
+    readonly_fields = ['token', 'created']
@@ -1,18 +1,30 @@
-from rest_framework import viewsets, status
+from rest_framework import mixins, viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.db import transaction
+from django.http import Http404, HttpResponse
 from django.utils import timezone
+from django.views.decorators.http import condition, require_GET
 
-from .models import Notification, NotificationPreference
-from .serializers import NotificationSerializer, NotificationPreferenceSerializer
+from team_planner.utils.pagination import KeysetPaginationMixin
 
+from . import calendar_feed
+from . import counters
+from .models import CalendarFeedToken, Notification, NotificationPreference
+from .serializers import (
+    CalendarFeedTokenSerializer,
+    NotificationSerializer,
+    NotificationPreferenceSerializer,
+)
 
-class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
+
+class NotificationViewSet(KeysetPaginationMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet for notifications.
     
-    Users can only see their own notifications.
+    Users can only see their own notifications. ``?pagination=cursor`` pages
+    by (created, id) for infinite scroll.
     """
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
@@ -38,10 +50,11 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=['post'])
     def mark_all_read(self, request):
         """Mark all notifications as read for the current user."""
-        count = 0
-        for notification in self.get_queryset().filter(is_read=False):
-            notification.mark_as_read()
-            count += 1
+        with transaction.atomic():
+            count = self.get_queryset().filter(is_read=False).update(
+                is_read=True, read_at=timezone.now(),
+            )
+            counters.adjust_unread({request.user.pk: -count})
         return Response({
             'status': 'all notifications marked as read',
             'count': count
@@ -49,15 +62,16 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     
     @action(detail=False, methods=['get'])
     def unread_count(self, request):
-        """Get count of unread notifications."""
-        count = self.get_queryset().filter(is_read=False).count()
-        return Response({'unread_count': count})
+        """Get count of unread notifications (maintained counter, cached)."""
+        return Response({'unread_count': counters.unread_count(request.user.pk)})
     
     @action(detail=False, methods=['delete'])
     def clear_all(self, request):
         """Delete all notifications for the current user."""
-        count = self.get_queryset().count()
-        self.get_queryset().delete()
+        with transaction.atomic():
+            count = self.get_queryset().count()
+            self.get_queryset().delete()
+            counters.recount(request.user.pk)
         return Response({
             'status': 'all notifications cleared',
             'count': count
@@ -99,3 +113,64 @@ class NotificationPreferenceViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         return Response(serializer.data)
+
+
+class CalendarFeedTokenViewSet(
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    mixins.DestroyModelMixin,
+    viewsets.GenericViewSet,
+):
+    """
+    ViewSet for managing calendar feed subscriptions.
+    
+    POST without a team creates a personal feed; with ``team`` a team feed.
+    DELETE revokes the token.
+    """
+    serializer_class = CalendarFeedTokenSerializer
+    permission_classes = [IsAuthenticated]
+    
+    def get_queryset(self):
+        """Return only the current user's active feed tokens."""
+        return CalendarFeedToken.objects.filter(
+            user=self.request.user, is_active=True
+        ).select_related('team', 'user')
+    
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)
+    
+    def perform_destroy(self, instance):
+        instance.is_active = False
+        instance.save(update_fields=['is_active'])
+
+
+def _feed_state(request, token):
+    """Resolve scope and version once per request for both condition() callbacks."""
+    if not hasattr(request, '_calendar_feed'):
+        scope = calendar_feed.resolve_scope(token)
+        if scope is None:
+            raise Http404("Unknown calendar feed")
+        request._calendar_feed = (scope, calendar_feed.get_feed_state(scope))
+    return request._calendar_feed
+
+
+@require_GET
+@condition(
+    etag_func=lambda request, token: _feed_state(request, token)[1].etag,
+    last_modified_func=lambda request, token: _feed_state(request, token)[1].last_modified,
+)
+def calendar_feed_view(request, token):
+    """
+    Serve a subscribable .ics feed addressed by its secret token.
+    
+    Unchanged feeds are answered with 304 via ETag/If-Modified-Since, and
+    changed feeds are rendered once per data version and served from cache.
+    """
+    scope, state = _feed_state(request, token)
+    response = HttpResponse(
+        calendar_feed.render_feed(scope, state),
+        content_type='text/calendar; charset=utf-8',
+    )
+    response['Cache-Control'] = 'private, max-age=300'
+    response['Content-Disposition'] = 'inline; filename="team-planner.ics"'
+    return response
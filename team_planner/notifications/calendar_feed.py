@@ -0,0 +1,229 @@
+"""
+Subscribable iCalendar feeds for employees and teams.
+
+Feeds are addressed by an unguessable ``CalendarFeedToken`` and rendered from
+Shift and approved LeaveRequest data over a rolling window. Rendered bodies are
+cached under a data version: every employee has a version stamp (the time of
+the last change to their shifts or leaves) that signals bump, and a team feed's
+version is derived from its members' stamps. Calendar clients polling an
+unchanged feed are answered from cache or with ``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone as dt_timezone
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .mailer import IcsEvent
+from .mailer import build_ics_for_shift
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+CACHE_PREFIX = "calendar_feed"
+TOKEN_CACHE_TIMEOUT = 300
+MEMBERS_CACHE_TIMEOUT = 300
+
+
+def _user_version_key(user_id: int) -> str:
+    return f"{CACHE_PREFIX}:user:{user_id}:version"
+
+
+def _team_members_key(team_id: int) -> str:
+    return f"{CACHE_PREFIX}:team:{team_id}:members"
+
+
+def _token_key(token: str) -> str:
+    return f"{CACHE_PREFIX}:token:{token}"
+
+
+def bump_feed_version(user_ids: Iterable[int | None]) -> None:
+    """Mark the calendar data of these employees as changed."""
+    now = time.time()
+    cache.set_many(
+        {_user_version_key(uid): now for uid in set(user_ids) if uid}, timeout=None,
+    )
+
+
+def invalidate_team_members(team_id: int) -> None:
+    cache.delete(_team_members_key(team_id))
+
+
+def invalidate_token(token: str) -> None:
+    cache.delete(_token_key(token))
+
+
+@dataclass(frozen=True)
+class FeedScope:
+    """What a token gives access to: one employee, or every member of a team."""
+
+    token: str
+    user_id: int
+    team_id: int | None
+    name: str
+
+    @property
+    def cache_id(self) -> str:
+        return f"team:{self.team_id}" if self.team_id else f"user:{self.user_id}"
+
+
+@dataclass(frozen=True)
+class FeedState:
+    etag: str
+    last_modified: datetime
+    employee_ids: tuple[int, ...]
+
+
+def resolve_scope(token: str) -> FeedScope | None:
+    """Look up an active token, cached briefly so polling skips the database."""
+    from .models import CalendarFeedToken
+
+    scope = cache.get(_token_key(token))
+    if scope is None:
+        feed_token: CalendarFeedToken | None = (
+            CalendarFeedToken.objects.select_related("user", "team")
+            .filter(token=token, is_active=True)
+            .first()
+        )
+        if feed_token is None:
+            return None
+        scope = FeedScope(
+            token=token,
+            user_id=feed_token.user_id,
+            team_id=feed_token.team_id,
+            name=feed_token.feed_name,
+        )
+        cache.set(_token_key(token), scope, TOKEN_CACHE_TIMEOUT)
+    return scope
+
+
+def _employee_ids(scope: FeedScope) -> tuple[int, ...]:
+    if not scope.team_id:
+        return (scope.user_id,)
+    key = _team_members_key(scope.team_id)
+    members = cache.get(key)
+    if members is None:
+        from team_planner.teams.models import TeamMembership
+
+        members = tuple(
+            sorted(
+                TeamMembership.objects.filter(
+                    team_id=scope.team_id, is_active=True,
+                ).values_list("user_id", flat=True),
+            ),
+        )
+        cache.set(key, members, MEMBERS_CACHE_TIMEOUT)
+    return members
+
+
+def get_feed_state(scope: FeedScope) -> FeedState:
+    """Compute the ETag and Last-Modified for a feed from cached version stamps."""
+    employee_ids = _employee_ids(scope)
+    keys = [_user_version_key(uid) for uid in employee_ids]
+    versions = cache.get_many(keys)
+    missing = [k for k in keys if k not in versions]
+    if missing:
+        # Stamps were evicted: treat as changed now and re-seed them
+        now = time.time()
+        cache.set_many(dict.fromkeys(missing, now), timeout=None)
+        versions.update(dict.fromkeys(missing, now))
+    # The rolling window moves daily, so the day is part of the version too
+    today = timezone.localdate()
+    digest = hashlib.sha256(
+        f"{scope.cache_id}|{today.isoformat()}|{sorted(versions.items())}".encode(),
+    ).hexdigest()[:32]
+    day_start = timezone.make_aware(datetime.combine(today, datetime.min.time())).timestamp()
+    newest = max([day_start, *versions.values()])
+    return FeedState(
+        etag=digest,
+        last_modified=datetime.fromtimestamp(int(newest), tz=dt_timezone.utc),
+        employee_ids=employee_ids,
+    )
+
+
+def _window() -> tuple[datetime, datetime]:
+    now = timezone.now()
+    past = int(getattr(settings, "CALENDAR_FEED_PAST_DAYS", 30))
+    future = int(getattr(settings, "CALENDAR_FEED_FUTURE_DAYS", 180))
+    return now - timedelta(days=past), now + timedelta(days=future)
+
+
+def _leave_event(leave) -> IcsEvent:
+    domain = getattr(settings, "SITE_DOMAIN", "example.com")
+    who = leave.employee.get_full_name() or leave.employee.username
+    return IcsEvent(
+        summary=f"{who}: {getattr(leave.leave_type, 'name', 'Leave')}",
+        # All-day events; DTEND is exclusive
+        dtstart=leave.start_date,
+        dtend=leave.end_date + timedelta(days=1),
+        description=leave.reason or "Approved leave",
+        uid=f"team-planner-leave-{leave.pk}@{domain}",
+    )
+
+
+def iter_feed_chunks(scope: FeedScope, employee_ids: Iterable[int]) -> Iterator[bytes]:
+    """Serialize the feed event by event without materializing a Calendar tree."""
+    from icalendar import vText  # type: ignore[import-not-found]
+
+    from team_planner.leaves.models import LeaveRequest
+    from team_planner.shifts.models import Shift
+
+    start, end = _window()
+    employee_ids = list(employee_ids)
+
+    yield (
+        b"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Team Planner//EN\r\n"
+        b"CALSCALE:GREGORIAN\r\nMETHOD:PUBLISH\r\n"
+        + b"X-WR-CALNAME:" + vText(scope.name).to_ical() + b"\r\n"
+        + b"X-PUBLISHED-TTL:PT15M\r\n"
+    )
+    shifts = (
+        Shift.objects.filter(
+            assigned_employee_id__in=employee_ids,
+            start_datetime__lt=end,
+            end_datetime__gt=start,
+        )
+        .exclude(status=Shift.Status.CANCELLED)
+        .select_related("template", "assigned_employee")
+        .order_by("start_datetime", "id")
+    )
+    for shift in shifts.iterator(chunk_size=500):
+        event = build_ics_for_shift(shift)
+        if scope.team_id:
+            who = shift.assigned_employee.get_full_name() or shift.assigned_employee.username
+            event.summary = f"{who}: {event.summary}"
+        yield event.to_component().to_ical()
+
+    leaves = (
+        LeaveRequest.objects.filter(
+            employee_id__in=employee_ids,
+            status=LeaveRequest.Status.APPROVED,
+            start_date__lte=end.date(),
+            end_date__gte=start.date(),
+        )
+        .select_related("leave_type", "employee")
+        .order_by("start_date", "id")
+    )
+    for leave in leaves.iterator(chunk_size=500):
+        yield _leave_event(leave).to_component().to_ical()
+    yield b"END:VCALENDAR\r\n"
+
+
+def render_feed(scope: FeedScope, state: FeedState) -> bytes:
+    """Return the feed body, rendering it only when the data version changed."""
+    key = f"{CACHE_PREFIX}:body:{scope.cache_id}:{state.etag}"
+    body = cache.get(key)
+    if body is None:
+        body = b"".join(iter_feed_chunks(scope, state.employee_ids))
+        cache.set(key, body, int(getattr(settings, "CALENDAR_FEED_CACHE_SECONDS", 24 * 3600)))
+    return body
@@ -0,0 +1,87 @@
+"""
+Per-user unread notification counter for the notification badge.
+
+Counting unread ``Notification`` rows on every page load and poll got slower
+as orchestration fan-outs grew the table, so each user has an
+``UnreadNotificationCounter`` row that the write paths keep in step:
+
+- creating notifications (single and digest bulk_create) adds to it
+- ``Notification.mark_as_read`` / ``mark_as_unread`` and mark-all-read
+  subtract or add exactly the rows whose state changed
+- clearing notifications recounts
+
+``adjust_unread()`` runs inside the caller's transaction, so the counter
+commits or rolls back with the notifications. ``unread_count()`` is one
+primary-key read, cached for UNREAD_CACHE_TIMEOUT and dropped on commit
+whenever the counter changes.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from typing import TYPE_CHECKING
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from .models import Notification
+from .models import UnreadNotificationCounter
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+CACHE_PREFIX = "notifications:unread"
+UNREAD_CACHE_TIMEOUT = 300
+
+
+def _cache_key(user_id: int) -> str:
+    return f"{CACHE_PREFIX}:{user_id}"
+
+
+def recount(user_id: int) -> int:
+    """Rebuild a user's counter from their notifications."""
+    unread = Notification.objects.filter(recipient_id=user_id, is_read=False).count()
+    UnreadNotificationCounter.objects.update_or_create(
+        user_id=user_id, defaults={"unread": unread},
+    )
+    transaction.on_commit(partial(cache.delete, _cache_key(user_id)))
+    return unread
+
+
+def adjust_unread(deltas: Mapping[int, int]) -> None:
+    """Add ``deltas[user_id]`` to each user's unread counter."""
+    by_delta: dict[int, list[int]] = {}
+    for user_id, delta in deltas.items():
+        if user_id and delta:
+            by_delta.setdefault(delta, []).append(user_id)
+
+    for delta, user_ids in by_delta.items():
+        counters = UnreadNotificationCounter.objects.filter(user_id__in=user_ids)
+        updated = counters.update(unread=Greatest(F("unread") + delta, 0))
+        if updated < len(user_ids):
+            # Users without a counter row yet: count them once
+            existing = set(counters.values_list("user_id", flat=True))
+            for user_id in set(user_ids) - existing:
+                recount(user_id)
+
+    changed = [_cache_key(uid) for user_ids in by_delta.values() for uid in user_ids]
+    if changed:
+        transaction.on_commit(partial(cache.delete_many, changed))
+
+
+def unread_count(user_id: int) -> int:
+    """The user's unread notification count, from cache or one row read."""
+    key = _cache_key(user_id)
+    unread = cache.get(key)
+    if unread is None:
+        unread = (
+            UnreadNotificationCounter.objects.filter(user_id=user_id)
+            .values_list("unread", flat=True)
+            .first()
+        )
+        if unread is None:
+            unread = recount(user_id)
+        cache.set(key, unread, UNREAD_CACHE_TIMEOUT)
+    return unread
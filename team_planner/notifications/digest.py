@@ -0,0 +1,177 @@
+"""
+Coalescing of per-shift notifications into per-recipient digests.
+
+Inside ``NotificationService.coalesce_shift_notifications()`` the
+``notify_shift_assigned``/``notify_shift_updated`` helpers buffer events
+instead of writing a Notification and queueing an email per shift. On flush
+each recipient receives a single digest notification and a single email
+carrying one multi-event ICS attachment.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from .counters import adjust_unread
+from .mailer import IcsEvent, build_ics_for_shift, queue_email_with_optional_ics
+from .models import Notification, NotificationPreference, NotificationType
+
+logger = logging.getLogger(__name__)
+
+_active_digest: ContextVar[Optional["ShiftNotificationDigest"]] = ContextVar(
+    "active_shift_notification_digest", default=None
+)
+
+
+def get_active_digest() -> Optional["ShiftNotificationDigest"]:
+    """Return the digest buffering shift notifications in this context, if any."""
+    return _active_digest.get()
+
+
+@dataclass
+class ShiftEvent:
+    """A buffered shift-assigned or shift-updated event."""
+    notification_type: str
+    shift: Any
+    changes: Dict[str, Any] = field(default_factory=dict)
+    assigned_by: str = 'system'
+
+
+class ShiftNotificationDigest:
+    """Buffer of shift events per recipient, flushed as one digest each.
+
+    The buffer is flushed when the coalescing block exits, or earlier once the
+    oldest buffered event is older than ``window_seconds`` so long-running
+    orchestrations still deliver in reasonable time.
+    """
+
+    def __init__(self, window_seconds: Optional[int] = None):
+        if window_seconds is None:
+            window_seconds = int(getattr(settings, 'NOTIFICATIONS_DIGEST_WINDOW_SECONDS', 300))
+        self.window_seconds = window_seconds
+        self.recipients: Dict[int, Any] = {}
+        self.events: Dict[int, List[ShiftEvent]] = defaultdict(list)
+        self.opened_at: Optional[float] = None
+        self.stats = {'events': 0, 'notifications': 0, 'emails': 0}
+
+    def __len__(self) -> int:
+        return sum(len(events) for events in self.events.values())
+
+    def add(self, recipient, event: ShiftEvent) -> None:
+        """Buffer an event, flushing first if the window has elapsed."""
+        if self.opened_at is not None and time.monotonic() - self.opened_at >= self.window_seconds:
+            self.flush()
+        if self.opened_at is None:
+            self.opened_at = time.monotonic()
+        self.recipients[recipient.pk] = recipient
+        self.events[recipient.pk].append(event)
+        self.stats['events'] += 1
+
+    def flush(self) -> Dict[str, int]:
+        """Emit one digest per recipient and clear the buffer."""
+        recipients, events = self.recipients, self.events
+        self.recipients, self.events, self.opened_at = {}, defaultdict(list), None
+        if not recipients:
+            return self.stats
+
+        preferences = self._load_preferences(recipients)
+        notifications: List[Notification] = []
+        for user_id, user in recipients.items():
+            prefs = preferences[user_id]
+            user_events = events[user_id]
+            inapp_events = [e for e in user_events if prefs.should_send_inapp(e.notification_type)]
+            email_events = [] if prefs.is_in_quiet_hours() else [
+                e for e in user_events if prefs.should_send_email(e.notification_type)
+            ]
+            if inapp_events:
+                notifications.append(self._build_notification(user, inapp_events))
+            if email_events and user.email:
+                self._queue_email(user, email_events)
+                self.stats['emails'] += 1
+
+        with transaction.atomic():
+            Notification.objects.bulk_create(notifications)
+            adjust_unread({n.recipient_id: 1 for n in notifications})
+        self.stats['notifications'] += len(notifications)
+        logger.info(
+            f"Flushed shift digest: {self.stats['events']} events → "
+            f"{len(notifications)} notifications for {len(recipients)} recipients"
+        )
+        return self.stats
+
+    # Internal helpers
+
+    @staticmethod
+    def _load_preferences(recipients: Dict[int, Any]) -> Dict[int, NotificationPreference]:
+        """Load preferences for all recipients in one query, creating missing defaults."""
+        preferences = {
+            p.user_id: p
+            for p in NotificationPreference.objects.filter(user_id__in=list(recipients))
+        }
+        missing = [NotificationPreference(user=u) for pk, u in recipients.items() if pk not in preferences]
+        if missing:
+            NotificationPreference.objects.bulk_create(missing, ignore_conflicts=True)
+            preferences.update({p.user_id: p for p in missing})
+        return preferences
+
+    @staticmethod
+    def _digest_type(events: List[ShiftEvent]) -> str:
+        if any(e.notification_type == NotificationType.SHIFT_ASSIGNED for e in events):
+            return NotificationType.SHIFT_ASSIGNED
+        return NotificationType.SHIFT_UPDATED
+
+    @staticmethod
+    def _summary(events: List[ShiftEvent]) -> str:
+        assigned = sum(1 for e in events if e.notification_type == NotificationType.SHIFT_ASSIGNED)
+        updated = len(events) - assigned
+        parts = []
+        if assigned:
+            parts.append(f"{assigned} new shift{'s' if assigned != 1 else ''} assigned")
+        if updated:
+            parts.append(f"{updated} shift{'s' if updated != 1 else ''} updated")
+        return " and ".join(parts)
+
+    def _build_notification(self, user, events: List[ShiftEvent]) -> Notification:
+        shift_ids = [e.shift.id for e in events]
+        return Notification(
+            recipient=user,
+            notification_type=self._digest_type(events),
+            title="Schedule Changes",
+            message=f"Your schedule has changed: {self._summary(events)}.",
+            related_shift_id=shift_ids[0] if len(shift_ids) == 1 else None,
+            action_url="/schedule",
+            data={
+                'digest': True,
+                'shift_ids': shift_ids,
+                'assigned_by': sorted({e.assigned_by for e in events}),
+            },
+        )
+
+    def _queue_email(self, user, events: List[ShiftEvent]) -> None:
+        ordered = sorted(events, key=lambda e: e.shift.start_datetime)
+        lines = []
+        for e in ordered:
+            label = getattr(getattr(e.shift, 'template', None), 'name', 'Shift')
+            when = e.shift.start_datetime.strftime('%A, %B %d, %Y at %I:%M %p')
+            verb = 'assigned' if e.notification_type == NotificationType.SHIFT_ASSIGNED else 'updated'
+            lines.append(f"- {label} on {when} ({verb})")
+        body = (
+            f"Hello {user.name},\n\nYour schedule has changed: {self._summary(events)}.\n\n"
+            + "\n".join(lines)
+            + "\n\nAll shifts are attached as calendar events."
+        )
+        ics_events: List[IcsEvent] = [build_ics_for_shift(e.shift) for e in ordered]
+        queue_email_with_optional_ics(
+            subject="Team Planner: Schedule Changes",
+            body_text=body,
+            recipients=[user.email],
+            ics_events=ics_events,
+            recipient=user,
+            notification_type=self._digest_type(events),
+        )
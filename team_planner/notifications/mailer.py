@@ -1,36 +1,45 @@
 from __future__ import annotations
 
+import logging
 import uuid
 from dataclasses import dataclass
+from datetime import date
 from datetime import datetime
 from datetime import time
 from typing import TYPE_CHECKING
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.mail import EmailMultiAlternatives
+from django.db import IntegrityError
+from django.db import transaction
 from django.utils import timezone
 
+from .models import OutboundEmail
+
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from collections.abc import Sequence
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_KICK_CACHE_KEY = "notifications:outbox:kick"
 
 
 @dataclass
 class IcsEvent:
     summary: str
-    dtstart: datetime
-    dtend: datetime
+    # Dates (not datetimes) produce all-day events
+    dtstart: datetime | date
+    dtend: datetime | date
     description: str = ""
     location: str = ""
     uid: str | None = None
 
-    def to_ical(self) -> bytes:
+    def to_component(self):
         # Local import to avoid optional dependency issues at import time
-        from icalendar import Calendar  # type: ignore[import-not-found]
         from icalendar import Event  # type: ignore[import-not-found]
 
-        cal = Calendar()
-        cal.add("prodid", "-//Team Planner//EN")
-        cal.add("version", "2.0")
         event = Event()
         event.add(
             "uid",
@@ -44,8 +53,47 @@ class IcsEvent:
             event.add("description", self.description)
         if self.location:
             event.add("location", self.location)
-        cal.add_component(event)
-        return cal.to_ical()
+        return event
+
+    def to_ical(self) -> bytes:
+        return build_ics_calendar([self])
+
+
+def build_ics_calendar(events: Iterable[IcsEvent]) -> bytes:
+    """Serialize several events into a single VCALENDAR."""
+    from icalendar import Calendar  # type: ignore[import-not-found]
+
+    cal = Calendar()
+    cal.add("prodid", "-//Team Planner//EN")
+    cal.add("version", "2.0")
+    for event in events:
+        cal.add_component(event.to_component())
+    return cal.to_ical()
+
+
+def build_email_message(
+    subject: str,
+    body_text: str,
+    to_list: list[str],
+    *,
+    body_html: str | None = None,
+    ics_content: bytes | None = None,
+    from_email: str | None = None,
+    connection=None,
+) -> EmailMultiAlternatives:
+    """Build the multipart message, attaching ``ics_content`` as invite.ics."""
+    msg = EmailMultiAlternatives(
+        subject=subject,
+        body=body_text,
+        to=to_list,
+        from_email=from_email or getattr(settings, "DEFAULT_FROM_EMAIL", None),
+        connection=connection,
+    )
+    if body_html:
+        msg.attach_alternative(body_html, "text/html")
+    if ics_content:
+        msg.attach(filename="invite.ics", content=ics_content, mimetype="text/calendar")
+    return msg
 
 
 def send_email_with_optional_ics(
@@ -57,26 +105,89 @@ def send_email_with_optional_ics(
     ics_event: IcsEvent | None = None,
     from_email: str | None = None,
 ) -> None:
-    """Send an email, optionally attaching an ICS calendar event for Outlook.
+    """Send an email synchronously, optionally attaching an ICS calendar event.
 
     This uses Django's EmailMultiAlternatives and attaches a text/calendar part
-    as .ics so Outlook and other clients recognize the invite.
+    as .ics so Outlook and other clients recognize the invite. Request handlers
+    should prefer ``queue_email_with_optional_ics`` which does not block on SMTP.
     """
-    from_email = from_email or getattr(settings, "DEFAULT_FROM_EMAIL", None)
     to_list = [e for e in recipients if e]
     if not to_list:
         return
-    msg = EmailMultiAlternatives(
-        subject=subject, body=body_text, to=to_list, from_email=from_email,
+    msg = build_email_message(
+        subject,
+        body_text,
+        to_list,
+        body_html=body_html,
+        ics_content=ics_event.to_ical() if ics_event else None,
+        from_email=from_email,
     )
-    if body_html:
-        msg.attach_alternative(body_html, "text/html")
+    msg.send(fail_silently=True)
 
-    if ics_event:
-        ical_bytes = ics_event.to_ical()
-        msg.attach(filename="invite.ics", content=ical_bytes, mimetype="text/calendar")
 
-    msg.send(fail_silently=True)
+def queue_email_with_optional_ics(
+    subject: str,
+    body_text: str,
+    recipients: Iterable[str],
+    *,
+    body_html: str | None = None,
+    ics_event: IcsEvent | None = None,
+    ics_events: Sequence[IcsEvent] | None = None,
+    from_email: str | None = None,
+    recipient=None,
+    notification_type: str | None = None,
+    idempotency_key: str | None = None,
+) -> OutboundEmail | None:
+    """Store an email on the durable outbox and return without touching SMTP.
+
+    ``ics_events`` attaches several events as one multi-event invite.
+    Enqueuing twice with the same ``idempotency_key`` returns the existing row,
+    so retried requests never deliver the same email twice.
+    """
+    to_list = [e for e in recipients if e]
+    if not to_list:
+        return None
+    events = list(ics_events or []) + ([ics_event] if ics_event else [])
+    key = idempotency_key or f"email-{uuid.uuid4()}"
+    try:
+        with transaction.atomic():
+            outbound, created = OutboundEmail.objects.get_or_create(
+                idempotency_key=key,
+                defaults={
+                    "recipient": recipient if getattr(recipient, "pk", None) else None,
+                    "to_emails": to_list,
+                    "from_email": from_email or getattr(settings, "DEFAULT_FROM_EMAIL", "") or "",
+                    "subject": subject[:255],
+                    "body_text": body_text,
+                    "body_html": body_html or "",
+                    "ics_content": build_ics_calendar(events) if events else None,
+                    "notification_type": notification_type,
+                },
+            )
+    except IntegrityError:
+        # Lost a race against a concurrent enqueue with the same key
+        return OutboundEmail.objects.get(idempotency_key=key)
+
+    if created and getattr(settings, "NOTIFICATIONS_OUTBOX_KICK_WORKER", True):
+        transaction.on_commit(_kick_outbox_worker)
+    return outbound
+
+
+def _kick_outbox_worker() -> None:
+    """Ask a worker to drain the outbox soon; at most one kick per debounce window.
+
+    The periodic beat entry drains the outbox regardless, so a missing broker
+    only delays delivery.
+    """
+    debounce = int(getattr(settings, "NOTIFICATIONS_OUTBOX_KICK_DEBOUNCE_SECONDS", 5))
+    if not cache.add(OUTBOX_KICK_CACHE_KEY, 1, timeout=debounce):
+        return
+    try:
+        from .tasks import drain_email_outbox_task
+
+        drain_email_outbox_task.apply_async(countdown=debounce)
+    except Exception:
+        logger.warning("Could not schedule outbox drain; beat will pick it up", exc_info=True)
 
 
 # Convenience builders
@@ -87,11 +198,18 @@ def build_ics_for_shift(shift) -> IcsEvent:
     summary = f"{getattr(shift.template, 'name', 'Shift')} ({getattr(shift.template, 'shift_type', '')})"
     desc = f"Assigned to: {getattr(shift.assigned_employee, 'username', 'employee')}\n"
     desc += f"Notes: {getattr(shift, 'notes', '')}".strip()
+    # Stable UID so calendar clients update the event instead of duplicating it
+    uid = (
+        f"team-planner-shift-{shift.pk}@{getattr(settings, 'SITE_DOMAIN', 'example.com')}"
+        if getattr(shift, "pk", None)
+        else None
+    )
     return IcsEvent(
         summary=summary,
         dtstart=shift.start_datetime,
         dtend=shift.end_datetime,
         description=desc,
+        uid=uid,
     )
 
 
@@ -114,25 +232,42 @@ def notify_swap_approved(
     target_email: str | None,
     shift_summary: str,
     ics_event: IcsEvent | None = None,
+    idempotency_key: str | None = None,
 ):
     subject = "Swap approved"
     body = f"Your swap request has been approved. {shift_summary}"
     if requester_email:
-        send_email_with_optional_ics(
-            subject, body, recipients=[requester_email], ics_event=ics_event,
+        queue_email_with_optional_ics(
+            subject,
+            body,
+            recipients=[requester_email],
+            ics_event=ics_event,
+            idempotency_key=f"{idempotency_key}:requester" if idempotency_key else None,
         )
     # Notify target as well
     body_target = f"You have been assigned a swap. {shift_summary}"
     if target_email:
-        send_email_with_optional_ics(
-            subject, body_target, recipients=[target_email], ics_event=ics_event,
+        queue_email_with_optional_ics(
+            subject,
+            body_target,
+            recipients=[target_email],
+            ics_event=ics_event,
+            idempotency_key=f"{idempotency_key}:target" if idempotency_key else None,
         )
 
 
-def notify_leave_approved(employee_email: str | None, ics_event: IcsEvent | None):
+def notify_leave_approved(
+    employee_email: str | None,
+    ics_event: IcsEvent | None,
+    idempotency_key: str | None = None,
+):
     subject = "Leave approved"
     body = "Your leave request has been approved. An event has been attached."
     if employee_email:
-        send_email_with_optional_ics(
-            subject, body, recipients=[employee_email], ics_event=ics_event,
+        queue_email_with_optional_ics(
+            subject,
+            body,
+            recipients=[employee_email],
+            ics_event=ics_event,
+            idempotency_key=idempotency_key,
         )
@@ -0,0 +1,52 @@
+# Generated by Django 5.1.11 on 2026-10-18 20:46
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_add_performance_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboundEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(help_text='Enqueuing the same key twice delivers the email only once', max_length=255, unique=True, verbose_name='Idempotency Key')),
+                ('to_emails', models.JSONField(default=list, verbose_name='To')),
+                ('from_email', models.CharField(blank=True, max_length=255, verbose_name='From')),
+                ('subject', models.CharField(max_length=255, verbose_name='Subject')),
+                ('body_text', models.TextField(blank=True, verbose_name='Body (text)')),
+                ('body_html', models.TextField(blank=True, verbose_name='Body (HTML)')),
+                ('ics_content', models.BinaryField(blank=True, null=True, verbose_name='ICS Attachment')),
+                ('notification_type', models.CharField(blank=True, choices=[('shift_assigned', 'Shift Assigned'), ('shift_updated', 'Shift Updated'), ('shift_cancelled', 'Shift Cancelled'), ('swap_requested', 'Swap Requested'), ('swap_approved', 'Swap Approved'), ('swap_rejected', 'Swap Rejected'), ('leave_submitted', 'Leave Request Submitted'), ('leave_approved', 'Leave Request Approved'), ('leave_rejected', 'Leave Request Rejected'), ('schedule_published', 'Schedule Published'), ('reminder', 'Reminder'), ('system', 'System Notification')], max_length=30, null=True, verbose_name='Notification Type')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Attempts')),
+                ('next_attempt_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Next Attempt At')),
+                ('locked_at', models.DateTimeField(blank=True, null=True, verbose_name='Locked At')),
+                ('last_error', models.TextField(blank=True, verbose_name='Last Error')),
+                ('sent_at', models.DateTimeField(blank=True, null=True, verbose_name='Sent At')),
+                ('created', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                'verbose_name': 'Outbound Email',
+                'verbose_name_plural': 'Outbound Emails',
+                'ordering': ['next_attempt_at', 'id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='outboundemail',
+            name='recipient',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='outbound_emails', to=settings.AUTH_USER_MODEL, verbose_name='Recipient'),
+        ),
+        migrations.AddIndex(
+            model_name='outboundemail',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_due_idx'),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 5.1.11 on 2026-10-18 20:52
+
+import django.db.models.deletion
+import team_planner.notifications.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_outboundemail'),
+        ('teams', '0003_team_prefs_membership_fte'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarFeedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(default=team_planner.notifications.models.generate_feed_token, editable=False, max_length=64, unique=True, verbose_name='Token')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('created', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Calendar Feed Token',
+                'verbose_name_plural': 'Calendar Feed Tokens',
+                'ordering': ['-created'],
+            },
+        ),
+        migrations.AddField(
+            model_name='calendarfeedtoken',
+            name='team',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='calendar_feed_tokens', to='teams.team', verbose_name='Team'),
+        ),
+        migrations.AddField(
+            model_name='calendarfeedtoken',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_feed_tokens', to=settings.AUTH_USER_MODEL, verbose_name='Owner'),
+        ),
+    ]
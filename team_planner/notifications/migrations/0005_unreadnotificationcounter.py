@@ -0,0 +1,42 @@
+# Generated by Django 5.1.11 on 2026-10-18 22:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q
+
+
+def backfill_counters(apps, schema_editor):
+    """One counter per existing user, from a single grouped count."""
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    UnreadNotificationCounter = apps.get_model('notifications', 'UnreadNotificationCounter')
+    counters = (
+        UnreadNotificationCounter(user_id=user['pk'], unread=user['unread'])
+        for user in User.objects.annotate(
+            unread=Count('notifications', filter=Q(notifications__is_read=False)),
+        ).values('pk', 'unread').iterator()
+    )
+    UnreadNotificationCounter.objects.bulk_create(counters, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0004_calendarfeedtoken'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadNotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='unread_notification_counter', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='User')),
+                ('unread', models.PositiveIntegerField(default=0, verbose_name='Unread')),
+            ],
+            options={
+                'verbose_name': 'Unread Notification Counter',
+                'verbose_name_plural': 'Unread Notification Counters',
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
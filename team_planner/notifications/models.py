@@ -1,4 +1,6 @@
-from django.db import models
+import secrets
+
+from django.db import models, transaction
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.utils import timezone
@@ -144,16 +146,49 @@ class Notification(models.Model):
     def mark_as_read(self):
         """Mark notification as read."""
         if not self.is_read:
-            self.is_read = True
-            self.read_at = timezone.now()
-            self.save(update_fields=['is_read', 'read_at'])
+            self._set_read(True, timezone.now())
     
     def mark_as_unread(self):
         """Mark notification as unread."""
         if self.is_read:
-            self.is_read = False
-            self.read_at = None
-            self.save(update_fields=['is_read', 'read_at'])
+            self._set_read(False, None)
+    
+    def _set_read(self, is_read: bool, read_at):
+        """Flip the read state and the recipient's unread counter together.
+        
+        The conditional UPDATE only matches while the row is still in the
+        opposite state, so concurrent clicks adjust the counter once.
+        """
+        from .counters import adjust_unread
+        
+        with transaction.atomic():
+            changed = Notification.objects.filter(pk=self.pk, is_read=not is_read).update(
+                is_read=is_read, read_at=read_at,
+            )
+            if changed:
+                adjust_unread({self.recipient_id: -1 if is_read else 1})
+        self.is_read = is_read
+        self.read_at = read_at
+
+
+class UnreadNotificationCounter(models.Model):
+    """Maintained number of unread notifications per user (see counters.py)."""
+    
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='unread_notification_counter',
+        verbose_name=_('User')
+    )
+    unread = models.PositiveIntegerField(_('Unread'), default=0)
+    
+    class Meta:
+        verbose_name = _('Unread Notification Counter')
+        verbose_name_plural = _('Unread Notification Counters')
+    
+    def __str__(self):
+        return f"{self.user_id}: {self.unread} unread"
 
 
 class EmailLog(models.Model):
@@ -190,3 +225,119 @@ class EmailLog(models.Model):
     def __str__(self):
         status = "✓" if self.success else "✗"
         return f"{status} {self.subject} → {self.recipient_email}"
+
+
+class OutboundEmail(models.Model):
+    """Durable outbox entry for an email waiting to be delivered by the worker.
+
+    Request handlers enqueue rows here and return immediately; the
+    ``notifications.drain_email_outbox`` Celery task delivers them in batches
+    over a single SMTP connection and retries failures with exponential backoff.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', _('Pending')
+        SENDING = 'sending', _('Sending')
+        SENT = 'sent', _('Sent')
+        FAILED = 'failed', _('Failed')
+
+    idempotency_key = models.CharField(
+        _('Idempotency Key'),
+        max_length=255,
+        unique=True,
+        help_text=_('Enqueuing the same key twice delivers the email only once'),
+    )
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='outbound_emails',
+        verbose_name=_('Recipient')
+    )
+    to_emails = models.JSONField(_('To'), default=list)
+    from_email = models.CharField(_('From'), max_length=255, blank=True)
+    subject = models.CharField(_('Subject'), max_length=255)
+    body_text = models.TextField(_('Body (text)'), blank=True)
+    body_html = models.TextField(_('Body (HTML)'), blank=True)
+    ics_content = models.BinaryField(_('ICS Attachment'), null=True, blank=True)
+    notification_type = models.CharField(
+        _('Notification Type'),
+        max_length=30,
+        choices=NotificationType.choices,
+        null=True,
+        blank=True
+    )
+
+    # Delivery state
+    status = models.CharField(
+        _('Status'),
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING
+    )
+    attempts = models.PositiveIntegerField(_('Attempts'), default=0)
+    next_attempt_at = models.DateTimeField(_('Next Attempt At'), default=timezone.now)
+    locked_at = models.DateTimeField(_('Locked At'), null=True, blank=True)
+    last_error = models.TextField(_('Last Error'), blank=True)
+    sent_at = models.DateTimeField(_('Sent At'), null=True, blank=True)
+
+    created = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = _('Outbound Email')
+        verbose_name_plural = _('Outbound Emails')
+        ordering = ['next_attempt_at', 'id']
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='outbox_status_due_idx'),
+        ]
+
+    def __str__(self):
+        return f"[{self.status}] {self.subject} → {', '.join(self.to_emails)}"
+
+
+def generate_feed_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+class CalendarFeedToken(models.Model):
+    """Secret token that addresses a subscribable iCalendar feed.
+
+    Calendar clients cannot send auth headers, so the token in the feed URL is
+    the credential. Without a team the feed covers the owner's own shifts and
+    leave; with a team it covers every active member of that team.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='calendar_feed_tokens',
+        verbose_name=_('Owner')
+    )
+    team = models.ForeignKey(
+        'teams.Team',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='calendar_feed_tokens',
+        verbose_name=_('Team')
+    )
+    token = models.CharField(
+        _('Token'), max_length=64, unique=True, default=generate_feed_token, editable=False
+    )
+    is_active = models.BooleanField(_('Is Active'), default=True)
+    created = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Calendar Feed Token')
+        verbose_name_plural = _('Calendar Feed Tokens')
+        ordering = ['-created']
+
+    def __str__(self):
+        return f"{self.feed_name} ({self.user.username})"
+
+    @property
+    def feed_name(self) -> str:
+        if self.team_id:
+            return f"Team Planner – {self.team.name}"
+        return f"Team Planner – {self.user.name or self.user.username}"
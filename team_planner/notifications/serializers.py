@@ -1,5 +1,6 @@
+from django.urls import reverse
 from rest_framework import serializers
-from .models import Notification, NotificationPreference
+from .models import CalendarFeedToken, Notification, NotificationPreference
 
 
 class NotificationSerializer(serializers.ModelSerializer):
@@ -37,3 +38,30 @@ class NotificationPreferenceSerializer(serializers.ModelSerializer):
             'created', 'modified'
         ]
         read_only_fields = ['id', 'user', 'created', 'modified']
+
+
+class CalendarFeedTokenSerializer(serializers.ModelSerializer):
+    """Serializer for CalendarFeedToken; exposes the subscription URL."""
+    
+    feed_url = serializers.SerializerMethodField()
+    feed_name = serializers.CharField(read_only=True)
+    
+    class Meta:
+        model = CalendarFeedToken
+        fields = ['id', 'team', 'token', 'feed_name', 'feed_url', 'is_active', 'created']
+        read_only_fields = ['id', 'token', 'feed_name', 'feed_url', 'is_active', 'created']
+    
+    def get_feed_url(self, obj):
+        path = reverse('api:calendar-feed', kwargs={'token': obj.token})
+        request = self.context.get('request')
+        return request.build_absolute_uri(path) if request else path
+    
+    def validate_team(self, team):
+        """Team feeds are limited to team members, team managers and staff."""
+        if team is None:
+            return team
+        user = self.context['request'].user
+        is_member = team.teammembership_set.filter(user=user, is_active=True).exists()
+        if not (is_member or team.manager_id == user.id or user.is_staff):
+            raise serializers.ValidationError("You are not a member of this team.")
+        return team
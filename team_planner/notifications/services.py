@@ -3,21 +3,24 @@ Notification Service - Central hub for sending notifications.
 
 This service handles:
 - Creating in-app notifications
-- Sending emails
+- Queueing emails on the durable outbox
 - Respecting user preferences
 - Logging email sends
 """
 
-from typing import Optional, Dict, Any, List
+from contextlib import contextmanager
+from typing import Iterator, Optional, Dict, Any, List
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 import logging
 
 from .models import Notification, NotificationPreference, EmailLog, NotificationType
-from .mailer import send_email_with_optional_ics, IcsEvent
+from .counters import adjust_unread
+from .mailer import queue_email_with_optional_ics, IcsEvent
+from .digest import ShiftEvent, ShiftNotificationDigest, _active_digest, get_active_digest
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -47,17 +50,19 @@ class NotificationService:
         data: Optional[Dict[str, Any]] = None
     ) -> Notification:
         """Create an in-app notification."""
-        notification = Notification.objects.create(
-            recipient=recipient,
-            notification_type=notification_type,
-            title=title,
-            message=message,
-            related_shift_id=related_shift_id,
-            related_leave_id=related_leave_id,
-            related_swap_id=related_swap_id,
-            action_url=action_url,
-            data=data or {}
-        )
+        with transaction.atomic():
+            notification = Notification.objects.create(
+                recipient=recipient,
+                notification_type=notification_type,
+                title=title,
+                message=message,
+                related_shift_id=related_shift_id,
+                related_leave_id=related_leave_id,
+                related_swap_id=related_swap_id,
+                action_url=action_url,
+                data=data or {}
+            )
+            adjust_unread({recipient.pk: 1})
         logger.info(f"Created notification {notification.id} for {recipient.username}")
         return notification
     
@@ -68,9 +73,14 @@ class NotificationService:
         body_text: str,
         body_html: Optional[str] = None,
         notification_type: Optional[str] = None,
-        ics_event: Optional[IcsEvent] = None
+        ics_event: Optional[IcsEvent] = None,
+        idempotency_key: Optional[str] = None
     ) -> bool:
-        """Send an email and log the result."""
+        """Queue an email on the outbox and return immediately.
+
+        Delivery and EmailLog entries are handled by the outbox worker
+        (see notifications.tasks.drain_email_outbox_task).
+        """
         try:
             recipient_email = recipient.email if hasattr(recipient, 'email') else str(recipient)
             
@@ -78,25 +88,18 @@ class NotificationService:
                 logger.warning(f"No email address for user {getattr(recipient, 'username', recipient)}")
                 return False
             
-            # Use existing mailer function
-            send_email_with_optional_ics(
+            queue_email_with_optional_ics(
                 subject=subject,
                 body_text=body_text,
                 recipients=[recipient_email],
                 body_html=body_html,
-                ics_event=ics_event
-            )
-            
-            # Log success
-            EmailLog.objects.create(
+                ics_event=ics_event,
                 recipient=recipient if hasattr(recipient, 'id') else None,
-                recipient_email=recipient_email,
-                subject=subject,
                 notification_type=notification_type,
-                success=True
+                idempotency_key=idempotency_key
             )
             
-            logger.info(f"Sent email '{subject}' to {recipient_email}")
+            logger.info(f"Queued email '{subject}' to {recipient_email}")
             return True
             
         except Exception as e:
@@ -110,7 +113,7 @@ class NotificationService:
                 error_message=str(e)
             )
             
-            logger.error(f"Failed to send email '{subject}': {str(e)}")
+            logger.error(f"Failed to queue email '{subject}': {str(e)}")
             return False
     
     @classmethod
@@ -128,11 +131,15 @@ class NotificationService:
         related_swap_id: Optional[int] = None,
         action_url: str = "",
         data: Optional[Dict[str, Any]] = None,
-        ics_event: Optional[IcsEvent] = None
+        ics_event: Optional[IcsEvent] = None,
+        email_idempotency_key: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Send a notification via all enabled channels (in-app, email).
         
+        Emails are queued on the outbox; ``email_idempotency_key`` prevents
+        duplicate delivery when the same event is notified twice.
+        
         Returns dict with status of each channel.
         """
         result = {
@@ -176,16 +183,58 @@ class NotificationService:
                     body_text=email_body_text or "",
                     body_html=email_body_html,
                     notification_type=notification_type,
-                    ics_event=ics_event
+                    ics_event=ics_event,
+                    idempotency_key=email_idempotency_key
                 )
         
         return result
     
+    @staticmethod
+    @contextmanager
+    def coalesce_shift_notifications(window_seconds: Optional[int] = None) -> Iterator[ShiftNotificationDigest]:
+        """
+        Buffer shift-assigned/updated notifications into one digest per recipient.
+        
+        Use around bulk shift creation (orchestrator runs, recurring patterns):
+        
+            with NotificationService.coalesce_shift_notifications():
+                for shift in created:
+                    NotificationService.notify_shift_assigned(shift.assigned_employee, shift)
+        
+        Nested blocks share the outermost buffer, which flushes on exit. If the
+        block raises, buffered events are discarded since the shifts they refer
+        to were most likely rolled back.
+        """
+        digest = get_active_digest()
+        if digest is not None:
+            yield digest
+            return
+        digest = ShiftNotificationDigest(window_seconds=window_seconds)
+        token = _active_digest.set(digest)
+        try:
+            yield digest
+        except BaseException:
+            logger.warning(f"Discarding {len(digest)} buffered shift notifications after error")
+            raise
+        else:
+            digest.flush()
+        finally:
+            _active_digest.reset(token)
+    
     # Convenience methods for specific notification types
     
     @classmethod
     def notify_shift_assigned(cls, employee, shift, assigned_by=None) -> Dict[str, Any]:
         """Notify employee that they've been assigned a shift."""
+        digest = get_active_digest()
+        if digest is not None:
+            digest.add(employee, ShiftEvent(
+                notification_type=NotificationType.SHIFT_ASSIGNED,
+                shift=shift,
+                assigned_by=assigned_by.username if assigned_by else 'system'
+            ))
+            return {'inapp': False, 'email': False, 'buffered': True}
+        
         shift_info = f"{shift.start_datetime.strftime('%A, %B %d, %Y at %I:%M %p')}"
         if hasattr(shift, 'template') and shift.template:
             shift_info = f"{shift.template.name} on {shift_info}"
@@ -216,6 +265,15 @@ class NotificationService:
     @classmethod
     def notify_shift_updated(cls, employee, shift, changes: Dict[str, Any]) -> Dict[str, Any]:
         """Notify employee that their shift has been updated."""
+        digest = get_active_digest()
+        if digest is not None:
+            digest.add(employee, ShiftEvent(
+                notification_type=NotificationType.SHIFT_UPDATED,
+                shift=shift,
+                changes=changes
+            ))
+            return {'inapp': False, 'email': False, 'buffered': True}
+        
         title = "Shift Updated"
         message = f"Your shift on {shift.start_datetime.strftime('%B %d, %Y')} has been updated."
         
@@ -257,7 +315,8 @@ class NotificationService:
             related_leave_id=leave_request.id,
             action_url=f"/leaves/{leave_request.id}",
             data={'leave_id': leave_request.id, 'approved_by': approved_by.username},
-            ics_event=ics_event
+            ics_event=ics_event,
+            email_idempotency_key=f"leave_approved:{leave_request.id}:{employee.pk}"
         )
     
     @classmethod
@@ -280,7 +339,8 @@ class NotificationService:
             email_body_text=email_body_text,
             related_leave_id=leave_request.id,
             action_url=f"/leaves/{leave_request.id}",
-            data={'leave_id': leave_request.id, 'rejected_by': rejected_by.username, 'reason': reason}
+            data={'leave_id': leave_request.id, 'rejected_by': rejected_by.username, 'reason': reason},
+            email_idempotency_key=f"leave_rejected:{leave_request.id}:{employee.pk}"
         )
     
     @classmethod
@@ -322,7 +382,8 @@ class NotificationService:
             email_body_text=email_body_text,
             related_swap_id=swap_request.id if hasattr(swap_request, 'id') else None,
             action_url=f"/swaps/{swap_request.id}" if hasattr(swap_request, 'id') else "/swaps",
-            data={'approved_by': approved_by.username}
+            data={'approved_by': approved_by.username},
+            email_idempotency_key=f"swap_approved:{swap_request.id}:{employee.pk}" if hasattr(swap_request, 'id') else None
         )
     
     @classmethod
@@ -345,7 +406,8 @@ class NotificationService:
             email_body_text=email_body_text,
             related_swap_id=swap_request.id if hasattr(swap_request, 'id') else None,
             action_url=f"/swaps/{swap_request.id}" if hasattr(swap_request, 'id') else "/swaps",
-            data={'rejected_by': rejected_by.username, 'reason': reason}
+            data={'rejected_by': rejected_by.username, 'reason': reason},
+            email_idempotency_key=f"swap_rejected:{swap_request.id}:{employee.pk}" if hasattr(swap_request, 'id') else None
         )
     
     @classmethod
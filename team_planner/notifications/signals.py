@@ -1,20 +1,70 @@
 """
 Django signals for automatic notification triggers.
 
-These signals listen for model changes and automatically send notifications.
+These signals listen for model changes and automatically send notifications,
+and keep the calendar feed cache (see calendar_feed.py) in step with the data.
 """
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
 from django.contrib.auth import get_user_model
 
-from .models import NotificationPreference
+from team_planner.leaves.models import LeaveRequest
+from team_planner.shifts.models import Shift
+from team_planner.teams.models import TeamMembership
+
+from . import calendar_feed
+from .models import CalendarFeedToken, NotificationPreference, UnreadNotificationCounter
 
 User = get_user_model()
 
 
 @receiver(post_save, sender=User)
 def create_notification_preferences(sender, instance, created, **kwargs):
-    """Automatically create notification preferences when a user is created."""
+    """Automatically create notification preferences and the unread counter."""
     if created:
         NotificationPreference.objects.get_or_create(user=instance)
+        UnreadNotificationCounter.objects.get_or_create(user=instance)
+
+
+def _bump_feeds_on_commit(*user_ids):
+    # Bump after commit so a poll in between cannot cache pre-commit data
+    transaction.on_commit(lambda: calendar_feed.bump_feed_version(user_ids))
+
+
+@receiver(post_init, sender=Shift)
+def remember_loaded_shift_employee(sender, instance, **kwargs):
+    """Remember who held the shift when loaded, so a reassignment refreshes their feed too.
+
+    Read from the instance rather than queried in pre_save, which would add a
+    SELECT to every swap and reassignment.
+    """
+    instance._calendar_feed_loaded_employee_id = instance.__dict__.get('assigned_employee_id')
+
+
+@receiver(post_save, sender=Shift)
+@receiver(post_delete, sender=Shift)
+def refresh_shift_calendar_feeds(sender, instance, **kwargs):
+    previous_employee_id = getattr(instance, '_calendar_feed_loaded_employee_id', None)
+    _bump_feeds_on_commit(instance.assigned_employee_id, previous_employee_id)
+    # Later saves of the same instance compare against what was just written
+    instance._calendar_feed_loaded_employee_id = instance.assigned_employee_id
+
+
+@receiver(post_save, sender=LeaveRequest)
+@receiver(post_delete, sender=LeaveRequest)
+def refresh_leave_calendar_feeds(sender, instance, **kwargs):
+    _bump_feeds_on_commit(instance.employee_id)
+
+
+@receiver(post_save, sender=TeamMembership)
+@receiver(post_delete, sender=TeamMembership)
+def refresh_team_calendar_feeds(sender, instance, **kwargs):
+    transaction.on_commit(lambda: calendar_feed.invalidate_team_members(instance.team_id))
+
+
+@receiver(post_save, sender=CalendarFeedToken)
+@receiver(post_delete, sender=CalendarFeedToken)
+def forget_calendar_feed_token(sender, instance, **kwargs):
+    transaction.on_commit(lambda: calendar_feed.invalidate_token(instance.token))
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Any
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import get_connection
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .mailer import build_email_message
+from .models import EmailLog
+from .models import OutboundEmail
+
+logger = logging.getLogger(__name__)
+
+
+def _backoff_delay(attempts: int) -> timedelta:
+    """Exponential backoff: base * 2^(attempts-1), capped."""
+    base = int(getattr(settings, "NOTIFICATIONS_OUTBOX_BACKOFF_BASE_SECONDS", 60))
+    cap = int(getattr(settings, "NOTIFICATIONS_OUTBOX_BACKOFF_MAX_SECONDS", 3600))
+    return timedelta(seconds=min(base * 2 ** max(attempts - 1, 0), cap))
+
+
+def _claim_batch(batch_size: int) -> list[OutboundEmail]:
+    """Lock a batch of due rows and mark them as sending.
+
+    Rows stuck in SENDING longer than the lease (a worker died mid-batch) are
+    reclaimed. ``skip_locked`` lets several workers drain concurrently.
+    """
+    now = timezone.now()
+    lease = timedelta(
+        seconds=int(getattr(settings, "NOTIFICATIONS_OUTBOX_LEASE_SECONDS", 300)),
+    )
+    with transaction.atomic():
+        due = (
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=OutboundEmail.Status.PENDING, next_attempt_at__lte=now)
+                | Q(status=OutboundEmail.Status.SENDING, locked_at__lt=now - lease),
+            )
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        batch = list(due)
+        if batch:
+            OutboundEmail.objects.filter(pk__in=[e.pk for e in batch]).update(
+                status=OutboundEmail.Status.SENDING, locked_at=now,
+            )
+    return batch
+
+
+def drain_email_outbox(batch_size: int | None = None) -> dict[str, Any]:
+    """Deliver one batch of due outbox emails over a single SMTP connection.
+
+    Each message is sent individually so one bad address does not fail the
+    batch. Failures are rescheduled with exponential backoff until
+    NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS is reached, then marked FAILED.
+    """
+    batch_size = batch_size or int(getattr(settings, "NOTIFICATIONS_OUTBOX_BATCH_SIZE", 50))
+    max_attempts = int(getattr(settings, "NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS", 6))
+
+    batch = _claim_batch(batch_size)
+    result = {"claimed": len(batch), "sent": 0, "retried": 0, "failed": 0}
+    if not batch:
+        return result
+
+    connection = get_connection(fail_silently=False)
+    logs: list[EmailLog] = []
+    try:
+        connection.open()
+        connection_error = None
+    except Exception as exc:  # noqa: BLE001
+        connection_error = exc
+        logger.warning("Could not open mail connection: %s", exc)
+
+    try:
+        for outbound in batch:
+            error = connection_error
+            if error is None:
+                msg = build_email_message(
+                    outbound.subject,
+                    outbound.body_text,
+                    list(outbound.to_emails),
+                    body_html=outbound.body_html or None,
+                    ics_content=bytes(outbound.ics_content) if outbound.ics_content else None,
+                    from_email=outbound.from_email or None,
+                    connection=connection,
+                )
+                try:
+                    connection.send_messages([msg])
+                except Exception as exc:  # noqa: BLE001
+                    error = exc
+
+            now = timezone.now()
+            outbound.attempts += 1
+            outbound.locked_at = None
+            if error is None:
+                outbound.status = OutboundEmail.Status.SENT
+                outbound.sent_at = now
+                outbound.last_error = ""
+                result["sent"] += 1
+            else:
+                outbound.last_error = str(error)
+                if outbound.attempts >= max_attempts:
+                    outbound.status = OutboundEmail.Status.FAILED
+                    result["failed"] += 1
+                else:
+                    outbound.status = OutboundEmail.Status.PENDING
+                    outbound.next_attempt_at = now + _backoff_delay(outbound.attempts)
+                    result["retried"] += 1
+            outbound.save(
+                update_fields=[
+                    "status", "attempts", "locked_at", "last_error", "sent_at", "next_attempt_at",
+                ],
+            )
+            logs.extend(
+                EmailLog(
+                    recipient_id=outbound.recipient_id,
+                    recipient_email=email,
+                    subject=outbound.subject,
+                    notification_type=outbound.notification_type,
+                    success=error is None,
+                    error_message="" if error is None else str(error),
+                )
+                for email in outbound.to_emails
+            )
+    finally:
+        if connection_error is None:
+            connection.close()
+
+    EmailLog.objects.bulk_create(logs)
+    logger.info(
+        "Outbox drained: %(sent)s sent, %(retried)s retried, %(failed)s failed", result,
+    )
+    return result
+
+
+@shared_task(name="notifications.drain_email_outbox")
+def drain_email_outbox_task(batch_size: int | None = None, max_batches: int = 20) -> dict[str, Any]:
+    """Celery task wrapper that drains the outbox until empty or ``max_batches``.
+
+    Scheduled periodically via CELERY_BEAT_SCHEDULE and kicked on enqueue.
+    """
+    totals = {"claimed": 0, "sent": 0, "retried": 0, "failed": 0}
+    for _ in range(max_batches):
+        result = drain_email_outbox(batch_size=batch_size)
+        for key, value in result.items():
+            totals[key] += value
+        # Stop on an empty outbox or when nothing got through (e.g. SMTP down)
+        if result["claimed"] == 0 or result["sent"] == 0:
+            break
+    return totals
@@ -0,0 +1,350 @@
+from datetime import time
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test import TransactionTestCase
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from team_planner.notifications.mailer import queue_email_with_optional_ics
+from team_planner.notifications.models import CalendarFeedToken
+from team_planner.notifications.models import EmailLog
+from team_planner.notifications.models import Notification
+from team_planner.notifications.models import OutboundEmail
+from team_planner.notifications.services import NotificationService
+from team_planner.notifications.tasks import drain_email_outbox
+from team_planner.shifts.models import RecurringShiftPattern
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.shifts.pattern_service import RecurringPatternService
+
+User = get_user_model()
+
+
+class EmailOutboxTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="outbox", email="outbox@example.com", name="Outbox User",
+        )
+
+    def test_send_email_enqueues_without_sending(self):
+        queued = NotificationService.send_email(
+            recipient=self.user, subject="Hello", body_text="Body",
+        )
+
+        assert queued is True
+        assert len(mail.outbox) == 0
+        outbound = OutboundEmail.objects.get()
+        assert outbound.status == OutboundEmail.Status.PENDING
+        assert outbound.to_emails == ["outbox@example.com"]
+
+    def test_idempotency_key_deduplicates(self):
+        for _ in range(3):
+            queue_email_with_optional_ics(
+                "Hello", "Body", ["outbox@example.com"], idempotency_key="same-key",
+            )
+
+        assert OutboundEmail.objects.count() == 1
+
+    def test_drain_sends_batch_and_logs(self):
+        for i in range(3):
+            queue_email_with_optional_ics("Hello", "Body", [f"user{i}@example.com"])
+
+        result = drain_email_outbox(batch_size=10)
+
+        assert result["sent"] == 3
+        assert len(mail.outbox) == 3
+        assert not OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT).exists()
+        assert EmailLog.objects.filter(success=True).count() == 3
+
+    def test_drain_skips_emails_not_yet_due(self):
+        outbound = queue_email_with_optional_ics("Later", "Body", ["later@example.com"])
+        outbound.next_attempt_at = timezone.now() + timedelta(minutes=5)
+        outbound.save()
+
+        result = drain_email_outbox()
+
+        assert result["claimed"] == 0
+        assert len(mail.outbox) == 0
+
+    @override_settings(
+        EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+        EMAIL_HOST="127.0.0.1",
+        EMAIL_PORT=1,
+        EMAIL_TIMEOUT=1,
+        NOTIFICATIONS_OUTBOX_MAX_ATTEMPTS=2,
+        NOTIFICATIONS_OUTBOX_BACKOFF_BASE_SECONDS=60,
+    )
+    def test_failures_back_off_then_fail(self):
+        outbound = queue_email_with_optional_ics("Hello", "Body", ["outbox@example.com"])
+
+        before = timezone.now()
+        result = drain_email_outbox()
+        outbound.refresh_from_db()
+
+        assert result["retried"] == 1
+        assert outbound.status == OutboundEmail.Status.PENDING
+        assert outbound.attempts == 1
+        assert outbound.next_attempt_at >= before + timedelta(seconds=60)
+
+        outbound.next_attempt_at = timezone.now()
+        outbound.save()
+        drain_email_outbox()
+        outbound.refresh_from_db()
+
+        assert outbound.status == OutboundEmail.Status.FAILED
+        assert outbound.attempts == 2
+
+
+class ShiftNotificationDigestTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="digest", email="digest@example.com", name="Digest User",
+        )
+        template = ShiftTemplate.objects.create(
+            name="Incidents", shift_type="incidents", duration_hours=8,
+        )
+        start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+        self.shifts = [
+            Shift.objects.create(
+                template=template,
+                assigned_employee=self.user,
+                start_datetime=start + timedelta(days=i),
+                end_datetime=start + timedelta(days=i, hours=8),
+            )
+            for i in range(5)
+        ]
+
+    def test_events_coalesce_into_one_notification_and_email(self):
+        with NotificationService.coalesce_shift_notifications() as digest:
+            for shift in self.shifts[:4]:
+                result = NotificationService.notify_shift_assigned(self.user, shift)
+                assert result["buffered"] is True
+            NotificationService.notify_shift_updated(self.user, self.shifts[4], {"notes": "x"})
+            assert len(digest) == 5
+            assert Notification.objects.count() == 0
+
+        notification = Notification.objects.get()
+        assert notification.data["shift_ids"] == [s.id for s in self.shifts]
+        assert "4 new shifts assigned and 1 shift updated" in notification.message
+
+        outbound = OutboundEmail.objects.get()
+        ics = bytes(outbound.ics_content)
+        assert ics.count(b"BEGIN:VEVENT") == 5
+
+    def test_buffer_is_discarded_on_error(self):
+        try:
+            with NotificationService.coalesce_shift_notifications():
+                NotificationService.notify_shift_assigned(self.user, self.shifts[0])
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        assert Notification.objects.count() == 0
+        assert OutboundEmail.objects.count() == 0
+
+    def test_recurring_pattern_generation_sends_one_digest(self):
+        pattern = RecurringShiftPattern.objects.create(
+            name="Daily incidents",
+            template=self.shifts[0].template,
+            start_time=time(9),
+            end_time=time(17),
+            recurrence_type=RecurringShiftPattern.RecurrenceType.DAILY,
+            pattern_start_date=self.shifts[-1].start_datetime.date() + timedelta(days=2),
+            assigned_employee=self.user,
+        )
+
+        created = RecurringPatternService.generate_shifts_for_pattern(
+            pattern, end_date=pattern.pattern_start_date + timedelta(days=6),
+        )
+
+        assert len(created) == 7
+        notification = Notification.objects.get()
+        assert notification.data["shift_ids"] == [s.id for s in created]
+        assert OutboundEmail.objects.count() == 1
+
+
+class CalendarFeedTestCase(TransactionTestCase):
+    """Uses real commits so on_commit version bumps run as in production."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="feed", email="feed@example.com")
+        self.template = ShiftTemplate.objects.create(
+            name="Incidents", shift_type="incidents", duration_hours=8,
+        )
+        start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+        self.shift = Shift.objects.create(
+            template=self.template,
+            assigned_employee=self.user,
+            start_datetime=start,
+            end_datetime=start + timedelta(hours=8),
+        )
+        self.feed = CalendarFeedToken.objects.create(user=self.user)
+        self.url = reverse("api:calendar-feed", kwargs={"token": self.feed.token})
+
+    def test_feed_contains_shifts(self):
+        response = self.client.get(self.url)
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/calendar")
+        assert response.content.count(b"BEGIN:VEVENT") == 1
+        assert f"team-planner-shift-{self.shift.pk}@".encode() in response.content
+
+    def test_unknown_token_is_404(self):
+        response = self.client.get(reverse("api:calendar-feed", kwargs={"token": "nope"}))
+
+        assert response.status_code == 404
+
+    def test_conditional_get_returns_304_until_data_changes(self):
+        first = self.client.get(self.url)
+        etag = first["ETag"]
+
+        unchanged = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert unchanged.status_code == 304
+
+        self.shift.notes = "changed"
+        self.shift.save()
+
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        assert changed.status_code == 200
+        assert changed["ETag"] != etag
+
+    def test_reassignment_refreshes_both_feeds_without_a_lookup(self):
+        other = User.objects.create_user(username="feed2", email="feed2@example.com")
+        other_feed = CalendarFeedToken.objects.create(user=other)
+        other_url = reverse("api:calendar-feed", kwargs={"token": other_feed.token})
+        etags = {url: self.client.get(url)["ETag"] for url in (self.url, other_url)}
+
+        shift = Shift.objects.get(pk=self.shift.pk)
+        shift.assigned_employee = other
+        with CaptureQueriesContext(connection) as queries:
+            shift.save()
+        assert [q["sql"].split()[0] for q in queries.captured_queries] == ["UPDATE"]
+
+        for url, etag in etags.items():
+            assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_revoked_token_stops_serving(self):
+        self.client.get(self.url)
+        self.feed.is_active = False
+        self.feed.save()
+
+        assert self.client.get(self.url).status_code == 404
+
+
+class KeysetPaginationTestCase(TestCase):
+    def setUp(self):
+        from team_planner.notifications.models import NotificationType
+
+        self.user = User.objects.create_user(username="pager", email="pager@example.com")
+        Notification.objects.bulk_create(
+            Notification(
+                recipient=self.user,
+                notification_type=NotificationType.SHIFT_ASSIGNED,
+                title=f"n{i}",
+                message="m",
+            )
+            for i in range(25)
+        )
+        # Ties on created must be broken by id without skipping rows
+        tied = list(Notification.objects.order_by("id").values_list("id", flat=True)[5:15])
+        Notification.objects.filter(id__in=tied).update(created=timezone.now())
+        self.client.force_login(self.user)
+
+    def test_cursor_pages_cover_every_row_once_in_order(self):
+        url = reverse("api:notification-list") + "?pagination=cursor&page_size=10"
+        seen = []
+        pages = 0
+        while url:
+            response = self.client.get(url)
+            assert response.status_code == 200
+            body = response.json()
+            assert body["count"] == 25
+            assert body["count_is_estimate"] is False
+            seen += [n["id"] for n in body["results"]]
+            url = body["next"]
+            pages += 1
+
+        assert pages == 3
+        assert seen == list(
+            Notification.objects.order_by("-created", "-id").values_list("id", flat=True),
+        )
+
+    def test_count_is_capped_and_bad_cursor_is_404(self):
+        from unittest import mock
+
+        from team_planner.utils.pagination import KeysetPagination
+
+        with mock.patch.object(KeysetPagination, "count_limit", 20):
+            body = self.client.get(reverse("api:notification-list"), {"pagination": "cursor"}).json()
+        assert body["count"] == 20
+        assert body["count_is_estimate"] is True
+
+        response = self.client.get(reverse("api:notification-list"), {"cursor": "garbage"})
+        assert response.status_code == 404
+
+
+class UnreadCounterTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="badge", email="badge@example.com")
+        self.client.force_login(self.user)
+        self.url = reverse("api:notification-unread-count")
+
+    def notify(self, n):
+        from team_planner.notifications.models import NotificationType
+
+        return [
+            NotificationService.create_notification(
+                recipient=self.user,
+                notification_type=NotificationType.SHIFT_ASSIGNED,
+                title=f"n{i}",
+                message="m",
+            )
+            for i in range(n)
+        ]
+
+    def badge(self):
+        return self.client.get(self.url).json()["unread_count"]
+
+    def test_counter_follows_every_write_path(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            first, second, third = self.notify(3)
+        assert self.badge() == 3
+
+        with self.captureOnCommitCallbacks(execute=True):
+            first.mark_as_read()
+            # Stale copy of an already-read row does not count twice
+            Notification.objects.get(pk=first.pk).mark_as_read()
+            Notification.objects.filter(pk=first.pk).first().mark_as_unread()
+            second.mark_as_read()
+        assert self.badge() == 2
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(reverse("api:notification-mark-all-read"))
+        assert response.json()["count"] == 2
+        assert self.badge() == 0
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.notify(2)
+            self.client.delete(reverse("api:notification-clear-all"))
+        assert self.badge() == 0
+
+    def test_badge_is_a_cached_counter_read(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.notify(2)
+
+        # Session/user lookups plus a single primary-key counter read
+        with CaptureQueriesContext(connection) as cold:
+            assert self.badge() == 2
+        assert sum("notifications_notification" in q["sql"] for q in cold.captured_queries) == 0
+        with CaptureQueriesContext(connection) as warm:
+            assert self.badge() == 2
+        assert len(warm.captured_queries) == len(cold.captured_queries) - 1
@@ -30,6 +30,10 @@ def waakdienst_adapter_enabled() -> bool:
 class WaakdienstAdapter:
     orchestrator: WaakdienstOrchestrator
 
+    @property
+    def telemetry(self):
+        return self.orchestrator.telemetry
+
     def generate_schedule(
         self, start_date: datetime, end_date: datetime, dry_run: bool = True,
     ) -> dict[str, Any]:
@@ -72,6 +72,9 @@ class OrchestrationRunAdmin(admin.ModelAdmin):
         "waakdienst_shifts_created",
         "execution_log",
         "error_message",
+        "duration_seconds",
+        "query_count",
+        "phase_metrics",
     ]
 
     fieldsets = (
@@ -101,6 +104,13 @@ class OrchestrationRunAdmin(admin.ModelAdmin):
                 "classes": ("collapse",),
             },
         ),
+        (
+            _("Telemetry"),
+            {
+                "fields": ("duration_seconds", "query_count", "phase_metrics"),
+                "classes": ("collapse",),
+            },
+        ),
         (
             _("Logs"),
             {"fields": ("execution_log", "error_message"), "classes": ("collapse",)},
@@ -10,6 +10,7 @@ Enhanced with automatic conflict detection and reassignment capabilities.
 """
 
 import logging
+import time as time_module
 from collections import defaultdict
 from datetime import datetime
 from datetime import time
@@ -24,9 +25,15 @@ from django.utils import timezone
 from team_planner.employees.models import EmployeeProfile
 from team_planner.leaves.models import Holiday  # include Holiday for skip logic
 from team_planner.leaves.models import LeaveRequest  # include Holiday for skip logic
+from team_planner.notifications.services import NotificationService
 from team_planner.orchestrators.anchors import business_weeks
 from team_planner.orchestrators.anchors import get_team_tz
 from team_planner.orchestrators.anchors import waakdienst_periods
+from team_planner.orchestrators.preview_cache import get_preview
+from team_planner.orchestrators.preview_cache import preview_key
+from team_planner.orchestrators.preview_cache import store_preview
+from team_planner.orchestrators.telemetry import RunTelemetry
+from team_planner.orchestrators.templates import template_cache
 from team_planner.shifts.models import Shift
 from team_planner.shifts.models import ShiftTemplate
 from team_planner.shifts.models import ShiftType
@@ -35,6 +42,8 @@ from team_planner.teams.models import Team
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+ASSIGNMENT_MODES = ("greedy", "optimal")
+
 
 class FairnessCalculator:
     """Calculate fairness scores for shift assignments using hour-based scoring with
@@ -966,6 +975,7 @@ class ShiftOrchestrator:
         schedule_incidents_standby: bool = False,
         schedule_waakdienst: bool = True,
         orchestration_run=None,
+        assignment_mode: str | None = None,
     ):
         self.start_date = start_date
         self.end_date = end_date
@@ -974,6 +984,16 @@ class ShiftOrchestrator:
         self.schedule_incidents_standby = schedule_incidents_standby
         self.schedule_waakdienst = schedule_waakdienst
         self.orchestration_run = orchestration_run
+        # "greedy" picks week by week; "optimal" solves each shift type's
+        # horizon at once with a min-cost flow (see optimal.py)
+        self.assignment_mode = assignment_mode or getattr(
+            settings, "ORCHESTRATOR_ASSIGNMENT_MODE", "greedy",
+        )
+        if self.assignment_mode not in ASSIGNMENT_MODES:
+            msg = f"Unknown assignment mode {self.assignment_mode!r}"
+            raise ValueError(msg)
+        self.solver_timings: dict[str, float] = {}
+        self.telemetry = RunTelemetry()
         self.fairness_calculator = FairnessCalculator(start_date, end_date)
         self.constraint_checker = ConstraintChecker(
             start_date, end_date, team_id=team_id, orchestrator=self,
@@ -1163,32 +1183,9 @@ class ShiftOrchestrator:
         return daily_shifts
 
     def get_shift_template(self, shift_type: str) -> ShiftTemplate | None:
-        """Get or create shift template for the given type."""
-        # Individual daily shift durations (hours)
-        if shift_type in (ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY):
-            duration_hours = 9  # Single day 08:00-17:00
-        elif shift_type == ShiftType.WAAKDIENST:
-            duration_hours = 15  # Average daily shift (varies from 15-24 hours)
-        else:
-            duration_hours = 8  # Default
-
-        # Try to get an existing template first, or create if none exist
+        """Get or create shift template for the given type (memoized, see templates.py)."""
         try:
-            template = ShiftTemplate.objects.filter(
-                shift_type=shift_type, is_active=True,
-            ).first()
-
-            if not template:
-                # No active template found, create one
-                template = ShiftTemplate.objects.create(
-                    shift_type=shift_type,
-                    name=f"{shift_type.replace('_', '-').title()} Daily Shift",
-                    description=f"Individual daily shift for {shift_type.replace('_', '-')}",
-                    duration_hours=duration_hours,
-                    is_active=True,
-                )
-                logger.info(f"Created new shift template for {shift_type}")
-
+            return template_cache.resolve(shift_type)
         except Exception as e:
             logger.exception(f"Error getting shift template for {shift_type}: {e}")
             # Fallback to first available template
@@ -1196,13 +1193,138 @@ class ShiftOrchestrator:
             if not template:
                 msg = f"No shift template found for {shift_type}"
                 raise ValueError(msg)
-
-        return template
+            return template
 
     def assign_shifts_fairly(
         self, shift_type: str, weeks: list[tuple[datetime, datetime, str]],
     ) -> list[dict]:
-        """Assign shifts using fair distribution algorithm with recurring pattern awareness."""
+        """Assign shifts using fair distribution algorithm with recurring pattern awareness.
+
+        Dispatches to assign_shifts_optimally() in "optimal" mode. Either way the
+        wall time per shift type is recorded in ``solver_timings``.
+        """
+        started = time_module.perf_counter()
+        try:
+            if self.assignment_mode == "optimal":
+                return self.assign_shifts_optimally(shift_type, weeks)
+            return self._assign_shifts_greedily(shift_type, weeks)
+        finally:
+            self.solver_timings[shift_type] = round(
+                time_module.perf_counter() - started, 4,
+            )
+
+    def assign_shifts_optimally(
+        self, shift_type: str, weeks: list[tuple[datetime, datetime, str]],
+    ) -> list[dict]:
+        """Assign whole weeks for the horizon in one min-cost-flow solve.
+
+        Builds the availability matrix (who can take each full week) and the
+        fairness deficits (historical hours for this shift type), then lets
+        optimal.solve_fair_assignment pick the fairest feasible roster. Weeks
+        nobody can take in full fall back to the greedy partial-week handling
+        for incidents.
+        """
+        from .optimal import solve_fair_assignment
+
+        available_employees = self.constraint_checker.get_available_employees(
+            shift_type,
+        )
+        if not available_employees:
+            logger.warning(f"No employees available for {shift_type} shifts")
+            return []
+
+        current_assignments = self.fairness_calculator.calculate_current_assignments(
+            available_employees,
+        )
+        new_assignments = defaultdict(
+            lambda: {"incidents": 0.0, "incidents_standby": 0.0, "waakdienst": 0.0},
+        )
+
+        planned_weeks = []
+        for week_start, week_end, week_type in weeks:
+            daily_shifts = self.generate_daily_shifts_for_week(
+                week_start, week_end, shift_type, week_type,
+            )
+            if daily_shifts:
+                planned_weeks.append((week_start, week_end, week_type, daily_shifts))
+        if not planned_weeks:
+            return []
+
+        units = list(range(len(planned_weeks)))
+        candidates = {
+            unit: [
+                emp.pk
+                for emp in available_employees
+                if self._is_available_for_full_week(
+                    emp, planned_weeks[unit][0], planned_weeks[unit][1], shift_type,
+                )
+            ]
+            for unit in units
+        }
+        week_hours = [
+            sum((end - start).total_seconds() / 3600 for start, end, _ in daily_shifts)
+            for _, _, _, daily_shifts in planned_weeks
+        ]
+        roster = solve_fair_assignment(
+            units,
+            candidates,
+            {
+                emp.pk: current_assignments.get(emp.pk, {}).get(shift_type.lower(), 0.0)
+                for emp in available_employees
+            },
+            unit_hours=sum(week_hours) / len(week_hours),
+        )
+
+        employees_by_id = {emp.pk: emp for emp in available_employees}
+        assignments: list[dict] = []
+        for unit, (week_start, week_end, week_type, daily_shifts) in enumerate(planned_weeks):
+            emp_id = roster.get(unit)
+            if emp_id is not None:
+                assignments.extend(
+                    self.create_full_week_assignments(
+                        employees_by_id[emp_id], daily_shifts, shift_type, new_assignments,
+                    ),
+                )
+            elif shift_type in [ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY]:
+                assignments.extend(
+                    self.assign_incidents_week_with_patterns_and_conflicts(
+                        week_start,
+                        week_end,
+                        week_type,
+                        shift_type,
+                        available_employees,
+                        current_assignments,
+                        new_assignments,
+                        daily_shifts,
+                        assignments,
+                    ),
+                )
+            else:
+                logger.warning(f"No eligible employees for {shift_type} week {week_start}")
+
+        return sorted(assignments, key=lambda a: a["start_datetime"])
+
+    def _is_available_for_full_week(
+        self, employee: Any, week_start: datetime, week_end: datetime, shift_type: str,
+    ) -> bool:
+        """Same full-week test the greedy path applies before assigning a whole week."""
+        if shift_type in [ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY]:
+            if self.check_incidents_conflicts_for_employee(
+                employee, week_start, week_end, shift_type,
+            ):
+                return False
+            info = self.constraint_checker.get_partial_availability_for_week(
+                employee, week_start, week_end, shift_type,
+            )
+            return info["available"] and not info["partial"]
+        return self.constraint_checker.is_employee_available(
+            employee, week_start, week_end, shift_type,
+        )
+
+    def _assign_shifts_greedily(
+        self, shift_type: str, weeks: list[tuple[datetime, datetime, str]],
+    ) -> list[dict]:
+        """Week-by-week greedy assignment (the default mode)."""
         available_employees = self.constraint_checker.get_available_employees(
             shift_type,
         )
@@ -1994,6 +2116,9 @@ class ShiftOrchestrator:
 
         all_assignments = []
 
+        # Resolve shift templates from the shared map, reloaded only if changed
+        template_cache.refresh()
+
         # Preload holiday cache if needed
         team = self.get_team()
         if team and getattr(team, "incidents_skip_holidays", False):
@@ -2002,9 +2127,11 @@ class ShiftOrchestrator:
         # Generate Incidents shifts first
         if self.schedule_incidents:
             incidents_weeks = self.generate_incidents_weeks()
-            incidents_assignments = self.assign_shifts_fairly(
-                ShiftType.INCIDENTS, incidents_weeks,
-            )
+            with self.telemetry.phase(ShiftType.INCIDENTS.value) as stats:
+                incidents_assignments = self.assign_shifts_fairly(
+                    ShiftType.INCIDENTS, incidents_weeks,
+                )
+                stats.rows = len(incidents_assignments)
             # Track assignments to prevent conflicts
             for assignment in incidents_assignments:
                 self.add_assignment_to_tracker(assignment)
@@ -2016,9 +2143,11 @@ class ShiftOrchestrator:
         # Generate Incidents-Standby shifts (with conflict checking)
         if self.schedule_incidents_standby:
             incidents_weeks = self.generate_incidents_weeks()  # Same weeks as incidents
-            standby_assignments = self.assign_shifts_fairly(
-                ShiftType.INCIDENTS_STANDBY, incidents_weeks,
-            )
+            with self.telemetry.phase(ShiftType.INCIDENTS_STANDBY.value) as stats:
+                standby_assignments = self.assign_shifts_fairly(
+                    ShiftType.INCIDENTS_STANDBY, incidents_weeks,
+                )
+                stats.rows = len(standby_assignments)
             # Track assignments
             for assignment in standby_assignments:
                 self.add_assignment_to_tracker(assignment)
@@ -2030,9 +2159,11 @@ class ShiftOrchestrator:
         # Generate Waakdienst shifts
         if self.schedule_waakdienst:
             waakdienst_weeks = self.generate_waakdienst_weeks()
-            waakdienst_assignments = self.assign_shifts_fairly(
-                ShiftType.WAAKDIENST, waakdienst_weeks,
-            )
+            with self.telemetry.phase(ShiftType.WAAKDIENST.value) as stats:
+                waakdienst_assignments = self.assign_shifts_fairly(
+                    ShiftType.WAAKDIENST, waakdienst_weeks,
+                )
+                stats.rows = len(waakdienst_assignments)
             # Track assignments
             for assignment in waakdienst_assignments:
                 self.add_assignment_to_tracker(assignment)
@@ -2044,49 +2175,51 @@ class ShiftOrchestrator:
         # Detect and resolve conflicts if reassignment manager is available
         reassignment_summary = None
         if self.reassignment_manager:
-            logger.info("Starting conflict detection and reassignment...")
-            conflicts = self.reassignment_manager.detect_conflicts(all_assignments)
+            with self.telemetry.phase("reassignment") as stats:
+                logger.info("Starting conflict detection and reassignment...")
+                conflicts = self.reassignment_manager.detect_conflicts(all_assignments)
+                stats.rows = len(conflicts)
 
-            if conflicts:
-                logger.info(
-                    f"Detected {len(conflicts)} conflicts, attempting automatic reassignment",
-                )
-                self.reassignment_manager.resolve_conflicts(conflicts)
-
-                # Handle split assignments by replacing with individual daily assignments
-                updated_assignments = []
-                split_assignments_to_remove = []
-
-                for assignment in all_assignments:
-                    if assignment.get("is_split_assignment", False):
-                        # This assignment was split, replace with individual daily assignments
-                        split_info = assignment.get("split_coverage")
-                        if split_info:
-                            daily_assignments = self.reassignment_manager.create_split_shift_assignments(
-                                assignment, split_info,
-                            )
-                            updated_assignments.extend(daily_assignments)
-                            split_assignments_to_remove.append(assignment)
-                            logger.info(
-                                f"Replaced split assignment with {len(daily_assignments)} daily assignments",
-                            )
-                    else:
-                        updated_assignments.append(assignment)
+                if conflicts:
+                    logger.info(
+                        f"Detected {len(conflicts)} conflicts, attempting automatic reassignment",
+                    )
+                    self.reassignment_manager.resolve_conflicts(conflicts)
+
+                    # Handle split assignments by replacing with individual daily assignments
+                    updated_assignments = []
+                    split_assignments_to_remove = []
+
+                    for assignment in all_assignments:
+                        if assignment.get("is_split_assignment", False):
+                            # This assignment was split, replace with individual daily assignments
+                            split_info = assignment.get("split_coverage")
+                            if split_info:
+                                daily_assignments = self.reassignment_manager.create_split_shift_assignments(
+                                    assignment, split_info,
+                                )
+                                updated_assignments.extend(daily_assignments)
+                                split_assignments_to_remove.append(assignment)
+                                logger.info(
+                                    f"Replaced split assignment with {len(daily_assignments)} daily assignments",
+                                )
+                        else:
+                            updated_assignments.append(assignment)
 
-                # Replace all_assignments with the updated list
-                all_assignments = updated_assignments
+                    # Replace all_assignments with the updated list
+                    all_assignments = updated_assignments
 
-                reassignment_summary = (
-                    self.reassignment_manager.get_reassignment_summary()
-                )
-                logger.info(
-                    f"Reassignment complete: {reassignment_summary['successful_reassignments']} successful, {reassignment_summary['failed_reassignments']} failed",
-                )
-            else:
-                logger.info("No conflicts detected")
-                reassignment_summary = (
-                    self.reassignment_manager.get_reassignment_summary()
-                )
+                    reassignment_summary = (
+                        self.reassignment_manager.get_reassignment_summary()
+                    )
+                    logger.info(
+                        f"Reassignment complete: {reassignment_summary['successful_reassignments']} successful, {reassignment_summary['failed_reassignments']} failed",
+                    )
+                else:
+                    logger.info("No conflicts detected")
+                    reassignment_summary = (
+                        self.reassignment_manager.get_reassignment_summary()
+                    )
 
         # Calculate metrics
         incidents_count = len(
@@ -2105,14 +2238,15 @@ class ShiftOrchestrator:
 
         # Calculate fairness metrics based on the generated plan (provisional)
         all_employees = list({a["assigned_employee_id"] for a in all_assignments})
-        provisional_assignments = (
-            self.fairness_calculator.calculate_provisional_assignments(all_assignments)
-            if all_assignments
-            else {}
-        )
-        fairness_scores = self.fairness_calculator.calculate_fairness_score(
-            provisional_assignments,
-        )
+        with self.telemetry.phase("fairness"):
+            provisional_assignments = (
+                self.fairness_calculator.calculate_provisional_assignments(all_assignments)
+                if all_assignments
+                else {}
+            )
+            fairness_scores = self.fairness_calculator.calculate_fairness_score(
+                provisional_assignments,
+            )
 
         result = {
             "assignments": all_assignments,
@@ -2128,6 +2262,8 @@ class ShiftOrchestrator:
             "period_start": self.start_date,
             "period_end": self.end_date,
             "reassignment_summary": reassignment_summary,
+            "assignment_mode": self.assignment_mode,
+            "solver_timings": dict(self.solver_timings),
         }
 
         logger.info(
@@ -2144,20 +2280,61 @@ class ShiftOrchestrator:
 
         # Also include DB-based fairness for reference
         try:
-            # Convert employee IDs to employee objects
-            employee_objects = [User.objects.get(pk=emp_id) for emp_id in all_employees]
-            (
-                self.fairness_calculator.calculate_current_assignments(employee_objects)
-            )
+            with self.telemetry.phase("fairness"):
+                # Convert employee IDs to employee objects
+                employee_objects = [User.objects.get(pk=emp_id) for emp_id in all_employees]
+                (
+                    self.fairness_calculator.calculate_current_assignments(employee_objects)
+                )
             # Skip DB fairness scores to avoid JSON serialization issues with User objects
             # result['db_fairness_scores'] = self.fairness_calculator.calculate_fairness_score(final_assignments_db)
         except Exception as e:
             logger.warning(f"DB fairness calculation skipped: {e}")
 
+        result["telemetry"] = self.telemetry.as_dict()
         return result
 
+    def _preview_cache_key(self) -> str | None:
+        """Key of this preview over the current data (None without a team)."""
+        if not self.team_id:
+            return None
+        shift_types = [
+            shift_type
+            for shift_type, scheduled in (
+                (ShiftType.INCIDENTS, self.schedule_incidents),
+                (ShiftType.INCIDENTS_STANDBY, self.schedule_incidents_standby),
+                (ShiftType.WAAKDIENST, self.schedule_waakdienst),
+            )
+            if scheduled
+        ]
+        return preview_key(
+            "shift_orchestrator",
+            self.team_id,
+            self.start_date,
+            self.end_date,
+            shift_types,
+            options={"assignment_mode": self.assignment_mode},
+        )
+
+    def _cached_preview(self, key: str | None) -> dict[str, Any] | None:
+        with self.telemetry.phase("preview_cache") as stats:
+            schedule = get_preview(key)
+            stats.rows = len(schedule["assignments"]) if schedule else 0
+        return schedule
+
     def preview_schedule(self) -> dict[str, Any]:
-        """Generate schedule preview without saving, with duplicate detection."""
+        """Generate schedule preview without saving, with duplicate detection.
+
+        An identical preview over unchanged data is served from the preview
+        cache (see preview_cache.py).
+        """
+        key = self._preview_cache_key()
+        cached = self._cached_preview(key)
+        if cached is not None:
+            cached["preview_cached"] = True
+            cached["telemetry"] = self.telemetry.as_dict()
+            return cached
+
         schedule = self.generate_schedule()
 
         # Check for duplicates in preview
@@ -2179,6 +2356,9 @@ class ShiftOrchestrator:
                 f"Preview detected {len(potential_duplicates)} potential duplicate shifts",
             )
 
+        if self._preview_cache_key() == key:
+            store_preview(key, schedule)
+        schedule["preview_cached"] = False
         return schedule
 
     def check_for_duplicate_shifts(self, assignment: dict) -> bool:
@@ -2198,46 +2378,55 @@ class ShiftOrchestrator:
         return False
 
     def apply_schedule(self) -> dict[str, Any]:
-        """Generate and save schedule to database with duplicate prevention."""
-        schedule = self.generate_schedule()
+        """Generate and save schedule to database with duplicate prevention.
+
+        A cached preview over unchanged data is committed as is.
+        """
+        schedule = self._cached_preview(self._preview_cache_key()) or self.generate_schedule()
 
         created_shifts = []
         skipped_duplicates = []
 
-        for assignment in schedule["assignments"]:
-            # Check for duplicates before creating
-            if self.check_for_duplicate_shifts(assignment):
-                skipped_duplicates.append(
-                    {
-                        "shift_type": assignment["shift_type"],
-                        "start_datetime": assignment["start_datetime"],
-                        "end_datetime": assignment["end_datetime"],
-                        "assigned_employee": assignment["assigned_employee_name"],
-                    },
-                )
-                continue
-
-            # Get the template and employee by ID
-            template = (
-                ShiftTemplate.objects.get(pk=assignment["template_id"])
-                if assignment["template_id"]
-                else None
-            )
-            employee = User.objects.get(pk=assignment["assigned_employee_id"])
+        # One digest per employee instead of a notification per shift
+        with self.telemetry.phase("persist") as stats, \
+                NotificationService.coalesce_shift_notifications():
+            for assignment in schedule["assignments"]:
+                # Check for duplicates before creating
+                if self.check_for_duplicate_shifts(assignment):
+                    skipped_duplicates.append(
+                        {
+                            "shift_type": assignment["shift_type"],
+                            "start_datetime": assignment["start_datetime"],
+                            "end_datetime": assignment["end_datetime"],
+                            "assigned_employee": assignment["assigned_employee_name"],
+                        },
+                    )
+                    continue
 
-            shift = Shift.objects.create(
-                template=template,
-                assigned_employee=employee,
-                start_datetime=assignment["start_datetime"],
-                end_datetime=assignment["end_datetime"],
-                status="scheduled",
-                auto_assigned=assignment["auto_assigned"],
-                assignment_reason=assignment["assignment_reason"],
-            )
-            created_shifts.append(shift)
+                # Get the template and employee by ID
+                template = (
+                    template_cache.get(assignment["template_id"])
+                    if assignment["template_id"]
+                    else None
+                )
+                employee = User.objects.get(pk=assignment["assigned_employee_id"])
+
+                shift = Shift.objects.create(
+                    template=template,
+                    assigned_employee=employee,
+                    start_datetime=assignment["start_datetime"],
+                    end_datetime=assignment["end_datetime"],
+                    status="scheduled",
+                    auto_assigned=assignment["auto_assigned"],
+                    assignment_reason=assignment["assignment_reason"],
+                )
+                NotificationService.notify_shift_assigned(employee, shift)
+                created_shifts.append(shift)
+            stats.rows = len(created_shifts)
 
         schedule["created_shifts"] = created_shifts
         schedule["skipped_duplicates"] = skipped_duplicates
+        schedule["telemetry"] = self.telemetry.as_dict()
 
         if skipped_duplicates:
             logger.warning(f"Skipped {len(skipped_duplicates)} duplicate shifts")
@@ -7,11 +7,16 @@ from typing import Any
 
 from django.conf import settings
 from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.decorators import permission_classes
+from rest_framework.decorators import renderer_classes
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BaseRenderer
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
 from team_planner.employees.models import EmployeeProfile
@@ -32,6 +37,9 @@ from .fairness_calculators import (
 )  # Use comprehensive calculator for API
 from .models import OrchestrationResult
 from .models import OrchestrationRun
+from .progress import completed_team_ids
+from .progress import iter_sse
+from .progress import latest_event
 from .unified import UnifiedOrchestrator  # Legacy compatibility
 
 logger = logging.getLogger(__name__)
@@ -210,6 +218,7 @@ def orchestrator_create_api(request):
                         "incidents_standby_shifts", 0,
                     )
                     run.waakdienst_shifts_created = result.get("waakdienst_shifts", 0)
+                    orchestrator.telemetry.apply_to(run)
                     run.save()
 
                     # Materialize preview results into OrchestrationResult rows for later application
@@ -323,6 +332,7 @@ def orchestrator_create_api(request):
                     "incidents_standby_shifts", 0,
                 )
                 run.waakdienst_shifts_created = result.get("waakdienst_shifts", 0)
+                orchestrator.telemetry.apply_to(run)
                 run.save()
 
                 # Shifts are already created by apply_schedule()
@@ -569,6 +579,9 @@ def orchestrator_status_api(request):
                     or run.initiated_by.username,
                     "description": run.description,
                     "duration": duration,
+                    "duration_seconds": run.duration_seconds,
+                    "query_count": run.query_count,
+                    "phase_metrics": run.phase_metrics,
                     "error_message": run.error_message,
                 },
             )
@@ -948,8 +961,11 @@ from celery.result import AsyncResult
 @api_view(["POST"])
 def orchestrator_run_horizon_async_api(request):
     """Dispatch rolling-horizon scheduling as a background Celery task.
-    Body: { months?: int=6, weeks?: int, dry_run: bool=false, team_ids?: number[] }
-    Returns: { task_id }
+    Body: { months?: int=6, weeks?: int, dry_run: bool=false, team_ids?: number[],
+            chunk_size?: int, resume_from?: task_id }
+    Returns: { task_id, progress_url }
+
+    ``resume_from`` skips the teams an earlier (interrupted) run already finished.
     """
     if not request.user.is_authenticated:
         return Response(
@@ -969,6 +985,8 @@ def orchestrator_run_horizon_async_api(request):
     dry_run = bool(payload.get("dry_run", False))
     team_ids = payload.get("team_ids")
     shift_types = payload.get("shift_types")
+    chunk_size = payload.get("chunk_size")
+    resume_from = payload.get("resume_from")
     try:
         team_ids_param = (
             [*team_ids] if isinstance(team_ids, (list, tuple)) else team_ids
@@ -982,8 +1000,18 @@ def orchestrator_run_horizon_async_api(request):
             team_ids=team_ids_param,
             weeks=weeks,
             shift_types=shift_types_param,
+            exclude_team_ids=completed_team_ids(resume_from) if resume_from else None,
+            chunk_size=int(chunk_size) if chunk_size else None,
         )  # type: ignore
-        return Response({"task_id": async_result.id}, status=status.HTTP_202_ACCEPTED)
+        return Response(
+            {
+                "task_id": async_result.id,
+                "progress_url": reverse(
+                    "orchestrators:progress_stream_api", args=[async_result.id],
+                ),
+            },
+            status=status.HTTP_202_ACCEPTED,
+        )
     except Exception as e:
         logger.error(f"Failed to dispatch automation task: {e}", exc_info=True)
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -1004,7 +1032,7 @@ def orchestrator_automation_status_api(request):
             {"error": "task_id is required"}, status=status.HTTP_400_BAD_REQUEST,
         )
     res = AsyncResult(task_id)
-    data = {"task_id": task_id, "state": res.state}
+    data = {"task_id": task_id, "state": res.state, "progress": latest_event(task_id)}
     if res.successful():
         try:
             data["result"] = res.get(propagate=False)
@@ -1015,6 +1043,52 @@ def orchestrator_automation_status_api(request):
     return Response(data)
 
 
+class EventStreamRenderer(BaseRenderer):
+    """Lets EventSource clients (Accept: text/event-stream) through content negotiation."""
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Only error payloads are rendered; the stream itself bypasses renderers
+        return JSONRenderer().render(data)
+
+
+@api_view(["GET"])
+@renderer_classes([JSONRenderer, EventStreamRenderer])
+def orchestrator_progress_stream_api(request, task_id):
+    """Relay a background run's progress events as server-sent events.
+    Resumes after the ``Last-Event-ID`` header (or ``?after=<seq>``) and closes
+    after the run's terminal event or ORCHESTRATOR_PROGRESS_STREAM_SECONDS.
+    """
+    if not request.user.is_authenticated:
+        return Response(
+            {"error": "Authentication required"}, status=status.HTTP_401_UNAUTHORIZED,
+        )
+    if not (
+        request.user.is_staff
+        or request.user.has_perm("orchestrators.add_orchestrationrun")
+    ):
+        return Response(
+            {"error": "Permission denied"}, status=status.HTTP_403_FORBIDDEN,
+        )
+    try:
+        after = int(request.headers.get("Last-Event-ID") or request.GET.get("after") or 0)
+    except ValueError:
+        return Response(
+            {"error": "Last-Event-ID must be an integer"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    response = StreamingHttpResponse(
+        iter_sse(task_id, after=after), content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    # Disable proxy buffering (nginx) so events are delivered as they happen
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @api_view(["POST"])
 def orchestrator_enable_auto_api(request):
     """Ensure a Celery Beat periodic task exists to extend horizon nightly for configured weeks ahead."""
@@ -3,7 +3,6 @@ V2 API endpoints for the Orchestrator system.
 Clean architecture implementation with proper error handling and comprehensive responses.
 """
 
-import contextlib
 import logging
 from datetime import date
 from datetime import datetime
@@ -11,6 +10,7 @@ from datetime import timedelta
 
 from django.conf import settings
 from django.db import transaction
+from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
 from rest_framework.authentication import BasicAuthentication
@@ -24,13 +24,18 @@ from rest_framework.response import Response
 
 from team_planner.rbac.decorators import check_user_permission
 from team_planner.employees.models import EmployeeProfile
-from team_planner.shifts.models import Shift
 from team_planner.teams.models import Department
 from team_planner.teams.models import Team
 from team_planner.users.models import User
 
-from .models import OrchestrationResult
+from .availability import day_conflicts
+from .coverage import coverage_percentage
+from .coverage import team_coverage
+from .history import HistoryScope
+from .history import assignment_distribution
+from .metrics import metrics_snapshot
 from .models import OrchestrationRun
+from .tasks import reset_assignment_history_task
 from .unified import ShiftOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -203,6 +208,7 @@ def orchestrator_schedule_v2(request):
 
                 run.completed_at = timezone.now()
                 run.total_shifts_created = result.get("total_shifts", 0)
+                orchestrator.telemetry.apply_to(run)
                 run.save()
 
                 return Response(
@@ -291,130 +297,41 @@ def orchestrator_coverage_v2(request):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-        # Convert to datetime range
-        start_datetime = timezone.make_aware(
-            datetime.combine(start_date, datetime.min.time()),
-        )
-        end_datetime = timezone.make_aware(
-            datetime.combine(end_date, datetime.max.time()),
-        )
-
-        # Get shifts in the date range
-        shifts_query = Shift.objects.filter(
-            start_datetime__gte=start_datetime,
-            end_datetime__lte=end_datetime,
-            status__in=["scheduled", "confirmed", "in_progress"],
-        ).select_related("template", "assigned_employee")
-
-        # Filter by department if provided
+        # Scope to the department's teams when one is given
+        teams = Team.objects.all()
         if department_id:
             try:
                 department = Department.objects.get(pk=department_id)
-                list(department.teams.values_list("pk", flat=True))
-                # Note: This assumes shifts have a team relationship or we can derive it
-                # For now, we'll include all shifts
-            except Department.DoesNotExist:
-                pass
-
-        # Analyze coverage by shift type and day
-        coverage_data = {
-            "period": {
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-            },
-            "overall_coverage": 0.0,
-            "shift_types": {},
-            "daily_coverage": {},
-            "uncovered_periods": [],
-            "summary": {
-                "total_required_shifts": 0,
-                "total_covered_shifts": 0,
-                "coverage_percentage": 0.0,
-            },
-        }
-
-        # Calculate coverage by shift type
-        shift_types = ["incidents", "waakdienst", "incidents_standby"]
-        current_date = start_date
-        total_required = 0
-        total_covered = 0
-
-        while current_date <= end_date:
-            day_coverage = {}
-            day_required = len(
-                shift_types,
-            )  # Simplified: assume each day needs all shift types
-            day_covered = 0
-
-            for shift_type in shift_types:
-                shifts_for_day_type = shifts_query.filter(
-                    start_datetime__date=current_date, template__shift_type=shift_type,
-                ).count()
-
-                is_covered = shifts_for_day_type > 0
-                day_coverage[shift_type] = {
-                    "covered": is_covered,
-                    "shifts_count": shifts_for_day_type,
-                }
-
-                if is_covered:
-                    day_covered += 1
-
-                # Update shift type totals
-                if shift_type not in coverage_data["shift_types"]:
-                    coverage_data["shift_types"][shift_type] = {
-                        "required_days": 0,
-                        "covered_days": 0,
-                        "coverage_percentage": 0.0,
-                    }
-
-                coverage_data["shift_types"][shift_type]["required_days"] += 1
-                if is_covered:
-                    coverage_data["shift_types"][shift_type]["covered_days"] += 1
-
-            # Calculate daily coverage percentage
-            day_percentage = (
-                (day_covered / day_required * 100) if day_required > 0 else 0
-            )
-            coverage_data["daily_coverage"][current_date.isoformat()] = {
-                "coverage_percentage": day_percentage,
-                "shift_types": day_coverage,
-                "required_shifts": day_required,
-                "covered_shifts": day_covered,
-            }
-
-            total_required += day_required
-            total_covered += day_covered
-            current_date += timedelta(days=1)
-
-        # Calculate shift type coverage percentages
-        for shift_type in coverage_data["shift_types"]:
-            st_data = coverage_data["shift_types"][shift_type]
-            st_data["coverage_percentage"] = (
-                st_data["covered_days"] / st_data["required_days"] * 100
-                if st_data["required_days"] > 0
-                else 0
-            )
-
-        # Calculate overall coverage
-        coverage_data["overall_coverage"] = (
-            total_covered / total_required * 100 if total_required > 0 else 0
-        )
+            except (Department.DoesNotExist, ValueError):
+                return Response(
+                    {"error": "Department not found", "code": "DEPARTMENT_NOT_FOUND"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            teams = teams.filter(department=department)
 
-        coverage_data["summary"] = {
-            "total_required_shifts": total_required,
-            "total_covered_shifts": total_covered,
-            "coverage_percentage": coverage_data["overall_coverage"],
+        # One pass over the window: shifts bucketed per team, day and type
+        coverage = team_coverage(start_date, end_date, teams)
+        summary = {
+            "total_required_shifts": sum(
+                t["required_shifts"] for t in coverage["teams"].values()
+            ),
+            "total_covered_shifts": sum(
+                t["covered_shifts"] for t in coverage["teams"].values()
+            ),
         }
+        summary["coverage_percentage"] = coverage_percentage(
+            summary["total_covered_shifts"], summary["total_required_shifts"],
+        )
 
         # Shape response to expected fields
         response_payload = {
             "department_id": request.GET.get("department_id"),
             "start_date": start_date.isoformat(),
             "end_date": end_date.isoformat(),
-            "coverage_summary": coverage_data["summary"],
-            "daily_coverage": coverage_data["daily_coverage"],
-            "coverage_gaps": coverage_data.get("uncovered_periods", []),
+            "coverage_summary": summary,
+            "daily_coverage": coverage["days"],
+            "team_coverage": coverage["teams"],
+            "coverage_gaps": coverage["gaps"],
             "recommendations": [],
         }
         return Response(response_payload, status=status.HTTP_200_OK)
@@ -497,31 +414,33 @@ def orchestrator_availability_v2(request):
         elif internal_type == "waakdienst":
             employees_query = employees_query.filter(available_for_waakdienst=True)
 
-        # Optional: filter by department (no-op if relation unknown)
+        # Optional: filter by department through team membership
         if department_id:
-            with contextlib.suppress(Department.DoesNotExist):
-                Department.objects.get(pk=department_id)
-
-        employees = employees_query.select_related("user")
+            try:
+                department = Department.objects.get(pk=department_id)
+            except (Department.DoesNotExist, ValueError):
+                return Response(
+                    {"error": "Department not found", "code": "DEPARTMENT_NOT_FOUND"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            employees_query = employees_query.filter(
+                user__teams__department=department,
+            ).distinct()
 
-        # Existing shifts on the target date
-        existing_shifts = Shift.objects.filter(
-            start_datetime__date=target_date,
-            status__in=["scheduled", "confirmed", "in_progress"],
-        ).select_related("assigned_employee", "template")
+        employees = list(employees_query.select_related("user"))
 
-        unavailable_employee_ids = {
-            shift.assigned_employee.pk
-            for shift in existing_shifts
-            if shift.assigned_employee
-        }
+        # Shifts, leave and recurring patterns on the target date, grouped by
+        # employee from one query each
+        conflicts_by_user = day_conflicts(
+            [employee.user_id for employee in employees], target_date, internal_type,
+        )
 
         # Build response
         availability_data = {
             "date": target_date.isoformat(),
             "shift_type": shift_type,
             "department_id": department_id,
-            "total_employees": employees.count(),
+            "total_employees": len(employees),
             "available_employees": [],
             "unavailable_employees": [],
             "summary": {
@@ -532,27 +451,16 @@ def orchestrator_availability_v2(request):
         }
 
         for employee in employees:
-            is_available = employee.user.pk not in unavailable_employee_ids
+            conflicts = conflicts_by_user.get(employee.user_id, [])
             employee_data = {
                 "id": str(employee.user.pk),
                 "name": employee.user.get_full_name() or employee.user.username,
                 "username": employee.user.username,
                 "email": employee.user.email,
-                "availability_status": "available" if is_available else "unavailable",
-                "conflicts": [],
+                "availability_status": "unavailable" if conflicts else "available",
+                "conflicts": conflicts,
             }
-
-            if not is_available:
-                conflicts = existing_shifts.filter(assigned_employee=employee.user)
-                for conflict in conflicts:
-                    employee_data["conflicts"].append(
-                        {
-                            "type": "existing_shift",
-                            "shift_type": conflict.template.shift_type,
-                            "start_time": conflict.start_datetime.isoformat(),
-                            "end_time": conflict.end_datetime.isoformat(),
-                        },
-                    )
+            if conflicts:
                 availability_data["unavailable_employees"].append(employee_data)
             else:
                 availability_data["available_employees"].append(employee_data)
@@ -589,25 +497,19 @@ def orchestrator_health_v2(request):
     GET /api/orchestrator-status/health/
     """
     try:
-        # Check database connectivity
-        try:
-            db_status = "healthy"
-            OrchestrationRun.objects.count()
-        except Exception as e:
-            db_status = "unhealthy"
-            logger.exception(f"Database health check failed: {e}")
-
-        # Check orchestrator service status
+        # One query checks database connectivity and counts running
+        # orchestrations
         try:
-            orchestrator_status = "operational"
-            # Check for any running orchestrations
             running_orchestrations = OrchestrationRun.objects.filter(
                 status=OrchestrationRun.Status.RUNNING,
             ).count()
+            db_status = "healthy"
+            orchestrator_status = "operational"
         except Exception as e:
+            db_status = "unhealthy"
             orchestrator_status = "degraded"
             running_orchestrations = 0
-            logger.exception(f"Orchestrator health check failed: {e}")
+            logger.exception(f"Database health check failed: {e}")
 
         # Overall system status
         overall_status = (
@@ -675,61 +577,28 @@ def orchestrator_metrics_v2(request):
         )
 
     try:
-        # Get orchestration statistics
-        total_runs = OrchestrationRun.objects.count()
-        successful_runs = OrchestrationRun.objects.filter(
-            status=OrchestrationRun.Status.COMPLETED,
-        ).count()
-        failed_runs = OrchestrationRun.objects.filter(
-            status=OrchestrationRun.Status.FAILED,
-        ).count()
-        active_runs = OrchestrationRun.objects.filter(
-            status=OrchestrationRun.Status.RUNNING,
-        ).count()
+        # Counters come from a short-lived snapshot (see metrics.py)
+        snapshot = metrics_snapshot()
+        runs = snapshot["runs"]
+        total_runs = runs["total"]
+        successful_runs = runs["successful"]
+        failed_runs = runs["failed"]
+        active_runs = runs["active"]
 
         success_rate = (successful_runs / total_runs * 100) if total_runs > 0 else 0
+        avg_execution_time = snapshot["average_execution_time_seconds"]
 
-        # Get recent performance data
-        recent_runs = OrchestrationRun.objects.filter(
-            completed_at__isnull=False, started_at__isnull=False,
-        ).order_by("-completed_at")[:10]
-
-        avg_execution_time = 0
-        if recent_runs:
-            durations = []
-            for run in recent_runs:
-                if run.completed_at and run.started_at:
-                    durations.append(
-                        (run.completed_at - run.started_at).total_seconds(),
-                    )
-            if durations:
-                avg_execution_time = sum(durations) / len(durations)
-
-        # Get employee statistics
-        total_active_employees = EmployeeProfile.objects.filter(
-            status=EmployeeProfile.Status.ACTIVE,
-        ).count()
-
-        incidents_eligible = EmployeeProfile.objects.filter(
-            status=EmployeeProfile.Status.ACTIVE, available_for_incidents=True,
-        ).count()
+        total_active_employees = snapshot["employees"]["active"]
+        incidents_eligible = snapshot["employees"]["incidents_eligible"]
+        waakdienst_eligible = snapshot["employees"]["waakdienst_eligible"]
 
-        waakdienst_eligible = EmployeeProfile.objects.filter(
-            status=EmployeeProfile.Status.ACTIVE, available_for_waakdienst=True,
-        ).count()
-
-        # Get shift statistics
-        today = date.today()
-        current_month_start = today.replace(day=1)
-
-        shifts_this_month = Shift.objects.filter(
-            start_datetime__date__gte=current_month_start,
-            status__in=["scheduled", "confirmed", "in_progress", "completed"],
-        ).count()
+        shifts_this_month = snapshot["shifts_this_month"]
+        month_day = snapshot["month_day"]
 
         # Top-level fields expected by tests
         metrics_data = {
             "timestamp": timezone.now().isoformat(),
+            "snapshot_computed_at": snapshot["computed_at"],
             "orchestrations_total": total_runs,
             "orchestrations_successful": successful_runs,
             "orchestrations_failed": failed_runs,
@@ -768,9 +637,7 @@ def orchestrator_metrics_v2(request):
             },
             "shift_metrics": {
                 "shifts_this_month": shifts_this_month,
-                "shifts_per_day_average": round(shifts_this_month / today.day, 2)
-                if today.day > 0
-                else 0,
+                "shifts_per_day_average": round(shifts_this_month / month_day, 2),
             },
             "system_metrics": {
                 "version": getattr(settings, "VERSION", "1.0.0"),
@@ -789,6 +656,83 @@ def orchestrator_metrics_v2(request):
         )
 
 
+RUN_TELEMETRY_ORDERINGS = {
+    "slowest": ("-duration_seconds", "-started_at"),
+    "queries": ("-query_count", "-started_at"),
+    "recent": ("-started_at",),
+}
+
+
+@api_view(["GET"])
+@authentication_classes([TokenAuthentication, BasicAuthentication])
+@permission_classes([IsAuthenticated])
+def orchestrator_run_telemetry_v2(request):
+    """
+    V2 API: Per-phase timings and query counts of recorded orchestration runs.
+    GET /api/orchestrator-status/runs/
+
+    Query parameters:
+    - ordering: slowest|queries|recent (default: slowest)
+    - status: run status filter (optional)
+    - limit: number of runs, 1-100 (default: 20)
+
+    Requires staff permissions.
+    """
+    if not request.user.is_staff:
+        return Response(
+            {
+                "error": "Permission denied - staff access required",
+                "code": "PERMISSION_DENIED",
+            },
+            status=status.HTTP_403_FORBIDDEN,
+        )
+
+    ordering = request.GET.get("ordering", "slowest")
+    if ordering not in RUN_TELEMETRY_ORDERINGS:
+        return Response(
+            {
+                "error": f"ordering must be one of {', '.join(RUN_TELEMETRY_ORDERINGS)}",
+                "code": "INVALID_ORDERING",
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    try:
+        limit = min(max(int(request.GET.get("limit", 20)), 1), 100)
+    except ValueError:
+        return Response(
+            {"error": "limit must be an integer", "code": "INVALID_LIMIT"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # Runs from before telemetry was recorded have no duration
+    runs = OrchestrationRun.objects.filter(duration_seconds__isnull=False)
+    if request.GET.get("status"):
+        runs = runs.filter(status=request.GET["status"])
+    runs = runs.order_by(*RUN_TELEMETRY_ORDERINGS[ordering])[:limit]
+
+    return Response(
+        {
+            "ordering": ordering,
+            "runs": [
+                {
+                    "id": run.pk,
+                    "name": run.name,
+                    "status": run.status,
+                    "start_date": run.start_date.isoformat(),
+                    "end_date": run.end_date.isoformat(),
+                    "started_at": run.started_at.isoformat() if run.started_at else None,
+                    "total_shifts": run.total_shifts_created,
+                    "duration_seconds": run.duration_seconds,
+                    "query_count": run.query_count,
+                    "phases": run.phase_metrics,
+                }
+                for run in runs
+            ],
+        },
+        status=status.HTTP_200_OK,
+    )
+
+
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def reset_assignment_history_v2(request):
@@ -803,6 +747,10 @@ def reset_assignment_history_v2(request):
         "days_back": 90,
         "confirm": true
     }
+
+    Responds 202 with the distribution about to be removed; the deletion runs
+    in the orchestrators.reset_assignment_history task, whose progress is
+    streamed at ``progress_url``.
     """
     # Staff permission required
     if not (
@@ -842,10 +790,6 @@ def reset_assignment_history_v2(request):
 
         cutoff_date = timezone.now() - timedelta(days=days_back)
 
-        # Build query filters
-        shift_filters = {"start_datetime__gte": cutoff_date}
-        run_filters = {"created__gte": cutoff_date}
-
         if employee_id:
             # Reset specific employee
             try:
@@ -858,14 +802,12 @@ def reset_assignment_history_v2(request):
                     },
                     status=status.HTTP_404_NOT_FOUND,
                 )
-
-            shift_filters["assigned_employee_id"] = employee.pk
-            # Don't filter runs by employee, they might be shared
+            employee_id = employee.pk
 
         if team_id:
             # Validate team exists
             try:
-                Team.objects.get(pk=team_id)
+                team_id = Team.objects.get(pk=team_id).pk
             except Team.DoesNotExist:
                 return Response(
                     {
@@ -875,51 +817,41 @@ def reset_assignment_history_v2(request):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-            shift_filters["assigned_employee__teams"] = team_id
-            run_filters["team_id"] = team_id
-
-        # Get items to delete
-        shifts_to_delete = Shift.objects.filter(**shift_filters)
-        runs_to_delete = OrchestrationRun.objects.filter(**run_filters)
-        results_to_delete = OrchestrationResult.objects.filter(
-            run__created__gte=cutoff_date,
-        )
-
-        # Calculate summary statistics before deletion
-        assignment_summary = {}
-        if shifts_to_delete.exists():
-            for shift in shifts_to_delete.select_related("assigned_employee"):
-                emp = shift.assigned_employee
-                key = f"{getattr(emp, 'username', 'unknown')} (ID: {emp.pk})"
-                assignment_summary[key] = assignment_summary.get(key, 0) + 1
+        scope = HistoryScope(cutoff=cutoff_date, employee_id=employee_id, team_id=team_id)
 
-        # Perform deletion
-        with transaction.atomic():
-            results_deleted = results_to_delete.delete()[0]
-            shifts_deleted = shifts_to_delete.delete()[0]
-            runs_deleted = runs_to_delete.delete()[0]
+        # Summary statistics before deletion, from one grouped aggregate
+        distribution = assignment_distribution(scope)
+        assignment_summary = {
+            f"{e['username']} (ID: {e['employee_id']})": e["total_shifts"]
+            for e in distribution["employees"]
+        }
 
-        logger.info(
-            f"Assignment history reset by {request.user.username}: "
-            f"{shifts_deleted} shifts, {runs_deleted} runs, {results_deleted} results deleted",
+        # Deletion runs in batches in the background
+        async_result = reset_assignment_history_task.delay(
+            cutoff=cutoff_date.isoformat(),
+            employee_id=employee_id,
+            team_id=team_id,
+            requested_by=request.user.username,
         )
 
         return Response(
             {
-                "message": "Assignment history successfully reset",
+                "message": "Assignment history reset started",
+                "task_id": async_result.id,
+                "progress_url": reverse(
+                    "orchestrators:progress_stream_api", args=[async_result.id],
+                ),
                 "summary": {
-                    "shifts_deleted": shifts_deleted,
-                    "runs_deleted": runs_deleted,
-                    "results_deleted": results_deleted,
+                    "shifts_to_delete": distribution["total_shifts"],
                     "cutoff_date": cutoff_date.isoformat(),
                     "days_back": days_back,
                     "employee_filter": employee_id,
                     "team_filter": team_id,
                     "assignment_distribution_before_reset": assignment_summary,
                 },
-                "status": "completed",
+                "status": "queued",
             },
-            status=status.HTTP_200_OK,
+            status=status.HTTP_202_ACCEPTED,
         )
 
     except ValueError as e:
@@ -964,13 +896,9 @@ def assignment_history_preview_v2(request):
 
         cutoff_date = timezone.now() - timedelta(days=days_back)
 
-        # Build query filters
-        shift_filters = {"start_datetime__gte": cutoff_date}
-
         if employee_id:
             try:
                 employee = User.objects.get(pk=employee_id)
-                shift_filters["assigned_employee_id"] = employee.pk
             except User.DoesNotExist:
                 return Response(
                     {
@@ -982,8 +910,7 @@ def assignment_history_preview_v2(request):
 
         if team_id:
             try:
-                Team.objects.get(pk=team_id)
-                shift_filters["assigned_employee__teams"] = team_id
+                team = Team.objects.get(pk=team_id)
             except Team.DoesNotExist:
                 return Response(
                     {
@@ -993,55 +920,25 @@ def assignment_history_preview_v2(request):
                     status=status.HTTP_404_NOT_FOUND,
                 )
 
-        # Get assignment statistics
-        shifts = Shift.objects.filter(**shift_filters).select_related(
-            "assigned_employee", "template",
-        )
-
-        assignment_stats = {}
-        shift_type_stats = {}
-        total_shifts = 0
-
-        for shift in shifts:
-            emp = shift.assigned_employee
-            emp_key = f"{getattr(emp, 'username', 'unknown')} (ID: {emp.pk})"
-
-            # Count by employee
-            if emp_key not in assignment_stats:
-                assignment_stats[emp_key] = {
-                    "employee_id": emp.pk,
-                    "username": getattr(emp, "username", "unknown"),
-                    "total_shifts": 0,
-                    "shift_types": {},
-                }
-
-            assignment_stats[emp_key]["total_shifts"] += 1
-
-            # Count by shift type for this employee
-            shift_type = shift.template.shift_type
-            assignment_stats[emp_key]["shift_types"][shift_type] = (
-                assignment_stats[emp_key]["shift_types"].get(shift_type, 0) + 1
-            )
-
-            # Global shift type stats
-            shift_type_stats[shift_type] = shift_type_stats.get(shift_type, 0) + 1
-            total_shifts += 1
-
-        # Sort by total shifts descending
-        sorted_assignments = sorted(
-            assignment_stats.values(), key=lambda x: x["total_shifts"], reverse=True,
+        # Same scope and aggregate as the reset itself
+        distribution = assignment_distribution(
+            HistoryScope(
+                cutoff=cutoff_date,
+                employee_id=employee.pk if employee_id else None,
+                team_id=team.pk if team_id else None,
+            ),
         )
 
         return Response(
             {
                 "preview": {
-                    "total_shifts_to_reset": total_shifts,
+                    "total_shifts_to_reset": distribution["total_shifts"],
                     "cutoff_date": cutoff_date.isoformat(),
                     "days_back": days_back,
                     "filters": {"team_id": team_id, "employee_id": employee_id},
-                    "assignment_distribution": sorted_assignments,
-                    "shift_type_breakdown": shift_type_stats,
-                    "affected_employees": len(assignment_stats),
+                    "assignment_distribution": distribution["employees"],
+                    "shift_type_breakdown": distribution["shift_types"],
+                    "affected_employees": len(distribution["employees"]),
                 },
             },
             status=status.HTTP_200_OK,
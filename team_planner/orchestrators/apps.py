@@ -5,3 +5,9 @@ class OrchestratorsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "team_planner.orchestrators"
     verbose_name = "Orchestrators"
+
+    def ready(self):
+        try:
+            import team_planner.orchestrators.signals  # noqa: F401
+        except ImportError:
+            pass
@@ -0,0 +1,96 @@
+"""
+Per-employee conflicts for one day, loaded in a fixed number of queries.
+
+``day_conflicts()`` evaluates the day's active shifts, approved leave and
+recurring leave patterns once each for the whole employee set and groups the
+results by employee, instead of querying per person. Leave blocks a shift
+according to ``LeaveType.blocks_shift_type()``; recurring patterns cover
+office hours, so like daytime-only leave they block incidents and standby but
+not waakdienst.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.db.models import Q
+
+from team_planner.employees.models import RecurringLeavePattern
+from team_planner.leaves.models import LeaveRequest
+from team_planner.leaves.models import LeaveType
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftType
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import date
+
+DAYTIME_SHIFT_TYPES = (ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY)
+
+
+def day_conflicts(
+    user_ids: Iterable[int], target_date: date, shift_type: str,
+) -> dict[int, list[dict[str, Any]]]:
+    """Conflicts keeping each of ``user_ids`` from a ``shift_type`` shift on ``target_date``.
+
+    Employees without conflicts are absent from the result.
+    """
+    user_ids = list(user_ids)
+    conflicts: dict[int, list[dict[str, Any]]] = defaultdict(list)
+
+    for shift in Shift.objects.filter(
+        assigned_employee_id__in=user_ids,
+        start_datetime__date=target_date,
+        status__in=[
+            Shift.Status.SCHEDULED,
+            Shift.Status.CONFIRMED,
+            Shift.Status.IN_PROGRESS,
+        ],
+    ).select_related("template"):
+        conflicts[shift.assigned_employee_id].append(
+            {
+                "type": "existing_shift",
+                "shift_type": shift.template.shift_type,
+                "start_time": shift.start_datetime.isoformat(),
+                "end_time": shift.end_datetime.isoformat(),
+            },
+        )
+
+    for leave in LeaveRequest.objects.filter(
+        employee_id__in=user_ids,
+        status=LeaveRequest.Status.APPROVED,
+        start_date__lte=target_date,
+        end_date__gte=target_date,
+    ).select_related("leave_type"):
+        if LeaveType.blocks_shift_type(leave.leave_type.conflict_handling, shift_type):
+            conflicts[leave.employee_id].append(
+                {
+                    "type": "leave",
+                    "leave_type": leave.leave_type.name,
+                    "start_date": leave.start_date.isoformat(),
+                    "end_date": leave.end_date.isoformat(),
+                },
+            )
+
+    if shift_type in DAYTIME_SHIFT_TYPES:
+        patterns = RecurringLeavePattern.objects.filter(
+            Q(effective_until__isnull=True) | Q(effective_until__gte=target_date),
+            employee_id__in=user_ids,
+            is_active=True,
+            day_of_week=target_date.weekday(),
+            effective_from__lte=target_date,
+        )
+        for pattern in patterns:
+            # Biweekly patterns only apply on alternate weeks
+            if pattern.applies_to_date(target_date):
+                conflicts[pattern.employee_id].append(
+                    {
+                        "type": "recurring_leave",
+                        "pattern": pattern.name,
+                        "coverage_type": pattern.coverage_type,
+                    },
+                )
+
+    return dict(conflicts)
@@ -24,13 +24,16 @@ from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.utils import timezone
 
+from team_planner.notifications.services import NotificationService
 from team_planner.orchestrators.constraints import BaseConstraintChecker
 from team_planner.orchestrators.fairness import BaseFairnessCalculator
 from team_planner.orchestrators.models import OrchestrationResult
 from team_planner.orchestrators.models import OrchestrationRun
+from team_planner.orchestrators.telemetry import RunTelemetry
+from team_planner.orchestrators.templates import default_duration_hours
+from team_planner.orchestrators.templates import template_cache
 from team_planner.shifts.models import Shift
 from team_planner.shifts.models import ShiftTemplate
-from team_planner.shifts.models import ShiftType
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -60,6 +63,9 @@ class BaseOrchestrator(ABC):
         # Track assignments made during this orchestration run
         self.current_assignments: list[dict] = []
         self.orchestration_run: OrchestrationRun | None = None
+        self.telemetry = RunTelemetry()
+        # Optional ProgressReporter-like callable: progress(event, **data)
+        self.progress = None
 
     @abstractmethod
     def _get_handled_shift_types(self) -> list[str]:
@@ -97,8 +103,12 @@ class BaseOrchestrator(ABC):
             f"Starting {self.__class__.__name__} for period {self.start_date} to {self.end_date}",
         )
 
+        template_cache.refresh()
+
         # Get available employees
-        available_employees = self._get_available_employees()
+        with self.telemetry.phase("employees") as stats:
+            available_employees = self._get_available_employees()
+            stats.rows = len(available_employees)
         if not available_employees:
             logger.warning(f"No employees available for {self.shift_types}")
             return self._create_empty_result()
@@ -111,22 +121,38 @@ class BaseOrchestrator(ABC):
 
         # Process each period with day-by-day generation
         all_assignments = []
-        for period_start, period_end, period_label in periods:
-            period_assignments = self._generate_period_assignments(
-                period_start, period_end, period_label, available_employees,
-            )
-            all_assignments.extend(period_assignments)
-
-            # Track assignments for conflict prevention
-            self.current_assignments.extend(period_assignments)
+        with self.telemetry.phase("assignment") as stats:
+            for period_start, period_end, period_label in periods:
+                period_assignments = self._generate_period_assignments(
+                    period_start, period_end, period_label, available_employees,
+                )
+                all_assignments.extend(period_assignments)
+
+                # Track assignments for conflict prevention
+                self.current_assignments.extend(period_assignments)
+                if self.progress:
+                    self.progress(
+                        "period_planned",
+                        team_id=self.team_id,
+                        shift_types=[str(t) for t in self.shift_types],
+                        period=period_label,
+                        start=period_start.isoformat(),
+                        assignments=len(period_assignments),
+                    )
+            stats.rows = len(all_assignments)
 
         logger.info(f"Generated {len(all_assignments)} total assignments")
 
         # Apply reassignment to resolve conflicts
-        all_assignments = self._apply_reassignment_if_needed(all_assignments)
+        if self.orchestration_run:
+            with self.telemetry.phase("reassignment"):
+                all_assignments = self._apply_reassignment_if_needed(all_assignments)
 
         # Calculate metrics and return result
-        return self._create_result(all_assignments, available_employees)
+        with self.telemetry.phase("fairness"):
+            result = self._create_result(all_assignments, available_employees)
+        result["telemetry"] = self.telemetry.as_dict()
+        return result
 
     def _apply_reassignment_if_needed(self, assignments: list[dict]) -> list[dict]:
         """Apply reassignment logic to resolve conflicts."""
@@ -313,37 +339,18 @@ class BaseOrchestrator(ABC):
 
 
     def _get_shift_template(self, shift_type: str) -> ShiftTemplate | None:
-        """Get or create shift template for the given type."""
+        """Get or create shift template for the given type (memoized, see templates.py)."""
         try:
-            template = ShiftTemplate.objects.filter(
-                shift_type=shift_type, is_active=True,
-            ).first()
-
-            if not template:
-                # Create a basic template
-                duration_hours = self._get_default_duration_hours(shift_type)
-                template = ShiftTemplate.objects.create(
-                    shift_type=shift_type,
-                    name=f"{shift_type.replace('_', '-').title()} Daily Shift",
-                    description=f"Individual daily shift for {shift_type.replace('_', '-')}",
-                    duration_hours=duration_hours,
-                    is_active=True,
-                )
-                logger.info(f"Created new shift template for {shift_type}")
-
-            return template
-
+            return template_cache.resolve(
+                shift_type, self._get_default_duration_hours(shift_type),
+            )
         except Exception as e:
             logger.exception(f"Error getting shift template for {shift_type}: {e}")
             return None
 
     def _get_default_duration_hours(self, shift_type: str) -> int:
         """Get default duration hours for a shift type."""
-        if shift_type in (ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY):
-            return 9  # 08:00-17:00
-        if shift_type == ShiftType.WAAKDIENST:
-            return 15  # Average daily shift
-        return 8  # Default
+        return default_duration_hours(shift_type)
 
     def _create_result(
         self, assignments: list[dict], employees: list[Any],
@@ -423,7 +430,7 @@ class BaseOrchestrator(ABC):
         created_shifts = []
         skipped_duplicates = []
 
-        with transaction.atomic():
+        with self.telemetry.phase("persist") as stats, transaction.atomic():
             for assignment in assignments:
                 # Check for duplicates
                 if self._check_for_duplicate_shift(assignment):
@@ -442,6 +449,11 @@ class BaseOrchestrator(ABC):
                 except Exception as e:
                     logger.exception(f"Error creating shift: {e}")
                     continue
+            stats.rows = len(created_shifts)
+
+        with NotificationService.coalesce_shift_notifications():
+            for shift in created_shifts:
+                NotificationService.notify_shift_assigned(shift.assigned_employee, shift)
 
         logger.info(
             f"Applied schedule: {len(created_shifts)} shifts created, {len(skipped_duplicates)} duplicates skipped",
@@ -477,7 +489,7 @@ class BaseOrchestrator(ABC):
         template = None
         if assignment.get("template_id"):
             try:
-                template = ShiftTemplate.objects.get(pk=assignment["template_id"])
+                template = template_cache.get(assignment["template_id"])
             except ShiftTemplate.DoesNotExist:
                 logger.warning(f"Template {assignment['template_id']} not found")
 
@@ -13,6 +13,9 @@ Architecture:
 
 from abc import ABC
 from abc import abstractmethod
+from bisect import bisect_left
+from collections import defaultdict
+from datetime import date as date_cls
 from datetime import datetime
 from datetime import timedelta
 from typing import Any
@@ -22,12 +25,142 @@ from django.db import models
 from django.db import transaction
 
 from team_planner.leaves.models import LeaveRequest
+from team_planner.notifications.services import NotificationService
 from team_planner.orchestrators.fairness_calculators import BaseFairnessCalculator
+from team_planner.orchestrators.telemetry import RunTelemetry
+from team_planner.orchestrators.templates import template_cache
 from team_planner.shifts.models import Shift
 from team_planner.shifts.models import ShiftTemplate
 from team_planner.users.models import User
 
 
+SOLVER_DAILY = "daily"
+SOLVER_WEEK = "week"
+SOLVERS = (SOLVER_DAILY, SOLVER_WEEK)
+
+
+class PlanningState:
+    """Append-only record of the assignments made during one generation.
+
+    Keeps running per-shift-type hour totals and per-day bookings so each
+    selection costs O(employees) instead of re-deriving them from the full
+    assignment list.
+    """
+
+    def __init__(self):
+        self.assignments: list[dict] = []
+        self.hours: dict[str, dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        self.booked: dict[date_cls, set[int]] = defaultdict(set)
+
+    def add(self, assignment: dict, day: datetime) -> None:
+        emp_id = assignment["assigned_employee_id"]
+        self.assignments.append(assignment)
+        self.hours[assignment["shift_type"]][emp_id] += assignment.get("duration_hours") or 0.0
+        self.booked[day.date()].add(emp_id)
+
+    def is_booked(self, employee: User, day: datetime) -> bool:
+        return employee.pk in self.booked.get(day.date(), ())
+
+
+class AvailabilitySnapshot:
+    """Leave, recurring leave and shift history for a set of employees, loaded once.
+
+    Answers the same questions as ``BaseOrchestrator.is_employee_available_on_date``
+    from memory, so a whole horizon is checked with a fixed number of queries.
+    """
+
+    def __init__(
+        self,
+        orchestrator: "BaseOrchestrator",
+        employees: list[User],
+        start_date: datetime,
+        end_date: datetime,
+    ):
+        self.orchestrator = orchestrator
+        employee_ids = [e.pk for e in employees]
+        first_day, last_day = start_date.date(), end_date.date()
+
+        self.leaves: dict[int, list[tuple[date_cls, date_cls]]] = defaultdict(list)
+        for emp_id, leave_start, leave_end in LeaveRequest.objects.filter(
+            employee_id__in=employee_ids,
+            status="approved",
+            start_date__lte=last_day,
+            end_date__gte=first_day,
+        ).values_list("employee_id", "start_date", "end_date"):
+            self.leaves[emp_id].append((leave_start, leave_end))
+
+        self.patterns: dict[int, list[Any]] = defaultdict(list)
+        try:
+            from team_planner.employees.models import RecurringLeavePattern
+
+            for pattern in RecurringLeavePattern.objects.filter(
+                employee_id__in=employee_ids,
+                is_active=True,
+                effective_from__lte=last_day,
+            ).filter(
+                models.Q(effective_until__isnull=True)
+                | models.Q(effective_until__gte=first_day),
+            ):
+                self.patterns[pattern.employee_id].append(pattern)
+        except ImportError:
+            pass
+
+        # Existing shifts relevant to the rest and consecutive-weeks checks
+        rest_from = start_date - timedelta(hours=max(orchestrator.min_rest_hours, 0))
+        weeks_from = orchestrator._get_week_start(
+            start_date, orchestrator._get_rotation_start_weekday(),
+        ) - timedelta(weeks=max(orchestrator.max_consecutive_weeks - 1, 0))
+        self.shift_starts: dict[int, list[datetime]] = defaultdict(list)
+        self.shift_ends: dict[int, list[datetime]] = defaultdict(list)
+        for emp_id, shift_start, shift_end in Shift.objects.filter(
+            models.Q(start_datetime__gte=weeks_from, start_datetime__lt=end_date)
+            | models.Q(end_datetime__gte=rest_from, end_datetime__lt=end_date),
+            assigned_employee_id__in=employee_ids,
+            template__shift_type__in=orchestrator._get_handled_shift_types(),
+        ).values_list("assigned_employee_id", "start_datetime", "end_datetime"):
+            self.shift_starts[emp_id].append(shift_start)
+            self.shift_ends[emp_id].append(shift_end)
+        for values in (*self.shift_starts.values(), *self.shift_ends.values()):
+            values.sort()
+
+    def is_available(self, employee: User, date: datetime) -> bool:
+        emp_id = employee.pk
+        day = date.date()
+        if any(start <= day <= end for start, end in self.leaves.get(emp_id, ())):
+            return False
+        if any(p.applies_to_date(day) for p in self.patterns.get(emp_id, ())):
+            return False
+        if not self._has_sufficient_rest(emp_id, date):
+            return False
+        return self._within_consecutive_weeks_limit(emp_id, date)
+
+    def _has_sufficient_rest(self, emp_id: int, date: datetime) -> bool:
+        if self.orchestrator.min_rest_hours <= 0:
+            return True
+        ends = self.shift_ends.get(emp_id, [])
+        cutoff = date - timedelta(hours=self.orchestrator.min_rest_hours)
+        idx = bisect_left(ends, cutoff)
+        return not (idx < len(ends) and ends[idx] < date)
+
+    def _within_consecutive_weeks_limit(self, emp_id: int, date: datetime) -> bool:
+        limit = self.orchestrator.max_consecutive_weeks
+        if limit <= 0:
+            return True
+        starts = self.shift_starts.get(emp_id, [])
+        week_start = self.orchestrator._get_week_start(
+            date, self.orchestrator._get_rotation_start_weekday(),
+        )
+        consecutive_weeks = 0
+        while consecutive_weeks < limit:
+            idx = bisect_left(starts, week_start)
+            if idx < len(starts) and starts[idx] < week_start + timedelta(days=7):
+                consecutive_weeks += 1
+                week_start -= timedelta(days=7)
+            else:
+                break
+        return consecutive_weeks < limit
+
+
 class BaseOrchestrator(ABC):
     """Base orchestrator providing common orchestration functionality.
 
@@ -40,14 +173,25 @@ class BaseOrchestrator(ABC):
     2. Constraint checking before assignment (not after)
     3. Shift-type specific fairness tracking
     4. Independent operation per orchestrator
+
+    Two solvers are available (see ``generate_assignments``):
+    - "daily": the original day-by-day walk over the horizon
+    - "week": plans one rotation week at a time against a shared
+      ``PlanningState`` and an ``AvailabilitySnapshot``, so cost grows
+      linearly with the horizon
     """
 
+    # Solver used when generate_assignments() is not given one explicitly
+    default_solver = SOLVER_DAILY
+
     def __init__(self, team_id: int | None = None):
         self.team_id = team_id
         self.fairness_calculator: BaseFairnessCalculator | None = None
         self._generation_assignment_count = (
             0  # Track assignments during current generation
         )
+        # Accumulates over every generate_assignments() call on this instance
+        self.telemetry = RunTelemetry()
 
         # Configurable parameters
         self.max_consecutive_weeks = int(
@@ -233,13 +377,24 @@ class BaseOrchestrator(ABC):
         return week_start.replace(hour=0, minute=0, second=0, microsecond=0)
 
     def generate_assignments(
-        self, start_date: datetime, end_date: datetime, dry_run: bool = False,
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        dry_run: bool = False,
+        solver: str | None = None,
     ) -> dict[str, Any]:
-        """Generate shift assignments using constraint-first day-by-day logic.
+        """Generate shift assignments using constraint-first logic.
 
         This is the main orchestration method that implements our new
         constraint-first approach instead of week-first with post-processing.
+        ``solver`` selects "daily" or "week" planning and defaults to
+        ``default_solver``.
         """
+        solver = solver or self.default_solver
+        if solver not in SOLVERS:
+            msg = f"Unknown solver {solver!r}; expected one of {', '.join(SOLVERS)}"
+            raise ValueError(msg)
+
         # Reset generation counter for fair rotation
         self._generation_assignment_count = 0
 
@@ -248,9 +403,13 @@ class BaseOrchestrator(ABC):
             start_date, end_date,
         )
 
-        # Get available employees and shift templates
-        employees = self.get_available_employees()
-        shift_templates = self._get_shift_templates()
+        # Get available employees and shift templates (from the shared map,
+        # reloaded only if templates changed)
+        template_cache.refresh()
+        with self.telemetry.phase("employees") as stats:
+            employees = self.get_available_employees()
+            shift_templates = self._get_shift_templates()
+            stats.rows = len(employees)
 
         if not employees:
             return {
@@ -268,40 +427,28 @@ class BaseOrchestrator(ABC):
                 "errors": ["No shift templates configured"],
             }
 
-        # Generate day-by-day assignments
-        assignments = []
-        current_date = start_date
-        last_assigned_employee: dict[
-            str, User,
-        ] = {}  # Track last assigned per shift type
-
-        while current_date < end_date:
-            # Generate assignments for this specific date
-            daily_assignments = self._generate_assignments_for_date(
-                current_date,
-                employees,
-                shift_templates,
-                last_assigned_employee,
-                assignments,
-            )
-
-            assignments.extend(daily_assignments)
-
-            # Update continuity tracking
-            for assignment in daily_assignments:
-                shift_type = assignment["shift_type"]
-                last_assigned_employee[shift_type] = assignment["assigned_employee"]
-
-            current_date += timedelta(days=1)
+        with self.telemetry.phase("assignment") as stats:
+            if solver == SOLVER_WEEK:
+                assignments = self._generate_week_by_week_assignments(
+                    start_date, end_date, employees, shift_templates,
+                )
+            else:
+                assignments = self._generate_day_by_day_assignments(
+                    start_date, end_date, employees, shift_templates,
+                )
+            stats.rows = len(assignments)
 
         # Calculate fairness metrics for the generated assignments
-        fairness_metrics = self._calculate_assignment_fairness(assignments, employees)
+        with self.telemetry.phase("fairness"):
+            fairness_metrics = self._calculate_assignment_fairness(assignments, employees)
 
         # If not a dry run, save the assignments to the database
         if not dry_run and assignments:
-            self._save_orchestration_results(
-                start_date, end_date, assignments, fairness_metrics,
-            )
+            with self.telemetry.phase("persist") as stats:
+                created = self._save_orchestration_results(
+                    start_date, end_date, assignments, fairness_metrics,
+                )
+                stats.rows = len(created or [])
 
         return {
             "assignments": assignments,
@@ -350,6 +497,171 @@ class BaseOrchestrator(ABC):
 
         return assignments
 
+    def _generate_week_by_week_assignments(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        employees: list[User],
+        shift_templates: list[ShiftTemplate],
+    ) -> list[dict]:
+        """Plan one rotation week at a time against a shared, append-only state.
+
+        Weeks follow the same rotation alignment as ``anchors.business_weeks``
+        and ``anchors.waakdienst_periods``, but partial weeks at either end of
+        the horizon are kept so every day is covered as in the daily solver.
+        Availability comes from one ``AvailabilitySnapshot`` and historical
+        workload is loaded once per shift type.
+        """
+        days = []
+        current_date = start_date
+        while current_date < end_date:
+            days.append(current_date)
+            current_date += timedelta(days=1)
+
+        snapshot = AvailabilitySnapshot(self, employees, start_date, end_date)
+        state = PlanningState()
+        baselines: dict[str, dict[int, float]] = {}
+        for template in shift_templates:
+            if template.shift_type not in baselines:
+                baselines[template.shift_type] = self._get_baseline_hours(
+                    template.shift_type, employees, start_date, end_date,
+                )
+
+        weekday = self._get_rotation_start_weekday()
+        weeks: dict[datetime, list[datetime]] = defaultdict(list)
+        for day in days:
+            weeks[self._get_week_start(day, weekday)].append(day)
+
+        periods: list[tuple[list[datetime], ShiftTemplate]] = []
+        demand: dict[str, float] = defaultdict(float)
+        for week_days in weeks.values():
+            for template in shift_templates:
+                needed = [d for d in week_days if self._needs_shift_on_date(d, template)]
+                if needed:
+                    periods.append((needed, template))
+                    for day in needed:
+                        shift_start, shift_end = self._calculate_shift_times(day, template)
+                        demand[template.shift_type] += (
+                            shift_end - shift_start
+                        ).total_seconds() / 3600
+
+        # Everyone's share of the horizon, so the last rotation can be split
+        # instead of leaving some employees a whole week ahead
+        fair_shares: dict[str, float] = {}
+        for template in shift_templates:
+            eligible = [e for e in employees if self._is_eligible_for_template(e, template)]
+            if eligible:
+                baseline = baselines[template.shift_type]
+                fair_shares[template.shift_type] = (
+                    sum(baseline.get(e.pk, 0.0) for e in eligible)
+                    + demand[template.shift_type]
+                ) / len(eligible)
+
+        for needed, template in periods:
+            self._plan_period(
+                needed, template, employees, state, snapshot,
+                baselines[template.shift_type],
+                fair_shares.get(template.shift_type, float("inf")),
+            )
+
+        template_order = {id(t): i for i, t in enumerate(shift_templates)}
+        return sorted(
+            state.assignments,
+            key=lambda a: (a["start_datetime"], template_order[id(a["template"])]),
+        )
+
+    def _plan_period(
+        self,
+        days: list[datetime],
+        template: ShiftTemplate,
+        employees: list[User],
+        state: PlanningState,
+        snapshot: AvailabilitySnapshot,
+        baseline: dict[int, float],
+        fair_share: float,
+    ) -> None:
+        """Assign every needed day of one period for a single template.
+
+        The fairest available employee takes the period. If they cannot work a
+        day, or have reached their ``fair_share`` of the horizon, the fairest
+        available colleague takes over for the rest of the period, matching the
+        continuity rules of the daily solver.
+        """
+        shift_type = template.shift_type
+        eligible = [e for e in employees if self._is_eligible_for_template(e, template)]
+        open_by_day = {
+            day: [
+                e for e in eligible
+                if not state.is_booked(e, day) and snapshot.is_available(e, day)
+            ]
+            for day in days
+        }
+
+        def workload(employee: User) -> float:
+            return baseline.get(employee.pk, 0.0) + state.hours[shift_type][employee.pk]
+
+        current: User | None = None
+        for day in days:
+            available = open_by_day[day]
+            if current is None or current not in available or workload(current) >= fair_share:
+                current = self._pick_lowest_workload(available, workload)
+            if current is None:
+                continue
+            employee = current
+
+            shift_start, shift_end = self._calculate_shift_times(day, template)
+            state.add(
+                {
+                    "assigned_employee": employee,
+                    "assigned_employee_id": employee.pk,
+                    "shift_type": shift_type,
+                    "template": template,
+                    "start_datetime": shift_start,
+                    "end_datetime": shift_end,
+                    "duration_hours": (shift_end - shift_start).total_seconds() / 3600,
+                    "auto_assigned": True,
+                },
+                day,
+            )
+
+    def _pick_lowest_workload(self, employees: list[User], workload) -> User | None:
+        """Lowest workload wins; ties rotate across the generation like the daily solver."""
+        if not employees:
+            return None
+        lowest = min(workload(e) for e in employees)
+        best_candidates = sorted(
+            (e for e in employees if workload(e) == lowest), key=lambda e: e.pk,
+        )
+        if len(best_candidates) == 1:
+            return best_candidates[0]
+        selected_index = self._generation_assignment_count % len(best_candidates)
+        self._generation_assignment_count += 1
+        return best_candidates[selected_index]
+
+    def _get_baseline_hours(
+        self,
+        shift_type: str,
+        employees: list[User],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> dict[int, float]:
+        """Historical (decayed) hours per employee for one shift type."""
+        calculator = self._get_fairness_calculator_for(shift_type, start_date, end_date)
+        if calculator is None:
+            return {}
+        current = calculator.calculate_current_assignments(employees)
+        return {emp_id: data.get("total_hours", 0.0) for emp_id, data in current.items()}
+
+    def _get_fairness_calculator_for(
+        self, shift_type: str, start_date: datetime, end_date: datetime,
+    ) -> BaseFairnessCalculator | None:
+        """Fairness calculator tracking ``shift_type``; subclasses may split by type."""
+        return self.fairness_calculator
+
+    def _is_eligible_for_template(self, employee: User, template: ShiftTemplate) -> bool:
+        """Whether an employee may work shifts of this template at all."""
+        return True
+
     def _generate_assignments_for_date(
         self,
         date: datetime,
@@ -648,7 +960,11 @@ class BaseOrchestrator(ABC):
                     )
                     created_shifts.append(shift)
 
-                return created_shifts
+            # Buffered into the caller's digest when coalescing
+            with NotificationService.coalesce_shift_notifications():
+                for shift in created_shifts:
+                    NotificationService.notify_shift_assigned(shift.assigned_employee, shift)
+            return created_shifts
 
         except Exception:
             # Log error but don't fail the entire generation
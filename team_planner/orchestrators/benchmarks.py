@@ -0,0 +1,314 @@
+"""
+Deterministic orchestration benchmarks with query and wall-clock budgets.
+
+Each scenario seeds a synthetic team (members, approved leave and recurring
+leave patterns drawn from a seeded RNG) and times the orchestrator hot paths
+on it:
+
+    preview   UnifiedOrchestrator.preview_schedule()
+    apply     UnifiedOrchestrator.apply_schedule()
+    extend    extend_rolling_horizon_core(dry_run=True) over the applied plan
+
+Every phase records its SQL query count and wall-clock seconds, and is checked
+against the scenario's budgets. Scenarios run inside a transaction that is
+rolled back, so the database is left as it was found.
+
+Usage:
+    python manage.py benchmark_orchestrators --scenarios small medium --output report.json
+"""
+
+from __future__ import annotations
+
+import platform
+import random
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import date
+from datetime import datetime
+from datetime import time as dt_time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django import get_version
+from django.db import connection
+from django.db import transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from .telemetry import QueryCounter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PHASES = ("preview", "apply", "extend")
+
+
+@dataclass(frozen=True)
+class BenchmarkScenario:
+    """A synthetic team and the budgets its orchestration must stay within."""
+
+    name: str
+    employees: int
+    weeks: int = 52
+    # Share of members with one approved vacation and with a recurring day off
+    leave_ratio: float = 0.5
+    pattern_ratio: float = 0.3
+    # Per-phase budgets; phases without an entry are recorded but not checked
+    max_queries: dict[str, int] = field(default_factory=dict)
+    max_seconds: dict[str, float] = field(default_factory=dict)
+
+
+# Budgets are regression ceilings per phase, re-baselined at the current
+# hot paths. Query budgets sit ~20% above the counts measured on SQLite with
+# seeds 0 and 1:
+#
+#              preview    apply   extend    (seconds: preview / apply / extend)
+#     small     33,063   33,635   31,543    28 / 28 / 38
+#     medium   163,318  164,404  162,155   130 / 140 / 142
+#
+# The large budgets are extrapolated linearly from those two. Time budgets
+# leave ~2x headroom for slower machines. Re-measure and tighten them
+# whenever a hot path gets faster.
+SCENARIOS: dict[str, BenchmarkScenario] = {
+    scenario.name: scenario
+    for scenario in (
+        BenchmarkScenario(
+            name="small",
+            employees=10,
+            max_queries={"preview": 39_700, "apply": 40_400, "extend": 37_900},
+            max_seconds={"preview": 60, "apply": 60, "extend": 75},
+        ),
+        BenchmarkScenario(
+            name="medium",
+            employees=50,
+            max_queries={"preview": 196_000, "apply": 197_300, "extend": 194_600},
+            max_seconds={"preview": 270, "apply": 280, "extend": 285},
+        ),
+        BenchmarkScenario(
+            name="large",
+            employees=200,
+            max_queries={"preview": 782_000, "apply": 786_000, "extend": 782_000},
+            max_seconds={"preview": 1030, "apply": 1130, "extend": 1090},
+        ),
+    )
+}
+
+
+@dataclass
+class PhaseResult:
+    name: str
+    queries: int
+    seconds: float
+    # Shifts planned by the phase
+    shifts: int
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    employees: int
+    weeks: int
+    seed: int
+    phases: list[PhaseResult] = field(default_factory=list)
+    violations: list[str] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return not self.violations
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["passed"] = self.passed
+        return data
+
+
+class _Rollback(Exception):
+    """Raised to roll back a scenario's seed data once it has been measured."""
+
+
+def _scenario_start() -> datetime:
+    """Monday 08:00 of next week, so the applied plan seeds the rolling horizon."""
+    today = timezone.localdate()
+    monday = today + timedelta(days=7 - today.weekday())
+    return timezone.make_aware(datetime.combine(monday, dt_time(8, 0)))
+
+
+def seed_scenario(scenario: BenchmarkScenario, start: date, seed: int = 0):
+    """Create the scenario's team, members, leave and recurring patterns.
+
+    The same scenario and seed always produce the same data relative to
+    ``start``. Returns the team.
+    """
+    from team_planner.employees.models import EmployeeProfile
+    from team_planner.employees.models import EmployeeSkill
+    from team_planner.employees.models import RecurringLeavePattern
+    from team_planner.leaves.models import LeaveRequest
+    from team_planner.leaves.models import LeaveType
+    from team_planner.teams.models import Department
+    from team_planner.teams.models import Team
+    from team_planner.teams.models import TeamMembership
+    from team_planner.users.models import User
+
+    rng = random.Random(f"{scenario.name}:{seed}")
+    prefix = f"bench-{scenario.name}-{seed}"
+
+    department = Department.objects.create(name=prefix)
+    team = Team.objects.create(name=prefix, department=department)
+    incidents_skill, _ = EmployeeSkill.objects.get_or_create(
+        name="incidents", defaults={"is_active": True},
+    )
+    waakdienst_skill, _ = EmployeeSkill.objects.get_or_create(
+        name="waakdienst", defaults={"is_active": True},
+    )
+    vacation, _ = LeaveType.objects.get_or_create(
+        name="Vacation",
+        defaults={"conflict_handling": LeaveType.ConflictHandling.FULL_UNAVAILABLE},
+    )
+
+    users = User.objects.bulk_create(
+        User(username=f"{prefix}-{i:03d}", email=f"{prefix}-{i:03d}@example.com")
+        for i in range(scenario.employees)
+    )
+    profiles = EmployeeProfile.objects.bulk_create(
+        EmployeeProfile(
+            user=user,
+            employee_id=f"{prefix}-{i:03d}",
+            hire_date=date(2020, 1, 1),
+            status=EmployeeProfile.Status.ACTIVE,
+            available_for_incidents=True,
+            available_for_waakdienst=rng.random() < 0.8,
+        )
+        for i, user in enumerate(users)
+    )
+    Through = EmployeeProfile.skills.through
+    Through.objects.bulk_create(
+        Through(employeeprofile_id=profile.pk, employeeskill_id=skill.pk)
+        for profile in profiles
+        for skill in (incidents_skill, waakdienst_skill)
+    )
+    TeamMembership.objects.bulk_create(
+        TeamMembership(user=user, team=team) for user in users
+    )
+
+    leaves, patterns = [], []
+    for user in users:
+        if rng.random() < scenario.leave_ratio:
+            leave_start = start + timedelta(days=rng.randrange(scenario.weeks * 7))
+            days = rng.randint(1, 10)
+            leaves.append(
+                LeaveRequest(
+                    employee=user,
+                    leave_type=vacation,
+                    start_date=leave_start,
+                    end_date=leave_start + timedelta(days=days - 1),
+                    days_requested=days,
+                    status=LeaveRequest.Status.APPROVED,
+                ),
+            )
+        if rng.random() < scenario.pattern_ratio:
+            patterns.append(
+                RecurringLeavePattern(
+                    employee=user,
+                    name="Benchmark day off",
+                    day_of_week=rng.randrange(5),
+                    frequency=rng.choice(RecurringLeavePattern.Frequency.values),
+                    coverage_type=rng.choice(RecurringLeavePattern.CoverageType.values),
+                    pattern_start_date=start,
+                    effective_from=start,
+                    is_active=True,
+                ),
+            )
+    LeaveRequest.objects.bulk_create(leaves)
+    RecurringLeavePattern.objects.bulk_create(patterns)
+    return team
+
+
+def _measure(result: BenchmarkResult, scenario: BenchmarkScenario, name: str, func: Callable[[], int]) -> None:
+    """Run one phase, record its queries and seconds and check them against the budgets."""
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        started = time.perf_counter()
+        shifts = func()
+        seconds = time.perf_counter() - started
+    phase = PhaseResult(name=name, queries=counter.count, seconds=round(seconds, 3), shifts=shifts)
+    result.phases.append(phase)
+
+    max_queries = scenario.max_queries.get(name)
+    if max_queries is not None and phase.queries > max_queries:
+        result.violations.append(f"{name}: {phase.queries} queries > budget {max_queries}")
+    max_seconds = scenario.max_seconds.get(name)
+    if max_seconds is not None and phase.seconds > max_seconds:
+        result.violations.append(f"{name}: {phase.seconds:.2f}s > budget {max_seconds}s")
+
+
+def _planned_shifts(totals: dict[str, Any]) -> int:
+    return totals["incidents"] + totals["incidents_standby"] + totals["waakdienst"]
+
+
+def run_scenario(scenario: BenchmarkScenario, seed: int = 0) -> BenchmarkResult:
+    """Seed, measure every phase and roll everything back."""
+    from team_planner.shifts.models import ShiftType
+
+    from .tasks import extend_rolling_horizon_core
+    from .unified import UnifiedOrchestrator
+
+    result = BenchmarkResult(
+        scenario=scenario.name, employees=scenario.employees, weeks=scenario.weeks, seed=seed,
+    )
+    start = _scenario_start()
+    end = start + timedelta(weeks=scenario.weeks)
+    shift_types = [ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY, ShiftType.WAAKDIENST]
+
+    try:
+        with transaction.atomic():
+            team = seed_scenario(scenario, start.date(), seed)
+            preview = UnifiedOrchestrator(team, start, end, shift_types=shift_types)
+            _measure(result, scenario, "preview", lambda: preview.preview_schedule()["total_shifts"])
+            apply = UnifiedOrchestrator(
+                team, start, end, shift_types=shift_types, dry_run=False,
+                user=team.members.order_by("pk").first(),
+            )
+            _measure(result, scenario, "apply", lambda: apply.apply_schedule()["total_shifts"])
+            # The applied plan is the seed the rolling horizon extends from. The
+            # rolling job runs without an initiating user, so only its planning
+            # (dry run) is measured.
+            with override_settings(ORCHESTRATOR_MIN_SEED_WEEKS=max(1, min(26, scenario.weeks - 1))):
+                _measure(
+                    result, scenario, "extend",
+                    lambda: _planned_shifts(
+                        extend_rolling_horizon_core(
+                            dry_run=True,
+                            team_ids=[team.pk],
+                            weeks=scenario.weeks,
+                            shift_types=[str(t) for t in shift_types],
+                        )["totals"],
+                    ),
+                )
+            raise _Rollback
+    except _Rollback:
+        pass
+    return result
+
+
+def run_benchmarks(names: list[str] | None = None, seed: int = 0, weeks: int | None = None) -> dict[str, Any]:
+    """Run the named scenarios (all by default) and return a JSON-serializable report."""
+    scenarios = [SCENARIOS[name] for name in (names or list(SCENARIOS))]
+    if weeks:
+        scenarios = [
+            BenchmarkScenario(**{**asdict(s), "weeks": weeks}) for s in scenarios
+        ]
+    results = [run_scenario(scenario, seed) for scenario in scenarios]
+    return {
+        "generated_at": timezone.now().isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "django": get_version(),
+            "database": connection.vendor,
+        },
+        "seed": seed,
+        "passed": all(r.passed for r in results),
+        "scenarios": [r.to_dict() for r in results],
+    }
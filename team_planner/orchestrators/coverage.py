@@ -0,0 +1,159 @@
+"""
+Day × shift-type coverage of teams over a date range.
+
+``team_coverage()`` answers "which shifts did each team need and which did it
+get" with a fixed number of queries whatever the range length: the teams,
+their memberships, the active shifts assigned to members in the window and the
+holidays. Shifts are projected in memory onto (team, local start date, shift
+type) buckets; a team owns a shift through the assigned employee's
+membership.
+
+A team requires, per day:
+
+- incidents on weekdays, unless the day is a holiday and the team skips
+  incidents on holidays
+- incidents-standby on the same days, only in ``global_per_week`` standby mode
+- waakdienst every day
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.db.models import Q
+from django.utils import timezone
+
+from team_planner.leaves.models import Holiday
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftType
+from team_planner.teams.models import Team
+from team_planner.teams.models import TeamMembership
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+SHIFT_TYPES = [ShiftType.INCIDENTS, ShiftType.WAAKDIENST, ShiftType.INCIDENTS_STANDBY]
+ACTIVE_STATUSES = [
+    Shift.Status.SCHEDULED,
+    Shift.Status.CONFIRMED,
+    Shift.Status.IN_PROGRESS,
+]
+
+
+def _holiday_checker(start_date: date, end_date: date):
+    exact: set[date] = set()
+    recurring_md: set[tuple[int, int]] = set()
+    for day, is_recurring in Holiday.objects.filter(
+        Q(date__gte=start_date, date__lte=end_date) | Q(is_recurring=True),
+    ).values_list("date", "is_recurring"):
+        exact.add(day)
+        if is_recurring:
+            recurring_md.add((day.month, day.day))
+    return lambda d: d in exact or (d.month, d.day) in recurring_md
+
+
+def required_shift_types(team: Team, day: date, is_holiday: bool) -> list[str]:
+    """Shift types ``team`` must cover on ``day`` (see module docstring)."""
+    required = []
+    if day.weekday() < 5 and not (is_holiday and team.incidents_skip_holidays):
+        required.append(ShiftType.INCIDENTS)
+        if team.standby_mode == Team.StandbyMode.GLOBAL_PER_WEEK:
+            required.append(ShiftType.INCIDENTS_STANDBY)
+    required.append(ShiftType.WAAKDIENST)
+    return required
+
+
+def _days(start_date: date, end_date: date) -> Iterable[date]:
+    day = start_date
+    while day <= end_date:
+        yield day
+        day += timedelta(days=1)
+
+
+def team_coverage(
+    start_date: date, end_date: date, teams: Iterable[Team] | None = None,
+) -> dict[str, Any]:
+    """Required-versus-covered shifts per team, day and shift type.
+
+    Returns ``{"teams": {team_id: {...}}, "days": {date: {...}}, "gaps": [...]}``
+    where each day entry sums over the teams and ``gaps`` lists every
+    required (team, date, shift type) without a shift.
+    """
+    teams = list(Team.objects.all() if teams is None else teams)
+    team_ids_by_user: dict[int, list[int]] = defaultdict(list)
+    for user_id, team_id in TeamMembership.objects.filter(
+        team__in=teams, is_active=True,
+    ).values_list("user_id", "team_id"):
+        team_ids_by_user[user_id].append(team_id)
+
+    # (team_id, day, shift_type) -> number of shifts
+    counts: dict[tuple[int, date, str], int] = defaultdict(int)
+    window_start = timezone.make_aware(datetime.combine(start_date, datetime.min.time()))
+    window_end = timezone.make_aware(datetime.combine(end_date, datetime.max.time()))
+    # Buckets are keyed by start date, so an overnight shift starting on the
+    # last day counts even though it ends after the window
+    shifts = Shift.objects.filter(
+        assigned_employee_id__in=list(team_ids_by_user),
+        start_datetime__gte=window_start,
+        start_datetime__lte=window_end,
+        status__in=ACTIVE_STATUSES,
+    ).values_list("assigned_employee_id", "template__shift_type", "start_datetime")
+    for employee_id, shift_type, start in shifts:
+        day = timezone.localdate(start)
+        for team_id in team_ids_by_user[employee_id]:
+            counts[(team_id, day, shift_type)] += 1
+
+    is_holiday = _holiday_checker(start_date, end_date)
+    teams_data: dict[int, dict[str, Any]] = {}
+    days_data: dict[str, dict[str, Any]] = {}
+    gaps = []
+    for day in _days(start_date, end_date):
+        holiday = is_holiday(day)
+        day_entry = days_data[day.isoformat()] = {
+            "required_shifts": 0,
+            "covered_shifts": 0,
+            "shift_types": {
+                st: {"required": 0, "covered": 0, "shifts_count": 0} for st in SHIFT_TYPES
+            },
+        }
+        for team in teams:
+            team_entry = teams_data.setdefault(
+                team.pk,
+                {
+                    "team_name": team.name,
+                    "required_shifts": 0,
+                    "covered_shifts": 0,
+                    "shift_types": {st: {"required": 0, "covered": 0} for st in SHIFT_TYPES},
+                },
+            )
+            required = required_shift_types(team, day, holiday)
+            for shift_type in SHIFT_TYPES:
+                shifts_count = counts.get((team.pk, day, shift_type), 0)
+                day_entry["shift_types"][shift_type]["shifts_count"] += shifts_count
+                if shift_type not in required:
+                    continue
+                covered = shifts_count > 0
+                for entry in (day_entry, team_entry):
+                    entry["required_shifts"] += 1
+                    entry["covered_shifts"] += covered
+                    entry["shift_types"][shift_type]["required"] += 1
+                    entry["shift_types"][shift_type]["covered"] += covered
+                if not covered:
+                    gaps.append(
+                        {"date": day.isoformat(), "team_id": team.pk, "shift_type": shift_type},
+                    )
+
+    for entry in [*teams_data.values(), *days_data.values()]:
+        entry["coverage_percentage"] = coverage_percentage(
+            entry["covered_shifts"], entry["required_shifts"],
+        )
+    return {"teams": teams_data, "days": days_data, "gaps": gaps}
+
+
+def coverage_percentage(covered: int, required: int) -> float:
+    return covered / required * 100 if required else 0.0
@@ -0,0 +1,145 @@
+"""
+Assignment history reset: summary and chunked purge.
+
+The reset endpoint and its preview share one ``HistoryScope`` (cutoff plus
+optional employee/team filter) and one grouped aggregate for the
+distribution of the shifts in scope. The deletion itself runs in the
+``orchestrators.reset_assignment_history`` task: each model is deleted in
+primary-key batches of ORCHESTRATOR_HISTORY_PURGE_BATCH_SIZE, each batch in
+its own short transaction (including the cascade into audit logs and swap
+requests), with a progress event per batch.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+
+from team_planner.shifts.models import Shift
+
+from .models import OrchestrationResult
+from .models import OrchestrationRun
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from django.db.models import QuerySet
+
+
+@dataclass(frozen=True)
+class HistoryScope:
+    """History created since ``cutoff``, optionally for one employee or team.
+
+    Orchestration runs are not tied to a team or employee, so a filtered
+    reset only removes that scope's shifts and run results and keeps the runs.
+    """
+
+    cutoff: datetime
+    employee_id: int | None = None
+    team_id: int | None = None
+
+    @property
+    def filtered(self) -> bool:
+        return bool(self.employee_id or self.team_id)
+
+    def shifts(self) -> QuerySet:
+        qs = Shift.objects.filter(start_datetime__gte=self.cutoff)
+        if self.employee_id:
+            qs = qs.filter(assigned_employee_id=self.employee_id)
+        if self.team_id:
+            qs = qs.filter(assigned_employee__teams=self.team_id)
+        return qs
+
+    def results(self) -> QuerySet:
+        qs = OrchestrationResult.objects.filter(orchestration_run__created__gte=self.cutoff)
+        if self.employee_id:
+            qs = qs.filter(employee_id=self.employee_id)
+        if self.team_id:
+            qs = qs.filter(employee__teams=self.team_id)
+        return qs
+
+    def runs(self) -> QuerySet:
+        if self.filtered:
+            return OrchestrationRun.objects.none()
+        return OrchestrationRun.objects.filter(created__gte=self.cutoff)
+
+
+def assignment_distribution(scope: HistoryScope) -> dict[str, Any]:
+    """Shifts in scope per employee and shift type, from one grouped query."""
+    rows = (
+        scope.shifts()
+        .order_by()
+        .values("assigned_employee_id", "assigned_employee__username", "template__shift_type")
+        .annotate(count=Count("pk"))
+    )
+    employees: dict[int, dict[str, Any]] = {}
+    shift_types: dict[str, int] = {}
+    total = 0
+    for row in rows:
+        employee = employees.setdefault(
+            row["assigned_employee_id"],
+            {
+                "employee_id": row["assigned_employee_id"],
+                "username": row["assigned_employee__username"] or "unknown",
+                "total_shifts": 0,
+                "shift_types": {},
+            },
+        )
+        shift_type, count = row["template__shift_type"], row["count"]
+        employee["total_shifts"] += count
+        employee["shift_types"][shift_type] = count
+        shift_types[shift_type] = shift_types.get(shift_type, 0) + count
+        total += count
+    return {
+        "total_shifts": total,
+        "employees": sorted(employees.values(), key=lambda e: e["total_shifts"], reverse=True),
+        "shift_types": shift_types,
+    }
+
+
+def _batch_size() -> int:
+    return int(getattr(settings, "ORCHESTRATOR_HISTORY_PURGE_BATCH_SIZE", 500))
+
+
+def _purge(
+    label: str,
+    queryset: QuerySet,
+    batch_size: int,
+    progress: Callable[..., None] | None,
+) -> int:
+    """Delete ``queryset``'s rows in primary-key batches; returns rows deleted."""
+    model = queryset.model
+    deleted = 0
+    last_pk = 0
+    while True:
+        pks = list(
+            queryset.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True)[:batch_size],
+        )
+        if not pks:
+            return deleted
+        with transaction.atomic():
+            model.objects.filter(pk__in=pks).delete()
+        deleted += len(pks)
+        last_pk = pks[-1]
+        if progress:
+            progress("batch_deleted", model=label, deleted=deleted)
+
+
+def purge_history(
+    scope: HistoryScope,
+    batch_size: int | None = None,
+    progress: Callable[..., None] | None = None,
+) -> dict[str, int]:
+    """Delete the scope's run results, shifts and runs in bounded batches."""
+    batch_size = batch_size or _batch_size()
+    return {
+        "results_deleted": _purge("results", scope.results(), batch_size, progress),
+        "shifts_deleted": _purge("shifts", scope.shifts(), batch_size, progress),
+        "runs_deleted": _purge("runs", scope.runs(), batch_size, progress),
+    }
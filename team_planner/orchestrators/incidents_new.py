@@ -7,7 +7,7 @@ shifts with Monday-Friday rotation cycles and constraint-first generation.
 
 Key Features:
 - Monday 08:00 start, Friday 17:00 end rotation
-- Constraint-first day-by-day generation
+- Constraint-first week-level generation (day-by-day available as "daily")
 - Business hours focus (excludes evening/weekend patterns)
 - Independent fairness tracking for incidents vs standby
 - Continuity preference for week-long assignments
@@ -19,11 +19,13 @@ from zoneinfo import ZoneInfo
 
 import pytz
 
+from team_planner.orchestrators.base_orchestrator import SOLVER_WEEK
 from team_planner.orchestrators.base_orchestrator import BaseOrchestrator
 from team_planner.orchestrators.fairness_calculators import IncidentsFairnessCalculator
 from team_planner.orchestrators.fairness_calculators import (
     IncidentsStandbyFairnessCalculator,
 )
+from team_planner.orchestrators.templates import template_cache
 from team_planner.shifts.models import ShiftTemplate
 from team_planner.shifts.models import ShiftType
 from team_planner.users.models import User
@@ -36,9 +38,11 @@ class IncidentsOrchestrator(BaseOrchestrator):
     - Rotation Start: Monday 08:00
     - Rotation End: Friday 17:00
     - Shift Types: Incidents, Incidents-Standby
-    - Generation: Constraint-first, day-by-day with continuity preference
+    - Generation: Constraint-first, one business week at a time
     """
 
+    default_solver = SOLVER_WEEK
+
     def __init__(
         self,
         team_id: int | None = None,
@@ -71,12 +75,11 @@ class IncidentsOrchestrator(BaseOrchestrator):
         if self.include_standby:
             wanted_types.append(ShiftType.INCIDENTS_STANDBY)
 
-        existing = list(
-            ShiftTemplate.objects.filter(
-                shift_type__in=wanted_types,
-                is_active=True,
-            ),
-        )
+        existing = [
+            template
+            for shift_type in wanted_types
+            for template in template_cache.active(shift_type)
+        ]
 
         have_incidents = any(t.shift_type == ShiftType.INCIDENTS for t in existing)
         have_standby = any(
@@ -107,6 +110,10 @@ class IncidentsOrchestrator(BaseOrchestrator):
             )
             existing.append(tmpl)
 
+        if not have_incidents or (self.include_standby and not have_standby):
+            # Load the provisioned templates into the shared map right away
+            template_cache.refresh()
+
         return existing
 
     def _create_fairness_calculator(self, start_date: datetime, end_date: datetime):
@@ -139,6 +146,25 @@ class IncidentsOrchestrator(BaseOrchestrator):
 
         return available_employees
 
+    def _get_fairness_calculator_for(
+        self, shift_type: str, start_date: datetime, end_date: datetime,
+    ):
+        """Standby keeps its own counters, independent of the primary rotation."""
+        if shift_type == ShiftType.INCIDENTS_STANDBY:
+            return IncidentsStandbyFairnessCalculator(start_date, end_date)
+        return self.fairness_calculator
+
+    def _is_eligible_for_template(self, employee: User, template: ShiftTemplate) -> bool:
+        """Incidents and standby both require the incidents availability flag."""
+        if template.shift_type not in (ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY):
+            return False
+        profile = getattr(employee, "employee_profile", None)
+        if profile:
+            # Standby uses the same availability flag as incidents for business-hours backup
+            return bool(getattr(profile, "available_for_incidents", False))
+        # Include employees without profiles
+        return True
+
     def _needs_shift_on_date(self, date: datetime, template: ShiftTemplate) -> bool:
         """Check if we need a shift of this template type on the given date.
 
@@ -231,17 +257,7 @@ class IncidentsOrchestrator(BaseOrchestrator):
             if getattr(employee, "pk", None) in assigned_emp_ids_same_day:
                 continue
 
-            profile = getattr(employee, "employee_profile", None)
-            if profile:
-                if template.shift_type == ShiftType.INCIDENTS:
-                    if getattr(profile, "available_for_incidents", False):
-                        shift_type_employees.append(employee)
-                elif template.shift_type == ShiftType.INCIDENTS_STANDBY:
-                    # Standby uses the same availability flag as incidents for business-hours backup
-                    if getattr(profile, "available_for_incidents", False):
-                        shift_type_employees.append(employee)
-            else:
-                # Include employees without profiles
+            if self._is_eligible_for_template(employee, template):
                 shift_type_employees.append(employee)
 
         if not shift_type_employees:
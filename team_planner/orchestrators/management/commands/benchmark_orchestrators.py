@@ -0,0 +1,59 @@
+"""Run the orchestration benchmark scenarios and report query counts and timings.
+
+Usage:
+  python manage.py benchmark_orchestrators [--scenarios small medium] [--seed 0]
+      [--weeks 52] [--output report.json]
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.core.management.base import CommandError
+
+from team_planner.orchestrators.benchmarks import SCENARIOS
+from team_planner.orchestrators.benchmarks import run_benchmarks
+
+
+class Command(BaseCommand):
+    help = "Seed synthetic teams, time preview/apply/extend and check query and time budgets."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenarios",
+            nargs="*",
+            choices=sorted(SCENARIOS),
+            help="Scenarios to run (default: all)",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed for the synthetic data (default 0)",
+        )
+        parser.add_argument(
+            "--weeks", type=int, help="Override the horizon of every scenario",
+        )
+        parser.add_argument(
+            "--output", help="Write the JSON report to this file instead of stdout",
+        )
+
+    def handle(self, *args, **options):
+        report = run_benchmarks(
+            names=options.get("scenarios"), seed=options["seed"], weeks=options.get("weeks"),
+        )
+        payload = json.dumps(report, indent=2, default=str)
+
+        if options.get("output"):
+            Path(options["output"]).write_text(payload + "\n")
+            for scenario in report["scenarios"]:
+                phases = " | ".join(
+                    f"{p['name']}: {p['queries']} queries, {p['seconds']:.2f}s"
+                    for p in scenario["phases"]
+                )
+                self.stdout.write(f"- {scenario['scenario']} ({scenario['employees']} employees): {phases}")
+        else:
+            self.stdout.write(payload)
+
+        if not report["passed"]:
+            violations = [v for s in report["scenarios"] for v in s["violations"]]
+            raise CommandError("Benchmark budgets exceeded:\n" + "\n".join(violations))
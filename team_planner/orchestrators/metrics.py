@@ -0,0 +1,96 @@
+"""
+Orchestration metrics snapshot for the status dashboard.
+
+``compute_metrics()`` builds the metric set with conditional aggregation in
+four queries (runs by status, recent run durations, employee eligibility,
+shifts this month). ``metrics_snapshot()`` serves it from the cache, where it
+is kept for ORCHESTRATOR_METRICS_SNAPSHOT_SECONDS:
+
+- run and employee profile changes drop the snapshot on commit (signals.py)
+- the ``orchestrators.refresh_metrics_snapshot`` beat task recomputes it
+  periodically, so readers rarely hit a cold cache
+
+Concurrent dashboard refreshes therefore cost one cache read each.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models import Q
+from django.utils import timezone
+
+from team_planner.employees.models import EmployeeProfile
+from team_planner.shifts.models import Shift
+
+from .models import OrchestrationRun
+
+SNAPSHOT_KEY = "orchestrator_metrics:snapshot"
+RECENT_RUNS = 10
+
+
+def _timeout() -> int:
+    return int(getattr(settings, "ORCHESTRATOR_METRICS_SNAPSHOT_SECONDS", 60))
+
+
+def compute_metrics() -> dict[str, Any]:
+    """Raw orchestration, employee and shift counters."""
+    runs = OrchestrationRun.objects.aggregate(
+        total=Count("pk"),
+        successful=Count("pk", filter=Q(status=OrchestrationRun.Status.COMPLETED)),
+        failed=Count("pk", filter=Q(status=OrchestrationRun.Status.FAILED)),
+        active=Count("pk", filter=Q(status=OrchestrationRun.Status.RUNNING)),
+    )
+    recent = OrchestrationRun.objects.filter(
+        completed_at__isnull=False, started_at__isnull=False,
+    ).order_by("-completed_at").values_list("started_at", "completed_at")[:RECENT_RUNS]
+    durations = [(completed - started).total_seconds() for started, completed in recent]
+
+    active = Q(status=EmployeeProfile.Status.ACTIVE)
+    employees = EmployeeProfile.objects.aggregate(
+        active=Count("pk", filter=active),
+        incidents_eligible=Count("pk", filter=active & Q(available_for_incidents=True)),
+        waakdienst_eligible=Count("pk", filter=active & Q(available_for_waakdienst=True)),
+    )
+
+    today = timezone.localdate()
+    month_start = today.replace(day=1)
+    shifts_this_month = Shift.objects.filter(
+        start_datetime__date__gte=month_start,
+        status__in=[
+            Shift.Status.SCHEDULED,
+            Shift.Status.CONFIRMED,
+            Shift.Status.IN_PROGRESS,
+            Shift.Status.COMPLETED,
+        ],
+    ).count()
+
+    return {
+        "computed_at": timezone.now().isoformat(),
+        "runs": runs,
+        "average_execution_time_seconds": sum(durations) / len(durations) if durations else 0,
+        "employees": employees,
+        "shifts_this_month": shifts_this_month,
+        "month_day": today.day,
+    }
+
+
+def refresh_metrics_snapshot() -> dict[str, Any]:
+    snapshot = compute_metrics()
+    cache.set(SNAPSHOT_KEY, snapshot, _timeout())
+    return snapshot
+
+
+def metrics_snapshot() -> dict[str, Any]:
+    """Cached metrics, recomputed when the snapshot expired or was dropped."""
+    snapshot = cache.get(SNAPSHOT_KEY)
+    if snapshot is None:
+        snapshot = refresh_metrics_snapshot()
+    return snapshot
+
+
+def invalidate_metrics_snapshot() -> None:
+    cache.delete(SNAPSHOT_KEY)
@@ -0,0 +1,28 @@
+# Generated by Django 5.1.11 on 2026-10-18 21:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orchestrators', '0002_orchestrationrun_incidents_standby_shifts_created_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='orchestrationrun',
+            name='duration_seconds',
+            field=models.FloatField(blank=True, null=True, verbose_name='Duration (seconds)'),
+        ),
+        migrations.AddField(
+            model_name='orchestrationrun',
+            name='phase_metrics',
+            field=models.JSONField(blank=True, default=dict, verbose_name='Phase Metrics'),
+        ),
+        migrations.AddField(
+            model_name='orchestrationrun',
+            name='query_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='SQL Queries'),
+        ),
+    ]
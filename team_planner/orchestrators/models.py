@@ -83,6 +83,12 @@ class OrchestrationRun(TimeStampedModel):
     execution_log = models.TextField(_("Execution Log"), blank=True)
     error_message = models.TextField(_("Error Message"), blank=True)
 
+    # Telemetry: {"phase": {"seconds", "queries", "rows", "calls"}}, nested
+    # phases keyed "parent/child"
+    phase_metrics = models.JSONField(_("Phase Metrics"), default=dict, blank=True)
+    duration_seconds = models.FloatField(_("Duration (seconds)"), null=True, blank=True)
+    query_count = models.PositiveIntegerField(_("SQL Queries"), default=0)
+
     class Meta:
         verbose_name = _("Orchestration Run")
         verbose_name_plural = _("Orchestration Runs")
@@ -0,0 +1,148 @@
+"""
+Optimal roster assignment for one horizon via min-cost flow.
+
+ShiftOrchestrator's greedy path picks one week at a time and rescores every
+candidate for every pick. In ``assignment_mode="optimal"`` the whole horizon
+is solved at once instead:
+
+    source -> week (capacity 1)
+    week -> employee (capacity 1, only where the employee is available)
+    employee -> sink (one arc per additional week, convex cost)
+
+The k-th week given to an employee costs the increase of their squared load,
+``(h + k*u)^2 - (h + (k-1)*u)^2`` where ``h`` is their historical (decayed)
+hours and ``u`` the average week length. Marginal costs grow with every week,
+so a maximum flow of minimum cost covers as many weeks as the availability
+matrix allows and, among those rosters, minimizes the sum of squared loads:
+employees with a fairness deficit are filled up first.
+
+Pure Python (successive shortest paths with Dijkstra and potentials); no
+solver dependency is required.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Hashable
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+# Hours are scaled to integers so path costs stay exact
+COST_SCALE = 10
+
+
+class MinCostFlow:
+    """Successive-shortest-path min-cost flow on a small directed graph."""
+
+    def __init__(self, node_count: int):
+        # Edge: [to, capacity, cost, reverse index]
+        self.graph: list[list[list[int]]] = [[] for _ in range(node_count)]
+
+    def add_edge(self, u: int, v: int, capacity: int, cost: int) -> tuple[int, int]:
+        """Add an edge and return its (node, index) handle for reading flow later."""
+        self.graph[u].append([v, capacity, cost, len(self.graph[v])])
+        self.graph[v].append([u, 0, -cost, len(self.graph[u]) - 1])
+        return u, len(self.graph[u]) - 1
+
+    def edge_flow(self, handle: tuple[int, int]) -> int:
+        u, index = handle
+        v, _capacity, _cost, rev = self.graph[u][index]
+        return self.graph[v][rev][1]
+
+    def solve(self, source: int, sink: int) -> tuple[int, int]:
+        """Push as much flow as possible at minimum cost; return (flow, cost).
+
+        All initial costs must be non-negative.
+        """
+        n = len(self.graph)
+        potential = [0] * n
+        flow = cost = 0
+        while True:
+            dist: list[float] = [float("inf")] * n
+            prev: list[tuple[int, int] | None] = [None] * n
+            dist[source] = 0
+            heap = [(0, source)]
+            while heap:
+                d, u = heapq.heappop(heap)
+                if d > dist[u]:
+                    continue
+                for index, (v, capacity, edge_cost, _rev) in enumerate(self.graph[u]):
+                    if capacity <= 0:
+                        continue
+                    nd = d + edge_cost + potential[u] - potential[v]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        prev[v] = (u, index)
+                        heapq.heappush(heap, (nd, v))
+            if dist[sink] == float("inf"):
+                return flow, cost
+            for node in range(n):
+                if dist[node] < float("inf"):
+                    potential[node] += int(dist[node])
+
+            # Every path carries one unit: all source arcs have capacity 1
+            push = 1
+            node = sink
+            while node != source:
+                u, index = prev[node]  # type: ignore[misc]
+                edge = self.graph[u][index]
+                edge[1] -= push
+                self.graph[node][edge[3]][1] += push
+                cost += push * edge[2]
+                node = u
+            flow += push
+
+
+def solve_fair_assignment(
+    units: Sequence[Hashable],
+    candidates: Mapping[Hashable, Sequence[int]],
+    baseline_hours: Mapping[int, float],
+    unit_hours: float,
+) -> dict[Hashable, int]:
+    """Assign each unit (week) to one candidate employee, fairest feasible roster.
+
+    Args:
+        units: the weeks to cover, in any order
+        candidates: unit -> employee ids available for the whole unit
+        baseline_hours: employee id -> hours already worked (history, decay applied)
+        unit_hours: typical hours per unit, used for the convex load cost
+
+    Returns:
+        unit -> employee id for every unit that could be covered. Units with no
+        candidate, or that cannot be covered without leaving another uncovered,
+        are omitted.
+    """
+    employee_ids = sorted({emp_id for unit in units for emp_id in candidates.get(unit, ())})
+    if not units or not employee_ids:
+        return {}
+
+    source, sink = 0, 1
+    unit_node = {unit: 2 + i for i, unit in enumerate(units)}
+    employee_node = {emp_id: 2 + len(units) + i for i, emp_id in enumerate(employee_ids)}
+    mcf = MinCostFlow(2 + len(units) + len(employee_ids))
+
+    for unit in units:
+        mcf.add_edge(source, unit_node[unit], 1, 0)
+
+    unit_load = max(1, round(unit_hours * COST_SCALE))
+    eligible_units: dict[int, int] = dict.fromkeys(employee_ids, 0)
+    handles: dict[tuple[int, int], tuple[Hashable, int]] = {}
+    for unit in units:
+        for emp_id in sorted(set(candidates.get(unit, ()))):
+            handle = mcf.add_edge(unit_node[unit], employee_node[emp_id], 1, 0)
+            handles[handle] = (unit, emp_id)
+            eligible_units[emp_id] += 1
+
+    for emp_id in employee_ids:
+        base = round(baseline_hours.get(emp_id, 0.0) * COST_SCALE)
+        for k in range(1, eligible_units[emp_id] + 1):
+            marginal = (base + k * unit_load) ** 2 - (base + (k - 1) * unit_load) ** 2
+            mcf.add_edge(employee_node[emp_id], sink, 1, marginal)
+
+    mcf.solve(source, sink)
+
+    return {
+        unit: emp_id
+        for handle, (unit, emp_id) in handles.items()
+        if mcf.edge_flow(handle) > 0
+    }
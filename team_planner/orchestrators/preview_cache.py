@@ -0,0 +1,137 @@
+"""
+Content-addressed cache for orchestration previews.
+
+A preview is stored under a hash of its inputs (orchestrator kind, team,
+window, shift types and options) plus a version stamp of the data planning
+reads for that team: its memberships and employee profiles (availability),
+shifts, leave requests and recurring leave patterns, holidays in the window
+and the shift templates. The stamp is one query of count/latest-change
+aggregates, so reopening an unchanged preview costs that query and one cache
+lookup, and any relevant edit simply addresses a different entry.
+
+``apply_schedule`` looks the same key up and commits the cached assignments
+instead of planning again when nothing changed since the preview.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from datetime import datetime
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count
+from django.db.models import Max
+from django.db.models import Subquery
+from django.db.models import Value
+
+from team_planner.employees.models import EmployeeProfile
+from team_planner.employees.models import RecurringLeavePattern
+from team_planner.leaves.models import Holiday
+from team_planner.leaves.models import LeaveRequest
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.teams.models import Team
+from team_planner.teams.models import TeamMembership
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from django.db.models import QuerySet
+
+CACHE_PREFIX = "orchestrator_preview"
+
+
+def _timeout() -> int:
+    return int(getattr(settings, "ORCHESTRATOR_PREVIEW_CACHE_SECONDS", 15 * 60))
+
+
+def _scalar(qs: QuerySet, aggregate) -> Subquery:
+    """``aggregate`` over ``qs`` as a scalar subquery (one row, no grouping)."""
+    return Subquery(
+        qs.order_by()
+        .annotate(_all=Value(1))
+        .values("_all")
+        .annotate(value=aggregate)
+        .values("value")[:1],
+    )
+
+
+def _stamps(prefix: str, qs: QuerySet) -> dict[str, Subquery]:
+    return {
+        f"{prefix}_count": _scalar(qs, Count("pk")),
+        f"{prefix}_last_pk": _scalar(qs, Max("pk")),
+        f"{prefix}_modified": _scalar(qs, Max("modified")),
+    }
+
+
+def data_version(team_id: int, start: datetime, end: datetime) -> dict[str, Any] | None:
+    """Version stamp of the data a plan for ``team_id`` over the window reads.
+
+    Shifts and recurring patterns are stamped over all time because fairness
+    looks at history. Returns ``None`` for an unknown team.
+    """
+    member_ids = TeamMembership.objects.filter(team_id=team_id).values("user_id")
+    start_date, end_date = start.date(), end.date()
+    sources = {
+        "memberships": TeamMembership.objects.filter(team_id=team_id),
+        "profiles": EmployeeProfile.objects.filter(user_id__in=member_ids),
+        "shifts": Shift.objects.filter(assigned_employee_id__in=member_ids),
+        "leaves": LeaveRequest.objects.filter(
+            employee_id__in=member_ids, start_date__lte=end_date, end_date__gte=start_date,
+        ),
+        "patterns": RecurringLeavePattern.objects.filter(employee_id__in=member_ids),
+        "holidays": Holiday.objects.all(),
+        "templates": ShiftTemplate.objects.all(),
+    }
+    stamps = {}
+    for prefix, qs in sources.items():
+        stamps.update(_stamps(prefix, qs))
+    return (
+        Team.objects.filter(pk=team_id)
+        .annotate(**stamps)
+        .values("modified", *stamps)
+        .first()
+    )
+
+
+def preview_key(
+    kind: str,
+    team_id: int,
+    start: datetime,
+    end: datetime,
+    shift_types: Iterable[Any],
+    options: dict[str, Any] | None = None,
+) -> str | None:
+    """Cache key for a preview, or ``None`` when the team does not exist."""
+    version = data_version(team_id, start, end)
+    if version is None:
+        return None
+    inputs = {
+        "kind": kind,
+        "team": team_id,
+        "start": start,
+        "end": end,
+        "shift_types": sorted(str(getattr(st, "value", st)) for st in shift_types),
+        "options": options or {},
+        "version": version,
+    }
+    digest = hashlib.sha256(
+        json.dumps(inputs, cls=DjangoJSONEncoder, sort_keys=True).encode(),
+    ).hexdigest()
+    return f"{CACHE_PREFIX}:{kind}:{team_id}:{digest}"
+
+
+def get_preview(key: str | None) -> Any | None:
+    if not key or _timeout() <= 0:
+        return None
+    return cache.get(key)
+
+
+def store_preview(key: str | None, payload: Any) -> None:
+    if key and _timeout() > 0:
+        cache.set(key, payload, _timeout())
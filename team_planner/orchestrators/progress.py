@@ -0,0 +1,222 @@
+"""
+Progress events for long orchestration runs.
+
+Orchestration code reports milestones through a ``ProgressReporter`` bound to
+a run id (the Celery task id for background runs):
+
+    started          teams queued for this run
+    team_started     planning for one team began
+    period_planned   one week/period of one shift type was planned
+    shifts_written   shifts were persisted
+    team_finished    one team's report
+    team_skipped     team without a seed plan
+    chunk_finished   a chunk is done and the rest continues in another task
+    finished/failed  terminal events
+
+Events are numbered, appended to a bounded per-run log and published on a
+Redis pub/sub channel. The server-sent-events endpoint replays the log after
+the client's ``Last-Event-ID`` and then follows the channel, so reconnecting
+clients miss nothing, and ``completed_team_ids()`` lets a new run resume an
+interrupted one.
+
+The "cache" broker keeps the log in the Django cache and is polled instead of
+subscribed; it is meant for tests and single-process development.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "orchestration_progress"
+TERMINAL_EVENTS = frozenset({"finished", "failed"})
+
+
+def _log_key(run_id: str) -> str:
+    return f"{KEY_PREFIX}:{run_id}:events"
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "ORCHESTRATOR_PROGRESS_TTL_SECONDS", 24 * 3600))
+
+
+def _max_events() -> int:
+    return int(getattr(settings, "ORCHESTRATOR_PROGRESS_MAX_EVENTS", 10_000))
+
+
+class CacheProgressBroker:
+    """Event log in the Django cache, followed by polling."""
+
+    poll_seconds = 0.5
+
+    def append(self, run_id: str, event: dict[str, Any]) -> dict[str, Any]:
+        # One writer per run id (the task), so read-modify-write is safe enough
+        events = cache.get(_log_key(run_id)) or []
+        event = {**event, "seq": (events[-1]["seq"] if events else 0) + 1}
+        events.append(event)
+        cache.set(_log_key(run_id), events[-_max_events():], _ttl())
+        return event
+
+    def events(self, run_id: str, after: int = 0) -> list[dict[str, Any]]:
+        return [e for e in cache.get(_log_key(run_id)) or [] if e["seq"] > after]
+
+    def listen(self, run_id: str, after: int, timeout: float) -> Iterator[dict[str, Any] | None]:
+        """Yield events after ``after`` until a terminal event or ``timeout``.
+
+        ``None`` is yielded on idle ticks so callers can send keep-alives.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            for event in self.events(run_id, after):
+                after = event["seq"]
+                yield event
+                if event["event"] in TERMINAL_EVENTS:
+                    return
+            if time.monotonic() >= deadline:
+                return
+            yield None
+            time.sleep(self.poll_seconds)
+
+
+class RedisProgressBroker:
+    """Event log in a Redis list plus a pub/sub channel for live delivery."""
+
+    def __init__(self, url: str | None = None):
+        self.url = url or settings.REDIS_URL
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            import redis
+
+            self._client = redis.Redis.from_url(self.url)
+        return self._client
+
+    @staticmethod
+    def _channel(run_id: str) -> str:
+        return f"{KEY_PREFIX}:{run_id}"
+
+    def append(self, run_id: str, event: dict[str, Any]) -> dict[str, Any]:
+        seq = self.client.incr(f"{KEY_PREFIX}:{run_id}:seq")
+        event = {**event, "seq": seq}
+        payload = json.dumps(event, cls=DjangoJSONEncoder)
+        pipe = self.client.pipeline()
+        pipe.rpush(_log_key(run_id), payload)
+        pipe.ltrim(_log_key(run_id), -_max_events(), -1)
+        pipe.expire(_log_key(run_id), _ttl())
+        pipe.expire(f"{KEY_PREFIX}:{run_id}:seq", _ttl())
+        pipe.publish(self._channel(run_id), payload)
+        pipe.execute()
+        return event
+
+    def events(self, run_id: str, after: int = 0) -> list[dict[str, Any]]:
+        events = (json.loads(raw) for raw in self.client.lrange(_log_key(run_id), 0, -1))
+        return [e for e in events if e["seq"] > after]
+
+    def listen(self, run_id: str, after: int, timeout: float) -> Iterator[dict[str, Any] | None]:
+        """Replay the log after ``after``, then follow the channel (see CacheProgressBroker)."""
+        deadline = time.monotonic() + timeout
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        # Subscribe before replaying so nothing published in between is lost
+        pubsub.subscribe(self._channel(run_id))
+        try:
+            for event in self.events(run_id, after):
+                after = event["seq"]
+                yield event
+                if event["event"] in TERMINAL_EVENTS:
+                    return
+            while time.monotonic() < deadline:
+                message = pubsub.get_message(timeout=1.0)
+                if message is None:
+                    yield None
+                    continue
+                event = json.loads(message["data"])
+                if event["seq"] <= after:
+                    continue
+                after = event["seq"]
+                yield event
+                if event["event"] in TERMINAL_EVENTS:
+                    return
+        finally:
+            pubsub.close()
+
+
+_BROKERS = {"cache": CacheProgressBroker, "redis": RedisProgressBroker}
+
+
+def get_broker():
+    name = getattr(settings, "ORCHESTRATOR_PROGRESS_BROKER", "redis")
+    return _BROKERS[name]()
+
+
+class ProgressReporter:
+    """Callable publishing progress events for one run.
+
+    Publishing never raises: a broker outage must not fail the orchestration.
+    """
+
+    def __init__(self, run_id: str, broker=None):
+        self.run_id = run_id
+        self.broker = broker or get_broker()
+
+    def __call__(self, event: str, **data: Any) -> None:
+        try:
+            self.broker.append(
+                self.run_id,
+                {"event": event, "at": timezone.now().isoformat(), "data": data},
+            )
+        except Exception:
+            logger.warning("Could not publish %s progress for run %s", event, self.run_id, exc_info=True)
+
+
+def completed_team_ids(run_id: str, broker=None) -> list[int]:
+    """Teams a (possibly interrupted) run already finished, for resuming it."""
+    broker = broker or get_broker()
+    return [
+        e["data"]["team_id"] for e in broker.events(run_id) if e["event"] == "team_finished"
+    ]
+
+
+def latest_event(run_id: str, broker=None) -> dict[str, Any] | None:
+    events = (broker or get_broker()).events(run_id)
+    return events[-1] if events else None
+
+
+def format_sse(event: dict[str, Any]) -> bytes:
+    payload = json.dumps(event, cls=DjangoJSONEncoder)
+    return f"id: {event['seq']}\nevent: {event['event']}\ndata: {payload}\n\n".encode()
+
+
+def iter_sse(run_id: str, after: int = 0, timeout: float | None = None, broker=None) -> Iterator[bytes]:
+    """Server-sent-events body for one run: replay, follow, keep-alive.
+
+    The stream closes after a terminal event or ``timeout``; EventSource
+    clients then reconnect with ``Last-Event-ID`` and resume where they were.
+    """
+    broker = broker or get_broker()
+    if timeout is None:
+        timeout = float(getattr(settings, "ORCHESTRATOR_PROGRESS_STREAM_SECONDS", 300))
+    keepalive = 15.0
+    yield b"retry: 3000\n\n"
+    last_write = time.monotonic()
+    for event in broker.listen(run_id, after, timeout):
+        if event is not None:
+            yield format_sse(event)
+            last_write = time.monotonic()
+        elif time.monotonic() - last_write >= keepalive:
+            yield b": keep-alive\n\n"
+            last_write = time.monotonic()
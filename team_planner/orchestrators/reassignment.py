@@ -20,6 +20,7 @@ from django.utils import timezone
 
 from team_planner.employees.models import RecurringLeavePattern
 from team_planner.leaves.models import LeaveRequest
+from team_planner.shifts.models import Shift
 from team_planner.shifts.models import ShiftType
 
 from .models import OrchestrationConstraint
@@ -48,6 +49,153 @@ class ReassignmentStrategy:
     MANUAL_INTERVENTION = "manual_intervention"
 
 
+INCIDENTS_SHIFT_TYPES = (ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY)
+
+
+class ReassignmentSnapshot:
+    """Employees, leave, recurring leave and booked shifts for one window, loaded once.
+
+    Answers the ``ConstraintChecker`` questions asked during conflict detection
+    and resolution from memory, so resolving any number of displaced shifts
+    costs a fixed number of queries. Reassignments made while resolving are
+    booked into the snapshot so later shifts in the same pass see them.
+    """
+
+    def __init__(
+        self,
+        start_datetime: datetime,
+        end_datetime: datetime,
+        team_id: int | None = None,
+        employee_ids: list[int] | None = None,
+    ):
+        # Pad by a day: split coverage checks 08:00-17:00 on any day in range
+        self.window_start = start_datetime - timedelta(days=1)
+        self.window_end = end_datetime + timedelta(days=1)
+        first_day, last_day = self.window_start.date(), self.window_end.date()
+
+        # Same pool as ConstraintChecker.get_available_employees
+        pool = User.objects.filter(
+            is_active=True, employee_profile__status="active",
+        ).select_related("employee_profile")
+        if team_id:
+            pool = pool.filter(teams=team_id)
+        self.pool = list(pool)
+        self.employees = {emp.pk: emp for emp in self.pool}
+        missing = set(employee_ids or ()) - set(self.employees)
+        if missing:
+            self.employees.update(User.objects.in_bulk(missing))
+        ids = list(self.employees)
+
+        self.leaves: dict[int, list[tuple[int, Any, Any]]] = defaultdict(list)
+        for emp_id, leave_id, leave_start, leave_end in LeaveRequest.objects.filter(
+            employee_id__in=ids,
+            status="approved",
+            start_date__lte=last_day,
+            end_date__gte=first_day,
+        ).values_list("employee_id", "pk", "start_date", "end_date"):
+            self.leaves[emp_id].append((leave_id, leave_start, leave_end))
+
+        self.patterns: dict[int, list[RecurringLeavePattern]] = defaultdict(list)
+        for pattern in RecurringLeavePattern.objects.filter(
+            employee_id__in=ids,
+            is_active=True,
+            effective_from__lte=last_day,
+        ).filter(
+            models.Q(effective_until__isnull=True)
+            | models.Q(effective_until__gte=first_day),
+        ):
+            self.patterns[pattern.employee_id].append(pattern)
+
+        self.booked: dict[int, list[tuple[datetime, datetime, str]]] = defaultdict(list)
+        for emp_id, shift_start, shift_end, shift_type in Shift.objects.filter(
+            assigned_employee_id__in=ids,
+            start_datetime__lt=self.window_end,
+            end_datetime__gt=self.window_start,
+            status__in=[Shift.Status.SCHEDULED, Shift.Status.IN_PROGRESS],
+        ).values_list(
+            "assigned_employee_id", "start_datetime", "end_datetime", "template__shift_type",
+        ):
+            self.booked[emp_id].append((shift_start, shift_end, shift_type))
+
+    def candidates(self, shift_type: str) -> list[Any]:
+        """Employees whose profile flags allow this shift type."""
+        if shift_type in INCIDENTS_SHIFT_TYPES:
+            return [e for e in self.pool if e.employee_profile.available_for_incidents]
+        if shift_type == ShiftType.WAAKDIENST:
+            return [e for e in self.pool if e.employee_profile.available_for_waakdienst]
+        return list(self.pool)
+
+    def leaves_for(self, emp_id: int, start_datetime: datetime, end_datetime: datetime) -> list[tuple[int, Any, Any]]:
+        first_day, last_day = start_datetime.date(), end_datetime.date()
+        return [
+            leave for leave in self.leaves.get(emp_id, ())
+            if leave[1] <= last_day and leave[2] >= first_day
+        ]
+
+    def patterns_for(self, emp_id: int, start_datetime: datetime, end_datetime: datetime) -> list[RecurringLeavePattern]:
+        first_day, last_day = start_datetime.date(), end_datetime.date()
+        return [
+            p for p in self.patterns.get(emp_id, ())
+            if p.effective_from <= last_day
+            and (p.effective_until is None or p.effective_until >= first_day)
+        ]
+
+    def has_leave(self, emp_id: int, start_datetime: datetime, end_datetime: datetime) -> bool:
+        return bool(self.leaves_for(emp_id, start_datetime, end_datetime))
+
+    def has_recurring_conflict(
+        self, emp_id: int, start_datetime: datetime, end_datetime: datetime, shift_type: str,
+    ) -> bool:
+        """Same rule as ``ConstraintChecker.check_recurring_pattern_conflicts``."""
+        if shift_type == ShiftType.WAAKDIENST:
+            return False
+        patterns = self.patterns_for(emp_id, start_datetime, end_datetime)
+        if not patterns:
+            return False
+        current_date = start_datetime.date()
+        while current_date <= end_datetime.date():
+            if current_date.weekday() < 5:
+                for pattern in patterns:
+                    affected_hours = pattern.get_affected_hours_for_date(current_date)
+                    if (
+                        affected_hours
+                        and start_datetime < affected_hours["end_datetime"]
+                        and affected_hours["start_datetime"] < end_datetime
+                    ):
+                        return True
+            current_date += timedelta(days=1)
+        return False
+
+    def has_booked_shift(
+        self, emp_id: int, start_datetime: datetime, end_datetime: datetime, shift_type: str,
+    ) -> bool:
+        """Same type-aware rule as ``ConstraintChecker.check_existing_assignments``."""
+        if shift_type in INCIDENTS_SHIFT_TYPES:
+            blocking = INCIDENTS_SHIFT_TYPES
+        elif shift_type == ShiftType.WAAKDIENST:
+            blocking = (ShiftType.WAAKDIENST,)
+        else:
+            blocking = None
+        return any(
+            booked_start < end_datetime
+            and booked_end > start_datetime
+            and (blocking is None or booked_type in blocking)
+            for booked_start, booked_end, booked_type in self.booked.get(emp_id, ())
+        )
+
+    def is_free(
+        self, emp_id: int, start_datetime: datetime, end_datetime: datetime, shift_type: str,
+    ) -> bool:
+        return not (
+            self.has_leave(emp_id, start_datetime, end_datetime)
+            or self.has_recurring_conflict(emp_id, start_datetime, end_datetime, shift_type)
+            or self.has_booked_shift(emp_id, start_datetime, end_datetime, shift_type)
+        )
+
+    def book(self, emp_id: int, start_datetime: datetime, end_datetime: datetime, shift_type: str) -> None:
+        self.booked[emp_id].append((start_datetime, end_datetime, shift_type))
+
+
 class ShiftReassignmentManager:
     """Manages automatic reassignment of shifts when conflicts are detected."""
 
@@ -57,13 +205,35 @@ class ShiftReassignmentManager:
         self.team_id = team_id  # Store team_id for proper filtering
         self.reassignment_log = []
         self.conflicts_detected = []
+        self.current_plan_assignments = []
         self._employee_cache = {}  # Cache to avoid repeated DB queries
+        # Loaded once per detect/resolve pass; see ReassignmentSnapshot
+        self.snapshot: ReassignmentSnapshot | None = None
+        self._plan_load: dict[int, dict[str, float]] | None = None
+        self._pending_constraints: list[OrchestrationConstraint] = []
+
+    def _load_snapshot(self, assignments: list[dict]) -> ReassignmentSnapshot | None:
+        """Load leave, patterns and booked shifts for the window the assignments span."""
+        if not assignments:
+            return None
+        employee_ids = [
+            a["assigned_employee_id"] if "assigned_employee_id" in a else a["assigned_employee"].pk
+            for a in assignments
+        ]
+        return ReassignmentSnapshot(
+            min(a["start_datetime"] for a in assignments),
+            max(a["end_datetime"] for a in assignments),
+            team_id=self.team_id,
+            employee_ids=employee_ids,
+        )
 
     def _get_employee_from_assignment(self, assignment: dict) -> Any:
         """Get employee object from assignment dict, handling both old and new formats."""
         # Handle new format with assigned_employee_id
         if "assigned_employee_id" in assignment:
             employee_id = assignment["assigned_employee_id"]
+            if self.snapshot and employee_id in self.snapshot.employees:
+                return self.snapshot.employees[employee_id]
             if employee_id not in self._employee_cache:
                 self._employee_cache[employee_id] = User.objects.get(pk=employee_id)
             return self._employee_cache[employee_id]
@@ -97,8 +267,14 @@ class ShiftReassignmentManager:
         """
         # Keep a reference to the plan to use for fairness sorting during reassignments
         self.current_plan_assignments = list(assignments)
+        self.snapshot = self._load_snapshot(assignments)
         conflicts = []
 
+        # Double assignments can only occur between one employee's own shifts
+        by_employee = defaultdict(list)
+        for assignment in assignments:
+            by_employee[self._get_employee_from_assignment(assignment).pk].append(assignment)
+
         for assignment in assignments:
             # Check for recurring leave conflicts
             recurring_conflicts = self._check_recurring_leave_conflicts(assignment)
@@ -110,7 +286,7 @@ class ShiftReassignmentManager:
 
             # Check for double assignment conflicts
             double_conflicts = self._check_double_assignment_conflicts(
-                assignment, assignments,
+                assignment, by_employee[self._get_employee_from_assignment(assignment).pk],
             )
             conflicts.extend(double_conflicts)
 
@@ -130,14 +306,9 @@ class ShiftReassignmentManager:
             return conflicts
 
         # Get active recurring patterns for this employee
-        patterns = RecurringLeavePattern.objects.filter(
-            employee=employee,
-            is_active=True,
-            effective_from__lte=end_datetime.date(),
-        ).filter(
-            models.Q(effective_until__isnull=True)
-            | models.Q(effective_until__gte=start_datetime.date()),
-        )
+        patterns = self.snapshot.patterns_for(employee.pk, start_datetime, end_datetime)
+        if not patterns:
+            return conflicts
 
         # Check each day in the assignment period
         current_date = start_datetime.date()
@@ -189,25 +360,20 @@ class ShiftReassignmentManager:
         end_datetime = assignment["end_datetime"]
 
         # Check for approved leave requests that overlap
-        leave_requests = LeaveRequest.objects.filter(
-            employee=employee,
-            status="approved",
-            start_date__lte=end_datetime.date(),
-            end_date__gte=start_datetime.date(),
-        )
-
-        for leave_request in leave_requests:
+        for leave_id, leave_start, leave_end in self.snapshot.leaves_for(
+            employee.pk, start_datetime, end_datetime,
+        ):
             conflicts.append(
                 {
                     "type": ConflictType.APPROVED_LEAVE,
                     "assignment": assignment,
                     "employee_id": employee.pk,
                     "employee_name": employee.get_full_name(),
-                    "leave_request_id": leave_request.pk,
-                    "leave_start_date": str(leave_request.start_date),
-                    "leave_end_date": str(leave_request.end_date),
+                    "leave_request_id": leave_id,
+                    "leave_start_date": str(leave_start),
+                    "leave_end_date": str(leave_end),
                     "severity": "critical",
-                    "description": f"Approved leave conflict: {leave_request.start_date} to {leave_request.end_date}",
+                    "description": f"Approved leave conflict: {leave_start} to {leave_end}",
                 },
             )
 
@@ -216,7 +382,10 @@ class ShiftReassignmentManager:
     def _check_double_assignment_conflicts(
         self, assignment: dict, all_assignments: list[dict],
     ) -> list[dict]:
-        """Check for double assignment conflicts (incidents + incidents-standby)."""
+        """Check for double assignment conflicts (incidents + incidents-standby).
+
+        ``all_assignments`` may be narrowed to the employee's own assignments.
+        """
         conflicts = []
         employee = self._get_employee_from_assignment(assignment)
         shift_type = assignment["shift_type"]
@@ -267,6 +436,11 @@ class ShiftReassignmentManager:
             List of reassignment actions taken
         """
         reassignments = []
+        if self.snapshot is None:
+            self.snapshot = self._load_snapshot(
+                self.current_plan_assignments or [c["assignment"] for c in conflicts],
+            )
+        self._plan_load = None
 
         # Group conflicts by assignment to handle them efficiently
         conflicts_by_assignment = defaultdict(list)
@@ -289,6 +463,8 @@ class ShiftReassignmentManager:
             if reassignment:
                 reassignments.append(reassignment)
 
+        # All audit records of this pass are written together
+        self._flush_constraint_records()
         self.reassignment_log.extend(reassignments)
         return reassignments
 
@@ -384,24 +560,7 @@ class ShiftReassignmentManager:
             return self._escalate_to_manual(assignment, conflicts)
 
         # Sort by least hours in this shift type within the current plan (fallback to DB if needed)
-        if self.fairness_calculator:
-            try:
-                load_map = self.fairness_calculator.calculate_provisional_assignments(
-                    self.current_plan_assignments,
-                )
-                def key(emp):
-                    return load_map.get(emp.pk, {}).get(shift_type.lower(), 0.0)
-            except Exception:
-                current_assignments = (
-                    self.fairness_calculator.calculate_current_assignments(
-                        available_employees,
-                    )
-                )
-                def key(emp):
-                    return current_assignments.get(emp.pk, {}).get(
-                                    shift_type.lower(), 0.0,
-                                )
-            available_employees.sort(key=key)
+        self._sort_by_plan_load(available_employees, shift_type)
 
         # Select the best candidate
         new_employee = available_employees[0]
@@ -420,8 +579,10 @@ class ShiftReassignmentManager:
             "success": True,
         }
 
-        # Update the assignment
+        # Update the assignment and keep the snapshot and plan loads in step
         self._update_assignment_employee(assignment, new_employee)
+        self.snapshot.book(new_employee.pk, start_datetime, end_datetime, shift_type)
+        self._move_plan_load(assignment, original_employee.pk, new_employee.pk)
         assignment["assignment_reason"] = (
             f"Reassigned from {original_employee.username} due to conflicts"
         )
@@ -560,88 +721,35 @@ class ShiftReassignmentManager:
         self, shift_type: str, conflict_days: list, exclude_employee: Any,
     ) -> Any | None:
         """Find an employee available to cover specific conflict days."""
-        # Get all potentially available employees
-        from .algorithms import ConstraintChecker
-
-        # Use the first conflict day to create datetime range
-        first_day = min(conflict_days)
-        last_day = max(conflict_days)
-        start_datetime = timezone.make_aware(datetime.combine(first_day, time(8, 0)))
-        end_datetime = timezone.make_aware(datetime.combine(last_day, time(17, 0)))
-
-        constraint_checker = ConstraintChecker(
-            start_datetime,
-            end_datetime,
-            team_id=getattr(self.orchestration_run, "team_id", None),
-        )
-
-        all_available = constraint_checker.get_available_employees(shift_type)
+        day_windows = [
+            (
+                timezone.make_aware(datetime.combine(conflict_day, time(8, 0))),
+                timezone.make_aware(datetime.combine(conflict_day, time(17, 0))),
+            )
+            for conflict_day in conflict_days
+        ]
 
         # Filter for employees available on ALL conflict days
-        suitable_employees = []
-        for emp in all_available:
-            if emp.pk == exclude_employee.pk:
-                continue
-
-            # Check if employee is available for all conflict days
-            available_for_all_days = True
-            for conflict_day in conflict_days:
-                day_start = timezone.make_aware(
-                    datetime.combine(conflict_day, time(8, 0)),
-                )
-                day_end = timezone.make_aware(
-                    datetime.combine(conflict_day, time(17, 0)),
-                )
-
-                # Check for leave conflicts on this specific day
-                if constraint_checker.check_leave_conflicts(emp, day_start, day_end):
-                    available_for_all_days = False
-                    break
-
-                # Check for recurring pattern conflicts on this specific day
-                if constraint_checker.check_recurring_pattern_conflicts(
-                    emp, day_start, day_end, shift_type,
-                ):
-                    available_for_all_days = False
-                    break
-
-                # Check for existing assignments on this specific day
-                if constraint_checker.check_existing_assignments(
-                    emp, day_start, day_end, shift_type,
-                ):
-                    available_for_all_days = False
-                    break
-
-            if available_for_all_days:
-                suitable_employees.append(emp)
+        suitable_employees = [
+            emp
+            for emp in self.snapshot.candidates(shift_type)
+            if emp.pk != exclude_employee.pk
+            and all(
+                self.snapshot.is_free(emp.pk, day_start, day_end, shift_type)
+                for day_start, day_end in day_windows
+            )
+        ]
 
         if not suitable_employees:
             return None
 
         # Sort by least hours in this shift type within the current plan (fallback to DB if needed)
-        if self.fairness_calculator:
-            try:
-                load_map = self.fairness_calculator.calculate_provisional_assignments(
-                    self.current_plan_assignments,
-                )
-                suitable_employees.sort(
-                    key=lambda emp: load_map.get(emp.pk, {}).get(
-                        shift_type.lower(), 0.0,
-                    ),
-                )
-            except Exception:
-                current_assignments = (
-                    self.fairness_calculator.calculate_current_assignments(
-                        suitable_employees,
-                    )
-                )
-                suitable_employees.sort(
-                    key=lambda emp: current_assignments.get(emp.pk, {}).get(
-                        shift_type.lower(), 0.0,
-                    ),
-                )
+        self._sort_by_plan_load(suitable_employees, shift_type)
 
-        return suitable_employees[0]
+        replacement = suitable_employees[0]
+        for day_start, day_end in day_windows:
+            self.snapshot.book(replacement.pk, day_start, day_end, shift_type)
+        return replacement
 
     def create_split_shift_assignments(
         self, original_assignment: dict, split_info: dict,
@@ -737,44 +845,49 @@ class ShiftReassignmentManager:
         exclude_employee: Any,
     ) -> list[Any]:
         """Get employees available for reassignment, excluding the original employee."""
-        from .algorithms import ConstraintChecker
-
-        # Create a temporary constraint checker
-        constraint_checker = ConstraintChecker(
-            start_datetime,
-            end_datetime,
-            team_id=self.team_id,  # Use the team_id passed to the constructor
-        )
-
-        # Get all available employees
-        all_available = constraint_checker.get_available_employees(shift_type)
-
-        # Filter out the original employee and those with conflicts
-        available_for_reassignment = []
-        for emp in all_available:
-            if emp.pk == exclude_employee.pk:
-                continue
-
-            # Check if this employee has conflicts for this specific time period
-            if not constraint_checker.check_leave_conflicts(
-                emp, start_datetime, end_datetime,
-            ):
-                if not constraint_checker.check_recurring_pattern_conflicts(
-                    emp, start_datetime, end_datetime, shift_type,
-                ):
-                    # Check if employee already has existing incidents/incidents-standby assignments
-                    if not constraint_checker.check_existing_assignments(
-                        emp, start_datetime, end_datetime, shift_type,
-                    ):
-                        available_for_reassignment.append(emp)
+        # Leave, recurring leave and existing incidents/waakdienst shifts, from the snapshot
+        return [
+            emp
+            for emp in self.snapshot.candidates(shift_type)
+            if emp.pk != exclude_employee.pk
+            and self.snapshot.is_free(emp.pk, start_datetime, end_datetime, shift_type)
+        ]
 
-        return available_for_reassignment
+    def _sort_by_plan_load(self, employees: list[Any], shift_type: str) -> None:
+        """Order candidates by hours of this shift type in the current plan, least first."""
+        if not self.fairness_calculator:
+            return
+        load_key = shift_type.lower()
+        try:
+            if self._plan_load is None:
+                self._plan_load = self.fairness_calculator.calculate_provisional_assignments(
+                    self.current_plan_assignments,
+                )
+            load_map = self._plan_load
+        except Exception:
+            load_map = self.fairness_calculator.calculate_current_assignments(employees)
+        employees.sort(key=lambda emp: load_map.get(emp.pk, {}).get(load_key, 0.0))
+
+    def _move_plan_load(self, assignment: dict, from_id: int, to_id: int) -> None:
+        """Shift an assignment's hours between employees in the cached plan loads."""
+        if self._plan_load is None:
+            return
+        hours = assignment.get("duration_hours")
+        if hours is None:
+            weighted = getattr(self.fairness_calculator, "_weighted_hours", None)
+            start, end = assignment["start_datetime"], assignment["end_datetime"]
+            hours = weighted(start, end) if weighted else (end - start).total_seconds() / 3600
+        load_key = assignment["shift_type"].lower()
+        for emp_id, delta in ((from_id, -hours), (to_id, hours)):
+            loads = self._plan_load.setdefault(emp_id, {})
+            loads[load_key] = loads.get(load_key, 0.0) + delta
+            loads["total_hours"] = loads.get("total_hours", 0.0) + delta
 
     def _create_constraint_violation_record(self, employee: Any, conflicts: list[dict]):
-        """Create a constraint violation record for audit purposes."""
-        with transaction.atomic():
-            for conflict in conflicts:
-                OrchestrationConstraint.objects.create(
+        """Queue a constraint violation record for audit purposes."""
+        for conflict in conflicts:
+            self._pending_constraints.append(
+                OrchestrationConstraint(
                     orchestration_run=self.orchestration_run,
                     constraint_type=OrchestrationConstraint.ConstraintType.LEAVE_CONFLICT,
                     severity=OrchestrationConstraint.Severity.HARD,
@@ -788,7 +901,15 @@ class ShiftReassignmentManager:
                     description=conflict["description"],
                     violations_count=1,
                     violation_details=f"Conflict type: {conflict['type']}, Resolved: {conflict.get('resolved', False)}",
-                )
+                ),
+            )
+
+    def _flush_constraint_records(self) -> None:
+        """Write all queued constraint violation records in one transaction."""
+        pending, self._pending_constraints = self._pending_constraints, []
+        if pending:
+            with transaction.atomic():
+                OrchestrationConstraint.objects.bulk_create(pending)
 
     def get_reassignment_summary(self) -> dict[str, Any]:
         """Get a summary of all reassignments performed."""
@@ -0,0 +1,32 @@
+"""
+Django signals for the orchestrators app.
+
+Keeps the process-wide shift template map (see templates.py) in step with
+template edits made in this process, and drops the metrics snapshot (see
+metrics.py) when runs or employee profiles change.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from team_planner.employees.models import EmployeeProfile
+from team_planner.shifts.models import ShiftTemplate
+
+from .metrics import invalidate_metrics_snapshot
+from .models import OrchestrationRun
+from .templates import template_cache
+
+
+@receiver(post_save, sender=ShiftTemplate)
+@receiver(post_delete, sender=ShiftTemplate)
+def invalidate_shift_templates(sender, instance, **kwargs):
+    template_cache.invalidate()
+
+
+@receiver(post_save, sender=OrchestrationRun)
+@receiver(post_delete, sender=OrchestrationRun)
+@receiver(post_save, sender=EmployeeProfile)
+@receiver(post_delete, sender=EmployeeProfile)
+def invalidate_metrics(sender, instance, **kwargs):
+    transaction.on_commit(invalidate_metrics_snapshot)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import asdict
 from dataclasses import dataclass
 from datetime import datetime
@@ -8,18 +9,26 @@ from typing import TYPE_CHECKING
 from typing import Any
 
 from celery import shared_task
+from celery.exceptions import SoftTimeLimitExceeded
 from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 
+from team_planner.orchestrators.history import HistoryScope
+from team_planner.orchestrators.history import purge_history
+from team_planner.orchestrators.metrics import refresh_metrics_snapshot
+from team_planner.orchestrators.progress import ProgressReporter
 from team_planner.orchestrators.unified import UnifiedOrchestrator
 from team_planner.shifts.models import Shift
 from team_planner.shifts.models import ShiftType
 from team_planner.teams.models import Team
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from collections.abc import Iterable
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class TeamHorizonReport:
@@ -44,6 +53,7 @@ def _plan_for_team(
     end_dt: datetime,
     dry_run: bool,
     shift_types: list[str] | None = None,
+    progress: Callable[..., None] | None = None,
 ) -> TeamHorizonReport:
     # Determine which shift types to schedule
     include_incidents = True if shift_types is None else ("incidents" in shift_types)
@@ -68,6 +78,7 @@ def _plan_for_team(
             end_date=end_dt,
             shift_types=[ShiftType.INCIDENTS],
             dry_run=dry_run,
+            progress=progress,
         )
 
         if dry_run:
@@ -87,6 +98,7 @@ def _plan_for_team(
             end_date=end_dt,
             shift_types=[ShiftType.INCIDENTS_STANDBY],
             dry_run=dry_run,
+            progress=progress,
         )
 
         if dry_run:
@@ -106,6 +118,7 @@ def _plan_for_team(
             end_date=end_dt,
             shift_types=[ShiftType.WAAKDIENST],
             dry_run=dry_run,
+            progress=progress,
         )
 
         if dry_run:
@@ -138,6 +151,9 @@ def extend_rolling_horizon_core(
     team_ids: Iterable[int] | None = None,
     weeks: int | None = None,
     shift_types: list[str] | None = None,
+    progress: Callable[..., None] | None = None,
+    exclude_team_ids: Iterable[int] | None = None,
+    max_teams: int | None = None,
 ) -> dict[str, Any]:
     """Extend schedules up to now + N months or weeks using complete, anchor-aligned periods per team.
 
@@ -147,6 +163,10 @@ def extend_rolling_horizon_core(
     - No partial periods are generated (orchestrator generators enforce anchors).
     - Idempotent: relies on unique constraints and duplicate skipping.
     - Scopes to teams with at least one active member.
+    - ``progress`` (a ProgressReporter) receives team and period events.
+    - ``exclude_team_ids`` skips teams an interrupted run already finished;
+      ``max_teams`` plans at most that many teams and returns the rest in
+      ``remaining_team_ids`` so a caller can continue in chunks.
     """
     now = timezone.now()
 
@@ -162,15 +182,23 @@ def extend_rolling_horizon_core(
     if team_ids:
         qs = qs.filter(id__in=list(team_ids))
 
+    if exclude_team_ids:
+        qs = qs.exclude(id__in=list(exclude_team_ids))
+
     # Only plan for teams that have active memberships
-    qs = qs.filter(teammembership__is_active=True).distinct()
+    teams = list(qs.filter(teammembership__is_active=True).distinct().order_by("pk"))
+    remaining: list[Team] = []
+    if max_teams and len(teams) > max_teams:
+        teams, remaining = teams[:max_teams], teams[max_teams:]
+    if progress:
+        progress("started", team_ids=[t.pk for t in teams], end=end_dt.isoformat(), dry_run=dry_run)
 
     require_seed = bool(getattr(settings, "ORCHESTRATOR_AUTO_ROLL_REQUIRES_SEED", True))
     min_seed_weeks = int(getattr(settings, "ORCHESTRATOR_MIN_SEED_WEEKS", 26))
     seed_target_dt = now + timedelta(weeks=max(1, min_seed_weeks))
 
     reports: list[TeamHorizonReport] = []
-    for team in qs:
+    for team in teams:
         if require_seed:
             has_seed = Shift.objects.filter(
                 assigned_employee__teams=team,
@@ -178,13 +206,20 @@ def extend_rolling_horizon_core(
                 status__in=[Shift.Status.SCHEDULED, Shift.Status.IN_PROGRESS],
             ).exists()
             if not has_seed:
+                if progress:
+                    progress("team_skipped", team_id=team.pk, reason="no_seed_plan")
                 continue
 
+        if progress:
+            progress("team_started", team_id=team.pk, team_name=str(team))
         start_dt = now
         report = _plan_for_team(
             team, start_dt, end_dt, dry_run=dry_run, shift_types=shift_types,
+            progress=progress,
         )
         reports.append(report)
+        if progress:
+            progress("team_finished", **report.to_dict())
 
     return {
         "now": now,
@@ -199,26 +234,109 @@ def extend_rolling_horizon_core(
             "incidents_standby": sum(r.incidents_standby for r in reports),
             "waakdienst": sum(r.waakdienst for r in reports),
         },
+        "remaining_team_ids": [t.pk for t in remaining],
     }
 
 
-@shared_task(name="orchestrators.extend_rolling_horizon")
+@shared_task(bind=True, name="orchestrators.extend_rolling_horizon")
 def extend_rolling_horizon_task(
+    self,
     months: int = 6,
     dry_run: bool = False,
     team_ids: list[int] | None = None,
     weeks: int | None = None,
     shift_types: list[str] | None = None,
+    exclude_team_ids: list[int] | None = None,
+    chunk_size: int | None = None,
+    progress_id: str | None = None,
 ) -> dict[str, Any]:
     """Celery task wrapper for rolling horizon extension.
 
+    Progress events are published under ``progress_id`` (default: this task's
+    id) for the server-sent-events endpoint. With ``chunk_size`` only that many
+    teams are planned per task and the rest continues in a follow-up task that
+    reports to the same stream, keeping each task under the time limits.
+
     Example dispatch:
       extend_rolling_horizon_task.delay(weeks=26, dry_run=False, shift_types=['incidents','waakdienst'])
     """
-    return extend_rolling_horizon_core(
-        months=months,
-        dry_run=dry_run,
-        team_ids=team_ids,
-        weeks=weeks,
-        shift_types=shift_types,
+    run_id = progress_id or self.request.id
+    progress = ProgressReporter(run_id) if run_id else None
+    try:
+        result = extend_rolling_horizon_core(
+            months=months,
+            dry_run=dry_run,
+            team_ids=team_ids,
+            weeks=weeks,
+            shift_types=shift_types,
+            progress=progress,
+            exclude_team_ids=exclude_team_ids,
+            max_teams=chunk_size,
+        )
+    except Exception as e:
+        if progress:
+            reason = "time_limit" if isinstance(e, SoftTimeLimitExceeded) else str(e)
+            progress("failed", reason=reason, resumable=True)
+        raise
+
+    if result["remaining_team_ids"]:
+        next_task = extend_rolling_horizon_task.apply_async(
+            kwargs={
+                "months": months,
+                "dry_run": dry_run,
+                "team_ids": result["remaining_team_ids"],
+                "weeks": weeks,
+                "shift_types": shift_types,
+                "chunk_size": chunk_size,
+                "progress_id": run_id,
+            },
+        )
+        result["next_task_id"] = next_task.id
+        if progress:
+            progress("chunk_finished", totals=result["totals"], next_task_id=next_task.id)
+    elif progress:
+        progress("finished", totals=result["totals"])
+    return result
+
+
+@shared_task(name="orchestrators.refresh_metrics_snapshot")
+def refresh_metrics_snapshot_task() -> str:
+    """Recompute the status dashboard's metrics snapshot (see metrics.py)."""
+    return refresh_metrics_snapshot()["computed_at"]
+
+
+@shared_task(bind=True, name="orchestrators.reset_assignment_history")
+def reset_assignment_history_task(
+    self,
+    cutoff: str,
+    employee_id: int | None = None,
+    team_id: int | None = None,
+    requested_by: str | None = None,
+) -> dict[str, Any]:
+    """Purge assignment history since ``cutoff`` (ISO datetime) in batches.
+
+    Publishes ``started``, one ``batch_deleted`` per batch and
+    ``finished``/``failed`` under this task's id (see history.py).
+    """
+    progress = ProgressReporter(self.request.id) if self.request.id else None
+    scope = HistoryScope(
+        cutoff=datetime.fromisoformat(cutoff), employee_id=employee_id, team_id=team_id,
+    )
+    if progress:
+        progress("started", cutoff=cutoff, employee_id=employee_id, team_id=team_id)
+    try:
+        totals = purge_history(scope, progress=progress)
+    except Exception as e:
+        if progress:
+            progress("failed", reason=str(e))
+        raise
+    logger.info(
+        "Assignment history reset by %s: %s shifts, %s runs, %s results deleted",
+        requested_by,
+        totals["shifts_deleted"],
+        totals["runs_deleted"],
+        totals["results_deleted"],
     )
+    if progress:
+        progress("finished", totals=totals)
+    return totals
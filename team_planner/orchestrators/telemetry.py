@@ -0,0 +1,115 @@
+"""
+Per-phase telemetry for orchestration runs.
+
+Orchestrators wrap their stages (employee loading, fairness, assignment,
+reassignment, persistence, ...) in ``RunTelemetry.phase()``. Each phase
+accumulates wall-clock seconds, SQL queries, rows produced and the number of
+times it ran; phases opened inside another phase are keyed ``parent/child``.
+The result is stored on ``OrchestrationRun.phase_metrics`` together with the
+run totals, so a slow run can be broken down without re-running it.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import replace
+from typing import TYPE_CHECKING
+from typing import Any
+
+from django.db import connection
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from .models import OrchestrationRun
+
+
+class QueryCounter:
+    """Execute wrapper counting queries; unlike CaptureQueriesContext it has no 9000 cap."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@dataclass
+class PhaseStats:
+    seconds: float = 0.0
+    queries: int = 0
+    # Rows the phase produced (assignments planned, shifts written, ...)
+    rows: int = 0
+    calls: int = 0
+
+
+class RunTelemetry:
+    """Accumulates phase statistics over the lifetime of one orchestrator."""
+
+    def __init__(self):
+        self.phases: dict[str, PhaseStats] = {}
+        self._stack: list[str] = []
+
+    def _key(self, name: str) -> str:
+        return "/".join([*self._stack, name])
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[PhaseStats]:
+        """Time a phase and count its queries; set ``rows`` on the yielded stats.
+
+        Re-entering a phase adds to its totals, so per-week loops report one
+        entry with ``calls`` > 1.
+        """
+        key = self._key(name)
+        stats = self.phases.setdefault(key, PhaseStats())
+        counter = QueryCounter()
+        self._stack.append(name)
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(counter):
+                yield stats
+        finally:
+            stats.seconds += time.perf_counter() - started
+            stats.queries += counter.count
+            stats.calls += 1
+            self._stack.pop()
+
+    def merge(self, other: RunTelemetry, under: str | None = None) -> None:
+        """Copy another orchestrator's phases in, optionally below phase ``under``.
+
+        ``other`` holds running totals itself, so merged entries are replaced
+        rather than added to.
+        """
+        prefix = "/".join([*self._stack, under] if under else self._stack)
+        for key, stats in other.phases.items():
+            self.phases[f"{prefix}/{key}" if prefix else key] = replace(stats)
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(s.seconds for k, s in self.phases.items() if "/" not in k)
+
+    @property
+    def total_queries(self) -> int:
+        return sum(s.queries for k, s in self.phases.items() if "/" not in k)
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        data = {}
+        for key, stats in self.phases.items():
+            entry = asdict(stats)
+            entry["seconds"] = round(stats.seconds, 4)
+            data[key] = entry
+        return data
+
+    def apply_to(self, run: OrchestrationRun) -> None:
+        """Copy the metrics onto ``run`` without saving it."""
+        run.phase_metrics = self.as_dict()
+        run.duration_seconds = round(self.total_seconds, 4)
+        run.query_count = self.total_queries
+
+    def save_to_run(self, run: OrchestrationRun) -> None:
+        self.apply_to(run)
+        run.save(update_fields=["phase_metrics", "duration_seconds", "query_count", "modified"])
@@ -0,0 +1,129 @@
+"""
+Process-wide shift template map for the orchestrators.
+
+Every generated shift needs a ``ShiftTemplate``; looking it up per shift cost
+one (or two, with get-or-create) queries per day of a multi-week run. The
+orchestrators instead resolve templates through ``template_cache``:
+
+    template_cache.refresh()                      # once, at the start of a run
+    template_cache.resolve("incidents", 9)        # memoized per (type, duration)
+    template_cache.active("waakdienst")           # active templates of a type
+    template_cache.get(template_id)               # persist paths
+
+``refresh()`` compares a one-query fingerprint (count, highest pk, latest
+modification) with the loaded snapshot and only reloads when it changed, which
+also picks up edits made by other processes. Saves and deletes in this process
+invalidate the map immediately via the signal receivers in ``signals.py``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from django.db.models import Count
+from django.db.models import Max
+
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.shifts.models import ShiftType
+
+logger = logging.getLogger(__name__)
+
+
+def default_duration_hours(shift_type: str) -> int:
+    """Duration given to an auto-created template of ``shift_type``."""
+    if shift_type in (ShiftType.INCIDENTS, ShiftType.INCIDENTS_STANDBY):
+        return 9  # 08:00-17:00
+    if shift_type == ShiftType.WAAKDIENST:
+        return 15  # Average daily shift (varies from 15-24 hours)
+    return 8
+
+
+class ShiftTemplateCache:
+    """Active shift templates grouped by type, plus resolved defaults."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._fingerprint: tuple | None = None
+        self._by_pk: dict[int, ShiftTemplate] = {}
+        self._active: dict[str, list[ShiftTemplate]] = {}
+        self._resolved: dict[tuple[str, int], ShiftTemplate] = {}
+
+    def _current_fingerprint(self) -> tuple:
+        stats = ShiftTemplate.objects.aggregate(
+            count=Count("pk"), last_pk=Max("pk"), last_modified=Max("modified"),
+        )
+        return (stats["count"], stats["last_pk"], stats["last_modified"])
+
+    def refresh(self) -> None:
+        """Reload the map if templates changed since it was loaded."""
+        with self._lock:
+            fingerprint = self._current_fingerprint()
+            if fingerprint == self._fingerprint:
+                return
+            templates = list(ShiftTemplate.objects.all())
+            self._by_pk = {t.pk: t for t in templates}
+            self._active = {}
+            for template in templates:
+                if template.is_active:
+                    self._active.setdefault(template.shift_type, []).append(template)
+            self._resolved = {}
+            self._fingerprint = fingerprint
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._fingerprint = None
+
+    def _ensure_loaded(self) -> None:
+        if self._fingerprint is None:
+            self.refresh()
+
+    def active(self, shift_type: str) -> list[ShiftTemplate]:
+        """Active templates of ``shift_type`` in the model's default ordering."""
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._active.get(shift_type, []))
+
+    def get(self, pk: int) -> ShiftTemplate:
+        """Template by primary key; raises ``ShiftTemplate.DoesNotExist``."""
+        with self._lock:
+            self._ensure_loaded()
+            template = self._by_pk.get(pk)
+        if template is None:
+            template = ShiftTemplate.objects.get(pk=pk)
+        return template
+
+    def resolve(self, shift_type: str, duration_hours: int | None = None) -> ShiftTemplate:
+        """First active template of ``shift_type``, creating a default if none exist.
+
+        ``duration_hours`` is the duration a created template gets (defaults
+        per shift type); results are memoized per (type, duration).
+        """
+        if duration_hours is None:
+            duration_hours = default_duration_hours(shift_type)
+        key = (shift_type, duration_hours)
+        with self._lock:
+            self._ensure_loaded()
+            template = self._resolved.get(key)
+            if template is not None:
+                return template
+            candidates = self._active.get(shift_type)
+            if candidates:
+                template = candidates[0]
+            else:
+                template = ShiftTemplate.objects.create(
+                    shift_type=shift_type,
+                    name=f"{shift_type.replace('_', '-').title()} Daily Shift",
+                    description=f"Individual daily shift for {shift_type.replace('_', '-')}",
+                    duration_hours=duration_hours,
+                    is_active=True,
+                )
+                logger.info(f"Created new shift template for {shift_type}")
+                # The post_save receiver invalidated the map; reload it now so
+                # the memo below survives until the next change
+                self.refresh()
+            self._resolved[key] = template
+            return template
+
+
+template_cache = ShiftTemplateCache()
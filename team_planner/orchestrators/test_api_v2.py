@@ -22,6 +22,7 @@ from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 from rest_framework.test import APITestCase
 
+from .models import OrchestrationRun
 from .test_utils import TestDataFactory
 
 User = get_user_model()
@@ -407,6 +408,54 @@ class SystemMetricsAPITest(OrchestratorV2APITestCase):
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
+class RunTelemetryAPITest(OrchestratorV2APITestCase):
+    """Test the GET /api/orchestrator-status/runs/ endpoint."""
+
+    def _create_run(self, name, duration_seconds, query_count):
+        return OrchestrationRun.objects.create(
+            name=name,
+            initiated_by=self.admin_user,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            status=OrchestrationRun.Status.COMPLETED,
+            duration_seconds=duration_seconds,
+            query_count=query_count,
+            phase_metrics={
+                "persist": {"seconds": duration_seconds, "queries": query_count, "rows": 1, "calls": 1},
+            },
+        )
+
+    def test_runs_ordered_by_duration_and_queries(self):
+        self._create_run("fast", 1.5, 900)
+        self._create_run("slow", 12.0, 300)
+        OrchestrationRun.objects.create(
+            name="untracked",
+            initiated_by=self.admin_user,
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+        self.authenticate_admin()
+
+        response = self.client.get("/api/orchestrator-status/runs/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["name"] for r in response.data["runs"]] == ["slow", "fast"]
+        assert response.data["runs"][0]["phases"]["persist"]["seconds"] == 12.0
+
+        response = self.client.get("/api/orchestrator-status/runs/?ordering=queries&limit=1")
+        assert [r["name"] for r in response.data["runs"]] == ["fast"]
+
+        response = self.client.get("/api/orchestrator-status/runs/?ordering=bogus")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_run_telemetry_staff_only(self):
+        self.authenticate_regular()
+
+        response = self.client.get("/api/orchestrator-status/runs/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
 class LegacyAPICompatibilityTest(OrchestratorV2APITestCase):
     """Test existing legacy API endpoints for backward compatibility."""
 
@@ -288,6 +288,75 @@ class ShiftOrchestratorTestCase(TestCase, BaseTestCase):
         # Should detect potential duplicates
         assert "potential_duplicates" in result
 
+    def test_optimal_mode_covers_each_week_with_one_employee(self):
+        """Optimal mode assigns whole weeks and reports its timings."""
+        orchestrator = ShiftOrchestrator(
+            self.start_date,
+            self.month_end_date,
+            team_id=self.team.pk,
+            schedule_incidents=True,
+            schedule_waakdienst=False,
+            assignment_mode="optimal",
+        )
+
+        result = orchestrator.preview_schedule()
+
+        assert result["assignment_mode"] == "optimal"
+        assert "incidents" in result["solver_timings"]
+        weeks: dict = {}
+        for assignment in result["assignments"]:
+            weeks.setdefault(assignment["week_start_date"], set()).add(
+                assignment["assigned_employee_id"],
+            )
+        assert len(weeks) == 4
+        assert all(len(emp_ids) == 1 for emp_ids in weeks.values())
+        # Four weeks over the incidents-capable employees: nobody gets a
+        # second week while a colleague has none
+        counts = [
+            sum(1 for emp_ids in weeks.values() if emp.pk in emp_ids)
+            for emp in self.employees
+            if emp.employee_profile.available_for_incidents
+        ]
+        assert max(counts) - min(counts) <= 1
+
+
+class OptimalAssignmentTestCase(TestCase):
+    """Test the min-cost-flow roster solver."""
+
+    def test_fills_fairness_deficits_first(self):
+        from .optimal import solve_fair_assignment
+
+        roster = solve_fair_assignment(
+            units=[0, 1, 2],
+            candidates={0: [1, 2], 1: [1, 2], 2: [1, 2]},
+            baseline_hours={1: 90.0, 2: 0.0},
+            unit_hours=45.0,
+        )
+
+        # Employee 2 is two weeks behind, so takes two of the three weeks
+        assert sorted(roster.values()) == [1, 2, 2]
+
+    def test_balances_equal_employees(self):
+        from .optimal import solve_fair_assignment
+
+        roster = solve_fair_assignment(
+            units=[0, 1, 2, 3],
+            candidates=dict.fromkeys(range(4), [1, 2]),
+            baseline_hours={},
+            unit_hours=45.0,
+        )
+
+        assert sorted(roster.values()) == [1, 1, 2, 2]
+
+    def test_uncoverable_week_is_omitted(self):
+        from .optimal import solve_fair_assignment
+
+        roster = solve_fair_assignment(
+            units=[0, 1], candidates={0: [1], 1: []}, baseline_hours={}, unit_hours=45.0,
+        )
+
+        assert roster == {0: 1}
+
 
 class OrchestrationAPITestCase(APITestCase):
     """Test the orchestration API endpoints."""
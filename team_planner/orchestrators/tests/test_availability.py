@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from team_planner.employees.models import RecurringLeavePattern
+from team_planner.leaves.models import LeaveRequest
+from team_planner.leaves.models import LeaveType
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.shifts.models import ShiftType
+from team_planner.users.models import User
+
+TUESDAY = date(2030, 1, 8)
+
+
+def _availability(client, department, shift_type):
+    response = client.get(
+        "/api/orchestrator/availability/",
+        {
+            "date": TUESDAY.isoformat(),
+            "shift_type": shift_type,
+            "department_id": str(department.pk),
+        },
+    )
+    assert response.status_code == 200
+    return {
+        int(e["id"]): [c["type"] for c in e["conflicts"]]
+        for e in response.data["unavailable_employees"]
+    }
+
+
+@pytest.mark.django_db
+def test_conflicts_include_shifts_leave_and_patterns_grouped_per_employee():
+    scenario = BenchmarkScenario(
+        name="availability", employees=6, weeks=1, leave_ratio=0, pattern_ratio=0,
+    )
+    team = seed_scenario(scenario, TUESDAY)
+    users = [m.user for m in team.teammembership_set.order_by("user_id")]
+    users[0].employee_profile.available_for_waakdienst = True
+    users[0].employee_profile.save()
+    start = timezone.make_aware(datetime.combine(TUESDAY, datetime.min.time())) + timedelta(hours=8)
+    template = ShiftTemplate.objects.create(
+        name="availability", shift_type=ShiftType.INCIDENTS, duration_hours=9,
+    )
+    Shift.objects.create(
+        template=template, assigned_employee=users[0],
+        start_datetime=start, end_datetime=start + timedelta(hours=9),
+    )
+    daytime, _ = LeaveType.objects.get_or_create(
+        name="Training",
+        defaults={"conflict_handling": LeaveType.ConflictHandling.DAYTIME_ONLY},
+    )
+    LeaveRequest.objects.create(
+        employee=users[1], leave_type=daytime, start_date=TUESDAY, end_date=TUESDAY,
+        days_requested=1, status=LeaveRequest.Status.APPROVED,
+    )
+    RecurringLeavePattern.objects.create(
+        employee=users[2], name="Tuesdays off", day_of_week=TUESDAY.weekday(),
+        pattern_start_date=TUESDAY, effective_from=TUESDAY,
+    )
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username="avail", password="x", is_staff=True))
+
+    with CaptureQueriesContext(connection) as queries:
+        incidents = _availability(client, team.department, "incidents")
+
+    assert incidents == {
+        users[0].pk: ["existing_shift"],
+        users[1].pk: ["leave"],
+        users[2].pk: ["recurring_leave"],
+    }
+    # Daytime-only leave and office-hours patterns do not block waakdienst
+    waakdienst = _availability(client, team.department, "waakdienst")
+    assert waakdienst == {users[0].pk: ["existing_shift"]}
+
+    # More employees with conflicts do not add queries
+    LeaveRequest.objects.create(
+        employee=users[4], leave_type=daytime, start_date=TUESDAY, end_date=TUESDAY,
+        days_requested=1, status=LeaveRequest.Status.APPROVED,
+    )
+    with CaptureQueriesContext(connection) as more:
+        assert len(_availability(client, team.department, "incidents")) == 4
+    assert len(more.captured_queries) == len(queries.captured_queries)
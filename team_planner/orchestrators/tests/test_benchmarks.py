@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from datetime import date
+
+import pytest
+from django.db import transaction
+
+from team_planner.employees.models import RecurringLeavePattern
+from team_planner.leaves.models import LeaveRequest
+from team_planner.orchestrators.benchmarks import PHASES
+from team_planner.orchestrators.benchmarks import SCENARIOS
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import run_scenario
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.shifts.models import Shift
+from team_planner.teams.models import Team
+
+
+def _seeded_signature(scenario: BenchmarkScenario) -> list:
+    with transaction.atomic():
+        team = seed_scenario(scenario, date(2030, 1, 7), seed=3)
+        signature = [
+            sorted(
+                LeaveRequest.objects.filter(employee__teams=team).values_list(
+                    "employee__username", "start_date", "end_date",
+                ),
+            ),
+            sorted(
+                RecurringLeavePattern.objects.filter(employee__teams=team).values_list(
+                    "employee__username", "day_of_week", "frequency", "coverage_type",
+                ),
+            ),
+        ]
+        transaction.set_rollback(True)
+    return signature
+
+
+@pytest.mark.django_db
+def test_seeded_data_is_deterministic():
+    scenario = BenchmarkScenario(name="det", employees=20, weeks=8)
+
+    first = _seeded_signature(scenario)
+
+    assert first == _seeded_signature(scenario)
+    assert first[0]
+    assert first[1]
+
+
+@pytest.mark.django_db
+def test_run_scenario_measures_every_phase_and_checks_budgets():
+    scenario = BenchmarkScenario(
+        name="smoke",
+        employees=6,
+        weeks=2,
+        max_queries={"preview": 1},
+        max_seconds={"apply": 600},
+    )
+
+    result = run_scenario(scenario)
+
+    assert [p.name for p in result.phases] == list(PHASES)
+    assert all(p.queries > 0 for p in result.phases)
+    assert result.phases[0].shifts > 0
+    assert len(result.violations) == 1
+    assert result.violations[0].startswith("preview:")
+    assert not result.passed
+    # The report is JSON-serializable and the seed data was rolled back
+    assert json.loads(json.dumps(result.to_dict()))["passed"] is False
+    assert not Team.objects.filter(name__startswith="bench-smoke").exists()
+    assert not Shift.objects.exists()
+
+
+def test_shipped_scenarios_budget_every_phase_separately():
+    for scenario in SCENARIOS.values():
+        assert set(scenario.max_queries) == set(PHASES)
+        assert set(scenario.max_seconds) == set(PHASES)
+    # Budgets scale with team size rather than sharing one ceiling
+    small, medium, large = (SCENARIOS[name] for name in ("small", "medium", "large"))
+    for phase in PHASES:
+        assert small.max_queries[phase] < medium.max_queries[phase] < large.max_queries[phase]
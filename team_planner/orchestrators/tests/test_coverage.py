@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.shifts.models import ShiftType
+from team_planner.users.models import User
+
+MONDAY = date(2030, 1, 7)
+
+
+def _shift(employee, shift_type, start_hour, hours):
+    template = ShiftTemplate.objects.create(
+        name=f"coverage-{shift_type}", shift_type=shift_type, duration_hours=hours,
+    )
+    start = timezone.make_aware(datetime.combine(MONDAY, datetime.min.time())) + timedelta(
+        hours=start_hour,
+    )
+    return Shift.objects.create(
+        template=template,
+        assigned_employee=employee,
+        start_datetime=start,
+        end_datetime=start + timedelta(hours=hours),
+    )
+
+
+def _coverage(client, department, end):
+    return client.get(
+        "/api/orchestrator/coverage/",
+        {
+            "start_date": MONDAY.isoformat(),
+            "end_date": end.isoformat(),
+            "department_id": str(department.pk),
+        },
+    )
+
+
+@pytest.mark.django_db
+def test_coverage_counts_required_and_covered_per_team_in_constant_queries():
+    team = seed_scenario(BenchmarkScenario(name="coverage", employees=3, weeks=1), MONDAY)
+    other = seed_scenario(BenchmarkScenario(name="coverage-other", employees=2, weeks=1), MONDAY)
+    member = team.teammembership_set.first().user
+    _shift(member, ShiftType.INCIDENTS, 8, 9)
+    _shift(member, ShiftType.WAAKDIENST, 17, 15)
+    _shift(other.teammembership_set.first().user, ShiftType.INCIDENTS, 8, 9)
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username="cov", password="x", is_staff=True))
+
+    with CaptureQueriesContext(connection) as week:
+        response = _coverage(client, team.department, MONDAY + timedelta(days=6))
+    with CaptureQueriesContext(connection) as year:
+        _coverage(client, team.department, MONDAY + timedelta(days=364))
+
+    assert response.status_code == 200
+    # Optional standby mode: incidents on 5 weekdays, waakdienst on 7 days
+    assert list(response.data["team_coverage"]) == [team.pk]
+    assert response.data["coverage_summary"] == {
+        "total_required_shifts": 12,
+        "total_covered_shifts": 2,
+        "coverage_percentage": pytest.approx(2 / 12 * 100),
+    }
+    monday = response.data["daily_coverage"][MONDAY.isoformat()]
+    assert monday["shift_types"][ShiftType.INCIDENTS] == {
+        "required": 1, "covered": 1, "shifts_count": 1,
+    }
+    assert len(response.data["coverage_gaps"]) == 10
+    assert len(year.captured_queries) == len(week.captured_queries)
+
+
+@pytest.mark.django_db
+def test_overnight_waakdienst_on_the_last_day_is_covered():
+    team = seed_scenario(BenchmarkScenario(name="coverage-overnight", employees=2, weeks=1), MONDAY)
+    member = team.teammembership_set.first().user
+    _shift(member, ShiftType.INCIDENTS, 8, 9)
+    _shift(member, ShiftType.WAAKDIENST, 17, 15)  # Monday 17:00 - Tuesday 08:00
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username="cov", password="x", is_staff=True))
+
+    response = _coverage(client, team.department, MONDAY)
+
+    assert response.status_code == 200
+    assert response.data["coverage_gaps"] == []
+    assert response.data["daily_coverage"][MONDAY.isoformat()]["shift_types"][
+        ShiftType.WAAKDIENST
+    ] == {"required": 1, "covered": 1, "shifts_count": 1}
+
+
+@pytest.mark.django_db
+def test_coverage_rejects_unknown_department():
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username="cov", password="x", is_staff=True))
+
+    response = client.get("/api/orchestrator/coverage/", {"department_id": "999999"})
+
+    assert response.status_code == 400
+    assert response.data["code"] == "DEPARTMENT_NOT_FOUND"
@@ -262,3 +262,25 @@ def test_full_scale_waakdienst_52_weeks():
     assert len(week_count_by_emp.keys()) >= 10
     counts = list(week_count_by_emp.values())
     assert max(counts) - min(counts) <= 2
+
+
+@pytest.mark.django_db
+def test_week_solver_query_count_does_not_grow_with_horizon():
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    team, users = _mk_team_with_members(10)
+    _add_recurring_leaves(users, date(2025, 9, 8))
+    start = datetime(2025, 9, 8, 8, 0, tzinfo=TZ)  # Monday 08:00
+
+    def planning_queries(weeks: int) -> int:
+        orch = IncidentsOrchestrator(team_id=team.pk, include_standby=True)
+        orch._get_shift_templates()  # provision templates outside the measurement
+        with CaptureQueriesContext(connection) as ctx:
+            result = orch.generate_assignments(
+                start, start + timedelta(weeks=weeks), dry_run=True,
+            )
+        assert len(result["assignments"]) == 2 * 5 * weeks
+        return len(ctx.captured_queries)
+
+    assert planning_queries(26) == planning_queries(4)
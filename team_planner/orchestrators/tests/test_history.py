@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from datetime import date
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.orchestrators.history import HistoryScope
+from team_planner.orchestrators.history import assignment_distribution
+from team_planner.orchestrators.history import purge_history
+from team_planner.orchestrators.models import OrchestrationRun
+from team_planner.orchestrators.progress import CacheProgressBroker
+from team_planner.orchestrators.tasks import reset_assignment_history_task
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.shifts.models import ShiftType
+from team_planner.users.models import User
+
+
+def _history(team, shifts_per_member):
+    templates = {
+        st: ShiftTemplate.objects.create(name=f"history-{st}", shift_type=st, duration_hours=9)
+        for st in (ShiftType.INCIDENTS, ShiftType.WAAKDIENST)
+    }
+    now = timezone.now()
+    members = [m.user for m in team.teammembership_set.order_by("user_id")]
+    Shift.objects.bulk_create(
+        Shift(
+            template=templates[ShiftType.WAAKDIENST if i % 3 == 0 else ShiftType.INCIDENTS],
+            assigned_employee=user,
+            start_datetime=now - timedelta(days=i + 1),
+            end_datetime=now - timedelta(days=i + 1) + timedelta(hours=9),
+        )
+        for user, count in zip(members, shifts_per_member)
+        for i in range(count)
+    )
+    return members
+
+
+@pytest.mark.django_db
+def test_distribution_and_batched_purge_share_the_scope():
+    team = seed_scenario(BenchmarkScenario(name="history", employees=3, weeks=1), date.today())
+    other = seed_scenario(BenchmarkScenario(name="history-other", employees=1, weeks=1), date.today())
+    members = _history(team, [5, 2, 0])
+    _history(other, [4])
+    scope = HistoryScope(cutoff=timezone.now() - timedelta(days=30), team_id=team.pk)
+
+    distribution = assignment_distribution(scope)
+
+    assert distribution["total_shifts"] == 7
+    assert [e["employee_id"] for e in distribution["employees"]] == [members[0].pk, members[1].pk]
+    assert distribution["employees"][0]["shift_types"] == {
+        ShiftType.WAAKDIENST: 2, ShiftType.INCIDENTS: 3,
+    }
+    assert distribution["shift_types"] == {ShiftType.WAAKDIENST: 3, ShiftType.INCIDENTS: 4}
+
+    events = []
+    totals = purge_history(scope, batch_size=3, progress=lambda e, **d: events.append(d))
+
+    assert totals == {"results_deleted": 0, "shifts_deleted": 7, "runs_deleted": 0}
+    assert [e["deleted"] for e in events] == [3, 6, 7]
+    assert not scope.shifts().exists()
+    assert Shift.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_reset_endpoint_queues_task_and_task_reports_progress():
+    team = seed_scenario(BenchmarkScenario(name="history-api", employees=2, weeks=1), date.today())
+    _history(team, [2, 1])
+    staff = User.objects.create_user(username="history-staff", password="x", is_staff=True)
+    OrchestrationRun.objects.create(
+        name="recent", start_date=date.today(), end_date=date.today(), initiated_by=staff,
+    )
+    client = APIClient()
+    client.force_authenticate(staff)
+
+    with mock.patch.object(
+        reset_assignment_history_task, "delay", return_value=SimpleNamespace(id="reset-run"),
+    ) as delay:
+        response = client.post(
+            "/orchestrators/api/orchestrator/reset-history/",
+            {"days_back": 30, "confirm": True},
+            format="json",
+        )
+
+    assert response.status_code == 202
+    assert response.data["summary"]["shifts_to_delete"] == 3
+    assert Shift.objects.count() == 3
+
+    reset_assignment_history_task.apply(kwargs=delay.call_args.kwargs, task_id="reset-run")
+
+    assert Shift.objects.count() == 0
+    assert not OrchestrationRun.objects.exists()
+    events = CacheProgressBroker().events("reset-run")
+    assert events[0]["event"] == "started"
+    assert events[-1]["event"] == "finished"
+    assert events[-1]["data"]["totals"]["shifts_deleted"] == 3
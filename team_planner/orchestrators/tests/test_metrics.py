@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from team_planner.orchestrators.metrics import compute_metrics
+from team_planner.orchestrators.models import OrchestrationRun
+from team_planner.orchestrators.tasks import refresh_metrics_snapshot_task
+from team_planner.users.models import User
+
+
+def _run(user, status):
+    return OrchestrationRun.objects.create(
+        name="metrics",
+        status=status,
+        start_date=date(2030, 1, 1),
+        end_date=date(2030, 1, 31),
+        initiated_by=user,
+    )
+
+
+@pytest.mark.django_db
+def test_compute_metrics_uses_conditional_aggregation():
+    user = User.objects.create_user(username="metrics", password="x")
+    _run(user, OrchestrationRun.Status.COMPLETED)
+    _run(user, OrchestrationRun.Status.FAILED)
+    _run(user, OrchestrationRun.Status.RUNNING)
+
+    with CaptureQueriesContext(connection) as queries:
+        metrics = compute_metrics()
+
+    assert metrics["runs"] == {"total": 3, "successful": 1, "failed": 1, "active": 1}
+    assert len(queries.captured_queries) == 4
+
+
+@pytest.mark.django_db
+@override_settings(ORCHESTRATOR_METRICS_SNAPSHOT_SECONDS=60)
+def test_metrics_endpoint_serves_snapshot_until_runs_change(django_capture_on_commit_callbacks):
+    cache.clear()
+    staff = User.objects.create_user(username="metrics-staff", password="x", is_staff=True)
+    client = APIClient()
+    client.force_authenticate(staff)
+    refresh_metrics_snapshot_task.apply()
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/orchestrator-status/metrics/")
+
+    assert response.status_code == 200
+    assert response.data["orchestrations_total"] == 0
+    assert len(queries.captured_queries) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _run(staff, OrchestrationRun.Status.COMPLETED)
+
+    response = client.get("/api/orchestrator-status/metrics/")
+    assert response.data["orchestrations_total"] == 1
+    assert response.data["orchestration_metrics"]["successful_runs"] == 1
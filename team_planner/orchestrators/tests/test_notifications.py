@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import timedelta
+
+import pytest
+
+from team_planner.notifications.models import Notification
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import _scenario_start
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.orchestrators.unified import UnifiedOrchestrator
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftType
+
+
+@pytest.mark.django_db
+def test_apply_sends_one_digest_per_assigned_employee():
+    start = _scenario_start()
+    team = seed_scenario(BenchmarkScenario(name="apply-digest", employees=4, weeks=2), start.date())
+    seeded = set(Shift.objects.values_list("pk", flat=True))
+
+    UnifiedOrchestrator(
+        team,
+        start,
+        start + timedelta(weeks=2),
+        shift_types=[ShiftType.INCIDENTS, ShiftType.WAAKDIENST],
+        dry_run=False,
+        user=team.members.order_by("pk").first(),
+    ).apply_schedule()
+
+    shifts = Shift.objects.exclude(pk__in=seeded)
+    assert shifts.count() > shifts.values("assigned_employee").distinct().count()
+    per_recipient = Counter(Notification.objects.values_list("recipient_id", flat=True))
+    assert set(per_recipient) == set(shifts.values_list("assigned_employee_id", flat=True))
+    assert set(per_recipient.values()) == {1}
+    for notification in Notification.objects.all():
+        assert sorted(notification.data["shift_ids"]) == sorted(
+            shifts.filter(assigned_employee=notification.recipient_id).values_list("pk", flat=True),
+        )
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from team_planner.leaves.models import LeaveRequest
+from team_planner.leaves.models import LeaveType
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import _scenario_start
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.orchestrators.unified import UnifiedOrchestrator
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.shifts.models import ShiftType
+
+
+def _seed(name):
+    start = _scenario_start()
+    team = seed_scenario(BenchmarkScenario(name=name, employees=4, weeks=2), start.date())
+    # Provision templates up front; a run that creates them is not cached
+    for shift_type, hours in ((ShiftType.INCIDENTS, 9), (ShiftType.WAAKDIENST, 15)):
+        ShiftTemplate.objects.create(name=shift_type, shift_type=shift_type, duration_hours=hours)
+    return team, start
+
+
+def _orchestrator(team, start, dry_run=True):
+    return UnifiedOrchestrator(
+        team,
+        start,
+        start + timedelta(weeks=2),
+        shift_types=[ShiftType.INCIDENTS, ShiftType.WAAKDIENST],
+        dry_run=dry_run,
+        user=team.members.order_by("pk").first(),
+    )
+
+
+@pytest.mark.django_db
+def test_repeat_preview_is_served_from_cache_until_data_changes():
+    team, start = _seed("preview-cache")
+
+    first = _orchestrator(team, start).preview_schedule()
+    assert first["preview_cached"] is False
+
+    orchestrator = _orchestrator(team, start)
+    with CaptureQueriesContext(connection) as queries:
+        repeat = orchestrator.preview_schedule()
+    assert repeat["preview_cached"] is True
+    assert len(queries) == 1  # the data version stamp
+    assert [a["start_datetime"] for a in repeat["assignments"]] == [
+        a["start_datetime"] for a in first["assignments"]
+    ]
+
+    member = team.members.order_by("pk").first()
+    LeaveRequest.objects.create(
+        employee=member,
+        leave_type=LeaveType.objects.first(),
+        start_date=start.date(),
+        end_date=start.date(),
+        days_requested=1,
+        status=LeaveRequest.Status.APPROVED,
+    )
+    assert _orchestrator(team, start).preview_schedule()["preview_cached"] is False
+
+
+@pytest.mark.django_db
+def test_apply_commits_the_cached_preview_without_planning_again():
+    team, start = _seed("preview-apply")
+    preview = _orchestrator(team, start).preview_schedule()
+
+    orchestrator = _orchestrator(team, start, dry_run=False)
+    result = orchestrator.apply_schedule()
+
+    assert orchestrator.preview_cache_hit is True
+    assert not {"incidents", "waakdienst"} & set(orchestrator.telemetry.phases)
+    assert result["total_shifts"] == len(preview["assignments"])
+    assert Shift.objects.filter(assigned_employee__in=team.members.all()).count() == len(
+        preview["assignments"],
+    )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.orchestrators.progress import CacheProgressBroker
+from team_planner.orchestrators.progress import ProgressReporter
+from team_planner.orchestrators.progress import completed_team_ids
+from team_planner.orchestrators.tasks import extend_rolling_horizon_task
+from team_planner.users.models import User
+
+
+def _events(run_id: str) -> list[str]:
+    return [e["event"] for e in CacheProgressBroker().events(run_id)]
+
+
+@pytest.mark.django_db
+@override_settings(ORCHESTRATOR_AUTO_ROLL_REQUIRES_SEED=False)
+def test_task_publishes_team_and_period_events():
+    team = seed_scenario(BenchmarkScenario(name="progress", employees=4, weeks=2), date.today())
+
+    extend_rolling_horizon_task.apply(
+        kwargs={"weeks": 2, "dry_run": True, "team_ids": [team.pk], "shift_types": ["incidents"]},
+        task_id="progress-run",
+    )
+
+    events = _events("progress-run")
+    assert events[0] == "started"
+    assert events[1] == "team_started"
+    assert "period_planned" in events
+    assert events[-2:] == ["team_finished", "finished"]
+    assert completed_team_ids("progress-run") == [team.pk]
+
+
+@pytest.mark.django_db
+@override_settings(ORCHESTRATOR_AUTO_ROLL_REQUIRES_SEED=False)
+def test_chunked_run_continues_in_follow_up_task_on_same_stream():
+    first = seed_scenario(BenchmarkScenario(name="chunk-a", employees=3, weeks=1), date.today())
+    second = seed_scenario(BenchmarkScenario(name="chunk-b", employees=3, weeks=1), date.today())
+
+    with mock.patch.object(
+        extend_rolling_horizon_task, "apply_async", return_value=SimpleNamespace(id="next"),
+    ) as follow_up:
+        result = extend_rolling_horizon_task.apply(
+            kwargs={
+                "weeks": 1,
+                "dry_run": True,
+                "team_ids": [first.pk, second.pk],
+                "shift_types": ["incidents"],
+                "chunk_size": 1,
+            },
+            task_id="chunked-run",
+        ).get()
+
+    assert result["remaining_team_ids"] == [second.pk]
+    kwargs = follow_up.call_args.kwargs["kwargs"]
+    assert kwargs["team_ids"] == [second.pk]
+    assert kwargs["progress_id"] == "chunked-run"
+    assert _events("chunked-run")[-1] == "chunk_finished"
+    assert completed_team_ids("chunked-run") == [first.pk]
+
+
+@pytest.mark.django_db
+def test_stream_replays_after_last_event_id_and_closes_on_terminal_event():
+    report = ProgressReporter("stream-run")
+    report("started", team_ids=[1])
+    report("team_finished", team_id=1)
+    report("finished", totals={"teams": 1})
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username="ops", password="x", is_staff=True))
+
+    response = client.get(
+        "/orchestrators/api/progress/stream-run/stream/",
+        HTTP_ACCEPT="text/event-stream",
+        HTTP_LAST_EVENT_ID="1",
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/event-stream"
+    body = b"".join(response.streaming_content).decode()
+    assert "id: 1\n" not in body
+    assert "id: 2\nevent: team_finished\n" in body
+    assert body.rstrip().split("\n\n")[-1].startswith("id: 3\nevent: finished\n")
@@ -10,7 +10,9 @@ import pytest
 from team_planner.employees.models import EmployeeProfile
 from team_planner.employees.models import EmployeeSkill
 from team_planner.employees.models import RecurringLeavePattern
+from team_planner.leaves.models import LeaveType
 from team_planner.orchestrators.incidents import IncidentsOrchestrator
+from team_planner.orchestrators.models import OrchestrationConstraint
 from team_planner.orchestrators.models import OrchestrationRun
 from team_planner.users.models import User
 
@@ -85,3 +87,64 @@ def test_recurring_leave_triggers_split_coverage_and_uses_all_available_users():
     # All available users should be used across the two weeks
     used = {a["assigned_employee_id"] for a in assignments}
     assert used.issuperset({u.pk for u in users})
+
+
+def _displaced_weeks(users: list[User], run: OrchestrationRun, weeks: int) -> tuple[list[dict], int]:
+    """Plan ``weeks`` incidents weeks for users[0], who is on leave, and resolve them."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from team_planner.orchestrators.reassignment import ShiftReassignmentManager
+
+    start = datetime(2025, 9, 8, 8, 0, tzinfo=TZ)
+    plan = [
+        {
+            "assigned_employee_id": users[0].pk,
+            "shift_type": "incidents",
+            "start_datetime": start + timedelta(weeks=w),
+            "end_datetime": start + timedelta(weeks=w, days=4, hours=9),
+            "week_start_date": (start + timedelta(weeks=w)).date(),
+        }
+        for w in range(weeks)
+    ]
+    manager = ShiftReassignmentManager(run)
+    with CaptureQueriesContext(connection) as ctx:
+        manager.resolve_conflicts(manager.detect_conflicts(plan))
+    return plan, len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+def test_reassignment_query_count_does_not_grow_with_displaced_shifts():
+    users: list[User] = []
+    for i in range(4):
+        u = User.objects.create_user(username=f"inc_bulk_{i}", password="pass")
+        EmployeeProfile.objects.create(
+            user=u,
+            employee_id=f"IB{i:03d}",
+            hire_date=date(2020, 1, 1),
+            status=EmployeeProfile.Status.ACTIVE,
+            available_for_incidents=True,
+        )
+        users.append(u)
+    # One long approved leave displaces every planned week
+    users[0].leave_requests.create(
+        leave_type=LeaveType.objects.create(name="Vacation"),
+        start_date=date(2025, 9, 1),
+        end_date=date(2025, 12, 31),
+        days_requested=80,
+        status="approved",
+    )
+    run = OrchestrationRun.objects.create(
+        name="Bulk reassignment",
+        initiated_by=users[1],
+        start_date=date(2025, 9, 8),
+        end_date=date(2025, 12, 31),
+    )
+
+    short_plan, short_queries = _displaced_weeks(users, run, weeks=2)
+    long_plan, long_queries = _displaced_weeks(users, run, weeks=8)
+
+    assert long_queries == short_queries
+    assert all(a["assigned_employee_id"] != users[0].pk for a in short_plan + long_plan)
+    # One audit record per displaced week, written in bulk
+    assert OrchestrationConstraint.objects.filter(orchestration_run=run).count() == 10
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+from team_planner.orchestrators.benchmarks import BenchmarkScenario
+from team_planner.orchestrators.benchmarks import _scenario_start
+from team_planner.orchestrators.benchmarks import seed_scenario
+from team_planner.orchestrators.models import OrchestrationRun
+from team_planner.orchestrators.telemetry import RunTelemetry
+from team_planner.orchestrators.unified import UnifiedOrchestrator
+from team_planner.shifts.models import ShiftType
+from team_planner.teams.models import Team
+
+
+@pytest.mark.django_db
+def test_phases_nest_accumulate_and_total_top_level_only():
+    telemetry = RunTelemetry()
+
+    for _ in range(2):
+        with telemetry.phase("assignment") as stats:
+            Team.objects.count()
+            with telemetry.phase("constraints"):
+                Team.objects.count()
+            stats.rows += 3
+    with telemetry.phase("persist"):
+        pass
+
+    phases = telemetry.as_dict()
+    assert phases["assignment"]["calls"] == 2
+    assert phases["assignment"]["queries"] == 4
+    assert phases["assignment"]["rows"] == 6
+    assert phases["assignment/constraints"]["queries"] == 2
+    assert phases["persist"]["queries"] == 0
+    # Nested phases are already included in their parent
+    assert telemetry.total_queries == 4
+
+    other = RunTelemetry()
+    with other.phase("employees"):
+        Team.objects.count()
+    telemetry.merge(other, under="incidents")
+    telemetry.merge(other, under="incidents")
+    assert telemetry.phases["incidents/employees"].queries == 1
+    assert telemetry.total_queries == 4
+
+
+@pytest.mark.django_db
+def test_applied_run_records_phase_metrics():
+    start = _scenario_start()
+    team = seed_scenario(BenchmarkScenario(name="telemetry", employees=4, weeks=2), start.date())
+    orchestrator = UnifiedOrchestrator(
+        team,
+        start,
+        start + timedelta(weeks=2),
+        shift_types=[ShiftType.INCIDENTS, ShiftType.WAAKDIENST],
+        dry_run=False,
+        user=team.members.order_by("pk").first(),
+    )
+
+    result = orchestrator.apply_schedule()
+
+    run = OrchestrationRun.objects.get(pk=result["run_id"])
+    assert {"incidents", "waakdienst", "persist"} <= set(run.phase_metrics)
+    assert "incidents/employees" in run.phase_metrics
+    assert run.phase_metrics["persist"]["rows"] == run.total_shifts_created
+    assert run.query_count == sum(
+        run.phase_metrics[name]["queries"] for name in ("incidents", "waakdienst", "persist")
+    )
+    assert run.duration_seconds > 0
+    # The incidents sub-run carries the incidents orchestrator's own phases
+    incidents_run = OrchestrationRun.objects.get(name=f"Incidents - {team.name}")
+    assert incidents_run.phase_metrics["assignment"]["rows"] > 0
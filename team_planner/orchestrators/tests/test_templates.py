@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from team_planner.orchestrators.templates import ShiftTemplateCache
+from team_planner.orchestrators.templates import template_cache
+from team_planner.shifts.models import ShiftTemplate
+from team_planner.shifts.models import ShiftType
+
+
+@pytest.mark.django_db
+def test_resolve_is_memoized_and_creates_default_once():
+    cache = ShiftTemplateCache()
+
+    first = cache.resolve(ShiftType.INCIDENTS)
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(50):
+            assert cache.resolve(ShiftType.INCIDENTS) == first
+            assert cache.get(first.pk) == first
+
+    assert len(queries) == 0
+    assert first.duration_hours == 9
+    assert ShiftTemplate.objects.filter(shift_type=ShiftType.INCIDENTS).count() == 1
+
+
+@pytest.mark.django_db
+def test_refresh_reloads_only_when_templates_changed():
+    cache = ShiftTemplateCache()
+    cache.resolve(ShiftType.WAAKDIENST)
+
+    with CaptureQueriesContext(connection) as queries:
+        cache.refresh()
+    assert len(queries) == 1  # fingerprint only
+
+    # A change this process' signals did not see (another worker, raw update)
+    ShiftTemplate.objects.create(
+        shift_type=ShiftType.WAAKDIENST, name="Weekend", duration_hours=24,
+    )
+    cache.refresh()
+    assert [t.name for t in cache.active(ShiftType.WAAKDIENST)][-1] == "Weekend"
+
+
+@pytest.mark.django_db
+def test_template_saves_invalidate_the_shared_map():
+    template = template_cache.resolve(ShiftType.INCIDENTS_STANDBY)
+
+    template.is_active = False
+    template.save()
+    replacement = template_cache.resolve(ShiftType.INCIDENTS_STANDBY)
+
+    assert replacement.pk != template.pk
+    assert template_cache.active(ShiftType.INCIDENTS_STANDBY) == [replacement]
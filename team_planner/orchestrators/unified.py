@@ -12,12 +12,17 @@ from datetime import timedelta
 
 from django.utils import timezone
 
+from team_planner.notifications.services import NotificationService
 from team_planner.shifts.models import ShiftType
 from team_planner.teams.models import Team
 
 from .incidents import IncidentsOrchestrator
 from .incidents_standby import IncidentsStandbyOrchestrator
 from .models import OrchestrationRun
+from .preview_cache import get_preview
+from .preview_cache import preview_key
+from .preview_cache import store_preview
+from .telemetry import RunTelemetry
 from .waakdienst import WaakdienstOrchestrator
 
 try:
@@ -49,6 +54,7 @@ class UnifiedOrchestrator:
         shift_types: list[ShiftType] | None = None,
         dry_run: bool = True,
         user=None,
+        progress=None,
     ):
         self.team = team
         self.start_date = start_date
@@ -56,10 +62,18 @@ class UnifiedOrchestrator:
         self.shift_types = shift_types or list(ShiftType)
         self.dry_run = dry_run
         self.user = user  # For orchestration run tracking
+        # Optional callable publishing progress events (see progress.py)
+        self.progress = progress
 
         # Track results from both orchestrators
         self.results = {"assignments": [], "errors": [], "warnings": [], "stats": {}}
 
+        # Per-phase timings and query counts, one phase per shift type
+        self.telemetry = RunTelemetry()
+
+        # Set when results came from the preview cache (see preview_cache.py)
+        self.preview_cache_hit = False
+
         # Initialize save operation tracking
         self.created_shifts = 0
         self.updated_shifts = 0
@@ -75,11 +89,13 @@ class UnifiedOrchestrator:
             self.incidents_orchestrator = IncidentsOrchestrator(
                 start_date=start_date, end_date=end_date, team_id=team.pk,
             )
+            self.incidents_orchestrator.progress = progress
 
         if ShiftType.INCIDENTS_STANDBY in self.shift_types:
             self.incidents_standby_orchestrator = IncidentsStandbyOrchestrator(
                 start_date=start_date, end_date=end_date, team_id=team.pk,
             )
+            self.incidents_standby_orchestrator.progress = progress
 
         if self._should_handle_waakdienst():
             base_waakdienst = WaakdienstOrchestrator(team_id=team.pk)
@@ -102,15 +118,26 @@ class UnifiedOrchestrator:
         return ShiftType.WAAKDIENST in self.shift_types
 
     def preview_schedule(self) -> dict:
-        """Generate a preview without saving to database."""
+        """Generate a preview without saving to database.
+
+        An identical preview over unchanged data is served from the preview
+        cache instead of being planned again.
+        """
         logger.info(
             f"Creating preview for team {self.team.name} from {self.start_date} to {self.end_date}",
         )
 
+        key = self._preview_cache_key()
+        if self._load_cached_preview(key):
+            return self._format_preview_result()
+
         # Run incidents orchestrator if needed
         if self.incidents_orchestrator:
             try:
-                incidents_result = self._run_incidents_orchestrator()
+                incidents_result = self._run_timed(
+                    "incidents", self._run_incidents_orchestrator,
+                    self.incidents_orchestrator,
+                )
                 self._merge_results("incidents", incidents_result)
             except Exception as e:
                 logger.exception(f"Incidents orchestrator failed: {e}")
@@ -119,7 +146,10 @@ class UnifiedOrchestrator:
         # Run incidents-standby orchestrator if needed
         if self.incidents_standby_orchestrator:
             try:
-                standby_result = self._run_incidents_standby_orchestrator()
+                standby_result = self._run_timed(
+                    "incidents_standby", self._run_incidents_standby_orchestrator,
+                    self.incidents_standby_orchestrator,
+                )
                 self._merge_results("incidents_standby", standby_result)
             except Exception as e:
                 logger.exception(f"Incidents-Standby orchestrator failed: {e}")
@@ -130,12 +160,20 @@ class UnifiedOrchestrator:
         # Run waakdienst orchestrator if needed
         if self.waakdienst_orchestrator:
             try:
-                waakdienst_result = self._run_waakdienst_orchestrator()
+                waakdienst_result = self._run_timed(
+                    "waakdienst", self._run_waakdienst_orchestrator,
+                    self.waakdienst_orchestrator,
+                )
                 self._merge_results("waakdienst", waakdienst_result)
             except Exception as e:
                 logger.exception(f"Waakdienst orchestrator failed: {e}")
                 self.results["errors"].append(f"Waakdienst scheduling failed: {e!s}")
 
+        # Only cache a clean plan whose inputs did not change while planning
+        # (e.g. templates auto-provisioned by this very run)
+        if not self.results["errors"] and self._preview_cache_key() == key:
+            store_preview(key, self.results)
+
         # Format results for compatibility with existing views
         return self._format_preview_result()
 
@@ -170,105 +208,166 @@ class UnifiedOrchestrator:
                 initiated_by=self.user,
             )
 
-        try:
-            # Run orchestrators
-            total_assignments = 0
+        # Shifts saved by every orchestrator reach each employee as one digest
+        with NotificationService.coalesce_shift_notifications():
+            try:
+                # Run orchestrators
+                total_assignments = 0
 
+                if self._load_cached_preview(self._preview_cache_key()):
+                    # Nothing changed since the preview: commit its assignments
+                    total_assignments = len(self.results["assignments"])
 
-            if self.incidents_orchestrator:
-                incidents_result = self._run_incidents_orchestrator(save=True)
-                self._merge_results("incidents", incidents_result)
-                total_assignments += len(incidents_result.get("assignments", []))
+                if self.incidents_orchestrator and not self.preview_cache_hit:
+                    incidents_result = self._run_timed(
+                        "incidents", self._run_incidents_orchestrator,
+                        self.incidents_orchestrator, save=True,
+                    )
+                    self._merge_results("incidents", incidents_result)
+                    total_assignments += len(incidents_result.get("assignments", []))
 
-            if self.incidents_standby_orchestrator:
-                standby_result = self._run_incidents_standby_orchestrator(save=True)
-                self._merge_results("incidents_standby", standby_result)
-                total_assignments += len(standby_result.get("assignments", []))
+                if self.incidents_standby_orchestrator and not self.preview_cache_hit:
+                    standby_result = self._run_timed(
+                        "incidents_standby", self._run_incidents_standby_orchestrator,
+                        self.incidents_standby_orchestrator, save=True,
+                    )
+                    self._merge_results("incidents_standby", standby_result)
+                    total_assignments += len(standby_result.get("assignments", []))
 
-            if self.waakdienst_orchestrator:
-                waakdienst_result = self._run_waakdienst_orchestrator(save=True)
-                self._merge_results("waakdienst", waakdienst_result)
-                total_assignments += len(waakdienst_result.get("assignments", []))
-
-
-            # Update run status
-            run.status = OrchestrationRun.Status.COMPLETED
-            run.completed_at = timezone.now()
-            run.total_shifts_created = total_assignments
-            if self.results["errors"]:
-                run.error_message = "\n".join(self.results["errors"])
-            if self.results["warnings"]:
-                run.execution_log = "Warnings:\n" + "\n".join(self.results["warnings"])
-            run.save()
-
-            # Create result records and actual shifts for individual assignments
-            created_shifts = 0
-
-            # Import here to avoid circular imports
-            from team_planner.shifts.models import Shift
-
-            # Process all assignments
-            for i, assignment in enumerate(self.results["assignments"], 1):
-                try:
-                    # Extract values carefully
-                    template = assignment.get("template")
-                    employee_id = assignment.get("assigned_employee_id")
-                    start_dt = assignment.get("start_datetime")
-                    end_dt = assignment.get("end_datetime")
-
-                    # Validate all fields are present
-                    if not all([template, employee_id, start_dt, end_dt]):
-                        continue
-
-                    # Check if shift already exists
-                    existing_shift = Shift.objects.filter(
-                        template=template,
-                        assigned_employee_id=employee_id,
-                        start_datetime=start_dt,
-                        end_datetime=end_dt,
-                    ).first()
-
-                    if existing_shift:
-                        continue
-
-                    # Create shift
-                    Shift.objects.create(
-                        template=template,
-                        assigned_employee_id=employee_id,
-                        start_datetime=start_dt,
-                        end_datetime=end_dt,
-                        status=Shift.Status.SCHEDULED,
+                if self.waakdienst_orchestrator and not self.preview_cache_hit:
+                    waakdienst_result = self._run_timed(
+                        "waakdienst", self._run_waakdienst_orchestrator,
+                        self.waakdienst_orchestrator, save=True,
                     )
+                    self._merge_results("waakdienst", waakdienst_result)
+                    total_assignments += len(waakdienst_result.get("assignments", []))
 
-                    created_shifts += 1
+                # Update run status
+                run.status = OrchestrationRun.Status.COMPLETED
+                run.completed_at = timezone.now()
+                run.total_shifts_created = total_assignments
+                if self.results["errors"]:
+                    run.error_message = "\n".join(self.results["errors"])
+                if self.results["warnings"]:
+                    run.execution_log = "Warnings:\n" + "\n".join(self.results["warnings"])
+                run.save()
 
-                    if i <= 5 or i % 50 == 0:  # Log first 5 and every 50th
-                        pass
+                # Create result records and actual shifts for individual assignments
+                created_shifts = 0
 
-                except Exception as e:
-                    logger.exception(f"Failed to create shift {i}: {e}")
-                    # Continue with next assignment instead of failing completely
-                    continue
+                # Import here to avoid circular imports
+                from team_planner.shifts.models import Shift
+                from team_planner.users.models import User
 
+                employees = User.objects.in_bulk(
+                    {a.get("assigned_employee_id") for a in self.results["assignments"]} - {None},
+                )
 
-            # Update the run with actual created shifts count
-            run.total_shifts_created = created_shifts
-            run.save()
+                with self.telemetry.phase("persist") as stats:
+                    # Process all assignments
+                    for i, assignment in enumerate(self.results["assignments"], 1):
+                        try:
+                            # Extract values carefully
+                            template = assignment.get("template")
+                            employee_id = assignment.get("assigned_employee_id")
+                            start_dt = assignment.get("start_datetime")
+                            end_dt = assignment.get("end_datetime")
+
+                            employee = employees.get(employee_id)
+
+                            # Validate all fields are present
+                            if not all([template, employee, start_dt, end_dt]):
+                                continue
+
+                            # Check if shift already exists
+                            existing_shift = Shift.objects.filter(
+                                template=template,
+                                assigned_employee_id=employee_id,
+                                start_datetime=start_dt,
+                                end_datetime=end_dt,
+                            ).first()
+
+                            if existing_shift:
+                                continue
+
+                            # Create shift
+                            shift = Shift.objects.create(
+                                template=template,
+                                assigned_employee=employee,
+                                start_datetime=start_dt,
+                                end_datetime=end_dt,
+                                status=Shift.Status.SCHEDULED,
+                            )
+                            NotificationService.notify_shift_assigned(employee, shift)
 
-            logger.info(
-                f"Successfully created {created_shifts} shifts for team {self.team.name}",
-            )
+                            created_shifts += 1
 
-        except Exception as e:
-            run.status = OrchestrationRun.Status.FAILED
-            run.completed_at = timezone.now()
-            run.error_message = str(e)
-            run.save()
-            logger.exception(f"Orchestration failed for team {self.team.name}: {e}")
-            raise
+                            if i <= 5 or i % 50 == 0:  # Log first 5 and every 50th
+                                pass
+
+                        except Exception as e:
+                            logger.exception(f"Failed to create shift {i}: {e}")
+                            # Continue with next assignment instead of failing completely
+                            continue
+                    stats.rows = created_shifts
+                if self.progress:
+                    self.progress("shifts_written", team_id=self.team.pk, created=created_shifts)
+
+                # Update the run with actual created shifts count
+                run.total_shifts_created = created_shifts
+                self.telemetry.apply_to(run)
+                run.save()
+
+                logger.info(
+                    f"Successfully created {created_shifts} shifts for team {self.team.name}",
+                )
+
+            except Exception as e:
+                run.status = OrchestrationRun.Status.FAILED
+                run.completed_at = timezone.now()
+                run.error_message = str(e)
+                self.telemetry.apply_to(run)
+                run.save()
+                logger.exception(f"Orchestration failed for team {self.team.name}: {e}")
+                raise
 
         return self._format_apply_result(run)
 
+    def _preview_cache_key(self) -> str | None:
+        """Key of this team/window/shift-type preview over the current data."""
+        return preview_key(
+            "unified",
+            self.team.pk,
+            self.start_date,
+            self.end_date,
+            self.shift_types,
+            options={
+                "waakdienst_adapter": bool(WaakdienstAdapter and waakdienst_adapter_enabled()),
+            },
+        )
+
+    def _load_cached_preview(self, key: str | None) -> bool:
+        """Adopt the cached results under ``key``, if any."""
+        with self.telemetry.phase("preview_cache") as stats:
+            cached = get_preview(key)
+            stats.rows = len(cached["assignments"]) if cached else 0
+        if cached is None:
+            return False
+        self.results = cached
+        self.preview_cache_hit = True
+        return True
+
+    def _run_timed(self, phase: str, runner, orchestrator, save: bool = False) -> dict:
+        """Run one specialized orchestrator inside a telemetry phase.
+
+        The orchestrator's own phases are recorded below ``phase``.
+        """
+        with self.telemetry.phase(phase) as stats:
+            result = runner(save=save)
+            stats.rows = len(result.get("assignments", []))
+        self.telemetry.merge(orchestrator.telemetry, under=phase)
+        return result
+
     def _run_incidents_orchestrator(self, save: bool = False) -> dict:
         """Run the incidents orchestrator for the specified date range."""
         if not self.incidents_orchestrator:
@@ -300,6 +399,7 @@ class UnifiedOrchestrator:
                 # Update run status
                 run.status = OrchestrationRun.Status.COMPLETED
                 run.completed_at = timezone.now()
+                self.incidents_orchestrator.telemetry.apply_to(run)
                 run.save()
 
             else:
@@ -363,6 +463,7 @@ class UnifiedOrchestrator:
                 # Update run status
                 run.status = OrchestrationRun.Status.COMPLETED
                 run.completed_at = timezone.now()
+                self.incidents_standby_orchestrator.telemetry.apply_to(run)
                 run.save()
 
             else:
@@ -465,6 +566,15 @@ class UnifiedOrchestrator:
 
             if week_result.get("assignments"):
                 all_assignments.extend(week_result["assignments"])
+            if self.progress:
+                self.progress(
+                    "period_planned",
+                    team_id=self.team.pk,
+                    shift_types=[str(ShiftType.WAAKDIENST)],
+                    period=f"Waakdienst week {current_date.date().isoformat()}",
+                    start=current_date.isoformat(),
+                    assignments=len(week_result.get("assignments", [])),
+                )
 
             # Move to next Wednesday
             current_date = week_end.replace(hour=17)
@@ -568,6 +678,7 @@ class UnifiedOrchestrator:
             "warnings": self.results["warnings"],
             "stats": self.results["stats"],
             "orchestrator_type": "split_orchestrator",
+            "preview_cached": self.preview_cache_hit,
             "start_date": self.start_date,
             "end_date": self.end_date,
             "shift_types": self.shift_types,
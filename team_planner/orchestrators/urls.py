@@ -39,6 +39,11 @@ urlpatterns = [
         api.orchestrator_automation_status_api,
         name="automation_status_api",
     ),
+    path(
+        "api/progress/<str:task_id>/stream/",
+        api.orchestrator_progress_stream_api,
+        name="progress_stream_api",
+    ),
     path("api/enable-auto/", api.orchestrator_enable_auto_api, name="enable_auto_api"),
     path(
         "api/clear-shifts/", api.orchestrator_clear_shifts_api, name="clear_shifts_api",
@@ -85,6 +90,11 @@ urlpatterns = [
         api_v2.orchestrator_metrics_v2,
         name="metrics_v2",
     ),
+    path(
+        "api/orchestrator-status/runs/",
+        api_v2.orchestrator_run_telemetry_v2,
+        name="run_telemetry_v2",
+    ),
     # Preview system (placeholder views for now)
     # path('preview/', views.preview_view, name='preview'),
     # path('apply-preview/', views.apply_preview, name='apply_preview'),
@@ -128,6 +128,7 @@ def create_orchestration(request):
                         }
 
                         run.status = OrchestrationRun.Status.PREVIEW
+                        orchestrator.telemetry.apply_to(run)
                         run.save()
 
                         shift_summary = []
@@ -160,6 +161,7 @@ def create_orchestration(request):
                         "incidents_standby_shifts"
                     ]
                     run.waakdienst_shifts_created = result["waakdienst_shifts"]
+                    orchestrator.telemetry.apply_to(run)
                     run.save()
 
                     # Create results records
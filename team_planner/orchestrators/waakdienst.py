@@ -21,6 +21,7 @@ from zoneinfo import ZoneInfo
 from team_planner.leaves.models import LeaveRequest
 from team_planner.orchestrators.base_orchestrator import BaseOrchestrator
 from team_planner.orchestrators.fairness_calculators import WaakdienstFairnessCalculator
+from team_planner.orchestrators.templates import template_cache
 from team_planner.orchestrators.utils.time_windows import get_waakdienst_week_bounds
 from team_planner.orchestrators.utils.time_windows import get_waakdienst_week_start
 from team_planner.orchestrators.utils.time_windows import waakdienst_daily_window
@@ -67,10 +68,11 @@ class WaakdienstOrchestrator(BaseOrchestrator):
         Returns one template to avoid duplicate assignments.
         Prefers templates with reasonable waakdienst durations (15-24 hours).
         """
-        # Get all active templates for waakdienst
-        candidates = ShiftTemplate.objects.filter(
-            shift_type=ShiftType.WAAKDIENST, is_active=True,
-        ).order_by("duration_hours")
+        # Get all active templates for waakdienst from the shared map
+        candidates = sorted(
+            template_cache.active(ShiftType.WAAKDIENST),
+            key=lambda template: template.duration_hours,
+        )
 
         # Select the best template for waakdienst work
         selected_template = None
@@ -82,8 +84,8 @@ class WaakdienstOrchestrator(BaseOrchestrator):
                 break
 
         # If no suitable template found but at least one exists, use the first
-        if not selected_template and candidates.exists():
-            selected_template = candidates.first()
+        if not selected_template and candidates:
+            selected_template = candidates[0]
 
         # If none exist, auto-provision a safe default to unblock orchestration
         if not selected_template:
@@ -98,6 +100,8 @@ class WaakdienstOrchestrator(BaseOrchestrator):
                     "is_active": True,
                 },
             )
+            # Load the provisioned template into the shared map right away
+            template_cache.refresh()
 
         return [selected_template] if selected_template else []
 
@@ -231,9 +235,13 @@ class WaakdienstOrchestrator(BaseOrchestrator):
             start_date, end_date,
         )
 
-        # Get available employees and shift templates
-        employees = self.get_available_employees()
-        shift_templates = self._get_shift_templates()
+        # Get available employees and shift templates (from the shared map,
+        # reloaded only if templates changed)
+        template_cache.refresh()
+        with self.telemetry.phase("employees") as stats:
+            employees = self.get_available_employees()
+            shift_templates = self._get_shift_templates()
+            stats.rows = len(employees)
 
         if not employees:
             return {
@@ -258,28 +266,33 @@ class WaakdienstOrchestrator(BaseOrchestrator):
         assigned_employees = set()
 
         # Assign each week to an available employee
-        for week_start, week_end in waakdienst_weeks:
-            # Find best employee for this entire week
-            week_employee = self._select_employee_for_week(
-                employees, week_start, assignments,
-            )
-
-            if week_employee:
-                # Generate all daily shifts for this week with the same employee
-                week_assignments = self._generate_week_assignments(
-                    week_employee, week_start, week_end, shift_templates[0],
+        with self.telemetry.phase("assignment") as stats:
+            for week_start, week_end in waakdienst_weeks:
+                # Find best employee for this entire week
+                week_employee = self._select_employee_for_week(
+                    employees, week_start, assignments,
                 )
-                assignments.extend(week_assignments)
-                assigned_employees.add(week_employee.pk)
+
+                if week_employee:
+                    # Generate all daily shifts for this week with the same employee
+                    week_assignments = self._generate_week_assignments(
+                        week_employee, week_start, week_end, shift_templates[0],
+                    )
+                    assignments.extend(week_assignments)
+                    assigned_employees.add(week_employee.pk)
+            stats.rows = len(assignments)
 
         # Calculate fairness metrics for the generated assignments
-        fairness_metrics = self._calculate_assignment_fairness(assignments, employees)
+        with self.telemetry.phase("fairness"):
+            fairness_metrics = self._calculate_assignment_fairness(assignments, employees)
 
         # If not a dry run, save the assignments to the database
         if not dry_run and assignments:
-            self._save_orchestration_results(
-                start_date, end_date, assignments, fairness_metrics,
-            )
+            with self.telemetry.phase("persist") as stats:
+                created = self._save_orchestration_results(
+                    start_date, end_date, assignments, fairness_metrics,
+                )
+                stats.rows = len(created or [])
 
         return {
             "assignments": assignments,
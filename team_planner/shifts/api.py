@@ -62,6 +62,19 @@ def respond_to_swap_request_api(request, pk):
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def dashboard_overview_api(request):
+    """Landing-page payload: today's team roster plus the user's own section.
+
+    Replaces separate calls to /shifts/api/dashboard/ and
+    /api/users/me/dashboard/ with one round-trip and a fixed query count.
+    """
+    from .services.dashboard import DashboardService
+
+    return Response(DashboardService(request.user).get_dashboard())
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def user_upcoming_shifts_api(request):
@@ -456,6 +469,57 @@ def get_team_members_api(request):
         return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def swap_candidates_api(request):
+    """API endpoint to rank team members as takers for one of the user's shifts."""
+    try:
+        from team_planner.teams.models import TeamMembership
+
+        from .services.swap_validation import SwapValidator
+
+        shift_id = request.GET.get("shift_id")
+        if not shift_id:
+            return Response(
+                {"error": "shift_id parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        shift = get_object_or_404(Shift.objects.select_related("template"), pk=shift_id)
+        if shift.assigned_employee_id != request.user.pk:
+            return Response(
+                {"error": "You can only look for swap candidates for your own shifts."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        team_ids = TeamMembership.objects.filter(user=request.user).values("team_id")
+        team_members = list(
+            User.objects.filter(teammembership__team__id__in=team_ids, is_active=True)
+            .exclude(pk=request.user.pk)
+            .distinct()
+            .order_by("name", "username"),
+        )
+        errors = SwapValidator.candidates(shift, [user.pk for user in team_members])
+
+        candidates = [
+            {
+                "id": user.pk,
+                "username": user.username,
+                "display_name": getattr(user, "display_name", user.username),
+                "eligible": not errors[user.pk],
+                "errors": errors[user.pk],
+            }
+            for user in team_members
+        ]
+        # Eligible candidates first, keeping the name order within each group
+        candidates.sort(key=lambda candidate: not candidate["eligible"])
+
+        return Response({"shift_id": shift.pk, "candidates": candidates})
+
+    except Exception as e:
+        return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def get_employee_shifts_api(request):
@@ -512,9 +576,43 @@ def create_bulk_swap_request_api(request):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        from .services.swap_validation import SwapValidator
+
         created_requests = []
         failed_requests = []
 
+        def valid_ids(*keys):
+            # Malformed ids are skipped here and reported per item by lookup()
+            ids = set()
+            for item in shifts_data:
+                for key in keys:
+                    try:
+                        ids.add(int(item.get(key)))
+                    except (AttributeError, TypeError, ValueError):
+                        pass
+            return ids
+
+        # Load every referenced shift, employee and pending request up front
+        shifts = Shift.objects.select_related("template").in_bulk(
+            valid_ids("requesting_shift_id", "target_shift_id"),
+        )
+        employees = User.objects.in_bulk(valid_ids("target_employee_id"))
+        pending_shift_ids = set(
+            SwapRequest.objects.filter(
+                requesting_shift__in=list(shifts), status=SwapRequest.Status.PENDING,
+            ).values_list("requesting_shift_id", flat=True),
+        )
+        validator = SwapValidator(
+            [shift for shift in shifts.values() if shift.assigned_employee_id == request.user.pk],
+            list(employees),
+        )
+
+        def lookup(objects, pk):
+            try:
+                return objects[int(pk)]
+            except (KeyError, TypeError, ValueError):
+                return None
+
         for shift_data in shifts_data:
             try:
                 requesting_shift_id = shift_data.get("requesting_shift_id")
@@ -522,8 +620,16 @@ def create_bulk_swap_request_api(request):
                 target_shift_id = shift_data.get("target_shift_id")
 
                 # Validate requesting shift
-                requesting_shift = get_object_or_404(Shift, pk=requesting_shift_id)
-                if requesting_shift.assigned_employee != request.user:
+                requesting_shift = lookup(shifts, requesting_shift_id)
+                if requesting_shift is None:
+                    failed_requests.append(
+                        {
+                            "requesting_shift_id": requesting_shift_id,
+                            "error": "Shift not found.",
+                        },
+                    )
+                    continue
+                if requesting_shift.assigned_employee_id != request.user.pk:
                     failed_requests.append(
                         {
                             "requesting_shift_id": requesting_shift_id,
@@ -543,8 +649,16 @@ def create_bulk_swap_request_api(request):
                     continue
 
                 # Validate target employee
-                target_employee = get_object_or_404(User, pk=target_employee_id)
-                if target_employee == request.user:
+                target_employee = lookup(employees, target_employee_id)
+                if target_employee is None:
+                    failed_requests.append(
+                        {
+                            "requesting_shift_id": requesting_shift_id,
+                            "error": "Target employee not found.",
+                        },
+                    )
+                    continue
+                if target_employee.pk == request.user.pk:
                     failed_requests.append(
                         {
                             "requesting_shift_id": requesting_shift_id,
@@ -556,8 +670,8 @@ def create_bulk_swap_request_api(request):
                 # Validate target shift if provided
                 target_shift = None
                 if target_shift_id:
-                    target_shift = get_object_or_404(Shift, pk=target_shift_id)
-                    if target_shift.assigned_employee != target_employee:
+                    target_shift = lookup(shifts, target_shift_id)
+                    if target_shift is None or target_shift.assigned_employee_id != target_employee.pk:
                         failed_requests.append(
                             {
                                 "requesting_shift_id": requesting_shift_id,
@@ -567,11 +681,7 @@ def create_bulk_swap_request_api(request):
                         continue
 
                 # Check for existing pending swap requests for this shift
-                existing_request = SwapRequest.objects.filter(
-                    requesting_shift=requesting_shift, status=SwapRequest.Status.PENDING,
-                ).first()
-
-                if existing_request:
+                if requesting_shift.pk in pending_shift_ids:
                     failed_requests.append(
                         {
                             "requesting_shift_id": requesting_shift_id,
@@ -580,6 +690,18 @@ def create_bulk_swap_request_api(request):
                     )
                     continue
 
+                validation_errors = validator.errors(
+                    request.user.pk, requesting_shift, target_employee.pk, target_shift,
+                )
+                if validation_errors:
+                    failed_requests.append(
+                        {
+                            "requesting_shift_id": requesting_shift_id,
+                            "error": "; ".join(validation_errors),
+                        },
+                    )
+                    continue
+
                 # Create the swap request
                 swap_request = SwapRequest.objects.create(
                     requesting_employee=request.user,
@@ -589,6 +711,7 @@ def create_bulk_swap_request_api(request):
                     reason=reason,
                     status=SwapRequest.Status.PENDING,
                 )
+                pending_shift_ids.add(requesting_shift.pk)
 
                 # Send notification to target employee
                 try:
@@ -2169,7 +2292,7 @@ def swap_audit_trail_api(request, swap_id):
     
     audit_entries = SwapApprovalAudit.objects.filter(
         swap_request=swap_request
-    ).select_related('actor', 'approval_chain', 'approval_rule').order_by('created')
+    ).select_related('actor', 'approval_chain', 'approval_rule').order_by('created', 'id')
     
     audit_data = []
     for entry in audit_entries:
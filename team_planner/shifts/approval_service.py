@@ -13,9 +13,24 @@ This module provides business logic for:
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
 from django.db import transaction
-from django.db.models import Q, Count
+from django.db.models import (
+    Avg,
+    Count,
+    DurationField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    Min,
+    OuterRef,
+    Q,
+    Window,
+)
+from django.db.models.functions import CumeDist
 from django.utils import timezone
 
 from .models import (
@@ -26,9 +41,74 @@ from .models import (
     ApprovalDelegation,
     SwapApprovalAudit,
 )
+from .services.approval_rules import rule_index
+from .services.audit import audit_buffer, record_swap_action
 
 User = get_user_model()
 
+# Nearest-rank percentiles reported by get_approval_statistics
+APPROVAL_LATENCY_PERCENTILES = (0.5, 0.9, 0.95)
+
+_APPROVAL_LATENCY = ExpressionWrapper(
+    F('approved_datetime') - F('created'), output_field=DurationField()
+)
+_APPROVAL_LATENCY_VIA_SWAP = ExpressionWrapper(
+    F('swap_request__approved_datetime') - F('swap_request__created'),
+    output_field=DurationField(),
+)
+
+
+def _hours(latency: Optional[timedelta]) -> Optional[float]:
+    return latency.total_seconds() / 3600 if latency is not None else None
+
+
+def _statistics_cache_seconds() -> int:
+    return int(getattr(settings, "SWAP_APPROVAL_STATS_CACHE_SECONDS", 24 * 60 * 60))
+
+
+def _latency_percentiles(approved_swaps) -> Dict[float, Optional[timedelta]]:
+    """
+    Nearest-rank approval latency percentiles in one query: the smallest
+    latency whose cumulative distribution reaches each fraction, aggregated
+    over one window annotation.
+    """
+    ranked = approved_swaps.filter(approved_datetime__isnull=False).annotate(
+        latency=_APPROVAL_LATENCY,
+        distribution=Window(CumeDist(), order_by=F('latency').asc()),
+    )
+    percentiles = ranked.aggregate(**{
+        f"p{index}": Min('latency', filter=Q(distribution__gte=fraction))
+        for index, fraction in enumerate(APPROVAL_LATENCY_PERCENTILES)
+    })
+    return {
+        fraction: percentiles[f"p{index}"]
+        for index, fraction in enumerate(APPROVAL_LATENCY_PERCENTILES)
+    }
+
+
+def _load_swap_shifts(swap_request: SwapRequest) -> Tuple[Shift, Optional[Shift]]:
+    """
+    The swap's shifts with their templates, fetched in one query unless the
+    caller already loaded them. The shifts stay cached on ``swap_request`` for
+    the auto-approval checks and the swap itself.
+    """
+    fields = [SwapRequest.requesting_shift]
+    if swap_request.target_shift_id:
+        fields.append(SwapRequest.target_shift)
+    if all(
+        field.is_cached(swap_request) and Shift.template.is_cached(getattr(swap_request, field.field.name))
+        for field in fields
+    ):
+        return swap_request.requesting_shift, swap_request.target_shift
+    
+    shifts = Shift.objects.select_related('template').in_bulk(
+        [swap_request.requesting_shift_id, swap_request.target_shift_id]
+    )
+    swap_request.requesting_shift = shifts[swap_request.requesting_shift_id]
+    if swap_request.target_shift_id:
+        swap_request.target_shift = shifts[swap_request.target_shift_id]
+    return swap_request.requesting_shift, swap_request.target_shift
+
 
 class ApprovalRuleEvaluator:
     """Evaluates approval rules and determines if auto-approval is possible."""
@@ -44,30 +124,11 @@ class ApprovalRuleEvaluator:
         Returns:
             The applicable rule or None if no rules match
         """
-        # Get requesting and target shifts
-        requesting_shift = swap_request.requesting_shift
-        target_shift = swap_request.target_shift
-        
-        # Start with active rules ordered by priority
-        rules = SwapApprovalRule.objects.filter(is_active=True).order_by('-priority', 'name')
-        
-        # Filter by shift type
-        for rule in rules:
-            # Check shift types
-            if rule.applies_to_shift_types:
-                shift_types = rule.applies_to_shift_types
-                req_type = requesting_shift.template.shift_type
-                if req_type not in shift_types:
-                    continue
-                if target_shift:
-                    tgt_type = target_shift.template.shift_type
-                    if tgt_type not in shift_types:
-                        continue
-            
-            # If we made it here, rule is applicable
-            return rule
-        
-        return None
+        requesting_shift, target_shift = _load_swap_shifts(swap_request)
+        return rule_index.match(
+            requesting_shift.template.shift_type,
+            target_shift.template.shift_type if target_shift else None,
+        )
     
     @staticmethod
     def evaluate_auto_approval(
@@ -160,59 +221,55 @@ class ApprovalRuleEvaluator:
         Returns:
             List of created approval chain steps
         """
-        chain_steps = []
+        # Managers and admins are resolved together, first by pk like before
+        is_manager = Exists(
+            Permission.objects.filter(codename='can_manage_team').filter(
+                Q(user=OuterRef('pk')) | Q(group__user=OuterRef('pk'))
+            )
+        )
+        candidates = list(
+            User.objects.annotate(is_manager=is_manager)
+            .filter(Q(is_manager=True) | Q(is_superuser=True))
+            .order_by('pk')
+        )
+        manager = next((u for u in candidates if u.is_manager), None)
+        admin = next((u for u in candidates if u.is_superuser), None)
         
-        # Determine approvers based on rule
         approvers = []
-        
-        if rule.requires_manager_approval:
-            # Find the manager (simplified - would need proper org structure)
-            # For now, find users with can_manage_team permission
-            managers = User.objects.filter(
-                Q(user_permissions__codename='can_manage_team') |
-                Q(groups__permissions__codename='can_manage_team')
-            ).distinct()
-            
-            if managers.exists():
-                approvers.append(managers.first())
-        
-        if rule.requires_admin_approval:
-            # Find admins
-            admins = User.objects.filter(is_superuser=True)
-            if admins.exists():
-                approvers.append(admins.first())
-        
-        # If no specific approvers found, add at least one level
-        if not approvers:
-            # Default to superusers
-            approvers = list(User.objects.filter(is_superuser=True)[:1])
-        
-        # Create approval chain steps
-        for level, approver in enumerate(approvers, start=1):
-            if level > rule.approval_levels_required:
-                break
-            
-            # Check for active delegations
-            active_delegation = ApprovalDelegation.objects.filter(
-                delegator=approver,
-                is_active=True,
-                start_date__lte=date.today(),
-            ).filter(
-                Q(end_date__isnull=True) | Q(end_date__gte=date.today())
-            ).first()
-            
-            actual_approver = active_delegation.delegate if active_delegation else approver
-            
-            chain_step = SwapApprovalChain.objects.create(
+        if rule.requires_manager_approval and manager:
+            approvers.append(manager)
+        if rule.requires_admin_approval and admin:
+            approvers.append(admin)
+        
+        # If no specific approvers found, default to a superuser
+        if not approvers and admin:
+            approvers = [admin]
+        
+        approvers = approvers[:rule.approval_levels_required]
+        
+        # Active delegations for all approvers, newest first per delegator
+        today = date.today()
+        delegates = {}
+        delegations = ApprovalDelegation.objects.filter(
+            delegator__in=approvers,
+            is_active=True,
+            start_date__lte=today,
+        ).filter(
+            Q(end_date__isnull=True) | Q(end_date__gte=today)
+        ).select_related('delegate').order_by('-start_date', 'pk')
+        for delegation in delegations:
+            delegates.setdefault(delegation.delegator_id, delegation.delegate)
+        
+        return SwapApprovalChain.objects.bulk_create([
+            SwapApprovalChain(
                 swap_request=swap_request,
                 approval_rule=rule,
                 level=level,
-                approver=actual_approver,
+                approver=delegates.get(approver.pk, approver),
                 status=SwapApprovalChain.Status.PENDING,
             )
-            chain_steps.append(chain_step)
-        
-        return chain_steps
+            for level, approver in enumerate(approvers, start=1)
+        ])
 
 
 class SwapApprovalService:
@@ -220,6 +277,7 @@ class SwapApprovalService:
     
     @staticmethod
     @transaction.atomic
+    @audit_buffer()
     def process_new_swap_request(swap_request: SwapRequest) -> Dict:
         """
         Process a new swap request and determine approval workflow.
@@ -243,7 +301,7 @@ class SwapApprovalService:
             }
             
             # Create audit entry
-            SwapApprovalAudit.objects.create(
+            record_swap_action(
                 swap_request=swap_request,
                 action=SwapApprovalAudit.Action.CREATED,
                 actor=swap_request.requesting_employee,
@@ -253,7 +311,7 @@ class SwapApprovalService:
             return result
         
         # Create audit entry for rule application
-        SwapApprovalAudit.objects.create(
+        record_swap_action(
             swap_request=swap_request,
             action=SwapApprovalAudit.Action.RULE_APPLIED,
             actor=swap_request.requesting_employee,
@@ -275,7 +333,7 @@ class SwapApprovalService:
             swap_request.save()
             
             # Create audit entry
-            SwapApprovalAudit.objects.create(
+            record_swap_action(
                 swap_request=swap_request,
                 action=SwapApprovalAudit.Action.AUTO_APPROVED,
                 actor=None,  # System
@@ -314,6 +372,7 @@ class SwapApprovalService:
     
     @staticmethod
     @transaction.atomic
+    @audit_buffer()
     def process_approval_decision(
         chain_step: SwapApprovalChain,
         approver: User,
@@ -353,7 +412,7 @@ class SwapApprovalService:
             chain_step.approve(notes)
             
             # Create audit entry
-            SwapApprovalAudit.objects.create(
+            record_swap_action(
                 swap_request=swap_request,
                 action=SwapApprovalAudit.Action.APPROVED,
                 actor=approver,
@@ -394,7 +453,7 @@ class SwapApprovalService:
             chain_step.reject(notes)
             
             # Create audit entry
-            SwapApprovalAudit.objects.create(
+            record_swap_action(
                 swap_request=swap_request,
                 action=SwapApprovalAudit.Action.REJECTED,
                 actor=approver,
@@ -418,6 +477,7 @@ class SwapApprovalService:
     
     @staticmethod
     @transaction.atomic
+    @audit_buffer()
     def delegate_approval(
         chain_step: SwapApprovalChain,
         delegator: User,
@@ -445,7 +505,7 @@ class SwapApprovalService:
             raise ValueError("User does not have authority to delegate this approval")
         
         # Create audit entry
-        SwapApprovalAudit.objects.create(
+        record_swap_action(
             swap_request=chain_step.swap_request,
             action=SwapApprovalAudit.Action.DELEGATED,
             actor=delegator,
@@ -487,6 +547,11 @@ class SwapApprovalService:
         """
         Get approval statistics for a date range.
         
+        Aggregated in the database in three queries: counts and average
+        latency, the per-rule breakdown, and the latency percentiles. Closed
+        periods (ending before today) are cached once none of their requests
+        is still pending, as their figures can no longer change.
+        
         Args:
             start_date: Start date for statistics
             end_date: End date for statistics
@@ -494,42 +559,83 @@ class SwapApprovalService:
         Returns:
             Dict with approval statistics
         """
+        closed = end_date < timezone.localdate()
+        cache_key = f"swap_approval_stats:{start_date.isoformat()}:{end_date.isoformat()}"
+        if closed:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         swaps = SwapRequest.objects.filter(
             created__date__gte=start_date,
             created__date__lte=end_date,
         )
-        
-        total_requests = swaps.count()
-        auto_approved = swaps.filter(
-            approved_by__isnull=True,
-            status=SwapRequest.Status.APPROVED,
-        ).count()
-        
-        manually_approved = swaps.filter(
-            approved_by__isnull=False,
-            status=SwapRequest.Status.APPROVED,
-        ).count()
-        
-        rejected = swaps.filter(status=SwapRequest.Status.REJECTED).count()
-        pending = swaps.filter(status=SwapRequest.Status.PENDING).count()
-        
-        # Average approval time
-        approved_swaps = swaps.filter(status=SwapRequest.Status.APPROVED)
-        avg_approval_time = None
-        if approved_swaps.exists():
-            total_time = sum([
-                (s.approved_datetime - s.created).total_seconds()
-                for s in approved_swaps if s.approved_datetime
-            ])
-            avg_approval_time = total_time / approved_swaps.count() / 3600  # in hours
-        
-        return {
+        approved = Q(status=SwapRequest.Status.APPROVED)
+        auto = approved & Q(approved_by__isnull=True)
+        
+        counts = swaps.aggregate(
+            total_requests=Count('pk'),
+            auto_approved=Count('pk', filter=auto),
+            manually_approved=Count('pk', filter=approved & Q(approved_by__isnull=False)),
+            **{status: Count('pk', filter=Q(status=status)) for status in SwapRequest.Status.values},
+            average_latency=Avg(_APPROVAL_LATENCY, filter=approved),
+        )
+        total_requests = counts['total_requests']
+        
+        by_rule = [
+            {
+                "rule_id": row['approval_rule_id'],
+                "rule": row['approval_rule__name'],
+                "total_requests": row['total'],
+                "auto_approved": row['auto_approved'],
+                "approved": row['approved'],
+                "rejected": row['rejected'],
+                "average_approval_time_hours": _hours(row['average_latency']),
+            }
+            for row in SwapApprovalAudit.objects.filter(
+                action=SwapApprovalAudit.Action.RULE_APPLIED,
+                swap_request__in=swaps,
+            ).values('approval_rule_id', 'approval_rule__name').annotate(
+                total=Count('swap_request', distinct=True),
+                auto_approved=Count(
+                    'swap_request', distinct=True,
+                    filter=Q(swap_request__status=SwapRequest.Status.APPROVED,
+                             swap_request__approved_by__isnull=True),
+                ),
+                approved=Count(
+                    'swap_request', distinct=True,
+                    filter=Q(swap_request__status=SwapRequest.Status.APPROVED),
+                ),
+                rejected=Count(
+                    'swap_request', distinct=True,
+                    filter=Q(swap_request__status=SwapRequest.Status.REJECTED),
+                ),
+                average_latency=Avg(
+                    _APPROVAL_LATENCY_VIA_SWAP,
+                    filter=Q(swap_request__status=SwapRequest.Status.APPROVED),
+                ),
+            ).order_by('-total', 'approval_rule__name')
+        ]
+        
+        auto_approved = counts['auto_approved']
+        manually_approved = counts['manually_approved']
+        statistics = {
             "total_requests": total_requests,
             "auto_approved": auto_approved,
             "manually_approved": manually_approved,
-            "rejected": rejected,
-            "pending": pending,
+            "rejected": counts[SwapRequest.Status.REJECTED],
+            "pending": counts[SwapRequest.Status.PENDING],
+            "by_status": {status: counts[status] for status in SwapRequest.Status.values},
             "auto_approval_rate": (auto_approved / total_requests * 100) if total_requests > 0 else 0,
             "approval_rate": ((auto_approved + manually_approved) / total_requests * 100) if total_requests > 0 else 0,
-            "average_approval_time_hours": avg_approval_time,
+            "average_approval_time_hours": _hours(counts['average_latency']),
+            "approval_time_percentiles_hours": {
+                f"p{round(fraction * 100)}": _hours(latency)
+                for fraction, latency in _latency_percentiles(swaps.filter(approved)).items()
+            },
+            "by_rule": by_rule,
         }
+        
+        if closed and not statistics["pending"]:
+            cache.set(cache_key, statistics, _statistics_cache_seconds())
+        return statistics
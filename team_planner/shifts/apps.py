@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class ShiftsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "team_planner.shifts"
+
+    def ready(self):
+        try:
+            import team_planner.shifts.signals  # noqa: F401
+        except ImportError:
+            pass
@@ -23,6 +23,14 @@ from .models import Shift, ShiftTemplate
 User = get_user_model()
 
 
+def _refresh_calendar_feeds(employee_ids) -> None:
+    """bulk_create/bulk_update skip signals, so bump calendar feed versions explicitly."""
+    from team_planner.notifications.calendar_feed import bump_feed_version
+
+    ids = set(employee_ids)
+    transaction.on_commit(lambda: bump_feed_version(ids))
+
+
 class BulkOperationError(Exception):
     """Raised when a bulk operation fails validation."""
     pass
@@ -139,6 +147,7 @@ class BulkShiftService:
             with transaction.atomic():
                 created_shifts = Shift.objects.bulk_create(shifts_to_create)
                 result['created'] = len(created_shifts)
+                _refresh_calendar_feeds(s.assigned_employee_id for s in created_shifts)
                 
                 # Increment template usage
                 template.usage_count += len(created_shifts)
@@ -296,6 +305,7 @@ class BulkShiftService:
                     ['start_datetime', 'end_datetime']
                 )
                 result['updated'] = len(shifts_to_update)
+                _refresh_calendar_feeds(s.assigned_employee_id for s in shifts_to_update)
         
         return result
     
@@ -503,5 +513,6 @@ class BulkShiftService:
             with transaction.atomic():
                 created_shifts = Shift.objects.bulk_create(shifts_to_create)
                 result['created'] = len(created_shifts)
+                _refresh_calendar_feeds(s.assigned_employee_id for s in created_shifts)
         
         return result
@@ -0,0 +1,43 @@
+# Indexes for the shift and actor audit timelines. Audit entries are written in
+# bulk at commit (see shifts/services/audit.py), so entries of one unit of work
+# share a timestamp and are ordered by id within it.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('shifts', '0009_add_performance_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='shiftauditlog',
+            index=models.Index(
+                fields=['shift', '-created', '-id'],
+                name='shift_audit_shift_time_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='shiftauditlog',
+            index=models.Index(
+                fields=['actor', '-created', '-id'],
+                name='shift_audit_actor_time_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='swapapprovalaudit',
+            index=models.Index(
+                fields=['swap_request', 'created', 'id'],
+                name='swap_audit_swap_time_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='swapapprovalaudit',
+            index=models.Index(
+                fields=['actor', '-created'],
+                name='swap_audit_actor_time_idx'
+            ),
+        ),
+    ]
@@ -283,7 +283,13 @@ class SwapRequest(TimeStampedModel):
             requester_email = getattr(self.requesting_employee, "email", None)
             target_email = getattr(self.target_employee, "email", None)
             shift_summary = f"Shift on {self.requesting_shift.start_datetime.strftime('%Y-%m-%d %H:%M')}"
-            notify_swap_approved(requester_email, target_email, shift_summary, ics)
+            notify_swap_approved(
+                requester_email,
+                target_email,
+                shift_summary,
+                ics,
+                idempotency_key=f"swap-approved-ics:{self.pk}",
+            )
         except Exception:
             pass
 
@@ -361,50 +367,23 @@ class SwapRequest(TimeStampedModel):
             )
 
     def validate_swap(self):
-        """Validate that the swap is feasible."""
-        errors = []
-
-        # Check if employees are the same
-        if self.requesting_employee == self.target_employee:
-            errors.append("Cannot swap shift with yourself")
-
-        # Check if requesting employee owns the requesting shift
-        if self.requesting_shift.assigned_employee != self.requesting_employee:
-            errors.append("You can only swap your own shifts")
-
-        # If target shift exists, check if target employee owns it
-        if (
-            self.target_shift
-            and self.target_shift.assigned_employee != self.target_employee
-        ):
-            errors.append("Target employee must own the target shift")
-
-        # Check if shifts overlap for target employee (if no target shift)
-        if not self.target_shift:
-            overlapping_shifts = Shift.objects.filter(
-                assigned_employee=self.target_employee,
-                start_datetime__lt=self.requesting_shift.end_datetime,
-                end_datetime__gt=self.requesting_shift.start_datetime,
-            ).exclude(pk=self.requesting_shift.pk)
-
-            if overlapping_shifts.exists():
-                errors.append(
-                    "Target employee has conflicting shifts during this period",
-                )
-
-        # Check if target employee has availability for the shift type
-        try:
-            profile = self.target_employee.employee_profile
-            shift_type = self.requesting_shift.template.shift_type
+        """Validate that the swap is feasible.
 
-            if shift_type == "incidents" and not profile.available_for_incidents:
-                errors.append("Target employee is not available for incident shifts")
-            elif shift_type == "waakdienst" and not profile.available_for_waakdienst:
-                errors.append("Target employee is not available for waakdienst shifts")
-        except:
-            errors.append("Target employee profile not found")
+        Use ``services.swap_validation.SwapValidator`` directly to validate
+        many candidates or requests at once.
+        """
+        from .services.swap_validation import SwapValidator
 
-        return errors
+        requesting_shift = Shift.objects.select_related("template").get(
+            pk=self.requesting_shift_id,
+        )
+        validator = SwapValidator([requesting_shift], [self.target_employee_id])
+        return validator.errors(
+            self.requesting_employee_id,
+            requesting_shift,
+            self.target_employee_id,
+            self.target_shift,
+        )
 
 
 class FairnessScore(TimeStampedModel):
@@ -665,6 +644,17 @@ class ShiftAuditLog(TimeStampedModel):
         verbose_name = _("Shift Audit Log")
         verbose_name_plural = _("Shift Audit Logs")
         ordering = ["-created", "-id"]
+        indexes = [
+            # Per-shift and per-actor history timelines
+            models.Index(fields=["shift", "-created", "-id"], name="shift_audit_shift_time_idx"),
+            models.Index(fields=["actor", "-created", "-id"], name="shift_audit_actor_time_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            msg = "Shift audit log entries cannot be modified"
+            raise ValueError(msg)
+        super().save(*args, **kwargs)
 
 
 class RecurringShiftPattern(TimeStampedModel):
@@ -1130,7 +1120,18 @@ class SwapApprovalAudit(TimeStampedModel):
         verbose_name = _("Swap Approval Audit")
         verbose_name_plural = _("Swap Approval Audits")
         ordering = ["-created"]
+        indexes = [
+            # Audit trail of one swap request, and per-actor activity
+            models.Index(fields=["swap_request", "created", "id"], name="swap_audit_swap_time_idx"),
+            models.Index(fields=["actor", "-created"], name="swap_audit_actor_time_idx"),
+        ]
     
     def __str__(self):
         actor_name = self.actor if self.actor else "System"
         return f"{self.get_action_display()} by {actor_name} at {self.created}"
+    
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            msg = "Swap approval audit entries cannot be modified"
+            raise ValueError(msg)
+        super().save(*args, **kwargs)
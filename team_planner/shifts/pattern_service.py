@@ -6,6 +6,7 @@ from typing import List, Optional
 from django.db import models, transaction
 from django.utils import timezone
 
+from team_planner.notifications.services import NotificationService
 from team_planner.shifts.models import RecurringShiftPattern, Shift
 
 
@@ -52,7 +53,8 @@ class RecurringPatternService:
         
         created_shifts = []
         
-        with transaction.atomic():
+        # One digest for the assignee instead of a notification per shift
+        with transaction.atomic(), NotificationService.coalesce_shift_notifications():
             for shift_date in shift_dates:
                 # Check for existing shift
                 if skip_existing and pattern.assigned_employee:
@@ -86,6 +88,8 @@ class RecurringPatternService:
                     auto_assigned=False,
                     assignment_reason=f"Generated from pattern: {pattern.name}",
                 )
+                if pattern.assigned_employee:
+                    NotificationService.notify_shift_assigned(pattern.assigned_employee, shift)
                 created_shifts.append(shift)
             
             # Update last generated date
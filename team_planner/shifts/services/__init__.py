@@ -3,4 +3,16 @@ Services module for Team Planner shifts app.
 
 Contains business logic services including:
 - ConflictDetector: Scheduling conflict detection
+- reassign_shift_transactional / swap_shifts_transactional: audited shift
+  changes (see shift_changes.py)
 """
+
+from .shift_changes import ReassignmentResult
+from .shift_changes import reassign_shift_transactional
+from .shift_changes import swap_shifts_transactional
+
+__all__ = [
+    "ReassignmentResult",
+    "reassign_shift_transactional",
+    "swap_shifts_transactional",
+]
@@ -0,0 +1,86 @@
+"""
+Process-wide index of active swap approval rules.
+
+``ApprovalRuleEvaluator.find_applicable_rule`` used to load every active rule
+for each swap request and walk them in Python. The rules rarely change, so
+they are compiled once into per-shift-type lists that keep the evaluation
+order (priority descending, then name):
+
+    rule_index.match("incidents", "waakdienst")   # highest-priority match
+
+Rules with an empty ``applies_to_shift_types`` apply to every type and are
+merged into each list. Rule saves and deletes bump a version key in the
+shared cache on commit (see ``signals.py``); each process compares that key
+with the version it compiled and reloads on mismatch, so a warm lookup costs
+one cache read and no queries.
+"""
+
+from __future__ import annotations
+
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Optional
+
+from django.core.cache import cache
+
+from team_planner.shifts.models import SwapApprovalRule
+
+VERSION_KEY = "swap_approval_rules:version"
+
+_UNLOADED = object()
+
+
+@dataclass(frozen=True)
+class _CompiledRule:
+    rule: SwapApprovalRule
+    shift_types: frozenset
+
+    def applies_to(self, shift_type: str) -> bool:
+        return not self.shift_types or shift_type in self.shift_types
+
+
+class ApprovalRuleIndex:
+    """Active rules in evaluation order, grouped by the shift types they cover."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._version = _UNLOADED
+        self._by_type: dict[str, list[_CompiledRule]] = {}
+        self._universal: list[_CompiledRule] = []
+
+    def _load(self, version) -> None:
+        compiled = [
+            _CompiledRule(rule, frozenset(rule.applies_to_shift_types or ()))
+            for rule in SwapApprovalRule.objects.filter(is_active=True).order_by("-priority", "name")
+        ]
+        shift_types = {t for entry in compiled for t in entry.shift_types}
+        self._by_type = {
+            shift_type: [entry for entry in compiled if entry.applies_to(shift_type)]
+            for shift_type in shift_types
+        }
+        self._universal = [entry for entry in compiled if not entry.shift_types]
+        self._version = version
+
+    def _candidates(self, shift_type: str) -> list[_CompiledRule]:
+        version = cache.get(VERSION_KEY)
+        with self._lock:
+            if version != self._version:
+                self._load(version)
+            return self._by_type.get(shift_type, self._universal)
+
+    def match(self, shift_type: str, target_shift_type: Optional[str] = None) -> Optional[SwapApprovalRule]:
+        """Highest-priority active rule covering both shift types."""
+        for entry in self._candidates(shift_type):
+            if target_shift_type is None or entry.applies_to(target_shift_type):
+                return entry.rule
+        return None
+
+    def invalidate(self) -> None:
+        """Make every process recompile on its next lookup."""
+        cache.set(VERSION_KEY, uuid.uuid4().hex, None)
+        with self._lock:
+            self._version = _UNLOADED
+
+
+rule_index = ApprovalRuleIndex()
@@ -0,0 +1,94 @@
+"""
+Buffered writer for shift and swap approval audit entries.
+
+Swap execution, reassignment and the approval flows used to INSERT each
+``ShiftAuditLog`` / ``SwapApprovalAudit`` row as it happened. They now collect
+entries in an ``audit_buffer()`` unit of work, which writes them with one
+``bulk_create`` per model when the surrounding transaction commits:
+
+    with audit_buffer() as audit:
+        audit.shift_change(action=..., shift=shift, ...)
+        audit.swap_action(action=..., swap_request=swap, ...)
+
+Buffers nest: an inner ``audit_buffer()`` joins the outer one, so a bulk
+operation wrapping many reassignments writes all of their entries at once.
+``audit_buffer()`` also decorates functions, and ``record_swap_action()``
+records a single entry into whichever buffer is active.
+
+Entries keep the order they were recorded in (ascending primary keys within
+each model), are never updated once written, and are dropped together with
+the work they describe: an exception leaving a buffer discards the entries it
+recorded, and a rolled-back transaction never runs the commit hook.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Iterator, List
+
+from django.db import models, transaction
+
+from team_planner.shifts.models import ShiftAuditLog, SwapApprovalAudit
+
+_local = threading.local()
+
+
+class AuditBuffer:
+    """Audit entries recorded during one unit of work, in recording order."""
+
+    def __init__(self):
+        self.entries: List[models.Model] = []
+
+    def add(self, entry: models.Model) -> models.Model:
+        if entry.pk is not None:
+            msg = "Audit entries are append-only"
+            raise ValueError(msg)
+        self.entries.append(entry)
+        return entry
+
+    def shift_change(self, **fields) -> ShiftAuditLog:
+        return self.add(ShiftAuditLog(**fields))
+
+    def swap_action(self, **fields) -> SwapApprovalAudit:
+        return self.add(SwapApprovalAudit(**fields))
+
+
+def write_entries(entries: List[models.Model]) -> None:
+    """Insert ``entries`` with one bulk_create per model, preserving order."""
+    by_model: dict = {}
+    for entry in entries:
+        by_model.setdefault(type(entry), []).append(entry)
+    for model, rows in by_model.items():
+        model.objects.bulk_create(rows)
+
+
+@contextmanager
+def audit_buffer() -> Iterator[AuditBuffer]:
+    """Collect audit entries and write them when the current transaction commits."""
+    outer = getattr(_local, "buffer", None)
+    if outer is not None:
+        mark = len(outer.entries)
+        try:
+            yield outer
+        except BaseException:
+            # Like a savepoint: forget what the failed inner block recorded
+            del outer.entries[mark:]
+            raise
+        return
+
+    buffer = AuditBuffer()
+    _local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _local.buffer = None
+    if buffer.entries:
+        transaction.on_commit(partial(write_entries, buffer.entries))
+
+
+def record_swap_action(**fields) -> SwapApprovalAudit:
+    """Record one ``SwapApprovalAudit`` entry in the active (or a new) buffer."""
+    with audit_buffer() as audit:
+        return audit.swap_action(**fields)
@@ -0,0 +1,303 @@
+"""
+Dashboard Service for Team Planner
+
+Composes the landing-page payload (today's team roster, the user's upcoming
+shifts, swap inbox/outbox, activity and shift/leave counters) in a fixed
+number of queries, independent of team size or history length:
+
+    team section: memberships (1), today's shifts (1), engineer counts (1)
+    user section: shift counters (1), upcoming (1), recent (1),
+                  pending swaps (1), recent swaps (1), leave counters (1)
+
+Both sections are cached for DASHBOARD_CACHE_SECONDS (per team set and per
+user respectively), so repeated page loads within the TTL cost no queries.
+
+Usage:
+    from team_planner.shifts.services.dashboard import DashboardService
+
+    payload = DashboardService(request.user).get_dashboard()
+"""
+
+import hashlib
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from team_planner.leaves.models import LeaveRequest
+from team_planner.shifts.models import Shift, ShiftType, SwapRequest
+from team_planner.teams.models import TeamMembership
+
+User = get_user_model()
+
+ACTIVE_SHIFT_STATUSES = [
+    Shift.Status.SCHEDULED,
+    Shift.Status.CONFIRMED,
+    Shift.Status.IN_PROGRESS,
+]
+
+
+def _shift_data(shift: Optional[Shift], now: datetime) -> Optional[Dict[str, Any]]:
+    """Compact shift representation shared by all dashboard sections."""
+    if shift is None:
+        return None
+    return {
+        "id": shift.id,
+        "title": f"{shift.template.name} - {shift.template.shift_type}",
+        "start_time": shift.start_datetime.isoformat(),
+        "end_time": shift.end_datetime.isoformat(),
+        "shift_type": shift.template.shift_type,
+        "status": shift.status,
+        "is_upcoming": shift.start_datetime >= now,
+    }
+
+
+def _person_data(user) -> Dict[str, Any]:
+    return {
+        "id": user.id,
+        "username": user.username,
+        "first_name": getattr(user, "first_name", None),
+        "last_name": getattr(user, "last_name", None),
+    }
+
+
+class DashboardService:
+    """Builds the team and user dashboard sections with bounded query counts."""
+
+    def __init__(self, user, cache_seconds: Optional[int] = None):
+        self.user = user
+        self.now = timezone.now()
+        self.today = timezone.localdate()
+        self.cache_seconds = (
+            cache_seconds
+            if cache_seconds is not None
+            else int(getattr(settings, "DASHBOARD_CACHE_SECONDS", 30))
+        )
+
+    # Public API
+
+    def get_dashboard(self) -> Dict[str, Any]:
+        """Single composed payload for the landing page."""
+        return {
+            "team": self.get_team_dashboard(),
+            "user": self.get_user_dashboard(),
+        }
+
+    def get_team_dashboard(self) -> Dict[str, Any]:
+        """Today's roster for the user's teams (cached per team set and day)."""
+        team_ids, member_ids = self._team_scope()
+        scope = ",".join(map(str, team_ids)) or "all"
+        key = "dashboard:team:{}:{}".format(
+            hashlib.md5(scope.encode()).hexdigest(), self.today.isoformat(),  # noqa: S324
+        )
+        data = cache.get(key)
+        if data is None:
+            data = self._build_team_dashboard(member_ids)
+            cache.set(key, data, self.cache_seconds)
+        return data
+
+    def get_user_dashboard(self) -> Dict[str, Any]:
+        """Personal shifts, swaps and counters (cached per user)."""
+        key = f"dashboard:user:{self.user.pk}"
+        data = cache.get(key)
+        if data is None:
+            data = self._build_user_dashboard()
+            cache.set(key, data, self.cache_seconds)
+        return data
+
+    @staticmethod
+    def invalidate_user(user_id: int) -> None:
+        cache.delete(f"dashboard:user:{user_id}")
+
+    # Team section
+
+    def _team_scope(self) -> tuple[List[int], Optional[List[int]]]:
+        """Return (team_ids, member_ids) in one query; member_ids None means all users."""
+        memberships = list(
+            TeamMembership.objects.filter(
+                team__teammembership__user=self.user,
+                team__teammembership__is_active=True,
+                is_active=True,
+            )
+            .values_list("team_id", "user_id")
+            .distinct()
+        )
+        if not memberships:
+            # Not in any team: fall back to showing all engineers
+            return [], None
+        team_ids = sorted({team_id for team_id, _ in memberships})
+        member_ids = sorted({user_id for _, user_id in memberships})
+        return team_ids, member_ids
+
+    def _build_team_dashboard(self, member_ids: Optional[List[int]]) -> Dict[str, Any]:
+        start_of_day = timezone.make_aware(datetime.combine(self.today, datetime.min.time()))
+        end_of_day = timezone.make_aware(datetime.combine(self.today, datetime.max.time()))
+
+        users = User.objects.filter(is_active=True)
+        shifts = Shift.objects.filter(
+            start_datetime__lte=end_of_day,
+            end_datetime__gte=start_of_day,
+            status__in=ACTIVE_SHIFT_STATUSES,
+        )
+        if member_ids is not None:
+            users = users.filter(id__in=member_ids)
+            shifts = shifts.filter(assigned_employee_id__in=member_ids)
+
+        counts = users.aggregate(
+            total=Count("id", distinct=True),
+            on_leave=Count(
+                "id",
+                distinct=True,
+                filter=Q(
+                    leave_requests__status=LeaveRequest.Status.APPROVED,
+                    leave_requests__start_date__lte=self.today,
+                    leave_requests__end_date__gte=self.today,
+                ),
+            ),
+        )
+
+        data: Dict[str, Any] = {
+            "incident_engineer": None,
+            "incident_standby_engineer": None,
+            "waakdienst_engineer": None,
+            "engineers_working": [],
+            "engineers_working_count": 0,
+            "total_engineers": counts["total"],
+            "available_engineers": counts["total"] - counts["on_leave"],
+            "engineers_on_leave": counts["on_leave"],
+        }
+        role_keys = {
+            ShiftType.INCIDENTS: "incident_engineer",
+            ShiftType.INCIDENTS_STANDBY: "incident_standby_engineer",
+            ShiftType.WAAKDIENST: "waakdienst_engineer",
+        }
+        working: Dict[int, Dict[str, Any]] = {}
+        for shift in shifts.select_related("template", "assigned_employee").order_by("start_datetime"):
+            employee = shift.assigned_employee
+            engineer = {
+                "id": employee.pk,
+                "name": employee.name or employee.username,
+                "username": employee.username,
+            }
+            role_key = role_keys.get(shift.template.shift_type)
+            if role_key:
+                data[role_key] = engineer
+            working.setdefault(employee.pk, engineer)
+
+        data["engineers_working"] = list(working.values())
+        data["engineers_working_count"] = len(working)
+        return data
+
+    # User section
+
+    def _build_user_dashboard(self) -> Dict[str, Any]:
+        user, now = self.user, self.now
+        start_of_month = self.today.replace(day=1)
+        next_month = (start_of_month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+        own_shifts = Shift.objects.filter(assigned_employee=user)
+        in_month = Q(start_datetime__gte=start_of_month, start_datetime__lt=next_month)
+        shift_counts = own_shifts.aggregate(
+            total_shifts_this_month=Count("id", filter=in_month),
+            completed_shifts=Count("id", filter=in_month & Q(status=Shift.Status.COMPLETED)),
+            upcoming_shifts=Count("id", filter=Q(start_datetime__gte=now, start_datetime__lt=next_month)),
+        )
+
+        upcoming = own_shifts.filter(start_datetime__gte=now).select_related("template").order_by("start_datetime")[:5]
+        recent_shifts = (
+            own_shifts.filter(modified__gte=now - timedelta(days=7))
+            .select_related("template")
+            .order_by("-modified")[:3]
+        )
+
+        pending_swaps = list(
+            SwapRequest.objects.filter(
+                Q(target_employee=user) | Q(requesting_employee=user),
+                status=SwapRequest.Status.PENDING,
+            ).select_related(
+                "requesting_employee",
+                "target_employee",
+                "requesting_shift__template",
+                "target_shift__template",
+            )
+        )
+        incoming = [s for s in pending_swaps if s.target_employee_id == user.pk]
+        outgoing = [s for s in pending_swaps if s.requesting_employee_id == user.pk]
+
+        recent_swaps = (
+            SwapRequest.objects.filter(requesting_employee=user)
+            .select_related("target_shift__template")
+            .order_by("-created")[:2]
+        )
+
+        leave_counts = LeaveRequest.objects.filter(employee=user).aggregate(
+            pending=Count("id", filter=Q(status=LeaveRequest.Status.PENDING)),
+            upcoming_approved=Count(
+                "id",
+                filter=Q(status=LeaveRequest.Status.APPROVED, end_date__gte=self.today),
+            ),
+        )
+
+        activities = [
+            {
+                "id": f"shift_{shift.id}",
+                "type": "shift",
+                "message": f"Shift {shift.template.name} on {shift.start_datetime.date()}",
+                "status": "info",
+                "created_at": shift.modified.isoformat(),
+                "related_object_id": shift.id,
+            }
+            for shift in recent_shifts
+        ] + [
+            {
+                "id": f"swap_{swap.id}",
+                "type": "swap_request",
+                "message": "Swap request {} for {}".format(
+                    swap.status,
+                    swap.target_shift.template.name if swap.target_shift else "Unknown shift",
+                ),
+                "status": swap.status,
+                "created_at": swap.created.isoformat(),
+                "related_object_id": swap.id,
+            }
+            for swap in recent_swaps
+        ]
+        activities.sort(key=lambda x: x["created_at"], reverse=True)
+
+        return {
+            "upcoming_shifts": [_shift_data(shift, now) for shift in upcoming],
+            "incoming_swap_requests": [
+                {
+                    "id": swap.id,
+                    "requester": _person_data(swap.requesting_employee),
+                    "target_shift": _shift_data(swap.target_shift, now),
+                    "offered_shift": _shift_data(swap.requesting_shift, now),
+                    "status": swap.status,
+                    "created_at": swap.created.isoformat(),
+                    "message": swap.reason or None,
+                }
+                for swap in incoming
+            ],
+            "outgoing_swap_requests": [
+                {
+                    "id": swap.id,
+                    "target_employee": _person_data(swap.target_employee),
+                    "requested_shift": _shift_data(swap.target_shift, now),
+                    "offered_shift": _shift_data(swap.requesting_shift, now),
+                    "status": swap.status,
+                    "created_at": swap.created.isoformat(),
+                    "message": swap.reason or None,
+                }
+                for swap in outgoing
+            ],
+            "recent_activities": activities[:5],
+            "shift_stats": {
+                **shift_counts,
+                "swap_requests_pending": len(outgoing),
+            },
+            "leave_stats": leave_counts,
+        }
@@ -1,11 +1,20 @@
+"""
+Transactional shift reassignment and swap execution with audit trail.
+
+Audit entries go through the audit buffer (see audit.py) and are written in
+bulk when the surrounding transaction commits.
+"""
+
 from __future__ import annotations
 
 from dataclasses import dataclass
 
 from django.db import transaction
 
-from .models import Shift
-from .models import ShiftAuditLog
+from team_planner.shifts.models import Shift
+from team_planner.shifts.models import ShiftAuditLog
+
+from .audit import audit_buffer
 
 
 @dataclass
@@ -48,15 +57,16 @@ def reassign_shift_transactional(
     shift.notes = f"{(shift.notes or '').strip()}\n{reason}".strip()
     shift.save(update_fields=["assigned_employee", "notes", "modified"])
 
-    ShiftAuditLog.objects.create(
-        action=ShiftAuditLog.Action.REASSIGNED,
-        shift=shift,
-        from_employee=from_employee,
-        to_employee=new_employee,
-        actor=actor,
-        reason=reason,
-        source=source,
-    )
+    with audit_buffer() as audit:
+        audit.shift_change(
+            action=ShiftAuditLog.Action.REASSIGNED,
+            shift=shift,
+            from_employee=from_employee,
+            to_employee=new_employee,
+            actor=actor,
+            reason=reason,
+            source=source,
+        )
 
     return ReassignmentResult(
         shift_id=int(shift.pk),
@@ -115,21 +125,22 @@ def swap_shifts_transactional(
     shift_a.save(update_fields=["assigned_employee", "notes", "modified"])
     shift_b.save(update_fields=["assigned_employee", "notes", "modified"])
 
-    ShiftAuditLog.objects.create(
-        action=ShiftAuditLog.Action.SWAP_APPROVED,
-        shift=shift_a,
-        from_employee=emp_a,
-        to_employee=emp_b,
-        actor=actor,
-        reason=reason,
-        source=source,
-    )
-    ShiftAuditLog.objects.create(
-        action=ShiftAuditLog.Action.SWAP_APPROVED,
-        shift=shift_b,
-        from_employee=emp_b,
-        to_employee=emp_a,
-        actor=actor,
-        reason=reason,
-        source=source,
-    )
+    with audit_buffer() as audit:
+        audit.shift_change(
+            action=ShiftAuditLog.Action.SWAP_APPROVED,
+            shift=shift_a,
+            from_employee=emp_a,
+            to_employee=emp_b,
+            actor=actor,
+            reason=reason,
+            source=source,
+        )
+        audit.shift_change(
+            action=ShiftAuditLog.Action.SWAP_APPROVED,
+            shift=shift_b,
+            from_employee=emp_b,
+            to_employee=emp_a,
+            actor=actor,
+            reason=reason,
+            source=source,
+        )
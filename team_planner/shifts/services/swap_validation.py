@@ -0,0 +1,156 @@
+"""
+Batch validation of shift swaps.
+
+``SwapRequest.validate_swap`` used to query overlaps and the target's profile
+per request, so matching a shift against every team member, or validating a
+bulk selection, cost queries per candidate. ``SwapValidator`` loads what the
+checks need for a set of requesting shifts and candidate employees up front:
+
+    overlapping shifts (1), employee profiles (1), approved leave (1)
+
+and then validates any number of (shift, candidate) pairs in memory:
+
+    validator = SwapValidator([shift], candidate_ids)
+    errors = validator.errors(requester_id, shift, candidate_id)
+
+``validate_swaps()`` does the same for existing swap requests.
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from django.db.models import Q
+
+from team_planner.employees.models import EmployeeProfile
+from team_planner.leaves.models import LeaveRequest
+from team_planner.leaves.models import LeaveType
+from team_planner.shifts.models import Shift, ShiftType, SwapRequest
+
+
+class SwapValidator:
+    """Validates swaps of ``shifts`` towards ``employee_ids`` in a fixed number of queries."""
+
+    def __init__(self, shifts: Iterable[Shift], employee_ids: Iterable[int]):
+        shifts = [shift for shift in shifts if shift is not None]
+        employee_ids = {pk for pk in employee_ids if pk}
+        self._shifts: Dict[int, List[tuple]] = defaultdict(list)
+        self._profiles: Dict[int, tuple] = {}
+        self._leaves: Dict[int, List[tuple]] = defaultdict(list)
+        if not shifts or not employee_ids:
+            return
+
+        windows = Q()
+        leave_windows = Q()
+        for shift in shifts:
+            windows |= Q(start_datetime__lt=shift.end_datetime, end_datetime__gt=shift.start_datetime)
+            leave_windows |= Q(
+                start_date__lte=shift.end_datetime.date(),
+                end_date__gte=shift.start_datetime.date(),
+            )
+
+        for row in (
+            Shift.objects.filter(windows, assigned_employee_id__in=employee_ids)
+            .exclude(status=Shift.Status.CANCELLED)
+            .values_list("assigned_employee_id", "pk", "start_datetime", "end_datetime")
+        ):
+            self._shifts[row[0]].append(row[1:])
+
+        for user_id, incidents, waakdienst in EmployeeProfile.objects.filter(
+            user_id__in=employee_ids,
+        ).values_list("user_id", "available_for_incidents", "available_for_waakdienst"):
+            self._profiles[user_id] = (incidents, waakdienst)
+
+        for row in LeaveRequest.objects.filter(
+            leave_windows,
+            employee_id__in=employee_ids,
+            status=LeaveRequest.Status.APPROVED,
+        ).values_list("employee_id", "start_date", "end_date", "leave_type__conflict_handling"):
+            self._leaves[row[0]].append(row[1:])
+
+    def _has_overlap(self, employee_id: int, shift: Shift) -> bool:
+        return any(
+            pk != shift.pk and start < shift.end_datetime and end > shift.start_datetime
+            for pk, start, end in self._shifts.get(employee_id, ())
+        )
+
+    def _on_leave(self, employee_id: int, shift: Shift) -> bool:
+        shift_type = shift.template.shift_type
+        first_day, last_day = shift.start_datetime.date(), shift.end_datetime.date()
+        return any(
+            start <= last_day and end >= first_day
+            and LeaveType.blocks_shift_type(handling, shift_type)
+            for start, end, handling in self._leaves.get(employee_id, ())
+        )
+
+    def errors(
+        self,
+        requesting_employee_id: int,
+        requesting_shift: Shift,
+        target_employee_id: int,
+        target_shift: Optional[Shift] = None,
+    ) -> List[str]:
+        """Reasons the swap is not feasible; empty when it is."""
+        errors = []
+
+        if requesting_employee_id == target_employee_id:
+            errors.append("Cannot swap shift with yourself")
+
+        if requesting_shift.assigned_employee_id != requesting_employee_id:
+            errors.append("You can only swap your own shifts")
+
+        if target_shift and target_shift.assigned_employee_id != target_employee_id:
+            errors.append("Target employee must own the target shift")
+
+        # A plain handover needs the target to be free during the shift
+        if not target_shift and self._has_overlap(target_employee_id, requesting_shift):
+            errors.append("Target employee has conflicting shifts during this period")
+
+        if self._on_leave(target_employee_id, requesting_shift):
+            errors.append("Target employee is on leave during this period")
+
+        profile = self._profiles.get(target_employee_id)
+        shift_type = requesting_shift.template.shift_type
+        if profile is None:
+            errors.append("Target employee profile not found")
+        elif shift_type == ShiftType.INCIDENTS and not profile[0]:
+            errors.append("Target employee is not available for incident shifts")
+        elif shift_type == ShiftType.WAAKDIENST and not profile[1]:
+            errors.append("Target employee is not available for waakdienst shifts")
+
+        return errors
+
+    @classmethod
+    def candidates(
+        cls, requesting_shift: Shift, employee_ids: Iterable[int],
+    ) -> Dict[int, List[str]]:
+        """Validation errors for handing ``requesting_shift`` to each employee."""
+        employee_ids = list(employee_ids)
+        validator = cls([requesting_shift], employee_ids)
+        return {
+            employee_id: validator.errors(
+                requesting_shift.assigned_employee_id, requesting_shift, employee_id,
+            )
+            for employee_id in employee_ids
+        }
+
+
+def validate_swaps(swap_requests: Iterable[SwapRequest]) -> Dict[int, List[str]]:
+    """Validation errors per swap request pk, for any number of requests."""
+    swap_requests = list(swap_requests)
+    shifts = Shift.objects.select_related("template").in_bulk(
+        {s.requesting_shift_id for s in swap_requests}
+        | {s.target_shift_id for s in swap_requests if s.target_shift_id},
+    )
+    validator = SwapValidator(
+        [shifts[s.requesting_shift_id] for s in swap_requests],
+        {s.target_employee_id for s in swap_requests},
+    )
+    return {
+        swap.pk: validator.errors(
+            swap.requesting_employee_id,
+            shifts[swap.requesting_shift_id],
+            swap.target_employee_id,
+            shifts.get(swap.target_shift_id),
+        )
+        for swap in swap_requests
+    }
@@ -0,0 +1,41 @@
+"""
+Django signals for the shifts app.
+
+Keeps the short-lived dashboard cache (see services/dashboard.py) from showing
+stale swaps or shifts right after the user acted on them, and recompiles the
+approval rule index (see services/approval_rules.py) after rule changes.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Shift, SwapApprovalRule, SwapRequest
+from .services.approval_rules import rule_index
+from .services.dashboard import DashboardService
+
+
+def _invalidate_dashboards_on_commit(*user_ids):
+    def invalidate():
+        for user_id in {uid for uid in user_ids if uid}:
+            DashboardService.invalidate_user(user_id)
+
+    transaction.on_commit(invalidate)
+
+
+@receiver(post_save, sender=SwapRequest)
+@receiver(post_delete, sender=SwapRequest)
+def invalidate_swap_dashboards(sender, instance, **kwargs):
+    _invalidate_dashboards_on_commit(instance.requesting_employee_id, instance.target_employee_id)
+
+
+@receiver(post_save, sender=Shift)
+@receiver(post_delete, sender=Shift)
+def invalidate_shift_dashboards(sender, instance, **kwargs):
+    _invalidate_dashboards_on_commit(instance.assigned_employee_id)
+
+
+@receiver(post_save, sender=SwapApprovalRule)
+@receiver(post_delete, sender=SwapApprovalRule)
+def invalidate_approval_rule_index(sender, instance, **kwargs):
+    transaction.on_commit(rule_index.invalidate)
@@ -1,8 +1,10 @@
 from datetime import timedelta
 
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import Client
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -318,3 +320,461 @@ class PhaseThreeIntegrationTestCase(TestCase):
         assert Shift in admin.site._registry
         assert SwapRequest in admin.site._registry
         assert ShiftTemplate in admin.site._registry
+
+
+class DashboardServiceTestCase(TestCase):
+    """The dashboard payload is built in a fixed number of queries."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="dash", email="dash@example.com", password="testpass123",
+        )
+        self.other = User.objects.create_user(
+            username="dash2", email="dash2@example.com", password="testpass123",
+        )
+        self.template = ShiftTemplate.objects.create(
+            name="Incidents", shift_type="incidents", duration_hours=8,
+        )
+        start = timezone.now() + timedelta(days=1)
+        self.shifts = [
+            Shift.objects.create(
+                template=self.template,
+                assigned_employee=self.user if i % 2 == 0 else self.other,
+                start_datetime=start + timedelta(days=i),
+                end_datetime=start + timedelta(days=i, hours=8),
+            )
+            for i in range(8)
+        ]
+        for i in range(0, 6, 2):
+            SwapRequest.objects.create(
+                requesting_employee=self.other,
+                target_employee=self.user,
+                requesting_shift=self.shifts[i + 1],
+                target_shift=self.shifts[i],
+                reason="Please swap",
+            )
+
+    def test_dashboard_query_count_is_bounded(self):
+        from .services.dashboard import DashboardService
+
+        with self.assertNumQueries(9):
+            payload = DashboardService(self.user).get_dashboard()
+
+        assert len(payload["user"]["incoming_swap_requests"]) == 3
+        assert payload["user"]["incoming_swap_requests"][0]["message"] == "Please swap"
+        assert len(payload["user"]["upcoming_shifts"]) == 4
+        assert payload["team"]["total_engineers"] == 2
+
+        # Cached: only the team scope lookup runs on a repeat load
+        with self.assertNumQueries(1):
+            DashboardService(self.user).get_dashboard()
+
+    def test_dashboard_endpoint_returns_both_sections(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse("api:dashboard"))
+
+        assert response.status_code == 200
+        assert set(response.json()) == {"team", "user"}
+
+    def test_swap_change_invalidates_user_section(self):
+        from .services.dashboard import DashboardService
+
+        assert len(DashboardService(self.user).get_user_dashboard()["incoming_swap_requests"]) == 3
+        with self.captureOnCommitCallbacks(execute=True):
+            SwapRequest.objects.filter(target_employee=self.user).first().delete()
+
+        assert len(DashboardService(self.user).get_user_dashboard()["incoming_swap_requests"]) == 2
+
+
+class ApprovalRuleIndexTestCase(TestCase):
+    """Rule matching is served from the compiled index; chains are batch-built."""
+
+    def setUp(self):
+        from datetime import date
+
+        from django.contrib.auth.models import Permission
+        from django.contrib.contenttypes.models import ContentType
+        from django.core.cache import cache
+
+        from .models import ApprovalDelegation
+        from .models import SwapApprovalRule
+        from .services.approval_rules import rule_index
+
+        cache.clear()
+        rule_index.invalidate()
+        self.requester = User.objects.create_user(username="rule-a", password="testpass123")
+        self.target = User.objects.create_user(username="rule-b", password="testpass123")
+        self.manager = User.objects.create_user(username="rule-manager", password="testpass123")
+        self.manager.user_permissions.add(
+            Permission.objects.create(
+                codename="can_manage_team",
+                name="Can manage team",
+                content_type=ContentType.objects.get_for_model(SwapApprovalRule),
+            ),
+        )
+        self.admin = User.objects.create_superuser(username="rule-admin", password="testpass123")
+        self.delegate = User.objects.create_user(username="rule-delegate", password="testpass123")
+        ApprovalDelegation.objects.create(
+            delegator=self.admin, delegate=self.delegate, start_date=date.today(),
+        )
+        templates = {
+            shift_type: ShiftTemplate.objects.create(
+                name=f"rule-{shift_type}", shift_type=shift_type, duration_hours=8,
+            )
+            for shift_type in ("incidents", "waakdienst")
+        }
+        start = timezone.now() + timedelta(days=3)
+
+        def shift(user, shift_type, day):
+            return Shift.objects.create(
+                template=templates[shift_type], assigned_employee=user,
+                start_datetime=start + timedelta(days=day),
+                end_datetime=start + timedelta(days=day, hours=8),
+            )
+
+        self.same_type = SwapRequest.objects.create(
+            requesting_employee=self.requester, target_employee=self.target,
+            requesting_shift=shift(self.requester, "incidents", 0),
+            target_shift=shift(self.target, "incidents", 0),
+        )
+        self.mixed = SwapRequest.objects.create(
+            requesting_employee=self.requester, target_employee=self.target,
+            requesting_shift=shift(self.requester, "incidents", 1),
+            target_shift=shift(self.target, "waakdienst", 1),
+        )
+        self.fallback = SwapApprovalRule.objects.create(name="Fallback", priority=1)
+        self.incidents = SwapApprovalRule.objects.create(
+            name="Incidents", priority=5, applies_to_shift_types=["incidents"],
+            requires_admin_approval=True, approval_levels_required=2,
+        )
+
+    def fresh(self, swap):
+        return SwapRequest.objects.get(pk=swap.pk)
+
+    def test_matching_uses_index_and_follows_rule_changes(self):
+        from .approval_service import ApprovalRuleEvaluator
+
+        assert ApprovalRuleEvaluator.find_applicable_rule(self.fresh(self.same_type)) == self.incidents
+        # Warm index: only the swap's shifts and templates are loaded
+        mixed = self.fresh(self.mixed)
+        with self.assertNumQueries(1):
+            assert ApprovalRuleEvaluator.find_applicable_rule(mixed) == self.fallback
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.incidents.applies_to_shift_types = ["incidents", "waakdienst"]
+            self.incidents.save()
+        assert ApprovalRuleEvaluator.find_applicable_rule(self.fresh(self.mixed)) == self.incidents
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.incidents.delete()
+        assert ApprovalRuleEvaluator.find_applicable_rule(self.fresh(self.same_type)) == self.fallback
+
+    def test_approval_chain_resolves_approvers_and_delegations_in_bulk(self):
+        from .approval_service import ApprovalRuleEvaluator
+
+        with self.assertNumQueries(3):
+            steps = ApprovalRuleEvaluator.create_approval_chain(self.same_type, self.incidents)
+
+        assert [(s.level, s.approver) for s in steps] == [(1, self.manager), (2, self.delegate)]
+        assert self.same_type.approval_chain.count() == 2
+
+
+class ApprovalStatisticsTestCase(TestCase):
+    """Approval statistics are aggregated in the database."""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        from .models import SwapApprovalAudit
+        from .models import SwapApprovalRule
+
+        cache.clear()
+        self.requester = User.objects.create_user(username="stats-a", password="testpass123")
+        self.target = User.objects.create_user(username="stats-b", password="testpass123")
+        self.approver = User.objects.create_user(username="stats-approver", password="testpass123")
+        template = ShiftTemplate.objects.create(
+            name="stats", shift_type="incidents", duration_hours=8,
+        )
+        rule = SwapApprovalRule.objects.create(name="Same type", auto_approve_enabled=True)
+        self.created = timezone.now() - timedelta(days=40)
+        # (status, approved_by, hours until decided)
+        outcomes = [
+            (SwapRequest.Status.APPROVED, None, 1),
+            (SwapRequest.Status.APPROVED, None, 2),
+            (SwapRequest.Status.APPROVED, self.approver, 10),
+            (SwapRequest.Status.APPROVED, self.approver, 20),
+            (SwapRequest.Status.REJECTED, None, None),
+        ]
+        for i, (status, approved_by, hours) in enumerate(outcomes):
+            start = timezone.now() + timedelta(days=i + 1)
+            shifts = [
+                Shift.objects.create(
+                    template=template, assigned_employee=user,
+                    start_datetime=start, end_datetime=start + timedelta(hours=8),
+                )
+                for user in (self.requester, self.target)
+            ]
+            swap = SwapRequest.objects.create(
+                requesting_employee=self.requester, target_employee=self.target,
+                requesting_shift=shifts[0], target_shift=shifts[1],
+            )
+            SwapRequest.objects.filter(pk=swap.pk).update(
+                status=status,
+                approved_by=approved_by,
+                created=self.created,
+                approved_datetime=self.created + timedelta(hours=hours) if hours else None,
+            )
+            if i < 2:
+                SwapApprovalAudit.objects.create(
+                    swap_request=swap, action=SwapApprovalAudit.Action.RULE_APPLIED,
+                    actor=self.requester, approval_rule=rule,
+                )
+
+    def test_statistics_are_aggregated_and_cached_for_closed_periods(self):
+        from .approval_service import SwapApprovalService
+
+        day = timezone.localdate(self.created)
+        # Counts and averages, per-rule breakdown, and all percentiles
+        with self.assertNumQueries(3):
+            stats = SwapApprovalService.get_approval_statistics(day, day)
+
+        assert stats["total_requests"] == 5
+        assert stats["auto_approved"] == 2
+        assert stats["manually_approved"] == 2
+        assert stats["by_status"]["rejected"] == 1
+        assert stats["auto_approval_rate"] == 40
+        assert round(stats["average_approval_time_hours"], 2) == 8.25
+        assert stats["approval_time_percentiles_hours"] == {"p50": 2, "p90": 20, "p95": 20}
+        assert stats["by_rule"][0]["rule"] == "Same type"
+        assert stats["by_rule"][0]["auto_approved"] == 2
+        assert round(stats["by_rule"][0]["average_approval_time_hours"], 2) == 1.5
+
+        # The period is closed and nothing is pending: served from the cache
+        with self.assertNumQueries(0):
+            assert SwapApprovalService.get_approval_statistics(day, day) == stats
+
+
+class SwapCandidateValidationTestCase(TestCase):
+    """Swap candidates are validated together in a fixed number of queries."""
+
+    def setUp(self):
+        from team_planner.teams.models import Department
+        from team_planner.teams.models import Team
+
+        self.team = Team.objects.create(
+            name="Swap team", department=Department.objects.create(name="Swap dept"),
+        )
+        self.template = ShiftTemplate.objects.create(
+            name="swap-incidents", shift_type="incidents", duration_hours=8,
+        )
+        self.leave_type = LeaveType.objects.create(
+            name="Swap vacation",
+            conflict_handling=LeaveType.ConflictHandling.FULL_UNAVAILABLE,
+        )
+        self.start = timezone.now() + timedelta(days=7)
+        self.owner = self.member("swap-owner")
+        self.shift = self.give_shift(self.owner)
+        self.client.force_login(self.owner)
+
+    def member(self, username, incidents=True):
+        from team_planner.teams.models import TeamMembership
+
+        user = User.objects.create_user(username=username, password="testpass123")
+        EmployeeProfile.objects.create(
+            user=user, employee_id=username, hire_date=timezone.now().date(),
+            available_for_incidents=incidents,
+        )
+        TeamMembership.objects.create(user=user, team=self.team)
+        return user
+
+    def give_shift(self, user, offset_hours=0):
+        return Shift.objects.create(
+            template=self.template, assigned_employee=user,
+            start_datetime=self.start + timedelta(hours=offset_hours),
+            end_datetime=self.start + timedelta(hours=offset_hours + 8),
+        )
+
+    def candidates(self):
+        response = self.client.get(
+            reverse("shifts:swap_candidates_api"), {"shift_id": self.shift.pk},
+        )
+        assert response.status_code == 200
+        return {c["username"]: c["errors"] for c in response.json()["candidates"]}
+
+    def test_candidates_are_validated_in_one_batch(self):
+        free = self.member("swap-free")
+        busy = self.member("swap-busy")
+        self.give_shift(busy, offset_hours=4)
+        away = self.member("swap-away")
+        LeaveRequest.objects.create(
+            employee=away, leave_type=self.leave_type,
+            start_date=self.start.date(), end_date=self.start.date(),
+            days_requested=1, status=LeaveRequest.Status.APPROVED,
+        )
+        self.member("swap-unavailable", incidents=False)
+
+        with CaptureQueriesContext(connection) as queries:
+            candidates = self.candidates()
+
+        assert candidates == {
+            "swap-free": [],
+            "swap-busy": ["Target employee has conflicting shifts during this period"],
+            "swap-away": ["Target employee is on leave during this period"],
+            "swap-unavailable": ["Target employee is not available for incident shifts"],
+        }
+        assert list(candidates)[0] == free.username
+
+        for i in range(3):
+            self.member(f"swap-extra-{i}")
+        with CaptureQueriesContext(connection) as more:
+            assert len(self.candidates()) == 7
+        assert len(more.captured_queries) == len(queries.captured_queries)
+
+    def test_validate_swap_uses_the_batch_validator(self):
+        busy = self.member("swap-single")
+        self.give_shift(busy, offset_hours=2)
+        swap = SwapRequest.objects.create(
+            requesting_employee=self.owner, target_employee=busy, requesting_shift=self.shift,
+        )
+
+        assert swap.validate_swap() == [
+            "Target employee has conflicting shifts during this period",
+        ]
+
+    def test_bulk_create_reports_malformed_ids_per_item(self):
+        free = self.member("swap-bulk-free")
+
+        response = self.client.post(
+            reverse("shifts:create_bulk_swap_request_api"),
+            {
+                "shifts": [
+                    {"requesting_shift_id": self.shift.pk, "target_employee_id": free.pk},
+                    {"requesting_shift_id": "abc", "target_employee_id": free.pk},
+                ],
+            },
+            content_type="application/json",
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data["created_requests"]) == 1
+        assert data["failed_requests"] == [
+            {"requesting_shift_id": "abc", "error": "Shift not found."},
+        ]
+
+
+class AuditWriterTestCase(TestCase):
+    """Audit entries are buffered per unit of work and bulk-written at commit."""
+
+    def setUp(self):
+        self.template = ShiftTemplate.objects.create(
+            name="audit", shift_type="incidents", duration_hours=8,
+        )
+        self.owner = User.objects.create_user(username="audit-owner", password="testpass123")
+        self.taker = User.objects.create_user(username="audit-taker", password="testpass123")
+        start = timezone.now() + timedelta(days=2)
+        self.shifts = [
+            Shift.objects.create(
+                template=self.template, assigned_employee=self.owner,
+                start_datetime=start + timedelta(days=i),
+                end_datetime=start + timedelta(days=i, hours=8),
+            )
+            for i in range(3)
+        ]
+
+    def test_entries_are_written_in_one_insert_at_commit(self):
+        from django.db import transaction
+
+        from .models import ShiftAuditLog
+        from .services import reassign_shift_transactional
+        from .services.audit import audit_buffer
+
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic(), audit_buffer():
+                for shift in self.shifts:
+                    reassign_shift_transactional(shift=shift, new_employee=self.taker)
+                # Overlaps with the shift just handed over: rolled back, not audited
+                with self.assertRaises(ValueError):
+                    reassign_shift_transactional(
+                        shift=Shift.objects.create(
+                            template=self.template, assigned_employee=self.owner,
+                            start_datetime=self.shifts[0].start_datetime,
+                            end_datetime=self.shifts[0].end_datetime,
+                        ),
+                        new_employee=self.taker,
+                    )
+                assert not ShiftAuditLog.objects.exists()
+
+        inserts = [q for q in queries.captured_queries if q["sql"].startswith('INSERT INTO "shifts_shiftauditlog"')]
+        assert len(inserts) == 1
+        entries = list(ShiftAuditLog.objects.order_by("id"))
+        assert [e.shift_id for e in entries] == [s.pk for s in self.shifts]
+
+        entries[0].reason = "edited"
+        with self.assertRaises(ValueError):
+            entries[0].save()
+
+    def test_bulk_swap_approval_writes_audit_entries_together(self):
+        from .models import ShiftAuditLog
+        from .models import SwapApprovalAudit
+
+        EmployeeProfile.objects.create(
+            user=self.taker, employee_id="audit-taker", hire_date=timezone.now().date(),
+            available_for_incidents=True,
+        )
+        swaps = [
+            SwapRequest.objects.create(
+                requesting_employee=self.owner, target_employee=self.taker, requesting_shift=shift,
+            )
+            for shift in self.shifts
+        ]
+        self.client.force_login(
+            User.objects.create_superuser(username="audit-admin", password="testpass123"),
+        )
+
+        with CaptureQueriesContext(connection) as queries, self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                reverse("shifts:bulk_swap_approval"),
+                {"swap_requests": [s.pk for s in swaps], "action": "approve"},
+            )
+
+        assert response.status_code == 302
+        # One reassignment entry and one bulk decision entry per swap ...
+        assert ShiftAuditLog.objects.filter(action=ShiftAuditLog.Action.REASSIGNED).count() == 3
+        assert sorted(
+            SwapApprovalAudit.objects.filter(
+                action=SwapApprovalAudit.Action.APPROVED,
+            ).values_list("swap_request_id", flat=True),
+        ) == [s.pk for s in swaps]
+        # ... each model written with a single bulk INSERT
+        for model in (ShiftAuditLog, SwapApprovalAudit):
+            inserts = [
+                q for q in queries.captured_queries
+                if q["sql"].startswith(f'INSERT INTO "{model._meta.db_table}"')
+            ]
+            assert len(inserts) == 1
+
+
+class ShiftsCalendarPaginationTestCase(TestCase):
+    def test_cursor_mode_pages_by_start_and_id(self):
+        template = ShiftTemplate.objects.create(name="cal", shift_type="incidents", duration_hours=8)
+        user = User.objects.create_user(username="cal", password="testpass123")
+        start = timezone.now() + timedelta(days=1)
+        shifts = [
+            Shift.objects.create(
+                template=template, assigned_employee=user,
+                start_datetime=start + timedelta(days=i), end_datetime=start + timedelta(days=i, hours=8),
+            )
+            for i in range(5)
+        ]
+
+        first = self.client.get(reverse("shifts:shifts_api"), {"pagination": "cursor", "page_size": 3}).json()
+        second = self.client.get(first["next"]).json()
+
+        assert [e["id"] for e in first["events"] + second["events"]] == [str(s.pk) for s in shifts]
+        assert first["has_next"] is True
+        assert second["next"] is None
@@ -63,6 +63,9 @@ urlpatterns = [
         name="user_outgoing_swap_requests_api",
     ),
     path("api/team-members/", api.get_team_members_api, name="team_members_api"),
+    path(
+        "api/swap-candidates/", api.swap_candidates_api, name="swap_candidates_api",
+    ),
     path(
         "api/employee-shifts/", api.get_employee_shifts_api, name="employee_shifts_api",
     ),
@@ -4,6 +4,7 @@ from django.contrib import messages
 from django.contrib.auth import get_user_model
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.decorators import permission_required
+from django.db import transaction
 from django.db.models import Q
 from django.http import HttpResponseForbidden
 from django.http import JsonResponse
@@ -17,14 +18,19 @@ from django.views.generic import DetailView
 from django.views.generic import ListView
 from rest_framework.decorators import api_view
 from rest_framework.decorators import permission_classes
+from rest_framework.exceptions import NotFound
 from rest_framework.permissions import IsAuthenticated
 
+from team_planner.utils.pagination import KeysetPagination
+
 from .forms import BulkSwapApprovalForm
 from .forms import ShiftSearchForm
 from .forms import SwapRequestForm
 from .models import Shift
-from .models import ShiftType
+from .models import SwapApprovalAudit
 from .models import SwapRequest
+from .services.audit import audit_buffer
+from .services.swap_validation import validate_swaps
 
 User = get_user_model()
 
@@ -250,15 +256,39 @@ def bulk_swap_approval(request):
             success_count = 0
             error_count = 0
 
-            for swap_request in swap_requests:
-                try:
-                    if action == "approve":
-                        swap_request.approve(request.user, notes)
-                    elif action == "reject":
-                        swap_request.reject(notes)
-                    success_count += 1
-                except ValueError:
-                    error_count += 1
+            # Re-check feasibility of the whole selection in one batch
+            validation_errors = (
+                validate_swaps(swap_requests) if action == "approve" else {}
+            )
+
+            # One transaction and one audit buffer for the whole selection, so
+            # the audit entries of every swap are written together at commit
+            with transaction.atomic(), audit_buffer():
+                for swap_request in swap_requests:
+                    if validation_errors.get(swap_request.pk):
+                        error_count += 1
+                        continue
+                    try:
+                        # A failed swap rolls back alone, audit entries included
+                        with transaction.atomic(), audit_buffer() as audit:
+                            if action == "approve":
+                                swap_request.approve(request.user, notes)
+                            elif action == "reject":
+                                swap_request.reject(notes)
+                            audit.swap_action(
+                                swap_request=swap_request,
+                                action=(
+                                    SwapApprovalAudit.Action.APPROVED
+                                    if action == "approve"
+                                    else SwapApprovalAudit.Action.REJECTED
+                                ),
+                                actor=request.user,
+                                notes=notes,
+                                metadata={"source": "bulk"},
+                            )
+                        success_count += 1
+                    except ValueError:
+                        error_count += 1
 
             if success_count > 0:
                 messages.success(
@@ -319,13 +349,17 @@ def get_target_shifts_ajax(request):
 
 @require_http_methods(["GET"])
 def shifts_api(request):
-    """API endpoint to get shifts data for the calendar."""
+    """API endpoint to get shifts data for the calendar.
+
+    With ``?pagination=cursor`` the events are served in keyset pages over
+    (start_datetime, id), for exports and infinite scroll over long ranges.
+    """
     # Get date range from query parameters
     start_date = request.GET.get("start")
     end_date = request.GET.get("end")
 
     queryset = Shift.objects.select_related("template", "assigned_employee").order_by(
-        "start_datetime",
+        "start_datetime", "id",
     )
 
     # Filter by date range if provided
@@ -334,6 +368,14 @@ def shifts_api(request):
     if end_date:
         queryset = queryset.filter(end_datetime__lte=end_date)
 
+    paginator = None
+    if request.GET.get("pagination") == "cursor" or KeysetPagination.cursor_query_param in request.GET:
+        paginator = KeysetPagination(ordering=("start_datetime", "id"))
+        try:
+            queryset = paginator.paginate_queryset(queryset, request)
+        except NotFound as exc:
+            return JsonResponse({"error": str(exc.detail)}, status=404)
+
     # Convert to calendar event format
     events = []
     for shift in queryset:
@@ -355,6 +397,10 @@ def shifts_api(request):
         }
         events.append(event)
 
+    if paginator is not None:
+        page = paginator.get_paginated_data(None)
+        page.pop("results")
+        return JsonResponse({"events": events, **page})
     return JsonResponse({"events": events})
 
 
@@ -363,105 +409,9 @@ def shifts_api(request):
 @permission_classes([IsAuthenticated])
 def dashboard_api(request):
     """API endpoint to get dashboard data for today's shifts."""
-    from django.contrib.auth import get_user_model
-
-    from team_planner.leaves.models import LeaveRequest
-    from team_planner.teams.models import TeamMembership
-
-    User = get_user_model()
-    today = timezone.now().date()
-    start_of_day = timezone.make_aware(datetime.combine(today, datetime.min.time()))
-    end_of_day = timezone.make_aware(datetime.combine(today, datetime.max.time()))
-
-    # Get the requesting user's teams
-    user_teams = TeamMembership.objects.filter(
-        user=request.user, is_active=True,
-    ).values_list("team_id", flat=True)
-
-    # If user is not in any teams, fall back to showing all engineers
-    if not user_teams:
-        team_member_ids = User.objects.filter(is_active=True).values_list(
-            "id", flat=True,
-        )
-    else:
-        # Get all team members from the user's teams
-        team_member_ids = TeamMembership.objects.filter(
-            team_id__in=user_teams, is_active=True,
-        ).values_list("user_id", flat=True)
-
-    # Get today's shifts for team members only
-    today_shifts = (
-        Shift.objects.filter(
-            start_datetime__lte=end_of_day,
-            end_datetime__gte=start_of_day,
-            status__in=["scheduled", "confirmed", "in_progress"],
-            assigned_employee_id__in=team_member_ids,
-        )
-        .select_related("template", "assigned_employee")
-        .order_by("start_datetime")
-    )
-
-    # Get total active engineers from the user's teams
-    total_engineers = User.objects.filter(
-        id__in=team_member_ids, is_active=True,
-    ).count()
-
-    # Get engineers on leave today from the user's teams
-    engineers_on_leave_today = (
-        LeaveRequest.objects.filter(
-            status="approved",
-            start_date__lte=today,
-            end_date__gte=today,
-            employee_id__in=team_member_ids,
-        )
-        .values_list("employee_id", flat=True)
-        .distinct()
-    )
-
-    engineers_on_leave_count = len(engineers_on_leave_today)
-
-    # Calculate available engineers (total - on leave)
-    available_engineers = total_engineers - engineers_on_leave_count
-
-    # Initialize result structure
-    dashboard_data = {
-        "incident_engineer": None,
-        "incident_standby_engineer": None,
-        "waakdienst_engineer": None,
-        "engineers_working": [],
-        "engineers_working_count": 0,
-        "total_engineers": total_engineers,
-        "available_engineers": available_engineers,
-        "engineers_on_leave": engineers_on_leave_count,
-    }
-
-    # Process shifts to find today's engineers
-    engineers_working = set()
-    engineers_working_list = []
-
-    for shift in today_shifts:
-        engineer_data = {
-            "id": shift.assigned_employee.pk,
-            "name": shift.assigned_employee.name or shift.assigned_employee.username,
-            "username": shift.assigned_employee.username,
-        }
-
-        if shift.template.shift_type == ShiftType.INCIDENTS:
-            dashboard_data["incident_engineer"] = engineer_data
-        elif shift.template.shift_type == ShiftType.INCIDENTS_STANDBY:
-            dashboard_data["incident_standby_engineer"] = engineer_data
-        elif shift.template.shift_type == ShiftType.WAAKDIENST:
-            dashboard_data["waakdienst_engineer"] = engineer_data
-
-        # Add to engineers working set and list
-        engineers_working.add(shift.assigned_employee.pk)
-        if engineer_data not in engineers_working_list:
-            engineers_working_list.append(engineer_data)
-
-    dashboard_data["engineers_working"] = engineers_working_list
-    dashboard_data["engineers_working_count"] = len(engineers_working)
+    from team_planner.shifts.services.dashboard import DashboardService
 
-    return JsonResponse(dashboard_data)
+    return JsonResponse(DashboardService(request.user).get_team_dashboard())
 
 
 def _can_respond_to_swap(user, swap_request):
@@ -1,4 +1,6 @@
+from django.contrib.auth.models import Group
 from django.db import transaction
+from django.db.models import Prefetch
 from rest_framework import serializers
 
 from team_planner.users.models import User
@@ -369,11 +371,13 @@ class UserSerializer(serializers.ModelSerializer[User]):
     def get_teams(self, obj):
         """Get user's teams with roles."""
         try:
-            from team_planner.teams.models import TeamMembership
+            memberships = getattr(obj, "active_memberships", None)
+            if memberships is None:
+                from team_planner.teams.models import TeamMembership
 
-            memberships = TeamMembership.objects.filter(
-                user=obj, is_active=True,
-            ).select_related("team")
+                memberships = TeamMembership.objects.filter(
+                    user=obj, is_active=True,
+                ).select_related("team")
             return [
                 {
                     "id": membership.team.id,
@@ -388,9 +392,10 @@ class UserSerializer(serializers.ModelSerializer[User]):
     def get_permissions(self, obj):
         """Get user's permissions."""
         try:
-            # Get all permissions for the user
-            permissions = obj.get_all_permissions()
-            return list(permissions)
+            if not _permissions_prefetched(obj):
+                # Get all permissions for the user
+                return list(obj.get_all_permissions())
+            return sorted(self._permission_map().permissions_for(obj))
         except Exception:
             return []
 
@@ -401,3 +406,95 @@ class UserSerializer(serializers.ModelSerializer[User]):
             return EmployeeProfileSerializer(profile).data
         except Exception:
             return None
+
+    def _permission_map(self):
+        """Group permission map shared by every row of a list serialization."""
+        # With many=True the child serializer is shared across rows
+        if not hasattr(self, "_group_permission_map"):
+            self._group_permission_map = GroupPermissionMap()
+        return self._group_permission_map
+
+    @staticmethod
+    def optimize_queryset(queryset):
+        """Eager-load everything the read representation touches.
+
+        Memberships, profile, skills, groups and direct permissions are loaded
+        in a fixed number of queries for the whole page instead of per user.
+        """
+        from django.contrib.auth.models import Permission
+
+        from team_planner.teams.models import TeamMembership
+
+        return queryset.select_related(
+            "employee_profile__manager",
+        ).prefetch_related(
+            Prefetch(
+                "teammembership_set",
+                queryset=TeamMembership.objects.filter(is_active=True).select_related("team"),
+                to_attr="active_memberships",
+            ),
+            "employee_profile__skills",
+            Prefetch("groups", queryset=Group.objects.only("id")),
+            Prefetch(
+                "user_permissions",
+                queryset=Permission.objects.select_related("content_type"),
+            ),
+        )
+
+
+def _permissions_prefetched(obj) -> bool:
+    cache = getattr(obj, "_prefetched_objects_cache", {})
+    return "groups" in cache and "user_permissions" in cache
+
+
+def _perm_name(app_label: str, codename: str) -> str:
+    return f"{app_label}.{codename}"
+
+
+class GroupPermissionMap:
+    """Lazily loaded group -> permission names map, mirroring ModelBackend.
+
+    One query loads the permissions of every group; superusers get the full
+    permission list, loaded at most once.
+    """
+
+    def __init__(self):
+        self._by_group: dict[int, set[str]] | None = None
+        self._all: frozenset[str] | None = None
+
+    def permissions_for(self, user) -> set[str] | frozenset[str]:
+        if not user.is_active:
+            return set()
+        if user.is_superuser:
+            return self._all_permissions()
+        by_group = self._group_permissions()
+        perms = {
+            _perm_name(p.content_type.app_label, p.codename)
+            for p in user.user_permissions.all()
+        }
+        for group in user.groups.all():
+            perms |= by_group.get(group.pk, set())
+        return perms
+
+    def _group_permissions(self) -> dict[int, set[str]]:
+        if self._by_group is None:
+            by_group: dict[int, set[str]] = {}
+            rows = Group.permissions.through.objects.values_list(
+                "group_id", "permission__content_type__app_label", "permission__codename",
+            )
+            for group_id, app_label, codename in rows:
+                by_group.setdefault(group_id, set()).add(_perm_name(app_label, codename))
+            self._by_group = by_group
+        return self._by_group
+
+    def _all_permissions(self) -> frozenset[str]:
+        if self._all is None:
+            from django.contrib.auth.models import Permission
+
+            self._all = frozenset(
+                _perm_name(app_label, codename)
+                for app_label, codename in Permission.objects.values_list(
+                    "content_type__app_label", "codename",
+                )
+            )
+        return self._all
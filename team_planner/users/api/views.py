@@ -1,7 +1,4 @@
-from datetime import timedelta
-
 from django.contrib.auth import get_user_model
-from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.mixins import CreateModelMixin
@@ -51,10 +48,14 @@ class UserViewSet(
     def get_queryset(self):
         # If user is staff/admin, they can see all users
         if self.request.user.is_staff or self.request.user.is_superuser:
-            return self.queryset.all()
+            queryset = self.queryset.all()
+        else:
+            # Regular users can only see themselves
+            queryset = self.queryset.filter(id=self.request.user.id)
 
-        # Regular users can only see themselves
-        return self.queryset.filter(id=self.request.user.id)
+        if getattr(self, "action", None) == "list":
+            queryset = UserSerializer.optimize_queryset(queryset)
+        return queryset
 
     def get_permissions(self):
         """Set permissions based on action."""
@@ -175,202 +176,6 @@ class UserViewSet(
     @action(detail=False, methods=["get"], url_path="me/dashboard")
     def dashboard(self, request):
         """Get user-specific dashboard data."""
-        from team_planner.shifts.models import Shift
-        from team_planner.shifts.models import SwapRequest
-
-        user = request.user
-        today = timezone.now().date()
-
-        # Get upcoming shifts (next 5)
-        upcoming_shifts = Shift.objects.filter(
-            assigned_employee=user, start_datetime__gte=timezone.now(),
-        ).order_by("start_datetime")[:5]
-
-        upcoming_shifts_data = [
-            {
-                "id": shift.id,
-                "title": f"{shift.template.name} - {shift.template.shift_type}",
-                "start_time": shift.start_datetime.isoformat(),
-                "end_time": shift.end_datetime.isoformat(),
-                "shift_type": shift.template.shift_type,
-                "status": shift.status,
-                "is_upcoming": True,
-            }
-            for shift in upcoming_shifts
-        ]
-
-        # Get incoming swap requests
-        incoming_swap_requests = SwapRequest.objects.filter(
-            target_employee=user, status=SwapRequest.Status.PENDING,
-        ).select_related("requesting_employee", "requesting_shift", "target_shift")
-
-        incoming_swaps_data = []
-        for swap in incoming_swap_requests:
-            # Handle case where target_shift might be None
-            if swap.target_shift and swap.target_shift.template:
-                target_shift_data = {
-                    "id": swap.target_shift.id,
-                    "title": f"{swap.target_shift.template.name} - {swap.target_shift.template.shift_type}",
-                    "start_time": swap.target_shift.start_datetime.isoformat(),
-                    "end_time": swap.target_shift.end_datetime.isoformat(),
-                    "shift_type": swap.target_shift.template.shift_type,
-                    "status": swap.target_shift.status,
-                    "is_upcoming": swap.target_shift.start_datetime >= timezone.now(),
-                }
-            else:
-                target_shift_data = None
-
-            incoming_swaps_data.append(
-                {
-                    "id": swap.id,
-                    "requester": {
-                        "id": swap.requesting_employee.id,
-                        "username": swap.requesting_employee.username,
-                        "first_name": swap.requesting_employee.first_name,
-                        "last_name": swap.requesting_employee.last_name,
-                    },
-                    "target_shift": target_shift_data,
-                    "offered_shift": {
-                        "id": swap.requesting_shift.id,
-                        "title": f"{swap.requesting_shift.template.name} - {swap.requesting_shift.template.shift_type}",
-                        "start_time": swap.requesting_shift.start_datetime.isoformat(),
-                        "end_time": swap.requesting_shift.end_datetime.isoformat(),
-                        "shift_type": swap.requesting_shift.template.shift_type,
-                        "status": swap.requesting_shift.status,
-                        "is_upcoming": swap.requesting_shift.start_datetime
-                        >= timezone.now(),
-                    },
-                    "status": swap.status,
-                    "created_at": swap.created.isoformat(),
-                    "message": swap.message if hasattr(swap, "message") else None,
-                },
-            )
-
-        # Get outgoing swap requests
-        outgoing_swap_requests = SwapRequest.objects.filter(
-            requesting_employee=user, status=SwapRequest.Status.PENDING,
-        ).select_related("target_employee", "requesting_shift", "target_shift")
-
-        outgoing_swaps_data = [
-            {
-                "id": swap.id,
-                "target_employee": {
-                    "id": swap.target_employee.id,
-                    "username": swap.target_employee.username,
-                    "first_name": swap.target_employee.first_name,
-                    "last_name": swap.target_employee.last_name,
-                },
-                "requested_shift": {
-                    "id": swap.target_shift.id,
-                    "title": f"{swap.target_shift.template.name} - {swap.target_shift.template.shift_type}",
-                    "start_time": swap.target_shift.start_datetime.isoformat(),
-                    "end_time": swap.target_shift.end_datetime.isoformat(),
-                    "shift_type": swap.target_shift.template.shift_type,
-                    "status": swap.target_shift.status,
-                    "is_upcoming": swap.target_shift.start_datetime >= timezone.now(),
-                },
-                "offered_shift": {
-                    "id": swap.requesting_shift.id,
-                    "title": f"{swap.requesting_shift.template.name} - {swap.requesting_shift.template.shift_type}",
-                    "start_time": swap.requesting_shift.start_datetime.isoformat(),
-                    "end_time": swap.requesting_shift.end_datetime.isoformat(),
-                    "shift_type": swap.requesting_shift.template.shift_type,
-                    "status": swap.requesting_shift.status,
-                    "is_upcoming": swap.requesting_shift.start_datetime
-                    >= timezone.now(),
-                },
-                "status": swap.status,
-                "created_at": swap.created.isoformat(),
-                "message": swap.message if hasattr(swap, "message") else None,
-            }
-            for swap in outgoing_swap_requests
-        ]
-
-        # Get recent activities (simplified for now)
-        recent_activities = []
-
-        # Add recent shifts
-        recent_shifts = Shift.objects.filter(
-            assigned_employee=user, modified__gte=timezone.now() - timedelta(days=7),
-        ).order_by("-modified")[:3]
-
-        for shift in recent_shifts:
-            recent_activities.append(
-                {
-                    "id": f"shift_{shift.id}",
-                    "type": "shift",
-                    "message": f"Shift {shift.template.name} on {shift.start_datetime.date()}",
-                    "status": "info",
-                    "created_at": shift.modified.isoformat(),
-                    "related_object_id": shift.id,
-                },
-            )
-
-        # Add recent swap requests
-        recent_swaps = SwapRequest.objects.filter(requesting_employee=user).order_by(
-            "-created",
-        )[:2]
-
-        for swap in recent_swaps:
-            # Handle case where target_shift might be None
-            if swap.target_shift:
-                shift_name = swap.target_shift.template.name
-            else:
-                shift_name = "Unknown shift"
-
-            recent_activities.append(
-                {
-                    "id": f"swap_{swap.id}",
-                    "type": "swap_request",
-                    "message": f"Swap request {swap.status} for {shift_name}",
-                    "status": swap.status,
-                    "created_at": swap.created.isoformat(),
-                    "related_object_id": swap.id,
-                },
-            )
-
-        # Sort activities by date
-        recent_activities.sort(key=lambda x: x["created_at"], reverse=True)
-        recent_activities = recent_activities[:5]
-
-        # Calculate stats for this month
-        start_of_month = today.replace(day=1)
-        next_month = (start_of_month.replace(day=28) + timedelta(days=4)).replace(day=1)
-
-        total_shifts_this_month = Shift.objects.filter(
-            assigned_employee=user,
-            start_datetime__gte=start_of_month,
-            start_datetime__lt=next_month,
-        ).count()
-
-        completed_shifts = Shift.objects.filter(
-            assigned_employee=user,
-            start_datetime__gte=start_of_month,
-            start_datetime__lt=next_month,
-            status=Shift.Status.COMPLETED,
-        ).count()
-
-        upcoming_shifts_count = Shift.objects.filter(
-            assigned_employee=user,
-            start_datetime__gte=timezone.now(),
-            start_datetime__lt=next_month,
-        ).count()
-
-        swap_requests_pending = SwapRequest.objects.filter(
-            requesting_employee=user, status=SwapRequest.Status.PENDING,
-        ).count()
-
-        dashboard_data = {
-            "upcoming_shifts": upcoming_shifts_data,
-            "incoming_swap_requests": incoming_swaps_data,
-            "outgoing_swap_requests": outgoing_swaps_data,
-            "recent_activities": recent_activities,
-            "shift_stats": {
-                "total_shifts_this_month": total_shifts_this_month,
-                "completed_shifts": completed_shifts,
-                "upcoming_shifts": upcoming_shifts_count,
-                "swap_requests_pending": swap_requests_pending,
-            },
-        }
+        from team_planner.shifts.services.dashboard import DashboardService
 
-        return Response(dashboard_data)
+        return Response(DashboardService(request.user).get_user_dashboard())
@@ -33,3 +33,37 @@ class TestUserViewSet:
             "url": f"http://testserver/api/users/{user.username}/",
             "name": user.name,
         }
+
+    def test_list_query_count_is_independent_of_user_count(
+        self, db, api_rf: APIRequestFactory, django_assert_max_num_queries,
+    ):
+        from django.contrib.auth.models import Group
+        from django.contrib.auth.models import Permission
+
+        from team_planner.teams.models import Department
+        from team_planner.teams.models import Team
+        from team_planner.teams.models import TeamMembership
+        from team_planner.users.tests.factories import UserFactory
+
+        admin = UserFactory(is_staff=True, is_superuser=True)
+        team = Team.objects.create(
+            name="Ops", department=Department.objects.create(name="Operations"),
+        )
+        group = Group.objects.create(name="planners")
+        group.permissions.add(Permission.objects.get(codename="view_user"))
+        for member in UserFactory.create_batch(10):
+            TeamMembership.objects.create(user=member, team=team)
+            member.groups.add(group)
+
+        view = UserViewSet.as_view({"get": "list"})
+        request = api_rf.get("/fake-url/")
+        request.user = admin
+
+        with django_assert_max_num_queries(10):
+            response = view(request)
+
+        rows = {row["username"]: row for row in response.data["results"]}
+        member = rows[team.members.first().username]
+        assert member["teams"] == [{"id": team.id, "name": "Ops", "role": "member"}]
+        assert member["permissions"] == ["users.view_user"]
+        assert "users.view_user" in rows[admin.username]["permissions"]
@@ -1,8 +1,14 @@
+import base64
+import json
 import math
 from collections import OrderedDict
 
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -32,3 +38,139 @@ class CustomPageNumberPagination(PageNumberPagination):
                 ],
             ),
         )
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination over a unique, indexed ordering such as ("-created", "-id").
+
+    The cursor holds the ordering values of the last row served, and the next
+    page is the rows strictly after it, e.g. for ("-created", "-id")::
+
+        created < c OR (created = c AND id < i)
+
+    so any page costs one index range scan regardless of depth. There is no
+    OFFSET and no full COUNT(*): ``count`` counts at most ``count_limit`` rows
+    and ``count_is_estimate`` tells when the real total is larger.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    ordering = ("-created", "-id")
+    count_limit = 1000
+
+    def __init__(self, ordering=None):
+        if ordering is not None:
+            self.ordering = tuple(ordering)
+
+    def _query_params(self, request):
+        return getattr(request, "query_params", request.GET)
+
+    def get_page_size(self, request):
+        try:
+            size = int(self._query_params(request)[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def _fields(self):
+        return [(name.lstrip("-"), name.startswith("-")) for name in self.ordering]
+
+    def _decode_cursor(self, request, model):
+        encoded = self._query_params(request).get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            fields = self._fields()
+            if len(values) != len(fields):
+                raise ValueError(encoded)
+            return [
+                model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(fields, values)
+            ]
+        except Exception:
+            msg = "Invalid cursor"
+            raise NotFound(msg) from None
+
+    def _encode_cursor(self, row):
+        values = []
+        for name, _ in self._fields():
+            value = getattr(row, name)
+            values.append(value.isoformat() if hasattr(value, "isoformat") else value)
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    def _after(self, values):
+        """Rows strictly after ``values`` in the pagination ordering."""
+        condition = Q()
+        equal = {}
+        for (name, descending), value in zip(self._fields(), values):
+            lookup = f"{name}__lt" if descending else f"{name}__gt"
+            condition |= Q(**equal, **{lookup: value})
+            equal[name] = value
+        return condition
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size_value = self.get_page_size(request)
+        counted = queryset.order_by()[: self.count_limit + 1].count()
+        self.count = min(counted, self.count_limit)
+        self.count_is_estimate = counted > self.count_limit
+
+        values = self._decode_cursor(request, queryset.model)
+        if values is not None:
+            queryset = queryset.filter(self._after(values))
+        rows = list(queryset.order_by(*self.ordering)[: self.page_size_value + 1])
+        self.has_next = len(rows) > self.page_size_value
+        self.page = rows[: self.page_size_value]
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self._encode_cursor(self.page[-1]),
+        )
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("count", self.count),
+                ("count_is_estimate", self.count_is_estimate),
+                ("has_next", self.has_next),
+                ("next", self.get_next_link()),
+                ("results", data),
+            ],
+        )
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
+
+
+class KeysetPaginationMixin:
+    """Lets clients opt a viewset into ``KeysetPagination``.
+
+    Requests carrying ``?pagination=cursor`` (or a ``cursor``) are paginated by
+    ``keyset_ordering``; all others keep the viewset's regular page numbers.
+    """
+
+    keyset_ordering = ("-created", "-id")
+
+    def uses_keyset_pagination(self):
+        params = self.request.query_params
+        return (
+            params.get("pagination") == "cursor"
+            or KeysetPagination.cursor_query_param in params
+        )
+
+    @property
+    def paginator(self):
+        if not hasattr(self, "_paginator"):
+            if self.uses_keyset_pagination():
+                self._paginator = KeysetPagination(ordering=self.keyset_ordering)
+            else:
+                self._paginator = super().paginator
+        return self._paginator
@@ -0,0 +1,97 @@
+"""
+Tests for the scheduling use cases.
+"""
+
+import zoneinfo
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+
+from application.use_cases import OrchestrateScheduleUseCase
+from domain.entities import Employee
+from domain.entities import LeaveRequest
+from domain.entities import Shift
+from domain.value_objects import AssignmentStatus
+from domain.value_objects import EmployeeId
+from domain.value_objects import ShiftId
+from domain.value_objects import ShiftType
+from domain.value_objects import TeamId
+from domain.value_objects import TimeRange
+
+TZ = zoneinfo.ZoneInfo("Europe/Amsterdam")
+MONDAY = datetime(2025, 1, 6, 8, 0, tzinfo=TZ)
+
+
+def _employee(pk, **kwargs):
+    return Employee(
+        id=EmployeeId(pk),
+        name=f"Employee {pk}",
+        email=f"e{pk}@example.com",
+        team_id=TeamId(1),
+        hire_date=date(2020, 1, 1),
+        **kwargs,
+    )
+
+
+def _shift(pk, shift_type=ShiftType.INCIDENTS, day=0):
+    start = MONDAY + timedelta(days=day)
+    return Shift(
+        id=ShiftId(pk),
+        shift_type=shift_type,
+        time_range=TimeRange(start, start + timedelta(hours=9), "Europe/Amsterdam"),
+        team_id=TeamId(1),
+    )
+
+
+def _optimize(shifts, employees, scores):
+    use_case = OrchestrateScheduleUseCase(uow=None, fairness_calculator=None, conflict_detector=None)
+    return async_to_sync(use_case._optimize_assignments)(shifts, employees, scores, None)
+
+
+def test_optimize_assigns_lowest_running_score_first():
+    employees = [_employee(1), _employee(2), _employee(3)]
+    scores = {EmployeeId(1): 2.0, EmployeeId(2): 0.0, EmployeeId(3): 0.0}
+
+    assignments, conflicts = _optimize([_shift(i, day=i) for i in range(1, 6)], employees, scores)
+
+    # Ties go to the earlier employee; each assignment re-queues the employee
+    assert [a.employee_id.value for a in assignments] == [2, 3, 2, 3, 1]
+    assert all(a.status == AssignmentStatus.PENDING for a in assignments)
+    assert conflicts == []
+    assert scores == {EmployeeId(1): 3.0, EmployeeId(2): 2.0, EmployeeId(3): 2.0}
+
+
+def test_optimize_skips_unavailable_employees_without_dropping_them():
+    on_leave = _employee(
+        1,
+        leave_requests=[
+            LeaveRequest(
+                id=1,
+                employee_id=EmployeeId(1),
+                start_date=date(2025, 1, 7),
+                end_date=date(2025, 1, 7),
+                leave_type="vacation",
+                status="approved",
+                coverage_type="full_day",
+            ),
+        ],
+    )
+    no_waakdienst = _employee(2, available_for_waakdienst=False)
+    employees = [on_leave, no_waakdienst]
+    shifts = [
+        _shift(1, day=1),
+        _shift(2, day=2),
+        _shift(3, ShiftType.WAAKDIENST, day=3),
+    ]
+
+    assignments, conflicts = _optimize(shifts, employees, {})
+
+    assert [a.employee_id.value for a in assignments] == [2, 1, 1]
+    assert conflicts == []
+
+    assignments, conflicts = _optimize([_shift(4, ShiftType.WAAKDIENST, day=1)], employees, {})
+
+    assert assignments == []
+    assert [c["type"] for c in conflicts] == ["no_eligible_employees"]
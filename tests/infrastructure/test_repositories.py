@@ -0,0 +1,104 @@
+"""
+Tests for the Django repository implementations on the async ORM.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.utils import timezone
+
+from domain.entities import Shift
+from domain.value_objects import EmployeeId
+from domain.value_objects import ShiftId
+from domain.value_objects import ShiftType
+from domain.value_objects import TeamId
+from domain.value_objects import TimeRange
+from infrastructure.repositories import DjangoUnitOfWork
+from team_planner.notifications.calendar_feed import _user_version_key
+from team_planner.shifts.models import Shift as DjangoShift
+from team_planner.users.models import User
+
+
+def _domain_shift(start, employee):
+    return Shift(
+        id=None,
+        shift_type=ShiftType.INCIDENTS,
+        time_range=TimeRange(start, start + timedelta(hours=9), "UTC"),
+        team_id=TeamId(1),
+        assigned_employee=EmployeeId(employee.pk),
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_batch_inserts_new_shifts_and_sets_ids():
+    user = User.objects.create_user(username="batch-user", password="x")
+    uow = DjangoUnitOfWork()
+    start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+    shifts = [_domain_shift(start + timedelta(days=i), user) for i in range(3)]
+
+    async_to_sync(uow.shifts.save_batch)(shifts)
+
+    assert [s.id.value for s in shifts] == list(
+        DjangoShift.objects.order_by("pk").values_list("pk", flat=True),
+    )
+    # One template resolved for the whole batch
+    assert DjangoShift.objects.values("template").distinct().count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_gather_runs_independent_loads_inside_transaction():
+    first = User.objects.create_user(username="repo-first", password="x")
+    second = User.objects.create_user(username="repo-second", password="x")
+    start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+    window = TimeRange(start - timedelta(hours=1), start + timedelta(days=3), "UTC")
+    uow = DjangoUnitOfWork()
+    shifts = [_domain_shift(start, first), _domain_shift(start + timedelta(days=1), second)]
+    async_to_sync(uow.shifts.save_batch)(shifts)
+
+    async def load():
+        async with uow:
+            return await uow.gather(
+                uow.assignments.find_by_employee_and_date_range(EmployeeId(second.pk), window),
+                uow.assignments.find_by_id(str(shifts[0].id.value)),
+                uow.shifts.find_by_id(shifts[0].id),
+            )
+
+    second_assignments, assignment, shift = async_to_sync(load)()
+
+    assert [a.shift_id for a in second_assignments] == [shifts[1].id]
+    assert assignment.employee_id == EmployeeId(first.pk)
+    assert shift.assigned_employee == EmployeeId(first.pk)
+    assert shift.time_range.timezone == "UTC"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_bulk_writes_refresh_feeds_and_dashboards_after_commit():
+    first = User.objects.create_user(username="feed-first", password="x")
+    second = User.objects.create_user(username="feed-second", password="x")
+    uow = DjangoUnitOfWork()
+    start = timezone.now().replace(microsecond=0) + timedelta(days=1)
+    cache.clear()
+    cache.set(f"dashboard:user:{first.pk}", {"stale": True})
+
+    async def create():
+        async with uow:
+            await uow.shifts.save_batch([_domain_shift(start, first)])
+            # Nothing is refreshed before the unit of work commits
+            assert await cache.aget(_user_version_key(first.pk)) is None
+
+    async_to_sync(create)()
+    assert cache.get(_user_version_key(first.pk)) is not None
+    assert cache.get(f"dashboard:user:{first.pk}") is None
+
+    shift = DjangoShift.objects.get()
+    cache.clear()
+    async_to_sync(uow.assignments.save_batch)([
+        SimpleNamespace(shift_id=ShiftId(shift.pk), employee_id=EmployeeId(second.pk), status="confirmed"),
+    ])
+
+    # Both the previous and the new assignee see the reassignment
+    assert cache.get(_user_version_key(first.pk)) is not None
+    assert cache.get(_user_version_key(second.pk)) is not None